@@ -39,6 +39,7 @@ class Settings(BaseSettings):
     provider_task_classes: str = ""  # semicolon-separated model_or_glob=task_class entries
     provider_budget_classes: str = ""  # semicolon-separated model_or_glob=low|medium|high entries
     llm_target_cooldown_seconds: int = 300  # temporarily deprioritize failed LLM targets across requests
+    llm_prompt_cache_enabled: bool = True  # mark the stable system-prompt prefix with cache_control for providers that honor it (Anthropic/Claude)
     codex_local_enabled: bool = True
     codex_local_command: str = "codex"
     codex_local_model: str = "gpt-5.5"
@@ -50,13 +51,19 @@ class Settings(BaseSettings):
     model_temperature: float = 0.7
     model_max_tokens: int = 4096
     agent_max_steps: int = 10
+    tool_surface_cache_seconds: float = 60.0  # reuse the wrapped agent tool surface across turns while its inputs are unchanged (0 disables)
+    chat_stream_final_answer: bool = True  # stream final-answer tokens over the chat WebSocket as they are generated
     debug: bool = False
     workspace_dir: str = "/app/data"
 
     # Phase 1 — Soul & Memory
     soul_file: str = "soul.md"
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_cache_size: int = 2048          # content-hash LRU of recent vectors (0 disables)
+    embedding_batch_window_ms: int = 2        # wait this long to coalesce concurrent embed() calls
+    embedding_max_batch_size: int = 64        # max texts per model.encode call
     memory_search_top_k: int = 5
+    memory_provider_inventory_cache_seconds: float = 30.0  # reuse the memory provider inventory between turns (0 disables)
     context_window_token_budget: int = 12000  # max tokens for conversation history
     context_window_keep_first: int = 2        # always keep first N messages
     context_window_keep_recent: int = 20      # always keep last N messages
@@ -65,6 +72,9 @@ class Settings(BaseSettings):
     sandbox_url: str = "http://sandbox:8060"
     sandbox_timeout: int = 35
     browser_timeout: int = 30
+    browser_pool_size: int = 2  # warm Chromium instances shared by browse_webpage and browser sessions
+    browser_pool_max_pages: int = 50  # recycle a pooled browser after it has served this many contexts (0 disables)
+    browser_pool_idle_seconds: int = 300  # close pooled browsers idle this long (0 keeps them warm)
     browser_site_allowlist: str = ""  # comma-separated hostname patterns allowed for browse/search
     browser_site_blocklist: str = ""  # comma-separated hostname patterns blocked for browse/search
 
@@ -74,6 +84,10 @@ class Settings(BaseSettings):
     agent_briefing_timeout: int = 60  # daily briefing + evening review LiteLLM calls
     consolidation_llm_timeout: int = 30  # memory consolidation LiteLLM call
     web_search_timeout: int = 15  # DDGS web search per-call
+    guardian_state_source_timeout_seconds: float = 20.0  # per-input deadline before a degraded fallback is used
+    guardian_state_cache_ttl_seconds: float = 15.0  # reuse soul/reconciliation/project inputs across back-to-back turns (0 disables)
+    memory_provider_timeout_seconds: float = 3.0  # per-provider deadline for additive memory retrieval
+    memory_provider_retrieval_budget_seconds: float = 5.0  # overall budget; providers still running are cancelled and marked degraded
 
     # Phase 4 — Recursive Delegation
     use_delegation: bool = False             # feature flag: orchestrator + specialists
@@ -93,6 +107,8 @@ class Settings(BaseSettings):
     working_hours_start: int = 9
     working_hours_end: int = 17
     observer_git_repo_path: str = ""
+    observer_source_timeout_seconds: float = 10.0  # per-source deadline during an observer refresh
+    observer_calendar_cache_seconds: int = 300     # reuse a successful calendar fetch across polls
     deep_work_apps: str = ""  # comma-separated extra app keywords for deep work detection
 
     # Screen Activity Tracking
@@ -140,12 +156,50 @@ class Settings(BaseSettings):
     # Vault
     vault_encryption_key: str = ""  # Fernet key; auto-generates key file when empty
 
+    # Runtime Audit Buffer
+    audit_buffer_max_pending: int = 5000       # drop (and count) sync audit events beyond this backlog
+    audit_buffer_batch_size: int = 200         # rows per batched insert transaction
+    audit_buffer_flush_interval_ms: int = 250  # max delay before buffered events are written
+
+    # WebSocket Broadcast
+    ws_outbound_queue_size: int = 256  # pending broadcast frames per connection before the slow-consumer policy applies
+    ws_slow_consumer_policy: str = "drop_oldest"  # drop_oldest | drop_newest | disconnect when a connection's queue is full
+    ws_coalesce_message_types: str = "ambient"  # comma-separated broadcast types where only the newest pending frame is kept
+    ws_broadcast_ack_timeout_ms: int = 250  # broadcast waits this long for a send; if none went out, still-queued frames are withdrawn for later delivery (0 = don't wait, count queued frames as delivered)
+    ws_send_timeout_seconds: int = 30  # drop a connection whose single send stalls this long (0 = no limit)
+    ws_replay_buffer_size: int = 200  # recent broadcast frames replayed to clients reconnecting with ?last_broadcast_seq=
+
+    # MCP Connections
+    mcp_connect_timeout_seconds: float = 15.0  # per-server handshake deadline; servers connect in parallel in the background (0 = adapter default)
+    mcp_connect_max_concurrency: int = 8  # MCP servers handshaking at once on the connection pool
+    mcp_reconnect_initial_seconds: float = 5.0  # first background retry after a failed connection, doubling per failure (0 disables retries)
+    mcp_reconnect_max_seconds: float = 300.0  # cap for the reconnect backoff
+    mcp_cached_tools_max_failures: int = 3  # consecutive failures after which a server's cached tool stand-ins are dropped (also dropped once the backoff hits its cap)
+    mcp_tool_schema_cache_enabled: bool = True  # offer tools cached from the last successful handshake while a server is still connecting
+
+    # Sync Tool Async Bridge
+    sync_bridge_timeout_seconds: int = 300  # max wait for a coroutine submitted from sync tool code (0 = no limit)
+
+    # Workflow Runtime
+    workflow_step_max_concurrency: int = 4  # independent workflow steps run concurrently up to this many (1 = strictly in order)
+    workflow_state_commit_delay_ms: int = 250  # max delay before deferred step transitions are committed (0 = commit each write)
+    workflow_state_batch_size: int = 32  # commit the step journal early once this many transitions are pending
+    workflow_state_max_run_failures: int = 3  # drop a run's pending step transitions (with a warning) after this many failed commits in a row
+
+    # Operator Benchmark Reports
+    operator_benchmark_report_ttl_minutes: int = 60     # serve a stored suite run this long before re-running it in the background
+    operator_benchmark_refresh_interval_min: int = 60   # scheduled re-run of every materialized suite set
+    operator_benchmark_warm_on_startup: bool = False    # materialize all operator benchmark reports after startup
+    operator_benchmark_worker_jobs: int = 1             # eval worker processes for background suite re-runs and warm-ups
+
     # LLM Call Logging
     llm_log_enabled: bool = True
     llm_log_content: bool = False          # include messages/response (large)
     llm_log_dir: str = "/app/logs"
     llm_log_max_bytes: int = 52_428_800    # 50 MB per file
     llm_log_backup_count: int = 5          # keep 5 rotated files
+    llm_log_index_enabled: bool = True     # index calls in llm_calls.index.sqlite3 for fast queries
+    llm_log_index_max_rows: int = 500_000  # oldest indexed calls are pruned beyond this
 
     model_config = SettingsConfigDict(env_file=DEFAULT_ENV_FILE, env_file_encoding="utf-8", extra="ignore")
 
@@ -3,6 +3,7 @@
 import hashlib
 import logging
 import math
+from dataclasses import dataclass
 from functools import lru_cache
 
 import tiktoken
@@ -18,6 +19,20 @@ _summary_cache: dict[str, str] = {}
 _encoding_failure_logged = False
 
 
+@dataclass
+class RollingSummary:
+    """Persisted summary of every message evicted from the window so far.
+
+    ``build_context_window`` folds newly-evicted messages into ``summary`` and
+    sets ``changed`` so the caller knows to persist the new state.
+    """
+
+    summary: str = ""
+    through_message_id: str = ""
+    message_count: int = 0
+    changed: bool = False
+
+
 @lru_cache(maxsize=1)
 def _load_encoding():
     return tiktoken.get_encoding("cl100k_base")
@@ -57,15 +72,60 @@ def _format_messages(messages: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def _summarize_middle(messages: list[dict], session_id: str, range_key: str) -> str:
+def count_message_tokens(role: str, content: str) -> int:
+    """Count the tokens of one formatted history line (``Role: content``)."""
+    return _count_tokens(_format_messages([{"role": role, "content": content}]))
+
+
+def _message_tokens(msg: dict) -> int:
+    token_count = msg.get("token_count")
+    if isinstance(token_count, int) and token_count >= 0:
+        return token_count
+    return count_message_tokens(msg.get("role", "unknown"), msg.get("content", ""))
+
+
+def _history_tokens(messages: list[dict]) -> int:
+    # Per-line counts plus one token for each joining newline.
+    return sum(_message_tokens(msg) for msg in messages) + max(0, len(messages) - 1)
+
+
+def _summarize_middle(
+    messages: list[dict],
+    session_id: str,
+    range_key: str,
+    previous_summary: str = "",
+) -> str:
     """Summarize the middle section of conversation history via LLM."""
+    return _summarize(messages, session_id, range_key, previous_summary)[0]
+
+
+def _summarize(
+    messages: list[dict],
+    session_id: str,
+    range_key: str,
+    previous_summary: str = "",
+) -> tuple[str, bool]:
+    """Return ``(summary, degraded)`` for ``messages``, folded into ``previous_summary``."""
     cache_key = f"{session_id}:{range_key}"
     if cache_key in _summary_cache:
-        return _summary_cache[cache_key]
+        return _summary_cache[cache_key], False
 
     text = _format_messages(messages)
     message_count = len(messages)
     text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+    if previous_summary:
+        prompt = (
+            "Update this running summary of an earlier conversation with the new excerpt below. "
+            "Return one concise paragraph covering key topics, decisions, and any commitments made.\n\n"
+            f"Running summary:\n{previous_summary}\n\nNew excerpt:\n{text[:8000]}"
+        )
+    else:
+        prompt = (
+            "Summarize this conversation excerpt in one concise paragraph. "
+            "Focus on key topics, decisions, and any commitments made.\n\n"
+            f"{text[:8000]}"
+        )
+    degraded = False
     runtime_tokens = None
     try:
         if session_id:
@@ -73,11 +133,7 @@ def _summarize_middle(messages: list[dict], session_id: str, range_key: str) ->
         response = completion_with_fallback_sync(
             messages=[{
                 "role": "user",
-                "content": (
-                    "Summarize this conversation excerpt in one concise paragraph. "
-                    "Focus on key topics, decisions, and any commitments made.\n\n"
-                    f"{text[:8000]}"
-                ),
+                "content": prompt,
             }],
             temperature=0.3,
             max_tokens=200,
@@ -93,12 +149,16 @@ def _summarize_middle(messages: list[dict], session_id: str, range_key: str) ->
                 "message_count": message_count,
                 "summary_length": len(summary),
                 "source_hash": text_hash,
+                "incremental": bool(previous_summary),
                 "runtime_path": "context_window_summary",
             },
         )
     except Exception:
         logger.warning("Failed to summarize middle section, using truncation fallback")
+        degraded = True
         summary = text[:500] + "\n[...earlier conversation truncated...]"
+        if previous_summary:
+            summary = f"{previous_summary}\n{summary}"
         log_background_task_event_sync(
             task_name="context_window_summary",
             session_id=session_id or None,
@@ -122,15 +182,69 @@ def _summarize_middle(messages: list[dict], session_id: str, range_key: str) ->
         oldest = next(iter(_summary_cache))
         del _summary_cache[oldest]
 
+    return summary, degraded
+
+
+def _rolling_middle_summary(
+    middle: list[dict],
+    session_id: str,
+    rolling_summary: RollingSummary,
+) -> str | None:
+    """Fold only the messages evicted since the last turn into the rolling summary.
+
+    Returns ``None`` when the messages carry no ids to anchor the summary on,
+    in which case the caller summarizes the whole middle section instead.
+    """
+    message_ids = [msg.get("id") for msg in middle]
+    if not session_id or not all(message_ids):
+        return None
+
+    start = 0
+    previous_summary = ""
+    if rolling_summary.summary and rolling_summary.through_message_id in message_ids:
+        start = message_ids.index(rolling_summary.through_message_id) + 1
+        previous_summary = rolling_summary.summary
+        if start == len(middle):
+            return rolling_summary.summary
+
+    evicted = middle[start:]
+    summary, degraded = _summarize(
+        evicted,
+        session_id,
+        f"{message_ids[start]}..{message_ids[-1]}",
+        previous_summary,
+    )
+    if not degraded:
+        # Degraded truncation fallbacks are never persisted, so the next turn
+        # retries the fold from the last good summary.
+        rolling_summary.summary = summary
+        rolling_summary.through_message_id = message_ids[-1]
+        rolling_summary.message_count = (
+            rolling_summary.message_count if previous_summary else 0
+        ) + len(evicted)
+        rolling_summary.changed = True
     return summary
 
 
+def _split_window(
+    messages: list[dict],
+    keep_recent: int,
+    keep_first: int,
+) -> tuple[list[dict], list[dict], list[dict]]:
+    n = len(messages)
+    first = messages[:keep_first]
+    recent = messages[max(keep_first, n - keep_recent):]
+    middle = messages[keep_first:max(keep_first, n - keep_recent)]
+    return first, middle, recent
+
+
 def build_context_window(
     messages: list[dict],
     token_budget: int | None = None,
     keep_recent: int | None = None,
     keep_first: int | None = None,
     session_id: str = "",
+    rolling_summary: RollingSummary | None = None,
 ) -> str:
     """Build a token-aware context window from message history.
 
@@ -140,6 +254,10 @@ def build_context_window(
     3. If total fits in budget, return all
     4. Otherwise, summarize the middle section
 
+    Budgets use each message's precomputed ``token_count`` when present.
+    When ``rolling_summary`` is given and messages carry ``id`` keys, only
+    messages evicted since the summary was last updated are summarized.
+
     When arguments are None, values are read from settings.
     """
     token_budget = token_budget if token_budget is not None else settings.context_window_token_budget
@@ -149,28 +267,32 @@ def build_context_window(
     if not messages:
         return ""
 
-    full_text = _format_messages(messages)
-    if _count_tokens(full_text) <= token_budget:
+    if _history_tokens(messages) <= token_budget:
         logger.info(
             "Context window: %d messages, all kept (within %d token budget)",
             len(messages), token_budget,
         )
-        return full_text
+        return _format_messages(messages)
 
     n = len(messages)
-    first = messages[:keep_first]
-    recent = messages[max(keep_first, n - keep_recent):]
-    middle = messages[keep_first:max(keep_first, n - keep_recent)]
+    first, middle, recent = _split_window(messages, keep_recent, keep_first)
 
     parts = []
+    result_tokens = _history_tokens(first) + _history_tokens(recent)
 
     if first:
         parts.append(_format_messages(first))
 
     if middle:
-        range_key = f"{keep_first}-{n - keep_recent}"
-        summary = _summarize_middle(middle, session_id, range_key)
-        parts.append(f"[Summary of {len(middle)} earlier messages: {summary}]")
+        summary = None
+        if rolling_summary is not None:
+            summary = _rolling_middle_summary(middle, session_id, rolling_summary)
+        if summary is None:
+            range_key = f"{keep_first}-{n - keep_recent}"
+            summary = _summarize_middle(middle, session_id, range_key)
+        summary_line = f"[Summary of {len(middle)} earlier messages: {summary}]"
+        parts.append(summary_line)
+        result_tokens += _count_tokens(summary_line)
 
     if recent:
         parts.append(_format_messages(recent))
@@ -179,7 +301,7 @@ def build_context_window(
     logger.info(
         "Context window: %d messages in, %d kept (%d first + %d recent), %d summarized, %d result tokens",
         n, len(first) + len(recent), len(first), len(recent), len(middle),
-        _count_tokens(result),
+        result_tokens,
     )
     return result
 
@@ -197,9 +319,8 @@ def requires_middle_summary(
     if not messages:
         return False
 
-    if _count_tokens(_format_messages(messages)) <= token_budget:
+    if _history_tokens(messages) <= token_budget:
         return False
 
-    n = len(messages)
-    middle = messages[keep_first:max(keep_first, n - keep_recent)]
+    _first, middle, _recent = _split_window(messages, keep_recent, keep_first)
     return bool(middle)
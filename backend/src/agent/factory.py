@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
 from smolagents import ToolCallingAgent
 
 from config.settings import settings
+from src.approval.runtime import get_current_approval_mode
+from src.extensions.registry import extension_registry_generation
+from src.extensions.state import extension_state_signature
 from src.guardian.state import GuardianState
+from src.llm_prompt_cache import compose_instructions
 from src.llm_runtime import FallbackLiteLLMModel as LiteLLMModel, build_model_kwargs
 from src.native_tools.loader import discover_tools
+from src.skills.loader import Skill
 from src.skills.manager import skill_manager
 from src.tools.approval import wrap_tools_for_approval, wrap_tools_with_forced_approval
 from src.tools.audit import wrap_tools_for_audit
@@ -95,10 +105,115 @@ def _append_workflow_tools(base_tools: list, active_skill_names: list[str], mcp_
     return base_tools + workflow_tools
 
 
+@dataclass(frozen=True)
+class _ToolSurfaceCacheEntry:
+    key: tuple[Any, ...]
+    expires_at: float
+    tools: tuple
+    active_skills: tuple[Skill, ...]
+
+
+_tool_surface_cache: _ToolSurfaceCacheEntry | None = None
+_tool_surface_lock = threading.Lock()
+
+
+def _reset_tool_surface_cache() -> None:
+    global _tool_surface_cache
+    with _tool_surface_lock:
+        _tool_surface_cache = None
+
+
+def _tool_surface_key() -> tuple[Any, ...]:
+    return (
+        get_current_tool_policy_mode(),
+        get_current_mcp_policy_mode(),
+        get_current_approval_mode(),
+        settings.use_delegation,
+        mcp_manager.generation,
+        workflow_manager.generation,
+        skill_manager.generation,
+        extension_registry_generation(),
+        extension_state_signature(),
+    )
+
+
+def _get_tool_surface() -> tuple[list, list[Skill]]:
+    """Return the wrapped agent tools and the skills they activate.
+
+    Wrapping every native, MCP and workflow tool is repeated per turn otherwise,
+    so the surface is reused while the policy modes, approval mode, MCP
+    connections and workflow/skill/extension registries are unchanged;
+    ``tool_surface_cache_seconds`` bounds how long on-disk edits can go unnoticed.
+    """
+    global _tool_surface_cache
+    ttl_seconds = float(settings.tool_surface_cache_seconds or 0)
+    key = _tool_surface_key()
+    now = time.monotonic()
+    with _tool_surface_lock:
+        cached = _tool_surface_cache
+    if ttl_seconds > 0 and cached is not None and cached.key == key and now < cached.expires_at:
+        return list(cached.tools), list(cached.active_skills)
+
+    base_tools, active_skill_names, mcp_mode = get_base_tools_and_active_skills()
+    tools = _append_workflow_tools(base_tools, active_skill_names, mcp_mode)
+    active_skills = skill_manager.get_active_skills([tool.name for tool in tools])
+    if ttl_seconds > 0:
+        with _tool_surface_lock:
+            _tool_surface_cache = _ToolSurfaceCacheEntry(
+                key=key,
+                expires_at=now + ttl_seconds,
+                tools=tuple(tools),
+                active_skills=tuple(active_skills),
+            )
+    return tools, active_skills
+
+
+def _compose_agent_instructions(
+    base_instructions: str,
+    *,
+    active_skills: list[Skill],
+    additional_context: str,
+    soul_context: str,
+    memory_context: str,
+    observer_context: str,
+    guardian_state: GuardianState | None,
+) -> str:
+    """Lay out instructions stable-first so providers can cache the shared prefix.
+
+    Persona, skills and the soul rarely change between turns; guardian state,
+    observer context, memories and history are rebuilt every turn and go after
+    the volatile-context header.
+    """
+    stable = [base_instructions]
+    if active_skills:
+        skill_lines = []
+        for s in active_skills:
+            invocable = " [user-invocable]" if s.user_invocable else ""
+            skill_lines.append(f"### Skill: {s.name}{invocable}\n{s.instructions}")
+        stable.append("## Available Skills\n\n" + "\n\n".join(skill_lines))
+
+    volatile = []
+    if guardian_state is not None:
+        soul_context = guardian_state.soul_context
+        memory_context = guardian_state.memory_context
+        additional_context = guardian_state.current_session_history or additional_context
+        volatile.append(f"--- GUARDIAN STATE ---\n{guardian_state.to_prompt_block()}")
+    elif observer_context:
+        volatile.append(f"--- CURRENT CONTEXT ---\n{observer_context}")
+
+    if soul_context:
+        stable.append(f"--- USER IDENTITY ---\n{soul_context}")
+    if memory_context:
+        volatile.append(f"--- RELEVANT MEMORIES ---\n{memory_context}")
+    if additional_context:
+        volatile.append(f"--- CONVERSATION HISTORY ---\n{additional_context}")
+    return compose_instructions(stable, volatile)
+
+
 def get_tools() -> list:
     """Return all auto-discovered tools + MCP tools."""
-    base_tools, active_skill_names, mcp_mode = get_base_tools_and_active_skills()
-    return _append_workflow_tools(base_tools, active_skill_names, mcp_mode)
+    tools, _ = _get_tool_surface()
+    return tools
 
 
 def create_agent(
@@ -117,8 +232,7 @@ def create_agent(
         observer_context: Current observer context (time, window, screen, etc.).
     """
     model = get_model(runtime_path="chat_agent")
-    tools = get_tools()
-    tool_names = [t.name for t in tools]
+    tools, active_skills = _get_tool_surface()
 
     instructions = (
         "You are Seraph, a proactive guardian intelligence operating a dense human workspace. "
@@ -127,30 +241,15 @@ def create_agent(
         "influence, and growth. Treat relationship or collaboration priorities as influence unless "
         "another supported domain fits better. Be concise, exact, strategic, and useful."
     )
-    if guardian_state is not None:
-        soul_context = guardian_state.soul_context
-        memory_context = guardian_state.memory_context
-        additional_context = guardian_state.current_session_history or additional_context
-        instructions += f"\n\n--- GUARDIAN STATE ---\n{guardian_state.to_prompt_block()}"
-    elif observer_context:
-        instructions += f"\n\n--- CURRENT CONTEXT ---\n{observer_context}"
-
-    if soul_context:
-        instructions += f"\n\n--- USER IDENTITY ---\n{soul_context}"
-    if memory_context:
-        instructions += f"\n\n--- RELEVANT MEMORIES ---\n{memory_context}"
-
-    # Inject active skills into instructions
-    active_skills = skill_manager.get_active_skills(tool_names)
-    if active_skills:
-        skill_lines = []
-        for s in active_skills:
-            invocable = " [user-invocable]" if s.user_invocable else ""
-            skill_lines.append(f"### Skill: {s.name}{invocable}\n{s.instructions}")
-        instructions += "\n\n## Available Skills\n\n" + "\n\n".join(skill_lines)
-
-    if additional_context:
-        instructions += f"\n\n--- CONVERSATION HISTORY ---\n{additional_context}"
+    instructions = _compose_agent_instructions(
+        instructions,
+        active_skills=active_skills,
+        additional_context=additional_context,
+        soul_context=soul_context,
+        memory_context=memory_context,
+        observer_context=observer_context,
+        guardian_state=guardian_state,
+    )
 
     agent = ToolCallingAgent(
         tools=tools,
@@ -199,30 +298,16 @@ def create_orchestrator(
         "- Give clear, specific task descriptions when delegating.\n"
         "- Synthesize specialist results into a natural response."
     )
-    if guardian_state is not None:
-        soul_context = guardian_state.soul_context
-        memory_context = guardian_state.memory_context
-        additional_context = guardian_state.current_session_history or additional_context
-        instructions += f"\n\n--- GUARDIAN STATE ---\n{guardian_state.to_prompt_block()}"
-    elif observer_context:
-        instructions += f"\n\n--- CURRENT CONTEXT ---\n{observer_context}"
-
-    if soul_context:
-        instructions += f"\n\n--- USER IDENTITY ---\n{soul_context}"
-    if memory_context:
-        instructions += f"\n\n--- RELEVANT MEMORIES ---\n{memory_context}"
-
-    # Inject active skills into instructions
     active_skills = skill_manager.get_active_skills(all_tool_names)
-    if active_skills:
-        skill_lines = []
-        for s in active_skills:
-            invocable = " [user-invocable]" if s.user_invocable else ""
-            skill_lines.append(f"### Skill: {s.name}{invocable}\n{s.instructions}")
-        instructions += "\n\n## Available Skills\n\n" + "\n\n".join(skill_lines)
-
-    if additional_context:
-        instructions += f"\n\n--- CONVERSATION HISTORY ---\n{additional_context}"
+    instructions = _compose_agent_instructions(
+        instructions,
+        active_skills=active_skills,
+        additional_context=additional_context,
+        soul_context=soul_context,
+        memory_context=memory_context,
+        observer_context=observer_context,
+        guardian_state=guardian_state,
+    )
 
     agent = ToolCallingAgent(
         tools=[],
@@ -1,4 +1,6 @@
 import asyncio
+import base64
+import binascii
 import json
 import logging
 import re
@@ -6,7 +8,7 @@ import uuid
 from datetime import datetime, timezone
 from time import perf_counter
 
-from sqlalchemy import func, or_, text
+from sqlalchemy import and_, func, or_, text, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import select, col
 
@@ -24,6 +26,7 @@ from src.db.models import (
     QueuedInsight,
     ScheduledJob,
     Session,
+    SessionContextSummary,
     SessionTodo,
 )
 from src.db.session_refs import ensure_sessions_exist
@@ -33,6 +36,8 @@ from src.tools.process_tools import process_runtime_manager
 
 logger = logging.getLogger(__name__)
 
+_HISTORY_ROLES = ("user", "assistant")
+
 
 def _escape_like(value: str) -> str:
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -92,6 +97,23 @@ def _coerce_datetime(value: object) -> datetime | None:
     return None
 
 
+def _encode_session_cursor(session: Session) -> str:
+    payload = json.dumps([session.updated_at.isoformat(), session.id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_session_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        updated_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(updated_at), str(session_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid session cursor") from exc
+
+
+def _isoformat(value: datetime | str) -> str:
+    return value if isinstance(value, str) else value.isoformat()
+
+
 class SessionManager:
     """DB-backed session manager replacing the old in-memory dict."""
 
@@ -178,42 +200,64 @@ class SessionManager:
             )
             for intervention in interventions.scalars().all():
                 await db.delete(intervention)
+            context_summary = await db.get(SessionContextSummary, session_id)
+            if context_summary is not None:
+                await db.delete(context_summary)
             await db.delete(session)
             return True
 
     async def list_sessions(self) -> list[dict]:
+        sessions, _ = await self.list_sessions_page()
+        return sessions
+
+    async def list_sessions_page(
+        self,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """List sessions newest first, keyset-paginated on ``(updated_at, id)``.
+
+        Returns the page plus the cursor for the next one (``None`` on the last
+        page). Raises ``ValueError`` for a malformed cursor.
+        """
+        position = _decode_session_cursor(cursor) if cursor else None
         try:
             async with get_session() as db:
-                # Single query: fetch sessions with their latest message using window function
-                rows = (await db.execute(text(
-                    """
-                    SELECT
-                        s.id, s.title, s.created_at, s.updated_at,
-                        lm.content AS last_content, lm.role AS last_role
-                    FROM sessions s
-                    LEFT JOIN (
-                        SELECT session_id, content, role,
-                               ROW_NUMBER() OVER (PARTITION BY session_id ORDER BY created_at DESC) AS rn
-                        FROM messages
-                    ) lm ON lm.session_id = s.id AND lm.rn = 1
-                    ORDER BY s.updated_at DESC
-                    """
-                ))).all()
-
-                return [
-                    {
-                        "id": r.id,
-                        "title": r.title,
-                        "created_at": r.created_at if isinstance(r.created_at, str) else r.created_at.isoformat(),
-                        "updated_at": r.updated_at if isinstance(r.updated_at, str) else r.updated_at.isoformat(),
-                        "last_message": r.last_content[:100] if r.last_content else None,
-                        "last_message_role": r.last_role,
-                    }
-                    for r in rows
-                ]
+                stmt = select(Session).order_by(
+                    col(Session.updated_at).desc(),
+                    col(Session.id).desc(),
+                )
+                if position is not None:
+                    updated_at, session_id = position
+                    stmt = stmt.where(
+                        or_(
+                            Session.updated_at < updated_at,
+                            and_(Session.updated_at == updated_at, Session.id < session_id),
+                        )
+                    )
+                if limit is not None:
+                    stmt = stmt.limit(limit + 1)
+                sessions = list((await db.execute(stmt)).scalars().all())
         except SQLAlchemyError as exc:
             logger.warning("Session list unavailable; returning empty list: %s", exc)
-            return []
+            return [], None
+
+        next_cursor = None
+        if limit is not None and len(sessions) > limit:
+            sessions = sessions[:limit]
+            next_cursor = _encode_session_cursor(sessions[-1])
+        return [
+            {
+                "id": session.id,
+                "title": session.title,
+                "created_at": _isoformat(session.created_at),
+                "updated_at": _isoformat(session.updated_at),
+                "last_message": session.last_message_preview or None,
+                "last_message_role": session.last_message_role,
+            }
+            for session in sessions
+        ], next_cursor
 
     async def get_recent_sessions_summary(
         self,
@@ -225,7 +269,11 @@ class SessionManager:
         """Summarize recent sessions outside the current thread for guardian state."""
         try:
             async with get_session() as db:
-                stmt = select(Session)
+                stmt = (
+                    select(Session)
+                    .order_by(func.coalesce(Session.last_message_at, Session.created_at).desc())
+                    .limit(limit_sessions)
+                )
                 if exclude_session_id:
                     stmt = stmt.where(Session.id != exclude_session_id)
                 session_result = await db.execute(stmt)
@@ -233,24 +281,6 @@ class SessionManager:
                 if not sessions:
                     return ""
 
-                recency_stmt = (
-                    select(Message.session_id, func.max(Message.created_at))
-                    .where(Message.role.in_(["user", "assistant"]))  # type: ignore[attr-defined]
-                    .group_by(Message.session_id)
-                )
-                if exclude_session_id:
-                    recency_stmt = recency_stmt.where(Message.session_id != exclude_session_id)
-                recency_rows = await db.execute(recency_stmt)
-                conversation_recency = {
-                    session_id: latest_at
-                    for session_id, latest_at in recency_rows.all()
-                }
-                sessions = sorted(
-                    sessions,
-                    key=lambda session: conversation_recency.get(session.id) or session.created_at,
-                    reverse=True,
-                )[:limit_sessions]
-
                 lines: list[str] = []
                 for session in sessions:
                     msg_result = await db.execute(
@@ -275,53 +305,37 @@ class SessionManager:
             logger.warning("Recent sessions summary unavailable; returning empty summary: %s", exc)
             return ""
 
-    async def _conversation_recency_map(
-        self,
-        db,
-        *,
-        exclude_session_id: str | None = None,
-    ) -> dict[str, datetime]:
-        recency_stmt = (
-            select(Message.session_id, func.max(Message.created_at))
-            .where(Message.role.in_(["user", "assistant"]))  # type: ignore[attr-defined]
-            .group_by(Message.session_id)
-        )
-        if exclude_session_id:
-            recency_stmt = recency_stmt.where(Message.session_id != exclude_session_id)
-        recency_rows = await db.execute(recency_stmt)
-        return {
-            session_id: latest_at
-            for session_id, latest_at in recency_rows.all()
-        }
+    async def _sessions_by_id(self, db, session_ids: set[str]) -> dict[str, Session]:
+        if not session_ids:
+            return {}
+        rows = await db.execute(select(Session).where(col(Session.id).in_(tuple(session_ids))))
+        return {session.id: session for session in rows.scalars().all()}
 
     async def _search_sessions_fallback(
         self,
         *,
         db,
         normalized_query: str,
-        session_map: dict[str, Session],
         limit: int,
         exclude_session_id: str | None,
         snippet_chars: int,
     ) -> list[dict]:
         pattern = f"%{_escape_like(normalized_query)}%"
-        message_recency = await self._conversation_recency_map(
-            db,
-            exclude_session_id=exclude_session_id,
-        )
-        sessions = list(session_map.values())
+        title_stmt = select(Session).where(func.lower(Session.title).like(pattern, escape="\\"))
+        if exclude_session_id:
+            title_stmt = title_stmt.where(Session.id != exclude_session_id)
+        session_map = {session.id: session for session in (await db.execute(title_stmt)).scalars().all()}
 
         title_hits = {
             session.id: {
                 "session_id": session.id,
                 "title": session.title or "Untitled session",
-                "matched_at": message_recency.get(session.id) or session.created_at,
+                "matched_at": session.last_message_at or session.created_at,
                 "snippet": session.title or "Untitled session",
                 "source": "title",
                 "rank": 0.0,
             }
-            for session in sessions
-            if normalized_query in (session.title or "").lower()
+            for session in session_map.values()
         }
 
         message_stmt = (
@@ -332,25 +346,7 @@ class SessionManager:
         )
         if exclude_session_id:
             message_stmt = message_stmt.where(Message.session_id != exclude_session_id)
-        message_rows = await db.execute(message_stmt)
-
-        combined = dict(title_hits)
-        for message in message_rows.scalars().all():
-            session = session_map.get(message.session_id)
-            if session is None or message.session_id in combined:
-                continue
-            combined[message.session_id] = {
-                "session_id": message.session_id,
-                "title": session.title or "Untitled session",
-                "matched_at": message.created_at,
-                "snippet": _matching_snippet(
-                    message.content,
-                    normalized_query,
-                    snippet_chars=snippet_chars,
-                ),
-                "source": "message",
-                "rank": 1.0,
-            }
+        messages = (await db.execute(message_stmt)).scalars().all()
 
         event_stmt = (
             select(MemoryEpisode)
@@ -369,8 +365,33 @@ class SessionManager:
         )
         if exclude_session_id:
             event_stmt = event_stmt.where(MemoryEpisode.session_id != exclude_session_id)
-        event_rows = await db.execute(event_stmt)
-        for episode in event_rows.scalars().all():
+        episodes = (await db.execute(event_stmt)).scalars().all()
+
+        referenced_ids = {message.session_id for message in messages}
+        referenced_ids.update(
+            episode.session_id for episode in episodes if isinstance(episode.session_id, str)
+        )
+        session_map.update(await self._sessions_by_id(db, referenced_ids - session_map.keys()))
+
+        combined = dict(title_hits)
+        for message in messages:
+            session = session_map.get(message.session_id)
+            if session is None or message.session_id in combined:
+                continue
+            combined[message.session_id] = {
+                "session_id": message.session_id,
+                "title": session.title or "Untitled session",
+                "matched_at": message.created_at,
+                "snippet": _matching_snippet(
+                    message.content,
+                    normalized_query,
+                    snippet_chars=snippet_chars,
+                ),
+                "source": "message",
+                "rank": 1.0,
+            }
+
+        for episode in episodes:
             if not isinstance(episode.session_id, str) or episode.session_id in combined:
                 continue
             session = session_map.get(episode.session_id)
@@ -398,7 +419,7 @@ class SessionManager:
             combined.values(),
             key=lambda item: (
                 item["rank"],
-                -(message_recency.get(item["session_id"]) or item["matched_at"]).timestamp(),
+                -(session_map[item["session_id"]].last_message_at or item["matched_at"]).timestamp(),
                 -item["matched_at"].timestamp(),
             ),
         )
@@ -427,25 +448,11 @@ class SessionManager:
             return []
 
         async with get_session() as db:
-            session_stmt = select(Session)
-            if exclude_session_id:
-                session_stmt = session_stmt.where(Session.id != exclude_session_id)
-            session_rows = await db.execute(session_stmt)
-            sessions = session_rows.scalars().all()
-            if not sessions:
-                return []
-
-            session_map = {session.id: session for session in sessions}
-            message_recency = await self._conversation_recency_map(
-                db,
-                exclude_session_id=exclude_session_id,
-            )
             match_expression = _build_fts_match_expression(normalized_query)
             if not match_expression:
                 return await self._search_sessions_fallback(
                     db=db,
                     normalized_query=normalized_query,
-                    session_map=session_map,
                     limit=limit,
                     exclude_session_id=exclude_session_id,
                     snippet_chars=snippet_chars,
@@ -487,12 +494,15 @@ class SessionManager:
                 return await self._search_sessions_fallback(
                     db=db,
                     normalized_query=normalized_query,
-                    session_map=session_map,
                     limit=limit,
                     exclude_session_id=exclude_session_id,
                     snippet_chars=snippet_chars,
                 )
 
+            session_map = await self._sessions_by_id(
+                db,
+                {row.get("session_id") for row in rows if isinstance(row.get("session_id"), str)},
+            )
             combined: dict[str, dict[str, object]] = {}
             for row in rows:
                 session_id = row.get("session_id")
@@ -537,7 +547,7 @@ class SessionManager:
                 combined.values(),
                 key=lambda item: (
                     float(item["rank"]),
-                    -(message_recency.get(item["session_id"]) or item["matched_at"]).timestamp(),  # type: ignore[union-attr]
+                    -(session_map[item["session_id"]].last_message_at or item["matched_at"]).timestamp(),  # type: ignore[union-attr, index]
                     -item["matched_at"].timestamp(),  # type: ignore[union-attr]
                 ),
             )
@@ -584,6 +594,11 @@ class SessionManager:
                 parsed_metadata = None
             if isinstance(parsed_metadata, dict):
                 episode_metadata = parsed_metadata
+        token_count = None
+        if role in _HISTORY_ROLES:
+            from src.agent.context_window import count_message_tokens
+
+            token_count = count_message_tokens(role, content)
         async with get_session() as db:
             msg = Message(
                 session_id=session_id,
@@ -592,14 +607,21 @@ class SessionManager:
                 step_number=step_number,
                 tool_used=tool_used,
                 metadata_json=metadata_json,
+                token_count=token_count,
             )
             db.add(msg)
-            # Update session timestamp
-            result = await db.execute(select(Session).where(Session.id == session_id))
-            session = result.scalars().first()
-            if session:
-                session.updated_at = datetime.now(timezone.utc)
-                db.add(session)
+            # Keep the session's listing columns current in the same transaction.
+            session_values: dict = {
+                "updated_at": datetime.now(timezone.utc),
+                "last_message_preview": content[:100],
+                "last_message_role": role,
+            }
+            if role in _HISTORY_ROLES:
+                session_values["last_message_at"] = msg.created_at
+                session_values["message_count"] = Session.message_count + 1
+            await db.execute(
+                update(Session).where(Session.id == session_id).values(**session_values)
+            )
             await db.flush()
             episode_draft = build_message_episode(
                 role=role,
@@ -643,43 +665,101 @@ class SessionManager:
         *,
         allow_memory_flush: bool = True,
     ) -> str:
+        # Read everything up front so no transaction stays open across the
+        # memory flush or the LLM summary call below.
         async with get_session() as db:
             result = await db.execute(
                 select(Message)
                 .where(Message.session_id == session_id)
-                .where(Message.role.in_(["user", "assistant"]))  # type: ignore[attr-defined]
+                .where(Message.role.in_(_HISTORY_ROLES))  # type: ignore[attr-defined]
                 .order_by(col(Message.created_at).desc())
                 .limit(200)
             )
-            messages = list(reversed(result.scalars().all()))
-            if not messages:
-                return ""
-
             msg_dicts = [
-                {"role": m.role, "content": m.content, "created_at": m.created_at.isoformat()}
-                for m in messages
+                {
+                    "id": m.id,
+                    "role": m.role,
+                    "content": m.content,
+                    "created_at": m.created_at.isoformat(),
+                    "token_count": m.token_count,
+                }
+                for m in reversed(result.scalars().all())
             ]
+            if not msg_dicts:
+                return ""
+            stored_summary = await db.get(SessionContextSummary, session_id)
+            stored_state = (
+                (stored_summary.summary, stored_summary.through_message_id, stored_summary.message_count)
+                if stored_summary is not None
+                else None
+            )
 
-            try:
-                from src.agent.context_window import build_context_window, requires_middle_summary
-                if allow_memory_flush and requires_middle_summary(msg_dicts):
-                    await flush_session_memory(
-                        session_id,
-                        trigger="pre_compaction",
-                        manager=self,
-                    )
-                return await asyncio.to_thread(
-                    build_context_window,
-                    msg_dicts,
-                    session_id=session_id,
+        try:
+            from src.agent.context_window import (
+                RollingSummary,
+                build_context_window,
+                count_message_tokens,
+                requires_middle_summary,
+            )
+
+            backfill: dict[str, int] = {}
+            for msg in msg_dicts:
+                if msg["token_count"] is None:
+                    # Rows written before token counts were stored are backfilled once.
+                    msg["token_count"] = count_message_tokens(msg["role"], msg["content"])
+                    backfill[msg["id"]] = msg["token_count"]
+            if backfill:
+                await self._backfill_token_counts(backfill)
+            if allow_memory_flush and requires_middle_summary(msg_dicts):
+                await flush_session_memory(
+                    session_id,
+                    trigger="pre_compaction",
+                    manager=self,
                 )
-            except Exception:
-                logger.warning("Token-aware context failed, falling back to simple truncation")
-                lines = []
-                for msg in messages[-limit:]:
-                    role = msg.role.capitalize()
-                    lines.append(f"{role}: {msg.content}")
-                return "\n".join(lines)
+            rolling_summary = RollingSummary(
+                summary=stored_state[0],
+                through_message_id=stored_state[1],
+                message_count=stored_state[2],
+            ) if stored_state is not None else RollingSummary()
+            history = await asyncio.to_thread(
+                build_context_window,
+                msg_dicts,
+                session_id=session_id,
+                rolling_summary=rolling_summary,
+            )
+            if rolling_summary.changed:
+                await self._save_context_summary(session_id, rolling_summary)
+            return history
+        except Exception:
+            logger.warning("Token-aware context failed, falling back to simple truncation")
+            lines = []
+            for msg in msg_dicts[-limit:]:
+                role = msg["role"].capitalize()
+                lines.append(f"{role}: {msg['content']}")
+            return "\n".join(lines)
+
+    @staticmethod
+    async def _backfill_token_counts(token_counts: dict[str, int]) -> None:
+        try:
+            async with get_session() as db:
+                await db.execute(
+                    update(Message),
+                    [{"id": message_id, "token_count": count} for message_id, count in token_counts.items()],
+                )
+        except SQLAlchemyError:
+            logger.debug("Failed to backfill token counts for %d message(s)", len(token_counts), exc_info=True)
+
+    @staticmethod
+    async def _save_context_summary(session_id: str, rolling_summary) -> None:
+        async with get_session() as db:
+            stored_summary = await db.get(SessionContextSummary, session_id)
+            if stored_summary is None:
+                stored_summary = SessionContextSummary(session_id=session_id)
+            stored_summary.summary = rolling_summary.summary
+            stored_summary.through_message_id = rolling_summary.through_message_id
+            stored_summary.message_count = rolling_summary.message_count
+            stored_summary.updated_at = datetime.now(timezone.utc)
+            db.add(stored_summary)
 
     async def get_messages(
         self,
@@ -979,10 +1059,8 @@ class SessionManager:
         """Count user+assistant messages in a session."""
         async with get_session() as db:
             result = await db.execute(
-                select(Message)
-                .where(Message.session_id == session_id)
-                .where(Message.role.in_(["user", "assistant"]))  # type: ignore[attr-defined]
+                select(Session.message_count).where(Session.id == session_id)
             )
-            return len(result.scalars().all())
+            return int(result.scalar() or 0)
 
 session_manager = SessionManager()
@@ -21,7 +21,7 @@ from src.approval.repository import approval_repository
 from src.approval.surfaces import approval_surface_metadata
 from src.audit.repository import audit_repository
 from src.guardian.feedback import guardian_feedback_repository
-from src.llm_logger import list_recent_llm_calls
+from src.llm_logger import list_recent_llm_calls, summarize_llm_usage_by_model
 from src.observer.insight_queue import insight_queue
 from src.observer.native_notification_queue import native_notification_queue
 
@@ -508,7 +508,7 @@ async def get_activity_ledger(
     intervention_scan_limit = max(limit * 4, 200)
     audit_scan_limit = 1000
     llm_scan_limit = 1000
-    workflow_runs, pending_approvals, notifications, queued_insights, recent_interventions, audit_events, llm_calls, continuity_snapshot = await asyncio.gather(
+    workflow_runs, pending_approvals, notifications, queued_insights, recent_interventions, audit_events, llm_calls, llm_usage_by_model, continuity_snapshot = await asyncio.gather(
         _list_workflow_runs(limit=workflow_scan_limit, session_id=session_id),
         approval_repository.list_pending(session_id=session_id, limit=approval_scan_limit),
         native_notification_queue.list(),
@@ -516,6 +516,7 @@ async def get_activity_ledger(
         guardian_feedback_repository.list_recent(limit=intervention_scan_limit, session_id=session_id),
         audit_repository.list_events(limit=audit_scan_limit, session_id=session_id, since=cutoff),
         asyncio.to_thread(list_recent_llm_calls, limit=llm_scan_limit, session_id=session_id, since=cutoff),
+        asyncio.to_thread(summarize_llm_usage_by_model, session_id=session_id, since=cutoff),
         build_observer_continuity_snapshot(),
     )
 
@@ -1051,6 +1052,8 @@ async def get_activity_ledger(
             metadata_key="capability_family",
             fallback="unattributed",
         ),
+        # Whole-window totals from the call ledger, not capped by llm_scan_limit.
+        "llm_usage_by_model": llm_usage_by_model,
         "categories": {
             "llm": sum(1 for item in items if item["category"] == "llm"),
             "workflow": sum(1 for item in items if item["category"] == "workflow"),
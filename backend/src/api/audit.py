@@ -12,3 +12,9 @@ async def list_audit_events(
 ):
     """Return recent structured audit events, newest first."""
     return await audit_repository.list_events(limit=limit, session_id=session_id)
+
+
+@router.get("/audit/buffer")
+async def get_audit_buffer_stats():
+    """Return runtime audit buffer counters, including dropped events."""
+    return audit_repository.buffer.stats()
@@ -109,6 +109,7 @@ async def list_browser_sessions(owner_session_id: str = Query(..., min_length=1)
     return {
         "owner_session_id": owner_session_id,
         "sessions": browser_session_runtime.list_sessions(owner_session_id=owner_session_id),
+        "browser_pool": browser_session_runtime.pool_status(),
     }
 
 
@@ -14,6 +14,7 @@ from src.memory.control import (
     pin_memory,
 )
 from src.memory.decay import summarize_memory_reconciliation_state
+from src.memory.embedder import get_embedding_service_stats
 from src.memory.providers import list_memory_provider_inventory
 
 router = APIRouter()
@@ -82,6 +83,11 @@ async def list_memory_providers():
     return payload
 
 
+@router.get("/memory/embedding-service")
+async def get_embedding_service():
+    return get_embedding_service_stats()
+
+
 @router.get("/memory/operator-policy")
 async def get_memory_operator_policy():
     return memory_operator_policy_payload()
@@ -8,7 +8,7 @@ import logging
 import re
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from config.settings import settings
@@ -64,6 +64,7 @@ from src.evals.final_parity_audit import (
     build_post_dx_final_claim_lift_report,
 )
 from src.evals.production_parity_readiness import build_production_parity_readiness_report
+from src.evals.report_store import benchmark_report_store, materialized_report_scope
 from src.execution.benchmark import build_m2_execution_benchmark_report
 from src.evolution.benchmark import build_governed_improvement_benchmark_report
 from src.evolution.engine import evolution_benchmark_gate_policy, list_evolution_targets
@@ -154,7 +155,19 @@ from src.workflows.post_dx_live_durable_orchestration import (
     build_post_dx_live_durable_orchestration_report,
 )
 
-router = APIRouter()
+
+async def _materialized_benchmark_reports(
+    refresh: bool = Query(
+        False,
+        description="Re-run the benchmark suites behind this report instead of serving the stored run.",
+    ),
+):
+    """Serve benchmark-suite runs behind operator reports from the report store."""
+    with materialized_report_scope(refresh=refresh):
+        yield
+
+
+router = APIRouter(dependencies=[Depends(_materialized_benchmark_reports)])
 logger = logging.getLogger(__name__)
 
 
@@ -4152,6 +4165,23 @@ async def get_operator_benchmark_proof():
     }
 
 
+@router.get("/operator/benchmark-reports")
+async def get_operator_benchmark_reports():
+    """List the materialized benchmark-suite runs behind operator reports."""
+    return {
+        "stats": benchmark_report_store.stats(),
+        "ttl_minutes": settings.operator_benchmark_report_ttl_minutes,
+        "entries": benchmark_report_store.entries(),
+    }
+
+
+async def warm_operator_benchmark_reports() -> int:
+    """Materialize every operator benchmark report on eval workers. Returns the stored suite-set count."""
+    with materialized_report_scope(warm=True):
+        await get_operator_benchmark_proof()
+    return benchmark_report_store.stats()["entries"]
+
+
 @router.get("/operator/memory-benchmark")
 async def get_operator_memory_benchmark():
     return await build_guardian_memory_benchmark_report()
@@ -1,6 +1,6 @@
 import logging
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
 from src.agent.session import session_manager
@@ -15,9 +15,23 @@ class SessionUpdate(BaseModel):
 
 
 @router.get("/sessions")
-async def list_sessions():
-    """List all sessions with titles and last message preview."""
-    return await session_manager.list_sessions()
+async def list_sessions(
+    response: Response,
+    limit: int | None = Query(default=None, ge=1, le=200),
+    cursor: str | None = Query(default=None),
+):
+    """List sessions with titles and last message preview, newest first.
+
+    With ``limit`` the list is keyset-paginated; the cursor for the next page
+    is returned in the ``X-Next-Cursor`` header (absent on the last page).
+    """
+    try:
+        sessions, next_cursor = await session_manager.list_sessions_page(limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return sessions
 
 
 @router.get("/sessions/search")
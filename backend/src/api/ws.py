@@ -2,11 +2,13 @@ import asyncio
 import contextvars
 import json
 import logging
+import re
 from contextlib import suppress
 from time import perf_counter
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from smolagents import ActionStep, ToolCall, FinalAnswerStep
+from smolagents.models import ChatMessageStreamDelta
 
 from config.settings import settings
 from src.approval.exceptions import ApprovalRequired
@@ -31,7 +33,7 @@ from src.operators.local_codex import (
 )
 from src.scheduler.connection_manager import ws_manager
 from src.tools.policy import get_current_tool_policy_mode
-from src.vault.redaction import redact_secrets_in_text
+from src.vault.redaction import SecretRedactor, load_secret_redactor, redact_secrets_in_text
 from src.llm_runtime import (
     _finish_request,
     _mark_request_timed_out,
@@ -46,6 +48,91 @@ router = APIRouter()
 
 
 _DONE = object()  # sentinel for queue completion
+_JSON_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+
+
+def _partial_json_string(raw: str, key: str) -> str | None:
+    """Decode the (possibly unterminated) string value of ``key`` in partial JSON."""
+    match = re.search(rf'"{re.escape(key)}"\s*:\s*"', raw)
+    if match is None:
+        return None
+    chars: list[str] = []
+    index = match.end()
+    while index < len(raw):
+        char = raw[index]
+        if char == '"':
+            break
+        if char != "\\":
+            chars.append(char)
+            index += 1
+            continue
+        if index + 1 >= len(raw):
+            break
+        escape = raw[index + 1]
+        if escape == "u":
+            try:
+                chars.append(chr(int(raw[index + 2:index + 6], 16)))
+            except ValueError:
+                break
+            index += 6
+            continue
+        chars.append(_JSON_ESCAPES.get(escape, escape))
+        index += 2
+    return "".join(chars)
+
+
+class _FinalAnswerStream:
+    """Turn streamed model deltas into redacted chunks of the final answer.
+
+    ToolCallingAgent answers through the ``final_answer`` tool, so the answer
+    arrives as fragments of that call's JSON arguments. Text is released only
+    up to the last whitespace and never past a tail that could still grow into
+    a vault secret (secrets may contain whitespace), and the released prefix is
+    redacted as a whole, so a secret is never split across chunks.
+    """
+
+    def __init__(self, redact: SecretRedactor):
+        self._redact = redact
+        self._tool_names: dict[int, str] = {}
+        self._arguments: dict[int, str] = {}
+        self._sent = ""
+
+    def feed(self, delta: ChatMessageStreamDelta) -> str:
+        for tool_call in delta.tool_calls or []:
+            index = getattr(tool_call, "index", None) or 0
+            function = getattr(tool_call, "function", None)
+            name = getattr(function, "name", None)
+            if name:
+                self._tool_names[index] = name
+            fragment = getattr(function, "arguments", None)
+            if isinstance(fragment, str) and fragment:
+                self._arguments[index] = self._arguments.get(index, "") + fragment
+
+        answer = None
+        for index, name in self._tool_names.items():
+            if name == "final_answer":
+                answer = _partial_json_string(self._arguments.get(index, ""), "answer")
+                break
+        if not answer:
+            return ""
+        boundary = max(answer.rfind(" "), answer.rfind("\n"), answer.rfind("\t"))
+        release_to = min(boundary + 1, len(answer) - self._redact.pending_prefix_length(answer))
+        if release_to <= 0:
+            return ""
+        released = self._redact(answer[:release_to])
+        if not released.startswith(self._sent):
+            return ""
+        chunk = released[len(self._sent):]
+        self._sent = released
+        return chunk
+
+    def reset(self) -> bool:
+        """Forget the current model step; returns whether any text had been released."""
+        had_output = bool(self._sent)
+        self._tool_names = {}
+        self._arguments = {}
+        self._sent = ""
+        return had_output
 
 
 def _format_tool_step(step_name: str, arguments: dict, specialist_names: set[str]) -> str:
@@ -64,6 +151,12 @@ def _run_agent_to_queue(agent, message: str, queue: asyncio.Queue, loop: asyncio
         loop.call_soon_threadsafe(queue.put_nowait, _DONE)
 
 
+def _enable_answer_streaming(agent) -> None:
+    """Have the agent yield model deltas so the final answer can stream over the socket."""
+    if settings.chat_stream_final_answer and hasattr(getattr(agent, "model", None), "generate_stream"):
+        agent.stream_outputs = True
+
+
 async def _build_agent(session_id: str, message: str):
     """Build the appropriate agent (onboarding vs normal) for this request.
 
@@ -72,13 +165,16 @@ async def _build_agent(session_id: str, message: str):
     profile = await get_or_create_profile()
 
     if not profile.onboarding_completed:
-        return create_onboarding_agent(message), True, set()
+        agent = create_onboarding_agent(message)
+        _enable_answer_streaming(agent)
+        return agent, True, set()
 
     guardian_state = await build_guardian_state(
         session_id=session_id,
         user_message=message,
     )
     agent = build_agent(guardian_state=guardian_state)
+    _enable_answer_streaming(agent)
     specialist_names = (
         set(agent.managed_agents.keys())
         if hasattr(agent, "managed_agents") and agent.managed_agents
@@ -87,11 +183,22 @@ async def _build_agent(session_id: str, message: str):
     return agent, False, specialist_names
 
 
+@router.get("/outbound")
+async def get_websocket_outbound_stats():
+    """Return per-connection broadcast queue lag, drops and replay buffer state."""
+    return ws_manager.stats()
+
+
 @router.websocket("/chat")
-async def websocket_chat(websocket: WebSocket):
-    """WebSocket endpoint for streaming chat responses."""
+async def websocket_chat(websocket: WebSocket, last_broadcast_seq: int | None = None):
+    """WebSocket endpoint for streaming chat responses.
+
+    Clients reconnecting with ``?last_broadcast_seq=`` (the highest
+    ``broadcast_seq`` they saw) are sent the buffered broadcasts they missed.
+    Chat frames carry their own per-socket ``seq``.
+    """
     await websocket.accept()
-    ws_manager.connect(websocket)
+    ws_manager.connect(websocket, last_broadcast_seq=last_broadcast_seq)
     _seq = 0
 
     def _next_seq() -> int:
@@ -272,6 +379,7 @@ async def websocket_chat(websocket: WebSocket):
                 reset_runtime_context(tokens)
                 reset_current_llm_request_id(llm_request_token)
                 loop.run_in_executor(None, run_ctx.run, _run_agent_to_queue, agent, ws_msg.message, queue, loop)
+                answer_stream = _FinalAnswerStream(await load_secret_redactor())
 
                 async def _drain_queue():
                     nonlocal step_num, final_result, tool_call_count
@@ -282,7 +390,19 @@ async def websocket_chat(websocket: WebSocket):
                         if isinstance(step, Exception):
                             raise step
 
-                        if isinstance(step, ToolCall):
+                        if isinstance(step, ChatMessageStreamDelta):
+                            chunk = answer_stream.feed(step)
+                            if chunk:
+                                await websocket.send_text(
+                                    WSResponse(
+                                        type="final_delta",
+                                        content=chunk,
+                                        session_id=session.id,
+                                        seq=_next_seq(),
+                                    ).model_dump_json()
+                                )
+
+                        elif isinstance(step, ToolCall):
                             if step.name == "final_answer":
                                 continue
                             tool_call_count += 1
@@ -299,6 +419,17 @@ async def websocket_chat(websocket: WebSocket):
                             )
 
                         elif isinstance(step, ActionStep):
+                            if not step.is_final_answer and answer_stream.reset():
+                                # The streamed answer was not accepted; tell the client to discard it.
+                                await websocket.send_text(
+                                    WSResponse(
+                                        type="final_delta",
+                                        content="",
+                                        session_id=session.id,
+                                        seq=_next_seq(),
+                                        reason="restart",
+                                    ).model_dump_json()
+                                )
                             if step.observations and not step.is_final_answer:
                                 safe_observations = await redact_secrets_in_text(step.observations)
                                 step_num += 1
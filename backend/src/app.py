@@ -9,6 +9,7 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from config.settings import settings
+from src.browser.pool import shutdown_browser_pool
 from src.db import init_db, close_db
 from src.extensions.registry import default_manifest_roots_for_workspace
 from src.llm_logger import init_llm_logging
@@ -20,7 +21,8 @@ from src.scheduler.engine import init_scheduler, shutdown_scheduler, sync_schedu
 from src.skills.manager import skill_manager
 from src.starter_packs.manager import starter_pack_manager
 from src.tools.mcp_manager import mcp_manager
-from src.utils.background import drain_tracked_tasks
+from src.utils.async_bridge import shutdown_async_bridge
+from src.utils.background import drain_tracked_tasks, track_task
 from src.workflows.manager import workflow_manager
 
 limiter = Limiter(key_func=get_remote_address, default_limits=["60/minute"])
@@ -91,6 +93,7 @@ async def lifespan(app: FastAPI):
             import shutil
             os.makedirs(os.path.dirname(stdio_proxy_config), exist_ok=True)
             shutil.copy2(default_proxy_config, stdio_proxy_config)
+    # Returns immediately; MCP servers connect in parallel in the background.
     mcp_manager.load_config(mcp_config)
     extensions_dir = os.path.join(settings.workspace_dir, "extensions")
     os.makedirs(extensions_dir, exist_ok=True)
@@ -110,6 +113,9 @@ async def lifespan(app: FastAPI):
     )
     init_scheduler()
     await sync_scheduled_jobs()
+    if settings.operator_benchmark_warm_on_startup:
+        from src.scheduler.jobs.benchmark_report_refresh import run_benchmark_report_refresh
+        track_task(run_benchmark_report_refresh(warm=True), name="benchmark_report_refresh:startup")
     try:
         from src.observer.manager import context_manager
         await context_manager.refresh()
@@ -125,6 +131,8 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         shutdown_error = exc
     finally:
+        shutdown_browser_pool(timeout_seconds=5.0)
+        shutdown_async_bridge(timeout_seconds=5.0)
         await close_db()
     if shutdown_error is not None:
         raise shutdown_error
@@ -148,6 +156,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     @app.get("/health")
@@ -0,0 +1,206 @@
+"""Bounded in-process buffer that batches fail-open runtime audit writes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from src.utils.background import track_task
+
+logger = logging.getLogger(__name__)
+
+AuditBatchWriter = Callable[[list[dict[str, Any]]], Awaitable[Any]]
+
+
+class AuditEventBuffer:
+    """Queue audit rows in memory and write them in batched transactions.
+
+    Events enqueued from a running event loop are flushed by a tracked writer
+    task on that loop; events enqueued from plain threads are flushed by one
+    long-lived daemon writer thread. Either writer flushes once ``batch_size``
+    events are pending or ``flush_interval_seconds`` has elapsed. When
+    ``max_pending`` events are already queued, new events are dropped and
+    counted instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        writer: AuditBatchWriter,
+        max_pending: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        thread_idle_seconds: float = 30.0,
+    ) -> None:
+        self._writer = writer
+        self._max_pending = max(1, max_pending)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_seconds = max(0.01, flush_interval_seconds)
+        self._thread_idle_seconds = thread_idle_seconds
+        self._pending: deque[dict[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self._inflight = 0
+        self._loop_wakeups: dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
+        self._thread: threading.Thread | None = None
+        self._thread_wakeup = threading.Event()
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+
+    def enqueue(self, event: dict[str, Any]) -> bool:
+        """Queue one event for the background writer. Returns ``False`` if dropped."""
+        with self._condition:
+            if len(self._pending) >= self._max_pending:
+                self._dropped += 1
+                dropped = self._dropped
+                accepted = False
+            else:
+                self._pending.append(event)
+                self._enqueued += 1
+                accepted = True
+            batch_ready = len(self._pending) >= self._batch_size
+        if not accepted:
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning("Runtime audit buffer full; dropped %d event(s) so far", dropped)
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._ensure_thread_writer(batch_ready=batch_ready)
+        else:
+            self._ensure_loop_writer(loop, batch_ready=batch_ready)
+        return True
+
+    async def flush(self) -> int:
+        """Write every pending event on the current loop. Returns rows written."""
+        written = 0
+        while True:
+            with self._condition:
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self._batch_size, len(self._pending)))
+                ]
+                if not batch:
+                    return written
+                self._inflight += 1
+            try:
+                await self._writer(batch)
+            except Exception:
+                with self._condition:
+                    self._failed += len(batch)
+                logger.debug("Failed to write %d buffered runtime audit event(s)", len(batch), exc_info=True)
+            else:
+                written += len(batch)
+                with self._condition:
+                    self._written += len(batch)
+                    self._batches += 1
+            finally:
+                with self._condition:
+                    self._inflight -= 1
+                    self._condition.notify_all()
+
+    async def drain(self, *, timeout_seconds: float = 5.0) -> int:
+        """Flush pending events and wait for batches other writers have in flight."""
+        written = await self.flush()
+        for wakeup in tuple(self._loop_wakeups.values()):
+            wakeup.set()
+        # Poll rather than block a worker thread so draining never creates the
+        # loop's default executor.
+        deadline = time.monotonic() + timeout_seconds
+        while time.monotonic() < deadline:
+            with self._condition:
+                if self._inflight == 0:
+                    break
+            await asyncio.sleep(0.005)
+        return written
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "max_pending": self._max_pending,
+                "enqueued": self._enqueued,
+                "written": self._written,
+                "batches": self._batches,
+                "dropped": self._dropped,
+                "failed": self._failed,
+            }
+
+    def reset(self) -> None:
+        """Discard pending events and counters for tests and deterministic evals."""
+        with self._condition:
+            self._pending.clear()
+            self._enqueued = 0
+            self._written = 0
+            self._dropped = 0
+            self._failed = 0
+            self._batches = 0
+
+    def _ensure_loop_writer(self, loop: asyncio.AbstractEventLoop, *, batch_ready: bool) -> None:
+        wakeup = self._loop_wakeups.get(loop)
+        if wakeup is None:
+            wakeup = asyncio.Event()
+            self._loop_wakeups[loop] = wakeup
+            track_task(self._run_loop_writer(loop, wakeup), name="runtime_audit:buffer_writer")
+        if batch_ready:
+            wakeup.set()
+
+    async def _run_loop_writer(self, loop: asyncio.AbstractEventLoop, wakeup: asyncio.Event) -> None:
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=self._flush_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+                await self.flush()
+                with self._condition:
+                    if not self._pending:
+                        self._loop_wakeups.pop(loop, None)
+                        return
+        except BaseException:
+            self._loop_wakeups.pop(loop, None)
+            raise
+
+    def _ensure_thread_writer(self, *, batch_ready: bool) -> None:
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_thread_writer,
+                    name="runtime_audit:buffer_writer",
+                    daemon=True,
+                )
+                self._thread.start()
+        if batch_ready:
+            self._thread_wakeup.set()
+
+    def _run_thread_writer(self) -> None:
+        loop = asyncio.new_event_loop()
+        idle_seconds = 0.0
+        try:
+            while True:
+                woken = self._thread_wakeup.wait(timeout=self._flush_interval_seconds)
+                self._thread_wakeup.clear()
+                with self._condition:
+                    has_pending = bool(self._pending)
+                    if not has_pending:
+                        idle_seconds = 0.0 if woken else idle_seconds + self._flush_interval_seconds
+                        if idle_seconds >= self._thread_idle_seconds:
+                            self._thread = None
+                            return
+                if has_pending:
+                    idle_seconds = 0.0
+                    loop.run_until_complete(self.flush())
+        except Exception:  # pragma: no cover - fail-open logging path
+            logger.debug("Runtime audit writer thread stopped unexpectedly", exc_info=True)
+            with self._condition:
+                self._thread = None
+        finally:
+            loop.close()
@@ -1,17 +1,117 @@
 """Persistence helpers for structured audit events."""
 
 import json
-from datetime import datetime
-from typing import Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Iterator
+from uuid import uuid4
 
+from sqlalchemy import insert
 from sqlmodel import select, col
 
+from config.settings import settings
+from src.audit.buffer import AuditEventBuffer
 from src.db.engine import get_session
 from src.db.models import AuditEvent
 from src.db.session_refs import ensure_sessions_exist
+from src.utils.background import register_drain_hook
+
+_SCOPED_BUFFER: ContextVar[AuditEventBuffer | None] = ContextVar("audit_scoped_buffer", default=None)
 
 
 class AuditRepository:
+    def __init__(self) -> None:
+        self._buffer = self.new_buffer()
+
+    @property
+    def buffer(self) -> AuditEventBuffer:
+        """The buffer for the current context: an isolated scope's buffer, else the live one."""
+        return _SCOPED_BUFFER.get() or self._buffer
+
+    def new_buffer(self) -> AuditEventBuffer:
+        return AuditEventBuffer(
+            writer=self._write_buffered_events,
+            max_pending=settings.audit_buffer_max_pending,
+            batch_size=settings.audit_buffer_batch_size,
+            flush_interval_seconds=settings.audit_buffer_flush_interval_ms / 1000,
+        )
+
+    @contextmanager
+    def isolated_buffer(self) -> Iterator[AuditEventBuffer]:
+        """Queue events from this context, and the tasks it starts, on a private buffer.
+
+        Eval scenarios run inside one so their events and counters never touch
+        the live buffer. Events still pending on exit are discarded.
+        """
+        buffer = self.new_buffer()
+        token = _SCOPED_BUFFER.set(buffer)
+        try:
+            yield buffer
+        finally:
+            _SCOPED_BUFFER.reset(token)
+            buffer.reset()
+
+    async def _write_buffered_events(self, events: list[dict[str, Any]]) -> int:
+        return await self.log_events(events)
+
+    def enqueue_event(
+        self,
+        *,
+        event_type: str,
+        summary: str,
+        session_id: str | None = None,
+        actor: str = "agent",
+        tool_name: str | None = None,
+        risk_level: str = "low",
+        policy_mode: str = "full",
+        details: dict[str, Any] | None = None,
+    ) -> bool:
+        """Queue an event for the batched background writer instead of writing inline."""
+        return self.buffer.enqueue(
+            {
+                "event_type": event_type,
+                "summary": summary,
+                "session_id": session_id,
+                "actor": actor,
+                "tool_name": tool_name,
+                "risk_level": risk_level,
+                "policy_mode": policy_mode,
+                "details": details,
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+
+    async def flush_pending(self) -> int:
+        """Write buffered events so subsequent reads observe them."""
+        return await self.buffer.drain()
+
+    async def log_events(self, events: list[dict[str, Any]]) -> int:
+        """Insert several events in one transaction with a single executemany."""
+        if not events:
+            return 0
+        rows = [
+            {
+                "id": uuid4().hex,
+                "session_id": event.get("session_id"),
+                "actor": event.get("actor", "agent"),
+                "event_type": event["event_type"],
+                "tool_name": event.get("tool_name"),
+                "risk_level": event.get("risk_level", "low"),
+                "policy_mode": event.get("policy_mode", "full"),
+                "summary": event.get("summary", ""),
+                "details_json": (
+                    json.dumps(event["details"]) if event.get("details") is not None else None
+                ),
+                "created_at": event.get("created_at") or datetime.now(timezone.utc),
+            }
+            for event in events
+        ]
+        async with get_session() as db:
+            await ensure_sessions_exist(db, [row["session_id"] for row in rows])
+            await db.execute(insert(AuditEvent), rows)
+        return len(rows)
+
     async def log_event(
         self,
         *,
@@ -49,6 +149,7 @@ class AuditRepository:
         since: datetime | None = None,
     ) -> list[dict]:
         limit = min(max(limit, 1), 500)
+        await self.flush_pending()
         async with get_session() as db:
             stmt = select(AuditEvent).order_by(col(AuditEvent.created_at).desc()).limit(limit)
             if session_id:
@@ -76,3 +177,4 @@ class AuditRepository:
 
 
 audit_repository = AuditRepository()
+register_drain_hook(audit_repository.flush_pending)
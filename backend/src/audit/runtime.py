@@ -2,40 +2,20 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import threading
 from typing import Any
 
 from src.audit.repository import audit_repository
-from src.utils.background import track_task
 
 logger = logging.getLogger(__name__)
-_SYNC_AUDIT_WAIT_SECONDS = 5.0
-
-
-def _run_coro_on_dedicated_loop(coro, *, label: str) -> None:
-    error: Exception | None = None
-
-    def _runner() -> None:
-        nonlocal error
-        try:
-            asyncio.run(coro)
-        except Exception as exc:  # pragma: no cover - fail-open logging path
-            error = exc
-
-    worker = threading.Thread(target=_runner, name=label, daemon=True)
-    worker.start()
-    worker.join(timeout=_SYNC_AUDIT_WAIT_SECONDS)
-    if worker.is_alive():
-        logger.debug(
-            "Timed out waiting for sync runtime audit %s after %.1fs",
-            label,
-            _SYNC_AUDIT_WAIT_SECONDS,
-        )
-        return
-    if error is not None:
-        logger.debug("Failed to record sync runtime audit %s", label, exc_info=error)
+
+
+def _integration_summary(integration_type: str, name: str, outcome: str) -> str:
+    return f"{integration_type.replace('_', ' ').capitalize()} {name} {outcome.replace('_', ' ')}"
+
+
+def _background_task_summary(task_name: str, outcome: str) -> str:
+    return f"Background task {task_name} {outcome.replace('_', ' ')}"
 
 
 async def log_agent_run_event(
@@ -99,7 +79,7 @@ async def log_background_task_event(
     details: dict[str, Any] | None = None,
 ) -> None:
     """Record a background/helper runtime event without breaking callers."""
-    summary = f"Background task {task_name} {outcome.replace('_', ' ')}"
+    summary = _background_task_summary(task_name, outcome)
     try:
         await audit_repository.log_event(
             session_id=session_id,
@@ -123,7 +103,7 @@ async def log_integration_event(
     details: dict[str, Any] | None = None,
 ) -> None:
     """Record an external integration lifecycle event without breaking callers."""
-    summary = f"{integration_type.replace('_', ' ').capitalize()} {name} {outcome.replace('_', ' ')}"
+    summary = _integration_summary(integration_type, name, outcome)
     try:
         await audit_repository.log_event(
             actor="system",
@@ -181,33 +161,27 @@ def log_integration_event_sync(
     outcome: str,
     details: dict[str, Any] | None = None,
 ) -> None:
-    """Sync wrapper for integration runtime events used by non-async callers."""
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        _run_coro_on_dedicated_loop(
-            log_integration_event(
-                integration_type=integration_type,
-                name=name,
-                outcome=outcome,
-                details=details,
-            ),
-            label=f"runtime_audit:integration:{integration_type}:{name}",
-        )
-        return
+    """Sync wrapper for integration runtime events used by non-async callers.
 
+    Events are queued on the audit buffer and written in batches by its
+    background writer, so hot paths never pay for a thread or transaction.
+    """
     try:
-        track_task(
-            log_integration_event(
-                integration_type=integration_type,
-                name=name,
-                outcome=outcome,
-                details=details,
-            ),
-            name=f"runtime_audit:integration:{integration_type}:{name}",
+        audit_repository.enqueue_event(
+            actor="system",
+            event_type=f"integration_{outcome}",
+            tool_name=f"{integration_type}:{name}",
+            risk_level="low",
+            policy_mode="full",
+            summary=_integration_summary(integration_type, name, outcome),
+            details={
+                "integration_type": integration_type,
+                "name": name,
+                **(details or {}),
+            },
         )
     except Exception:
-        logger.debug("Failed to run integration runtime audit logger", exc_info=True)
+        logger.debug("Failed to queue integration runtime audit event", exc_info=True)
 
 
 def log_background_task_event_sync(
@@ -219,28 +193,15 @@ def log_background_task_event_sync(
 ) -> None:
     """Sync wrapper for background/helper runtime events used by non-async callers."""
     try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        _run_coro_on_dedicated_loop(
-            log_background_task_event(
-                task_name=task_name,
-                outcome=outcome,
-                session_id=session_id,
-                details=details,
-            ),
-            label=f"runtime_audit:background:{task_name}:{outcome}",
-        )
-        return
-
-    try:
-        track_task(
-            log_background_task_event(
-                task_name=task_name,
-                outcome=outcome,
-                session_id=session_id,
-                details=details,
-            ),
-            name=f"runtime_audit:background:{task_name}:{outcome}",
+        audit_repository.enqueue_event(
+            session_id=session_id,
+            actor="system",
+            event_type=f"background_task_{outcome}",
+            tool_name=task_name,
+            risk_level="low",
+            policy_mode="full",
+            summary=_background_task_summary(task_name, outcome),
+            details=details or {},
         )
     except Exception:
-        logger.debug("Failed to run background runtime audit logger", exc_info=True)
+        logger.debug("Failed to queue background runtime audit event", exc_info=True)
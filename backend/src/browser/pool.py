@@ -0,0 +1,258 @@
+"""Warm Playwright Chromium pool shared by ``browse_webpage`` and browser sessions.
+
+Launching Chromium costs a second or two per call, so instead of starting
+Playwright and a browser for every browse, the pool keeps up to
+``browser_pool_size`` browsers running on one long-lived event loop and hands
+each call a fresh browser context. Contexts never share cookies or storage,
+and callers install their own per-page routes, so the site-policy guard is
+unaffected. Browsers are health-checked before reuse, recycled after
+``browser_pool_max_pages`` contexts, and closed once idle for
+``browser_pool_idle_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, TypeVar
+
+from config.settings import settings
+from src.utils.async_bridge import AsyncBridge
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _PooledBrowser:
+    browser: Any
+    launched_at: float
+    last_used_at: float
+    contexts_served: int = 0
+    active_contexts: int = 0
+    retiring: bool = False
+
+    def healthy(self) -> bool:
+        try:
+            return bool(self.browser.is_connected())
+        except Exception:
+            return False
+
+
+class BrowserPool:
+    """Keep warm Chromium browsers on a dedicated loop and lend out isolated contexts.
+
+    All pool state is touched only from the pool's own loop; sync callers go
+    through :meth:`run`, which submits the coroutine to that loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        launcher: Callable[[], Awaitable[Any]] | None = None,
+        name: str = "browser_pool",
+    ) -> None:
+        self._bridge = AsyncBridge(name=name)
+        self._launcher = launcher
+        self._playwright: Any = None
+        self._browsers: list[_PooledBrowser] = []
+        self._lock: asyncio.Lock | None = None
+        self._reaper: asyncio.Task | None = None
+        self._launches = 0
+        self._contexts_served = 0
+        self._recycled = 0
+        self._health_evictions = 0
+        self._idle_evictions = 0
+
+    def run(self, coro: Coroutine[Any, Any, T], *, timeout_seconds: float | None = None) -> T:
+        """Run ``coro`` on the pool loop and block for its result."""
+        return self._bridge.run(coro, timeout_seconds=timeout_seconds)
+
+    @asynccontextmanager
+    async def context(self, **context_options: Any) -> AsyncIterator[Any]:
+        """Yield a new browser context on a warm browser; closes the context on exit."""
+        pooled = await self._checkout()
+        context = None
+        try:
+            try:
+                context = await pooled.browser.new_context(**context_options)
+            except Exception:
+                # The browser died between the health check and now; replace it once.
+                logger.warning("Pooled browser failed to open a context; relaunching", exc_info=True)
+                await self._discard(pooled)
+                pooled = await self._checkout()
+                context = await pooled.browser.new_context(**context_options)
+            yield context
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    logger.debug("Closing pooled browser context failed", exc_info=True)
+            await self._checkin(pooled)
+
+    def stats(self) -> dict[str, Any]:
+        browsers = list(self._browsers)
+        return {
+            "size_limit": max(1, settings.browser_pool_size),
+            "warm_browsers": len(browsers),
+            "active_contexts": sum(item.active_contexts for item in browsers),
+            "launches": self._launches,
+            "contexts_served": self._contexts_served,
+            "recycled": self._recycled,
+            "health_evictions": self._health_evictions,
+            "idle_evictions": self._idle_evictions,
+            "loop": self._bridge.stats(),
+        }
+
+    def shutdown(self, *, timeout_seconds: float = 5.0) -> None:
+        """Close every pooled browser and Playwright, then stop the pool loop."""
+        if self._bridge.stats()["running"]:
+            try:
+                self._bridge.run(self._close_all(), timeout_seconds=timeout_seconds)
+            except Exception:
+                logger.warning("Closing pooled browsers during shutdown failed", exc_info=True)
+        self._bridge.shutdown(timeout_seconds=timeout_seconds)
+        self._browsers = []
+        self._playwright = None
+        self._lock = None
+        self._reaper = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _checkout(self) -> _PooledBrowser:
+        stale: list[_PooledBrowser] = []
+        async with self._get_lock():
+            for item in list(self._browsers):
+                if not item.healthy():
+                    self._browsers.remove(item)
+                    self._health_evictions += 1
+                    stale.append(item)
+            candidates = [item for item in self._browsers if not item.retiring]
+            idle = [item for item in candidates if item.active_contexts == 0]
+            if idle:
+                pooled = max(idle, key=lambda item: item.last_used_at)
+            elif len(candidates) < max(1, settings.browser_pool_size):
+                pooled = await self._launch()
+            else:
+                pooled = min(candidates, key=lambda item: item.active_contexts)
+            pooled.active_contexts += 1
+            pooled.contexts_served += 1
+            pooled.last_used_at = time.monotonic()
+            self._contexts_served += 1
+            if settings.browser_pool_max_pages > 0 and pooled.contexts_served >= settings.browser_pool_max_pages:
+                # Finish the contexts already lent out, then close and relaunch lazily.
+                pooled.retiring = True
+            self._ensure_reaper()
+        for item in stale:
+            await self._close_browser(item)
+        return pooled
+
+    async def _checkin(self, pooled: _PooledBrowser) -> None:
+        async with self._get_lock():
+            pooled.active_contexts = max(0, pooled.active_contexts - 1)
+            pooled.last_used_at = time.monotonic()
+            close = (
+                pooled.active_contexts == 0
+                and (pooled.retiring or not pooled.healthy())
+                and pooled in self._browsers
+            )
+            if close:
+                self._browsers.remove(pooled)
+                if pooled.retiring:
+                    self._recycled += 1
+                else:
+                    self._health_evictions += 1
+        if close:
+            await self._close_browser(pooled)
+
+    async def _discard(self, pooled: _PooledBrowser) -> None:
+        async with self._get_lock():
+            if pooled in self._browsers:
+                self._browsers.remove(pooled)
+                self._health_evictions += 1
+        await self._close_browser(pooled)
+
+    async def _launch(self) -> _PooledBrowser:
+        if self._launcher is not None:
+            browser = await self._launcher()
+        else:
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+            browser = await self._playwright.chromium.launch(headless=True)
+        now = time.monotonic()
+        pooled = _PooledBrowser(browser=browser, launched_at=now, last_used_at=now)
+        self._browsers.append(pooled)
+        self._launches += 1
+        return pooled
+
+    def _ensure_reaper(self) -> None:
+        if settings.browser_pool_idle_seconds <= 0:
+            return
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.get_running_loop().create_task(
+                self._reap_idle(),
+                name="browser_pool_reaper",
+            )
+
+    async def _reap_idle(self) -> None:
+        while True:
+            idle_seconds = settings.browser_pool_idle_seconds
+            if idle_seconds <= 0:
+                return
+            await asyncio.sleep(max(1.0, idle_seconds / 2))
+            expired: list[_PooledBrowser] = []
+            async with self._get_lock():
+                now = time.monotonic()
+                for item in list(self._browsers):
+                    if item.active_contexts == 0 and now - item.last_used_at >= idle_seconds:
+                        self._browsers.remove(item)
+                        self._idle_evictions += 1
+                        expired.append(item)
+                for item in expired:
+                    await self._close_browser(item)
+                if not self._browsers:
+                    # Nothing warm left; release Playwright too until the next checkout.
+                    await self._stop_playwright()
+                    self._reaper = None
+                    return
+
+    async def _close_all(self) -> None:
+        if self._reaper is not None and not self._reaper.done():
+            self._reaper.cancel()
+        async with self._get_lock():
+            browsers, self._browsers = self._browsers, []
+            for item in browsers:
+                await self._close_browser(item)
+            await self._stop_playwright()
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        try:
+            await pooled.browser.close()
+        except Exception:
+            logger.debug("Closing pooled browser failed", exc_info=True)
+
+    async def _stop_playwright(self) -> None:
+        playwright, self._playwright = self._playwright, None
+        if playwright is None:
+            return
+        try:
+            await playwright.stop()
+        except Exception:
+            logger.debug("Stopping Playwright failed", exc_info=True)
+
+
+browser_pool = BrowserPool()
+
+
+def shutdown_browser_pool(*, timeout_seconds: float = 5.0) -> None:
+    browser_pool.shutdown(timeout_seconds=timeout_seconds)
@@ -10,6 +10,8 @@ import threading
 import uuid
 from typing import Any
 
+from src.browser.pool import browser_pool
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -240,6 +242,10 @@ class BrowserSessionRuntime:
             self._sessions = {}
             self._refs = {}
 
+    def pool_status(self) -> dict[str, object]:
+        """Warm browser pool serving this runtime's captures (shared with browse_webpage)."""
+        return browser_pool.stats()
+
     def list_sessions(self, *, owner_session_id: str) -> list[dict[str, object]]:
         with self._lock:
             sessions = [
@@ -57,6 +57,48 @@ async def _ensure_legacy_columns(conn) -> None:
             "ALTER TABLE user_profiles ADD COLUMN approval_mode VARCHAR DEFAULT 'high_risk'"
         )
 
+    message_columns = await _table_columns("messages")
+    if message_columns and "token_count" not in message_columns:
+        await conn.exec_driver_sql(
+            "ALTER TABLE messages ADD COLUMN token_count INTEGER"
+        )
+
+    session_columns = await _table_columns("sessions")
+    if session_columns and "message_count" not in session_columns:
+        await conn.exec_driver_sql("ALTER TABLE sessions ADD COLUMN last_message_at DATETIME")
+        await conn.exec_driver_sql("ALTER TABLE sessions ADD COLUMN last_message_preview VARCHAR")
+        await conn.exec_driver_sql("ALTER TABLE sessions ADD COLUMN last_message_role VARCHAR")
+        await conn.exec_driver_sql(
+            "ALTER TABLE sessions ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0"
+        )
+        await conn.exec_driver_sql(
+            """
+            UPDATE sessions SET
+                last_message_at = (
+                    SELECT MAX(m.created_at) FROM messages m
+                    WHERE m.session_id = sessions.id AND m.role IN ('user', 'assistant')
+                ),
+                message_count = (
+                    SELECT COUNT(*) FROM messages m
+                    WHERE m.session_id = sessions.id AND m.role IN ('user', 'assistant')
+                ),
+                last_message_preview = (
+                    SELECT substr(m.content, 1, 100) FROM messages m
+                    WHERE m.session_id = sessions.id
+                    ORDER BY m.created_at DESC LIMIT 1
+                ),
+                last_message_role = (
+                    SELECT m.role FROM messages m
+                    WHERE m.session_id = sessions.id
+                    ORDER BY m.created_at DESC LIMIT 1
+                )
+            """
+        )
+    if session_columns:
+        await conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_sessions_updated_at_id ON sessions (updated_at, id)"
+        )
+
     queued_insight_columns = await _table_columns("queued_insights")
     if queued_insight_columns and "intervention_id" not in queued_insight_columns:
         await conn.exec_driver_sql(
@@ -303,6 +345,121 @@ async def _ensure_search_indexes(conn) -> None:
           AND episode_type != 'conversation'
         """
     )
+    await _ensure_memory_search_indexes(conn)
+
+
+async def _ensure_memory_search_indexes(conn) -> None:
+    """Keep the lexical memory/episode index used by hybrid retrieval in sync.
+
+    The trigram tokenizer preserves the substring semantics of the old
+    ``LIKE '%term%'`` predicates while letting SQLite rank matches with BM25.
+    Older databases are backfilled once, whenever the index row count drifts
+    from the source tables.
+    """
+    table_rows = await conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('memories', 'memory_episodes')"
+    )
+    existing_tables = {row[0] for row in table_rows.fetchall()}
+    if existing_tables != {"memories", "memory_episodes"}:
+        return
+
+    await conn.exec_driver_sql(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS memory_recall_fts USING fts5(
+            entry_key UNINDEXED,
+            source_type UNINDEXED,
+            source_id UNINDEXED,
+            text,
+            tokenize = 'trigram'
+        )
+        """
+    )
+
+    trigger_statements = (
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_recall_memories_ai
+        AFTER INSERT ON memories
+        BEGIN
+            INSERT INTO memory_recall_fts (entry_key, source_type, source_id, text)
+            VALUES ('memory:' || NEW.id, 'memory', NEW.id, COALESCE(NEW.summary, '') || ' ' || COALESCE(NEW.content, ''));
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_recall_memories_au
+        AFTER UPDATE OF summary, content ON memories
+        BEGIN
+            DELETE FROM memory_recall_fts WHERE entry_key = 'memory:' || OLD.id;
+            INSERT INTO memory_recall_fts (entry_key, source_type, source_id, text)
+            VALUES ('memory:' || NEW.id, 'memory', NEW.id, COALESCE(NEW.summary, '') || ' ' || COALESCE(NEW.content, ''));
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_recall_memories_ad
+        AFTER DELETE ON memories
+        BEGIN
+            DELETE FROM memory_recall_fts WHERE entry_key = 'memory:' || OLD.id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_recall_episodes_ai
+        AFTER INSERT ON memory_episodes
+        BEGIN
+            INSERT INTO memory_recall_fts (entry_key, source_type, source_id, text)
+            VALUES ('episode:' || NEW.id, 'episode', NEW.id, COALESCE(NEW.summary, '') || ' ' || COALESCE(NEW.content, ''));
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_recall_episodes_au
+        AFTER UPDATE OF summary, content ON memory_episodes
+        BEGIN
+            DELETE FROM memory_recall_fts WHERE entry_key = 'episode:' || OLD.id;
+            INSERT INTO memory_recall_fts (entry_key, source_type, source_id, text)
+            VALUES ('episode:' || NEW.id, 'episode', NEW.id, COALESCE(NEW.summary, '') || ' ' || COALESCE(NEW.content, ''));
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_recall_episodes_ad
+        AFTER DELETE ON memory_episodes
+        BEGIN
+            DELETE FROM memory_recall_fts WHERE entry_key = 'episode:' || OLD.id;
+        END
+        """,
+    )
+    for statement in trigger_statements:
+        await conn.exec_driver_sql(statement)
+
+    indexed_count = (await conn.exec_driver_sql("SELECT COUNT(*) FROM memory_recall_fts")).scalar()
+    source_count = (
+        await conn.exec_driver_sql(
+            "SELECT (SELECT COUNT(*) FROM memories) + (SELECT COUNT(*) FROM memory_episodes)"
+        )
+    ).scalar()
+    if indexed_count == source_count:
+        return
+
+    await conn.exec_driver_sql("DELETE FROM memory_recall_fts")
+    await conn.exec_driver_sql(
+        """
+        INSERT INTO memory_recall_fts (entry_key, source_type, source_id, text)
+        SELECT
+            'memory:' || id,
+            'memory',
+            id,
+            COALESCE(summary, '') || ' ' || COALESCE(content, '')
+        FROM memories
+        """
+    )
+    await conn.exec_driver_sql(
+        """
+        INSERT INTO memory_recall_fts (entry_key, source_type, source_id, text)
+        SELECT
+            'episode:' || id,
+            'episode',
+            id,
+            COALESCE(summary, '') || ' ' || COALESCE(content, '')
+        FROM memory_episodes
+        """
+    )
 
 
 async def _ensure_memory_indexes(conn) -> None:
@@ -323,6 +480,10 @@ async def init_db() -> None:
         await _ensure_legacy_columns(conn)
         await _ensure_memory_indexes(conn)
         await _ensure_search_indexes(conn)
+    # Databases that predate the screen activity rollups get them built once.
+    from src.observer.screen_repository import screen_observation_repo
+
+    await screen_observation_repo.ensure_rollups()
 
 
 async def close_db() -> None:
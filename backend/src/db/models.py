@@ -110,6 +110,11 @@ class Session(SQLModel, table=True):
     title: str = Field(default="New Conversation")
     created_at: datetime = Field(default_factory=_now)
     updated_at: datetime = Field(default_factory=_now)
+    # Maintained by SessionManager.add_message so listing and search never scan messages.
+    last_message_at: Optional[datetime] = Field(default=None)  # latest user/assistant message
+    last_message_preview: Optional[str] = Field(default=None)  # first 100 chars of the latest message, any role
+    last_message_role: Optional[str] = Field(default=None)
+    message_count: int = Field(default=0)  # user/assistant messages
 
     messages: list["Message"] = Relationship(back_populates="session")
 
@@ -126,11 +131,26 @@ class Message(SQLModel, table=True):
     metadata_json: Optional[str] = Field(default=None)
     step_number: Optional[int] = Field(default=None)
     tool_used: Optional[str] = Field(default=None)
+    token_count: Optional[int] = Field(default=None)  # formatted history-line tokens, set at insert
     created_at: datetime = Field(default_factory=_now)
 
     session: Optional[Session] = Relationship(back_populates="messages")
 
 
+# ─── Session Context Summary ────────────────────────────
+
+class SessionContextSummary(SQLModel, table=True):
+    """Rolling summary of history messages evicted from the context window."""
+
+    __tablename__ = "session_context_summaries"
+
+    session_id: str = Field(foreign_key="sessions.id", primary_key=True)
+    summary: str = Field(default="")
+    through_message_id: str = Field(default="")  # last message folded into the summary
+    message_count: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=_now)
+
+
 # ─── Session Todo ───────────────────────────────────────
 
 class SessionTodo(SQLModel, table=True):
@@ -524,6 +544,82 @@ class ScreenObservation(SQLModel, table=True):
     created_at: datetime = Field(default_factory=_now)
 
 
+class ScreenActivityRollup(SQLModel, table=True):
+    """Per-hour and per-day tracked time for one activity, project or app.
+
+    ``dimension="total"`` (with an empty ``key``) holds the bucket's overall
+    observation count and tracked seconds. Blocked observations are excluded.
+    """
+
+    __tablename__ = "screen_activity_rollups"
+    __table_args__ = (
+        Index(
+            "ix_screen_activity_rollups_bucket_unique",
+            "granularity",
+            "bucket_start",
+            "dimension",
+            "key",
+            unique=True,
+        ),
+    )
+
+    id: str = Field(default_factory=_uuid, primary_key=True)
+    granularity: str = Field(index=True)  # "hour" | "day"
+    bucket_start: datetime = Field(index=True)
+    dimension: str  # "total" | "activity" | "project" | "app"
+    key: str = Field(default="")
+    observation_count: int = Field(default=0)
+    tracked_s: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=_now)
+
+
+class ScreenActivityStreak(SQLModel, table=True):
+    """Run of consecutive same-activity, non-blocked observations within one day."""
+
+    __tablename__ = "screen_activity_streaks"
+
+    id: str = Field(default_factory=_uuid, primary_key=True)
+    bucket_date: str = Field(index=True)  # ISO date (UTC) the streak belongs to
+    activity_type: str
+    started_at: datetime = Field(index=True)
+    last_observed_at: datetime
+    observation_count: int = Field(default=0)
+    duration_s: int = Field(default=0)
+
+
+class ScreenshotFolderFile(SQLModel, table=True):
+    """Screenshot-folder image already ingested or found to be a duplicate.
+
+    A file whose ``(size, mtime_ns, inode)`` still match is skipped without
+    being re-hashed on the next scan.
+    """
+
+    __tablename__ = "screenshot_folder_files"
+
+    path: str = Field(primary_key=True)
+    root: str = Field(index=True)
+    size: int
+    mtime_ns: int
+    inode: int
+    image_sha256: str = Field(index=True)
+    captured_at_epoch: float  # capture time used to order scans, newest first
+    seen_at: datetime = Field(default_factory=_now)
+
+
+class ScreenshotFolderDirectory(SQLModel, table=True):
+    """Last listing of a screenshot-folder directory, reused while its mtime is unchanged."""
+
+    __tablename__ = "screenshot_folder_directories"
+
+    path: str = Field(primary_key=True)
+    root: str = Field(index=True)
+    mtime_ns: int
+    inode: int
+    images_json: str = Field(default="[]")  # image file names directly inside the directory
+    subdirs_json: str = Field(default="[]")  # subdirectory names directly inside the directory
+    scanned_at: datetime = Field(default_factory=_now)
+
+
 # ─── Secret (Vault) ─────────────────────────────────────
 
 class Secret(SQLModel, table=True):
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextvars
 import inspect
 import json
 import os
@@ -15,11 +16,11 @@ import time
 import tempfile
 import threading
 import types
-from contextlib import ExitStack, asynccontextmanager, suppress
+from contextlib import ExitStack, asynccontextmanager, contextmanager, suppress
 from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Sequence
+from typing import Any, Awaitable, Callable, Iterator, Sequence
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -673,7 +674,10 @@ from src.memory.provider_quality_gate import (
     MEMORY_PROVIDER_QUALITY_GATE_SUITE_NAME,
     build_memory_provider_quality_gate_report,
 )
-from src.memory.providers import memory_provider_quality_gate_policy_payload
+from src.memory.providers import (
+    invalidate_memory_provider_inventory_cache,
+    memory_provider_quality_gate_policy_payload,
+)
 from src.workflows.operating_layer import (
     M5_OPERATING_LAYER_BENCHMARK_SCENARIO_NAMES,
     M5_OPERATING_LAYER_BENCHMARK_SUITE_NAME,
@@ -799,7 +803,7 @@ from src.approval.exceptions import ApprovalRequired
 from src.approval.runtime import reset_runtime_context, set_runtime_context
 from src.agent.session import SessionManager, session_manager
 from src.agent.context_window import _summarize_middle, _summary_cache
-from src.agent.factory import create_agent, create_orchestrator, get_model
+from src.agent.factory import _reset_tool_surface_cache, create_agent, create_orchestrator, get_model
 from src.agent.onboarding import create_onboarding_agent
 from src.agent.specialists import build_all_specialists, create_mcp_specialist, create_specialist, mcp_specialist_runtime_path
 from src.agent.strategist import create_strategist_agent
@@ -953,9 +957,24 @@ from src.security.post_dx_formal_secure_runtime_isolation import (
     build_post_dx_formal_secure_runtime_contract,
 )
 from src.memory.snapshots import _reset_bounded_guardian_snapshot_cache
-from src.observer.sources.calendar_source import gather_calendar
+from src.evals.parallel import (
+    DEFAULT_SCENARIO_TIMEOUT_SECONDS,
+    WORKER_FLAG,
+    parse_shard,
+    run_scenarios_in_workers,
+    serve_worker,
+    shard_items,
+    slowest_results,
+)
+from src.evals.report_store import (
+    benchmark_report_store,
+    report_materialization_mode,
+    suite_fingerprint,
+)
+from src.guardian.state import _reset_guardian_state_cache
+from src.observer.sources.calendar_source import _reset_calendar_cache, gather_calendar
 from src.observer.sources.goal_source import gather_goals
-from src.observer.sources.git_source import gather_git
+from src.observer.sources.git_source import _reset_reflog_tails, gather_git
 from src.observer.screen_repository import ScreenObservationRepository
 from src.observer.sources.time_source import gather_time
 from src.memory.consolidator import consolidate_session
@@ -1101,6 +1120,23 @@ def _find_audit_call(
     raise AssertionError(f"Missing audit event {event_type} for {tool_name or 'any tool'}")
 
 
+@contextmanager
+def _patched_runtime_audit_log() -> Iterator[AsyncMock]:
+    """Route direct and buffered runtime audit writes onto one ``log_event`` mock."""
+    mock_log_event = AsyncMock()
+
+    async def _log_events(events: list[dict[str, Any]]) -> int:
+        for event in events:
+            await mock_log_event(**{key: value for key, value in event.items() if key != "created_at"})
+        return len(events)
+
+    with (
+        patch.object(audit_repository, "log_event", mock_log_event),
+        patch.object(audit_repository, "log_events", AsyncMock(side_effect=_log_events)),
+    ):
+        yield mock_log_event
+
+
 class _DummyStrategistTool(Tool):
     name = "get_goals"
     description = "Dummy strategist tool"
@@ -1228,14 +1264,17 @@ class _FakeExecuteResult:
 
 
 class _FakeScreenRepoSession:
-    def __init__(self, execute_results: list[list[Any]]):
+    def __init__(self, execute_results: list[list[Any] | Exception]):
         self._execute_results = execute_results
         self.deleted: list[Any] = []
 
     async def execute(self, _query: Any) -> _FakeExecuteResult:
         if not self._execute_results:
             raise AssertionError("Unexpected screen repository execute call")
-        return _FakeExecuteResult(self._execute_results.pop(0))
+        result = self._execute_results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return _FakeExecuteResult(result)
 
     async def delete(self, obj: Any) -> None:
         self.deleted.append(obj)
@@ -2255,13 +2294,13 @@ async def _eval_context_window_summary_audit() -> dict[str, Any]:
             patch.object(settings, "fallback_model", ""),
             patch.object(settings, "fallback_models", ""),
             patch("litellm.completion", return_value=success_response) as mock_completion,
-            patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
+            _patched_runtime_audit_log() as mock_log_event,
         ):
             success_summary = _summarize_middle(messages, session_id="ctx-success", range_key="0-1")
             _summary_cache.clear()
             with patch("src.agent.context_window.completion_with_fallback_sync", side_effect=RuntimeError("provider down")):
                 degraded_summary = _summarize_middle(messages, session_id="ctx-fail", range_key="1-2")
-            await asyncio.sleep(0)
+            await audit_repository.flush_pending()
 
         success = _find_audit_call(
             mock_log_event,
@@ -4429,14 +4468,14 @@ async def _eval_embedding_runtime_audit() -> dict[str, Any]:
     try:
         with (
             patch.dict(sys.modules, {"sentence_transformers": fake_module}),
-            patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
+            _patched_runtime_audit_log() as mock_log_event,
         ):
             vector = embed("hello")
             try:
                 embed("fail")
             except RuntimeError:
                 pass
-            await asyncio.sleep(0)
+            await audit_repository.flush_pending()
 
         loaded = _find_audit_call(
             mock_log_event,
@@ -4469,7 +4508,7 @@ async def _eval_vector_store_runtime_audit() -> dict[str, Any]:
 
     _reset_vector_store_state()
     try:
-        with patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event:
+        with _patched_runtime_audit_log() as mock_log_event:
             with (
                 patch("src.memory.vector_store._get_or_create_table", return_value=success_table),
                 patch("src.memory.vector_store.embed", return_value=[0.1, 0.2]),
@@ -4482,7 +4521,7 @@ async def _eval_vector_store_runtime_audit() -> dict[str, Any]:
             with patch("src.memory.vector_store._get_or_create_table", side_effect=RuntimeError("db down")):
                 failed_id = add_memory("broken", category="fact", source_session_id="sess-2")
 
-            await asyncio.sleep(0)
+            await audit_repository.flush_pending()
 
         success = _find_audit_call(
             mock_log_event,
@@ -4519,7 +4558,7 @@ async def _eval_soul_runtime_audit() -> dict[str, Any]:
         original_path = soul_mod._soul_path
         soul_mod._soul_path = soul_path
         try:
-            with patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event:
+            with _patched_runtime_audit_log() as mock_log_event:
                 default_text = soul_mod.read_soul()
                 soul_mod.write_soul("# Soul\n\n## Identity\nHero")
                 read_back = soul_mod.read_soul()
@@ -4529,7 +4568,7 @@ async def _eval_soul_runtime_audit() -> dict[str, Any]:
                         soul_mod.write_soul("broken")
                     except PermissionError:
                         pass
-                await asyncio.sleep(0)
+                await audit_repository.flush_pending()
 
             empty = _find_audit_call(
                 mock_log_event,
@@ -4571,7 +4610,7 @@ async def _eval_filesystem_runtime_audit() -> dict[str, Any]:
     with tempfile.TemporaryDirectory() as tmpdir:
         with (
             patch.object(settings, "workspace_dir", tmpdir),
-            patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
+            _patched_runtime_audit_log() as mock_log_event,
         ):
             missing_result = read_file.forward("missing.txt")
             write_result = write_file.forward("notes/today.txt", "hello filesystem")
@@ -4589,7 +4628,7 @@ async def _eval_filesystem_runtime_audit() -> dict[str, Any]:
             with patch("pathlib.Path.write_text", side_effect=PermissionError("denied")):
                 write_failure = write_file.forward("blocked.txt", "denied content")
 
-            await asyncio.sleep(0)
+            await audit_repository.flush_pending()
 
         empty = _find_audit_call(
             mock_log_event,
@@ -5833,12 +5872,12 @@ async def _eval_shell_tool_runtime_audit() -> dict[str, Any]:
 
     with (
         patch("src.tools.shell_tool.httpx.Client") as client_cls,
-        patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
+        _patched_runtime_audit_log() as mock_log_event,
     ):
         client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
         client_cls.return_value.__exit__ = MagicMock(return_value=False)
         result = shell_execute("import time; time.sleep(999)")
-        await asyncio.sleep(0)
+        await audit_repository.flush_pending()
 
     assert "timed out" in result.lower()
     timed_out = _find_audit_call(
@@ -5868,10 +5907,10 @@ async def _eval_web_search_runtime_audit() -> dict[str, Any]:
 
     with (
         patch("src.tools.web_search_tool.DDGS", MockDDGS),
-        patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
+        _patched_runtime_audit_log() as mock_log_event,
     ):
         result = web_search("slow search", max_results=3)
-        await asyncio.sleep(0)
+        await audit_repository.flush_pending()
 
     assert "timed out" in result.lower()
     timed_out = _find_audit_call(
@@ -5902,10 +5941,10 @@ async def _eval_web_search_empty_result_audit() -> dict[str, Any]:
 
     with (
         patch("src.tools.web_search_tool.DDGS", MockDDGS),
-        patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
+        _patched_runtime_audit_log() as mock_log_event,
     ):
         result = web_search("empty query", max_results=2)
-        await asyncio.sleep(0)
+        await audit_repository.flush_pending()
 
     assert "no results found" in result.lower()
     empty_result = _find_audit_call(
@@ -5921,26 +5960,12 @@ async def _eval_web_search_empty_result_audit() -> dict[str, Any]:
 
 
 async def _eval_browser_runtime_audit() -> dict[str, Any]:
-    class _ImmediateFuture:
-        def result(self):
-            raise TimeoutError("Timed out")
-
-    class _ImmediateExecutor:
-        def __enter__(self) -> "_ImmediateExecutor":
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> bool:
-            return False
-
-        def submit(self, _fn, *args, **kwargs) -> _ImmediateFuture:
-            return _ImmediateFuture()
-
     with (
-        patch("concurrent.futures.ThreadPoolExecutor", return_value=_ImmediateExecutor()),
-        patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
+        patch("src.tools.browser_tool._browse", new=AsyncMock(side_effect=TimeoutError("Timed out"))),
+        _patched_runtime_audit_log() as mock_log_event,
     ):
         result = browse_webpage("https://example.com/slow", action="extract")
-        await asyncio.sleep(0)
+        await audit_repository.flush_pending()
 
     assert "timed out after" in result.lower()
     timed_out = _find_audit_call(
@@ -5959,28 +5984,15 @@ async def _eval_browser_runtime_audit() -> dict[str, Any]:
 async def _eval_browser_execution_task_replay_behavior() -> dict[str, Any]:
     from src.security.site_policy import SiteAccessDecision
 
-    class _ImmediateFuture:
-        def __init__(self, value: str) -> None:
-            self._value = value
-
-        def result(self) -> str:
-            return self._value
-
-    class _ImmediateExecutor:
-        def __enter__(self) -> "_ImmediateExecutor":
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> bool:
-            return False
+    outputs = {
+        "extract": "Atlas launch checklist\nOpen blockers\nOwner: Seraph",
+        "html": "<html><body><button>Ship</button></body></html>",
+        "screenshot": "Screenshot captured (32 bytes). Base64 data: QUJDREVGR0g=",
+    }
 
-        def submit(self, _fn, url: str, action: str) -> _ImmediateFuture:
-            del url
-            outputs = {
-                "extract": "Atlas launch checklist\nOpen blockers\nOwner: Seraph",
-                "html": "<html><body><button>Ship</button></body></html>",
-                "screenshot": "Screenshot captured (32 bytes). Base64 data: QUJDREVGR0g=",
-            }
-            return _ImmediateFuture(outputs[action])
+    async def _browse(url: str, action: str) -> str:
+        del url
+        return outputs[action]
 
     decision = SiteAccessDecision(
         allowed=True,
@@ -5991,7 +6003,7 @@ async def _eval_browser_execution_task_replay_behavior() -> dict[str, Any]:
 
     with (
         patch("src.tools.browser_tool.evaluate_site_access", return_value=decision),
-        patch("concurrent.futures.ThreadPoolExecutor", return_value=_ImmediateExecutor()),
+        patch("src.tools.browser_tool._browse", new=_browse),
         patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
     ):
         extract_result = browse_webpage("https://example.com/task", action="extract")
@@ -6183,12 +6195,12 @@ async def _eval_observer_calendar_source_audit() -> dict[str, Any]:
 
 
 async def _eval_observer_git_source_audit() -> dict[str, Any]:
-    with patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event:
+    with _patched_runtime_audit_log() as mock_log_event:
         with patch("src.observer.sources.git_source.settings") as mock_settings:
             mock_settings.observer_git_repo_path = "/tmp/missing"
             mock_settings.workspace_dir = "/tmp/missing"
             result = gather_git()
-        await asyncio.sleep(0)
+        await audit_repository.flush_pending()
 
     unavailable = _find_audit_call(
         mock_log_event,
@@ -6237,10 +6249,10 @@ async def _eval_observer_time_source_audit() -> dict[str, Any]:
             working_hours_start=9,
             working_hours_end=17,
         )),
-        patch.object(audit_repository, "log_event", AsyncMock()) as mock_log_event,
+        _patched_runtime_audit_log() as mock_log_event,
     ):
         result = gather_time()
-        await asyncio.sleep(0)
+        await audit_repository.flush_pending()
 
     success = _find_audit_call(
         mock_log_event,
@@ -25309,58 +25321,32 @@ async def _eval_screen_repository_runtime_audit() -> dict[str, Any]:
     repo = ScreenObservationRepository()
     target_date = date(2026, 3, 16)
     week_start = date(2026, 3, 16)
-    observation = MagicMock()
-    observation.activity_type = "coding"
-    observation.project = "seraph"
-    observation.app_name = "VS Code"
-    observation.duration_s = 1800
-    observation.timestamp = datetime(2026, 3, 16, 9, 0, tzinfo=timezone.utc)
-    old_observation = MagicMock()
-    old_observation.timestamp = datetime(2025, 12, 1, 9, 0, tzinfo=timezone.utc)
+    start = datetime(2026, 3, 16, 9, 0, tzinfo=timezone.utc)
     mock_log_event = AsyncMock()
 
-    empty_daily_session = _FakeScreenRepoSession([[]])
-    success_daily_session = _FakeScreenRepoSession([[observation]])
-    cleanup_success_session = _FakeScreenRepoSession([[old_observation]])
-    cleanup_skip_session = _FakeScreenRepoSession([[]])
-
     with patch.object(audit_repository, "log_event", mock_log_event):
-        with patch("src.observer.screen_repository.get_session", return_value=_FakeScreenRepoContext(empty_daily_session)):
+        async with _patched_async_db("src.observer.screen_repository.get_session"):
             empty_daily = await repo.get_daily_summary(target_date)
 
-        with patch("src.observer.screen_repository.get_session", return_value=_FakeScreenRepoContext(success_daily_session)):
+            await repo.create(app_name="VS Code", activity_type="coding", project="seraph", timestamp=start)
+            # A blocked capture closes the coding observation without being counted.
+            await repo.create(app_name="1Password", blocked=True, timestamp=start + timedelta(minutes=30))
             success_daily = await repo.get_daily_summary(target_date)
-
-        with patch.object(
-            repo,
-            "get_daily_summary",
-            AsyncMock(
-                side_effect=[
-                    {
-                        "date": "2026-03-16",
-                        "total_observations": 1,
-                        "total_tracked_minutes": 30,
-                        "by_activity": {"coding": 1800},
-                        "by_project": {"seraph": 1800},
-                    },
-                    {"date": "2026-03-17", "total_observations": 0, "total_tracked_minutes": 0},
-                    {"date": "2026-03-18", "total_observations": 0, "total_tracked_minutes": 0},
-                    {"date": "2026-03-19", "total_observations": 0, "total_tracked_minutes": 0},
-                    {"date": "2026-03-20", "total_observations": 0, "total_tracked_minutes": 0},
-                    {"date": "2026-03-21", "total_observations": 0, "total_tracked_minutes": 0},
-                    {"date": "2026-03-22", "total_observations": 0, "total_tracked_minutes": 0},
-                ]
-            ),
-        ):
             weekly = await repo.get_weekly_summary(week_start)
 
-        with patch("src.observer.screen_repository.get_session", return_value=_FakeScreenRepoContext(cleanup_success_session)):
+        async with _patched_async_db("src.observer.screen_repository.get_session"):
+            await repo.create(
+                app_name="VS Code",
+                activity_type="coding",
+                timestamp=datetime.now(timezone.utc) - timedelta(days=120),
+            )
             deleted_count = await repo.cleanup_old(retention_days=90)
-
-        with patch("src.observer.screen_repository.get_session", return_value=_FakeScreenRepoContext(cleanup_skip_session)):
             skipped_count = await repo.cleanup_old(retention_days=90)
 
-        with patch.object(repo, "get_daily_summary", AsyncMock(side_effect=RuntimeError("db down"))):
+        with patch(
+            "src.observer.screen_repository.get_session",
+            return_value=_FakeScreenRepoContext(_FakeScreenRepoSession([RuntimeError("db down")])),
+        ):
             try:
                 await repo.get_weekly_summary(week_start)
             except RuntimeError:
@@ -29725,16 +29711,31 @@ def _select_benchmark_scenarios(selected_suite_names: Sequence[str] | None) -> l
     return _select_scenarios(scenario_names)
 
 
+# Set while a scenario runs so nested benchmark runs execute inline instead of
+# going back through the report store.
+_SCENARIO_ACTIVE: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "eval_scenario_active",
+    default=False,
+)
+
+
 async def _run_scenario(scenario: EvalScenario) -> EvalResult:
     started = time.perf_counter()
     _reset_bounded_guardian_snapshot_cache()
+    _reset_guardian_state_cache()
     _reset_vector_store_state()
+    _reset_calendar_cache()
+    _reset_reflog_tails()
+    invalidate_memory_provider_inventory_cache()
+    _reset_tool_surface_cache()
+    token = _SCENARIO_ACTIVE.set(True)
     try:
-        output = scenario.runner()
-        if asyncio.iscoroutine(output):
-            details = await output
-        else:
-            details = output
+        with audit_repository.isolated_buffer():
+            output = scenario.runner()
+            if asyncio.iscoroutine(output):
+                details = await output
+            else:
+                details = output
         return EvalResult(
             name=scenario.name,
             category=scenario.category,
@@ -29753,12 +29754,17 @@ async def _run_scenario(scenario: EvalScenario) -> EvalResult:
             error=str(exc),
         )
     finally:
+        _SCENARIO_ACTIVE.reset(token)
         _reset_bounded_guardian_snapshot_cache()
+        _reset_guardian_state_cache()
         _reset_vector_store_state()
+        _reset_calendar_cache()
+        _reset_reflog_tails()
+        invalidate_memory_provider_inventory_cache()
+        _reset_tool_surface_cache()
 
 
-async def run_runtime_evals(selected_names: Sequence[str] | None = None) -> EvalSummary:
-    scenarios = _select_scenarios(selected_names)
+async def _run_scenarios(scenarios: Sequence[EvalScenario]) -> EvalSummary:
     started = time.perf_counter()
     results = []
     for scenario in scenarios:
@@ -29766,15 +29772,82 @@ async def run_runtime_evals(selected_names: Sequence[str] | None = None) -> Eval
     return EvalSummary(results=results, duration_ms=int((time.perf_counter() - started) * 1000))
 
 
+async def run_runtime_evals(selected_names: Sequence[str] | None = None) -> EvalSummary:
+    return await _run_scenarios(_select_scenarios(selected_names))
+
+
 async def run_benchmark_suites(selected_suite_names: Sequence[str] | None = None) -> EvalSummary:
-    scenarios = _select_benchmark_scenarios(selected_suite_names)
+    """Run benchmark suites, or serve them from the report store inside a materialization scope."""
+    mode = report_materialization_mode()
+    if mode is None or _SCENARIO_ACTIVE.get():
+        return await _execute_benchmark_suites(selected_suite_names)
+    suite_names = tuple(selected_suite_names or ())
+    fingerprint = suite_fingerprint(
+        suite_names,
+        [scenario.name for scenario in _select_benchmark_scenarios(selected_suite_names)],
+    )
+    return await benchmark_report_store.get(
+        suite_names,
+        fingerprint=fingerprint,
+        runner=_execute_benchmark_suites,
+        background_runner=_execute_benchmark_suites_in_workers,
+        refresh=mode == "refresh",
+        background=mode == "warm",
+    )
+
+
+async def _execute_benchmark_suites(selected_suite_names: Sequence[str] | None = None) -> EvalSummary:
+    return await _run_scenarios(_select_benchmark_scenarios(selected_suite_names))
+
+
+async def _execute_benchmark_suites_in_workers(
+    selected_suite_names: Sequence[str] | None = None,
+) -> EvalSummary:
+    """Run benchmark suites on eval worker processes, off the serving process."""
+    return await asyncio.to_thread(
+        run_scenarios_parallel,
+        _select_benchmark_scenarios(selected_suite_names),
+        jobs=max(settings.operator_benchmark_worker_jobs, 1),
+    )
+
+
+def run_scenarios_parallel(
+    scenarios: Sequence[EvalScenario],
+    *,
+    jobs: int,
+    scenario_timeout_seconds: float | None = DEFAULT_SCENARIO_TIMEOUT_SECONDS,
+) -> EvalSummary:
+    """Run scenarios on ``jobs`` isolated worker processes; results keep selection order."""
     started = time.perf_counter()
+    payloads, errors = run_scenarios_in_workers(
+        [scenario.name for scenario in scenarios],
+        jobs=jobs,
+        scenario_timeout_seconds=scenario_timeout_seconds,
+    )
     results = []
     for scenario in scenarios:
-        results.append(await _run_scenario(scenario))
+        payload = payloads.get(scenario.name)
+        if payload is not None:
+            results.append(EvalResult(**payload))
+            continue
+        results.append(
+            EvalResult(
+                name=scenario.name,
+                category=scenario.category,
+                description=scenario.description,
+                passed=False,
+                duration_ms=0,
+                error=errors.get(scenario.name, "eval worker returned no result"),
+            )
+        )
     return EvalSummary(results=results, duration_ms=int((time.perf_counter() - started) * 1000))
 
 
+async def _run_named_scenario(name: str) -> dict[str, Any]:
+    (scenario,) = _select_scenarios([name])
+    return (await _run_scenario(scenario)).to_dict()
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -29805,6 +29878,32 @@ def _build_parser() -> argparse.ArgumentParser:
         default=2,
         help="JSON indentation for output.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run scenarios on this many isolated worker processes (default 1 runs in-process).",
+    )
+    parser.add_argument(
+        "--shard",
+        help="Only run shard i of n (1-based, e.g. 2/4) of the selected scenarios.",
+    )
+    parser.add_argument(
+        "--slowest",
+        type=int,
+        default=0,
+        help="Report this many slowest scenarios in the JSON output (default 0 omits them).",
+    )
+    parser.add_argument(
+        "--scenario-timeout",
+        type=float,
+        default=DEFAULT_SCENARIO_TIMEOUT_SECONDS,
+        help=(
+            "Kill a worker process whose scenario runs longer than this many seconds "
+            "(only with --jobs > 1; 0 disables)."
+        ),
+    )
+    parser.add_argument(WORKER_FLAG, action="store_true", help=argparse.SUPPRESS)
     return parser
 
 
@@ -29821,16 +29920,38 @@ def main(argv: Sequence[str] | None = None) -> int:
             print(f"{suite.name}: {suite.label} [{suite.benchmark_axis}]")
         return 0
 
+    if args.worker:
+        return asyncio.run(serve_worker(_run_named_scenario, stdin=sys.stdin, stdout=sys.stdout))
+
     try:
-        if args.benchmark_suites:
-            summary = asyncio.run(run_benchmark_suites(args.benchmark_suites))
+        shard = parse_shard(args.shard) if args.shard else None
+        if shard is None and args.jobs <= 1:
+            if args.benchmark_suites:
+                summary = asyncio.run(run_benchmark_suites(args.benchmark_suites))
+            else:
+                summary = asyncio.run(run_runtime_evals(args.scenarios))
         else:
-            summary = asyncio.run(run_runtime_evals(args.scenarios))
+            if args.benchmark_suites:
+                selected = _select_benchmark_scenarios(args.benchmark_suites)
+            else:
+                selected = _select_scenarios(args.scenarios)
+            selected = shard_items(selected, shard)
+            if args.jobs > 1:
+                summary = run_scenarios_parallel(
+                    selected,
+                    jobs=args.jobs,
+                    scenario_timeout_seconds=args.scenario_timeout,
+                )
+            else:
+                summary = asyncio.run(_run_scenarios(selected))
     except ValueError as exc:
         print(str(exc), file=sys.stderr)
         return 2
 
-    print(json.dumps(summary.to_dict(), indent=args.indent))
+    payload = summary.to_dict()
+    if args.slowest > 0:
+        payload["slowest_scenarios"] = slowest_results(summary.results, args.slowest)
+    print(json.dumps(payload, indent=args.indent))
     return 0 if summary.failed == 0 else 1
 
 
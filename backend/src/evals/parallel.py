@@ -0,0 +1,231 @@
+"""Parallel, sharded execution of eval scenarios across worker processes.
+
+Scenarios patch module globals and share the process-wide workspace, SQLite
+engine and vector store, so they cannot safely run concurrently inside one
+interpreter. Instead each worker is a long-lived ``python -m src.evals.harness
+--worker`` process with its own temporary ``WORKSPACE_DIR`` (and therefore its
+own database, vector store and LLM logs). Workers pull scenario names one at a
+time over stdin and answer with one JSON result per line, so a few slow
+scenarios do not leave the other workers idle. A worker that overruns the
+per-scenario deadline is killed and replaced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence, TextIO, TypeVar
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+WORKER_FLAG = "--worker"
+DEFAULT_SCENARIO_TIMEOUT_SECONDS = 600.0
+
+T = TypeVar("T")
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse a 1-based ``i/n`` shard spec into ``(index, count)``."""
+    index_text, separator, count_text = value.partition("/")
+    try:
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        index, count = 0, 0
+    if not separator or count <= 0 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard {value!r}; expected i/n with 1 <= i <= n, e.g. 1/4")
+    return index, count
+
+
+def shard_items(items: Sequence[T], shard: tuple[int, int] | None) -> list[T]:
+    """Take every n-th item so neighbouring, similarly heavy scenarios spread across shards."""
+    if shard is None:
+        return list(items)
+    index, count = shard
+    return list(items[index - 1 :: count])
+
+
+def slowest_results(results: Sequence[Any], limit: int) -> list[dict[str, Any]]:
+    ranked = sorted(results, key=lambda result: result.duration_ms, reverse=True)
+    return [
+        {
+            "name": result.name,
+            "category": result.category,
+            "duration_ms": result.duration_ms,
+            "passed": result.passed,
+        }
+        for result in ranked[: max(0, limit)]
+    ]
+
+
+class EvalWorkerDied(RuntimeError):
+    """Raised when a worker process exits before answering for a scenario."""
+
+
+class EvalWorkerTimedOut(EvalWorkerDied):
+    """Raised when a worker is killed for overrunning the per-scenario deadline."""
+
+
+class _EvalWorker:
+    def __init__(self, index: int) -> None:
+        self.workspace_dir = tempfile.mkdtemp(prefix=f"seraph-eval-worker-{index}-")
+        env = {
+            **os.environ,
+            "WORKSPACE_DIR": self.workspace_dir,
+            "LLM_LOG_DIR": os.path.join(self.workspace_dir, "logs"),
+        }
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "src.evals.harness", WORKER_FLAG],
+            cwd=BACKEND_ROOT,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run(self, name: str, *, timeout_seconds: float | None = None) -> dict[str, Any]:
+        assert self.process.stdin is not None and self.process.stdout is not None
+        try:
+            self.process.stdin.write(name + "\n")
+            self.process.stdin.flush()
+        except OSError as exc:
+            raise EvalWorkerDied(f"eval worker stopped accepting scenarios: {exc}") from exc
+        expired = threading.Event()
+        deadline: threading.Timer | None = None
+        if timeout_seconds is not None and timeout_seconds > 0:
+
+            def _expire() -> None:
+                expired.set()
+                self.process.kill()
+
+            deadline = threading.Timer(timeout_seconds, _expire)
+            deadline.daemon = True
+            deadline.start()
+        try:
+            line = self.process.stdout.readline()
+        finally:
+            if deadline is not None:
+                deadline.cancel()
+        if expired.is_set():
+            # Killed even if the answer raced the deadline; wait so `alive` is accurate.
+            self.process.wait()
+        if not line:
+            code = self.process.wait()
+            if expired.is_set():
+                raise EvalWorkerTimedOut(
+                    f"eval worker killed after {timeout_seconds:g}s deadline while running {name}"
+                )
+            raise EvalWorkerDied(f"eval worker exited with code {code} while running {name}")
+        return json.loads(line)
+
+    def close(self) -> None:
+        if self.process.stdin is not None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            logger.warning("Eval worker %s did not exit; killing it", self.process.pid)
+            self.process.kill()
+            self.process.wait()
+        shutil.rmtree(self.workspace_dir, ignore_errors=True)
+
+
+def run_scenarios_in_workers(
+    names: Sequence[str],
+    *,
+    jobs: int,
+    scenario_timeout_seconds: float | None = DEFAULT_SCENARIO_TIMEOUT_SECONDS,
+) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
+    """Run ``names`` on up to ``jobs`` worker processes.
+
+    Returns ``(results, errors)``: result dicts keyed by scenario name, and an
+    error message for every scenario whose worker died mid-run or was killed
+    after ``scenario_timeout_seconds`` (``None`` or 0 disables the deadline).
+    A dead worker is replaced so the remaining scenarios still run.
+    """
+    pending: queue.SimpleQueue[str] = queue.SimpleQueue()
+    for name in names:
+        pending.put(name)
+    results: dict[str, dict[str, Any]] = {}
+    errors: dict[str, str] = {}
+    lock = threading.Lock()
+
+    def _drive(index: int) -> None:
+        worker: _EvalWorker | None = None
+        try:
+            while True:
+                try:
+                    name = pending.get_nowait()
+                except queue.Empty:
+                    return
+                if worker is None:
+                    worker = _EvalWorker(index)
+                try:
+                    payload = worker.run(name, timeout_seconds=scenario_timeout_seconds)
+                except EvalWorkerDied as exc:
+                    with lock:
+                        errors[name] = str(exc)
+                    worker.close()
+                    worker = None
+                    continue
+                with lock:
+                    results[name] = payload
+                if not worker.alive:
+                    worker.close()
+                    worker = None
+        finally:
+            if worker is not None:
+                worker.close()
+
+    threads = [
+        threading.Thread(target=_drive, args=(index,), name=f"eval-worker-{index}", daemon=True)
+        for index in range(max(1, min(jobs, len(names))))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+async def serve_worker(
+    run_one: Callable[[str], Awaitable[dict[str, Any]]],
+    *,
+    stdin: TextIO,
+    stdout: TextIO,
+) -> int:
+    """Answer scenario names read from ``stdin`` with one JSON result line each.
+
+    Anything scenarios print goes to stderr so it cannot corrupt the protocol.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        # Read off-loop so background tasks left by the last scenario keep running.
+        line = await loop.run_in_executor(None, stdin.readline)
+        if not line:
+            return 0
+        name = line.strip()
+        if not name:
+            continue
+        with redirect_stdout(sys.stderr):
+            payload = await run_one(name)
+        stdout.write(json.dumps(payload, default=str) + "\n")
+        stdout.flush()
@@ -0,0 +1,241 @@
+"""Materialized benchmark-suite runs served to operator report endpoints.
+
+Operator ``build_*_report()`` helpers call ``run_benchmark_suites`` on every
+GET. Inside a materialization scope (set by the operator router) those calls
+are answered from the latest stored run for the same suite set instead; stale
+runs are re-run in the background, and ``refresh=True`` forces a fresh run.
+
+Background re-runs and warm-ups use the suite set's background runner, which
+the harness points at eval worker processes, so scheduled refreshes never run
+scenarios (and their module patches) inside the serving process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterator, Sequence
+
+from config.settings import settings
+from src.utils.background import track_task
+
+logger = logging.getLogger(__name__)
+
+SuiteRunner = Callable[[Sequence[str] | None], Awaitable[Any]]
+
+_MATERIALIZATION_MODE: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "benchmark_report_materialization_mode",
+    default=None,
+)
+
+
+@dataclass(frozen=True)
+class MaterializedSuiteRun:
+    suite_names: tuple[str, ...]
+    fingerprint: str
+    summary: Any
+    materialized_at: datetime
+    duration_ms: int
+
+    def age_seconds(self) -> float:
+        return (datetime.now(timezone.utc) - self.materialized_at).total_seconds()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "suite_names": list(self.suite_names),
+            "fingerprint": self.fingerprint,
+            "materialized_at": self.materialized_at.isoformat(),
+            "age_seconds": round(self.age_seconds(), 1),
+            "duration_ms": self.duration_ms,
+            "total": getattr(self.summary, "total", None),
+            "passed": getattr(self.summary, "passed", None),
+            "failed": getattr(self.summary, "failed", None),
+        }
+
+
+def suite_fingerprint(suite_names: Sequence[str], scenario_names: Sequence[str]) -> str:
+    """Hash the suite selection and the scenarios it currently resolves to."""
+    payload = "\n".join([*suite_names, "--", *scenario_names])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def report_materialization_mode() -> str | None:
+    """Return ``"serve"``, ``"refresh"``, ``"warm"`` or ``None`` when runs should execute inline."""
+    return _MATERIALIZATION_MODE.get()
+
+
+@contextmanager
+def materialized_report_scope(*, refresh: bool = False, warm: bool = False) -> Iterator[None]:
+    """Serve ``run_benchmark_suites`` calls in this context from the report store.
+
+    ``warm`` re-runs every suite set reached in this context on its background runner.
+    """
+    token = _MATERIALIZATION_MODE.set("warm" if warm else "refresh" if refresh else "serve")
+    try:
+        yield
+    finally:
+        _MATERIALIZATION_MODE.reset(token)
+
+
+class BenchmarkReportStore:
+    """Latest benchmark-suite run per suite set, with single-flight re-runs."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, ...], MaterializedSuiteRun] = {}
+        self._runners: dict[tuple[str, ...], SuiteRunner] = {}
+        self._inflight: dict[tuple[str, ...], asyncio.Task] = {}
+        # In-process runs take turns because scenarios patch module globals;
+        # background runs take turns so only one worker pool runs at a time.
+        self._lanes: dict[bool, asyncio.Lock] = {}
+        self._lanes_loop: asyncio.AbstractEventLoop | None = None
+        self._hits = 0
+        self._runs = 0
+        self._background_refreshes = 0
+
+    async def get(
+        self,
+        suite_names: Sequence[str],
+        *,
+        fingerprint: str,
+        runner: SuiteRunner,
+        background_runner: SuiteRunner | None = None,
+        refresh: bool = False,
+        background: bool = False,
+    ) -> Any:
+        """Return the stored run for ``suite_names``, running it when missing or stale.
+
+        ``runner`` serves foreground misses and refreshes; ``background_runner``
+        (default ``runner``) serves TTL re-runs, ``refresh_all`` and calls made
+        with ``background=True``.
+        """
+        key = tuple(suite_names)
+        self._runners[key] = background_runner or runner
+        entry = self._entries.get(key)
+        if background:
+            return await self._materialize(key, fingerprint, self._runners[key], background=True)
+        if refresh or entry is None or entry.fingerprint != fingerprint:
+            return await self._materialize(key, fingerprint, runner)
+        self._hits += 1
+        ttl_seconds = max(settings.operator_benchmark_report_ttl_minutes, 0) * 60
+        if entry.age_seconds() >= ttl_seconds and self._running_task(key) is None:
+            self._background_refreshes += 1
+            self._start(key, fingerprint, self._runners[key], background=True)
+        return entry.summary
+
+    async def refresh_all(self) -> int:
+        """Re-run every stored suite set in turn. Returns the number refreshed."""
+        refreshed = 0
+        for key in list(self._entries):
+            entry = self._entries.get(key)
+            runner = self._runners.get(key)
+            if entry is None or runner is None:
+                continue
+            try:
+                await self._materialize(key, entry.fingerprint, runner, background=True)
+            except Exception:
+                logger.warning("Failed to refresh benchmark suites %s", ",".join(key), exc_info=True)
+                continue
+            refreshed += 1
+        return refreshed
+
+    def entries(self) -> list[dict[str, Any]]:
+        return [
+            {**entry.to_dict(), "refreshing": self._running_task(key) is not None}
+            for key, entry in sorted(self._entries.items())
+        ]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "runs": self._runs,
+            "background_refreshes": self._background_refreshes,
+            "inflight": sum(1 for key in self._inflight if self._running_task(key) is not None),
+        }
+
+    def reset(self) -> None:
+        self._entries.clear()
+        self._runners.clear()
+        self._inflight.clear()
+        self._lanes.clear()
+        self._lanes_loop = None
+        self._hits = 0
+        self._runs = 0
+        self._background_refreshes = 0
+
+    def _running_task(self, key: tuple[str, ...]) -> asyncio.Task | None:
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        return task if task.get_loop() is loop else None
+
+    def _start(
+        self,
+        key: tuple[str, ...],
+        fingerprint: str,
+        runner: SuiteRunner,
+        *,
+        background: bool = False,
+    ) -> asyncio.Task:
+        task = track_task(
+            self._run(key, fingerprint, runner, background=background),
+            name=f"benchmark_report:{'+'.join(key) or 'all'}",
+        )
+        self._inflight[key] = task
+        return task
+
+    async def _materialize(
+        self,
+        key: tuple[str, ...],
+        fingerprint: str,
+        runner: SuiteRunner,
+        *,
+        background: bool = False,
+    ) -> Any:
+        task = self._running_task(key) or self._start(key, fingerprint, runner, background=background)
+        # Shield so a cancelled request does not abort a run other callers share.
+        return await asyncio.shield(task)
+
+    def _lane(self, background: bool) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lanes_loop is not loop:
+            self._lanes.clear()
+            self._lanes_loop = loop
+        lane = self._lanes.get(background)
+        if lane is None:
+            lane = self._lanes[background] = asyncio.Lock()
+        return lane
+
+    async def _run(
+        self,
+        key: tuple[str, ...],
+        fingerprint: str,
+        runner: SuiteRunner,
+        *,
+        background: bool = False,
+    ) -> Any:
+        async with self._lane(background):
+            started = time.perf_counter()
+            summary = await runner(list(key) or None)
+        self._runs += 1
+        self._entries[key] = MaterializedSuiteRun(
+            suite_names=key,
+            fingerprint=fingerprint,
+            summary=summary,
+            materialized_at=datetime.now(timezone.utc),
+            duration_ms=int((time.perf_counter() - started) * 1000),
+        )
+        return summary
+
+
+benchmark_report_store = BenchmarkReportStore()
@@ -44,6 +44,8 @@ from .registry import (
     ExtensionRegistry,
     ExtensionRegistrySnapshot,
     extension_registry,
+    extension_registry_generation,
+    invalidate_extension_registry_cache,
 )
 
 __all__ = [
@@ -71,7 +73,9 @@ __all__ = [
     "doctor_extension",
     "doctor_snapshot",
     "extension_registry",
+    "extension_registry_generation",
     "expected_layout_prefixes",
+    "invalidate_extension_registry_cache",
     "is_package_manifest_path",
     "iter_extension_manifest_paths",
     "load_extension_manifest",
@@ -56,8 +56,10 @@ from src.extensions.registry import (
     _current_seraph_version,
     bundled_manifest_root,
     default_manifest_roots_for_workspace,
+    invalidate_extension_registry_cache,
 )
 from src.extensions.scaffold import validate_extension_package
+from src.memory.providers import invalidate_memory_provider_inventory_cache
 from src.extensions.state import (
     add_extension_rollback_snapshot,
     append_extension_lifecycle_event,
@@ -480,6 +482,8 @@ def _ensure_manifest_roots() -> list[str]:
 
 
 def _refresh_runtime() -> None:
+    invalidate_extension_registry_cache()
+    invalidate_memory_provider_inventory_cache()
     manifest_roots = _ensure_manifest_roots()
     skills_dir = getattr(skill_manager, "_skills_dir", "") or os.path.join(_workspace_root(), "skills")
     workflows_dir = getattr(workflow_manager, "_workflows_dir", "") or os.path.join(_workspace_root(), "workflows")
@@ -39,6 +39,18 @@ from src.workflows.loader import scan_workflows
 
 _MCP_RUNTIME_UNSET = object()
 
+# Parsed manifest packages keyed on (manifest path, manifest roots, runtime version).
+# Each entry remembers the stat signature of the manifest and every file it read,
+# so unchanged packages are served without reparsing.
+_manifest_entry_cache: dict[tuple[str, tuple[str, ...], str], "_ManifestCacheEntry"] = {}
+# Conflict-annotated manifest stage keyed on (manifest roots, runtime version, workspace).
+_manifest_stage_cache: dict[
+    tuple[tuple[str, ...], str, str],
+    tuple[tuple["_ManifestCacheEntry", ...], list["ExtensionRecord"], list["ExtensionLoadErrorRecord"]],
+] = {}
+# Bumped by invalidate_extension_registry_cache so derived caches can notice.
+_registry_generation = 0
+
 
 def _slugify(value: str) -> str:
     sanitized = re.sub(r"[^a-zA-Z0-9]+", "-", value).strip("-").lower()
@@ -142,6 +154,40 @@ class ExtensionRegistrySnapshot:
         return [item for item in contributions if item.contribution_type == contribution_type]
 
 
+FileSignature = tuple[str, int, int]
+
+
+def _file_signature(path: str) -> FileSignature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, -1, -1)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass(frozen=True)
+class _ManifestCacheEntry:
+    signatures: tuple[FileSignature, ...]
+    record: ExtensionRecord | None = None
+    error: ExtensionLoadErrorRecord | None = None
+
+    def is_current(self) -> bool:
+        return all(_file_signature(signature[0]) == signature for signature in self.signatures)
+
+
+def invalidate_extension_registry_cache() -> None:
+    """Drop cached manifest parses, e.g. after a lifecycle mutation rewrote a package."""
+    global _registry_generation
+    _manifest_entry_cache.clear()
+    _manifest_stage_cache.clear()
+    _registry_generation += 1
+
+
+def extension_registry_generation() -> int:
+    """Counter bumped on every registry cache invalidation, for caches derived from it."""
+    return _registry_generation
+
+
 class ExtensionRegistry:
     """Enumerate manifest-backed extensions and current legacy capability sources."""
 
@@ -164,14 +210,9 @@ class ExtensionRegistry:
         extensions: list[ExtensionRecord] = []
         load_errors: list[ExtensionLoadErrorRecord] = []
 
-        manifest_extensions, manifest_errors = self._scan_manifest_extensions()
-        manifest_extensions, manifest_conflict_errors = self._annotate_named_contribution_conflicts(
-            manifest_extensions
-        )
-        manifest_extensions = self._enrich_workflow_contribution_metadata(manifest_extensions)
+        manifest_extensions, manifest_errors = self._manifest_stage()
         extensions.extend(manifest_extensions)
         load_errors.extend(manifest_errors)
-        load_errors.extend(manifest_conflict_errors)
 
         manifest_claims = self._manifest_claims(manifest_extensions)
 
@@ -217,10 +258,69 @@ class ExtensionRegistry:
                 return index
         return len(self._manifest_roots)
 
-    def _scan_manifest_extensions(self) -> tuple[list[ExtensionRecord], list[ExtensionLoadErrorRecord]]:
+    def _manifest_stage(self) -> tuple[list[ExtensionRecord], list[ExtensionLoadErrorRecord]]:
+        """Return conflict-annotated manifest extensions, recomputed only when a package changed."""
+        entries = self._manifest_entries()
+        stage_key = (tuple(self._manifest_roots), self._seraph_version, str(settings.workspace_dir))
+        cached = _manifest_stage_cache.get(stage_key)
+        if cached is not None and len(cached[0]) == len(entries) and all(
+            previous is current for previous, current in zip(cached[0], entries)
+        ):
+            return list(cached[1]), list(cached[2])
+
+        manifest_extensions = [entry.record for entry in entries if entry.record is not None]
+        manifest_errors = [entry.error for entry in entries if entry.error is not None]
+        manifest_extensions, manifest_conflict_errors = self._annotate_named_contribution_conflicts(
+            manifest_extensions
+        )
+        manifest_extensions = self._enrich_workflow_contribution_metadata(manifest_extensions)
+        manifest_errors.extend(manifest_conflict_errors)
+        _manifest_stage_cache[stage_key] = (tuple(entries), manifest_extensions, manifest_errors)
+        return list(manifest_extensions), list(manifest_errors)
+
+    def _manifest_entries(self) -> list[_ManifestCacheEntry]:
+        roots_key = tuple(self._manifest_roots)
+        entries: list[_ManifestCacheEntry] = []
+        for manifest_path in self._iter_manifest_paths():
+            cache_key = (str(manifest_path.resolve()), roots_key, self._seraph_version)
+            entry = _manifest_entry_cache.get(cache_key)
+            if entry is None or not entry.is_current():
+                entry = self._load_manifest_entry(manifest_path)
+                _manifest_entry_cache[cache_key] = entry
+            entries.append(entry)
+        return entries
+
+    def _load_manifest_entry(self, manifest_path: Path) -> _ManifestCacheEntry:
+        # Stat before reading so a write racing the parse invalidates the entry next time.
+        manifest_signature = _file_signature(str(manifest_path))
+        record: ExtensionRecord | None = None
+        error: ExtensionLoadErrorRecord | None = None
+        extensions, errors = self._scan_manifest_paths([manifest_path])
+        if extensions:
+            record = extensions[0]
+        if errors:
+            error = errors[0]
+        dependency_paths = sorted(
+            {
+                resolved_path
+                for contribution in (record.contributions if record is not None else [])
+                for resolved_path in [contribution.metadata.get("resolved_path")]
+                if isinstance(resolved_path, str) and resolved_path
+            }
+        )
+        return _ManifestCacheEntry(
+            signatures=(manifest_signature, *(_file_signature(path) for path in dependency_paths)),
+            record=record,
+            error=error,
+        )
+
+    def _scan_manifest_paths(
+        self,
+        manifest_paths: list[Path],
+    ) -> tuple[list[ExtensionRecord], list[ExtensionLoadErrorRecord]]:
         extensions: list[ExtensionRecord] = []
         errors: list[ExtensionLoadErrorRecord] = []
-        for manifest_path in self._iter_manifest_paths():
+        for manifest_path in manifest_paths:
             try:
                 manifest = load_extension_manifest(manifest_path)
             except ExtensionManifestError as exc:
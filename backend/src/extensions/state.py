@@ -11,11 +11,25 @@ from config.settings import settings
 
 STATE_FILE_NAME = "extensions-state.json"
 
+# Bumped on every in-process state write so caches derived from the state file
+# can tell a rewrite apart even when its mtime and size are unchanged.
+_state_write_generation = 0
+
 
 def state_path() -> str:
     return os.path.join(settings.workspace_dir, STATE_FILE_NAME)
 
 
+def extension_state_signature() -> tuple[str, int, int, int]:
+    """Identify the current extension state: path, in-process write generation, mtime and size."""
+    path = state_path()
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, _state_write_generation, -1, -1)
+    return (path, _state_write_generation, stat.st_mtime_ns, stat.st_size)
+
+
 def load_extension_state_payload() -> dict[str, Any]:
     path = state_path()
     if not os.path.exists(path):
@@ -34,6 +48,7 @@ def load_extension_state_payload() -> dict[str, Any]:
 
 
 def save_extension_state_payload(payload: dict[str, Any]) -> None:
+    global _state_write_generation
     payload = payload if isinstance(payload, dict) else {"extensions": {}}
     extensions = payload.get("extensions")
     if not isinstance(extensions, dict):
@@ -42,6 +57,7 @@ def save_extension_state_payload(payload: dict[str, Any]) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as handle:
         json.dump(payload, handle, indent=2, sort_keys=True)
+    _state_write_generation += 1
 
 
 def extension_state_entries(payload: dict[str, Any]) -> dict[str, Any]:
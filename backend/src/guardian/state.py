@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, TypeVar
 
+from config.settings import settings
 from src.agent.session import session_manager
 from src.guardian.world_model import GuardianWorldModel, build_guardian_world_model
 from src.guardian.learning_arbitration import GuardianLearningArbitration
@@ -13,6 +17,11 @@ from src.observer.context import CurrentContext
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Short-TTL cache for guardian inputs that rarely change between back-to-back turns.
+_SOURCE_CACHE: dict[str, tuple[float, Any]] = {}
+
 
 def _dedupe(items: list[str]) -> tuple[str, ...]:
     seen: set[str] = set()
@@ -61,6 +70,7 @@ class GuardianState:
     judgment_proof_lines: tuple[str, ...] = ()
     restraint_reasons: tuple[str, ...] = ()
     user_model_benchmark_diagnostics: tuple[str, ...] = ()
+    source_timings_ms: dict[str, float] = field(default_factory=dict)
 
     @property
     def active_goals_summary(self) -> str:
@@ -891,6 +901,48 @@ def _user_model_benchmark_diagnostics(
     return tuple(diagnostics)
 
 
+def _reset_guardian_state_cache() -> None:
+    _SOURCE_CACHE.clear()
+
+
+async def _cached_source(key: str, load: Callable[[], Awaitable[_T]]) -> _T:
+    ttl_seconds = settings.guardian_state_cache_ttl_seconds
+    if ttl_seconds > 0:
+        cached = _SOURCE_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+            return cached[1]
+    value = await load()
+    if ttl_seconds > 0:
+        _SOURCE_CACHE[key] = (time.monotonic(), value)
+    return value
+
+
+async def _load_source(
+    name: str,
+    awaitable: Awaitable[_T],
+    *,
+    fallback: _T,
+    timings: dict[str, float],
+) -> _T:
+    """Await one guardian input with a deadline, failing open to ``fallback``."""
+    timeout_seconds = settings.guardian_state_source_timeout_seconds
+    started = time.perf_counter()
+    try:
+        return await asyncio.wait_for(awaitable, timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Guardian state input %s timed out after %.1fs; using degraded fallback",
+            name,
+            timeout_seconds,
+        )
+        return fallback
+    except Exception:
+        logger.debug("Failed to load %s for guardian state", name, exc_info=True)
+        return fallback
+    finally:
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
 async def build_guardian_state(
     *,
     session_id: str | None = None,
@@ -915,103 +967,214 @@ async def build_guardian_state(
     from src.observer.manager import context_manager
     from src.observer.screen_repository import screen_observation_repo
 
+    from src.guardian.feedback import GuardianLearningSignal, ScopedGuardianLearningResolution
+    from src.memory.retrieval_planner import MemoryRetrievalPlanResult
+    from src.memory.soul import get_soul_file_mtime
+
+    started = time.perf_counter()
+    timings: dict[str, float] = {}
+    observer_started = time.perf_counter()
     observer_context = (
         await context_manager.refresh() if refresh_observer else context_manager.get_context()
     )
+    timings["observer_context"] = round((time.perf_counter() - observer_started) * 1000, 1)
     normalized_intervention_type = str(intervention_type or "").strip() or "advisory"
-    soul_context = render_soul_text(await sync_soul_file_to_profile())
-    session_record = await session_manager.get(session_id) if session_id is not None else None
 
-    current_session_history = (
-        await session_manager.get_history_text(session_id)
-        if session_id is not None
-        else ""
-    )
-    session_todos = await session_manager.get_todos(session_id) if session_id is not None else []
-    recent_sessions_summary = await session_manager.get_recent_sessions_summary(
-        exclude_session_id=session_id
-    )
-    live_learning_resolution = await guardian_feedback_repository.resolve_learning_signal(
-        intervention_type=normalized_intervention_type,
-        limit=12,
-        session_id=session_id,
-        active_project=observer_context.active_project,
-    )
-    recent_intervention_feedback = await guardian_feedback_repository.summarize_recent_for_scope(
-        scope=live_learning_resolution.dominant_scope,
-        limit=5,
-        session_id=session_id,
-        active_project=observer_context.active_project,
+    async def _no_value(value: _T) -> _T:
+        return value
+
+    async def _load_soul_context() -> str:
+        return render_soul_text(await sync_soul_file_to_profile())
+
+    async def _load_recent_execution_summary() -> str:
+        return _summarize_recent_execution(
+            await audit_repository.list_events(limit=20, session_id=session_id)
+        )
+
+    async def _load_recent_projects() -> tuple[str, ...]:
+        return tuple(await screen_observation_repo.get_recent_projects(limit=3))
+
+    # Stage 1: inputs that depend only on the request and observer context.
+    (
+        soul_context,
+        session_record,
+        current_session_history,
+        session_todos,
+        recent_sessions_summary,
+        live_learning_resolution,
+        procedural_guidance,
+        recent_execution_summary,
+        active_projects,
+        memory_reconciliation_summary,
+    ) = await asyncio.gather(
+        _load_source(
+            "soul",
+            _cached_source(f"soul:{get_soul_file_mtime()}", _load_soul_context),
+            fallback="",
+            timings=timings,
+        ),
+        _load_source(
+            "session_record",
+            session_manager.get(session_id) if session_id is not None else _no_value(None),
+            fallback=None,
+            timings=timings,
+        ),
+        _load_source(
+            "session_history",
+            session_manager.get_history_text(session_id) if session_id is not None else _no_value(""),
+            fallback="",
+            timings=timings,
+        ),
+        _load_source(
+            "session_todos",
+            session_manager.get_todos(session_id) if session_id is not None else _no_value([]),
+            fallback=[],
+            timings=timings,
+        ),
+        _load_source(
+            "recent_sessions",
+            session_manager.get_recent_sessions_summary(exclude_session_id=session_id),
+            fallback="",
+            timings=timings,
+        ),
+        _load_source(
+            "learning_signal",
+            guardian_feedback_repository.resolve_learning_signal(
+                intervention_type=normalized_intervention_type,
+                limit=12,
+                session_id=session_id,
+                active_project=observer_context.active_project,
+            ),
+            fallback=ScopedGuardianLearningResolution(
+                effective_signal=GuardianLearningSignal.neutral(normalized_intervention_type),
+                dominant_scope="global",
+                decisions=(),
+            ),
+            timings=timings,
+        ),
+        _load_source(
+            "procedural_guidance",
+            load_procedural_memory_guidance(
+                normalized_intervention_type,
+                continuity_thread_id=session_id,
+                active_project=observer_context.active_project,
+            ),
+            fallback=None,
+            timings=timings,
+        ),
+        _load_source(
+            "recent_execution",
+            _load_recent_execution_summary(),
+            fallback="",
+            timings=timings,
+        ),
+        _load_source(
+            "recent_projects",
+            _cached_source("recent_projects", _load_recent_projects),
+            fallback=(),
+            timings=timings,
+        ),
+        _load_source(
+            "memory_reconciliation",
+            _cached_source("memory_reconciliation", summarize_memory_reconciliation_state),
+            fallback={},
+            timings=timings,
+        ),
     )
+
     advisory_learning_signal = live_learning_resolution.effective_signal
     effective_learning_signal = advisory_learning_signal
     try:
-        procedural_guidance = await load_procedural_memory_guidance(
-            normalized_intervention_type,
-            continuity_thread_id=session_id,
-            active_project=observer_context.active_project,
-        )
         learning_arbitration = arbitrate_learning_signal(
             live_signal=advisory_learning_signal,
             procedural_guidance=procedural_guidance,
         )
-        effective_learning_signal = learning_arbitration.effective_signal
+        if procedural_guidance is not None:
+            effective_learning_signal = learning_arbitration.effective_signal
     except Exception:
-        logger.debug("Failed to load procedural guidance for guardian state", exc_info=True)
+        logger.debug("Failed to arbitrate procedural guidance for guardian state", exc_info=True)
         learning_arbitration = arbitrate_learning_signal(
             live_signal=advisory_learning_signal,
             procedural_guidance=None,
         )
-    try:
-        recent_execution_summary = _summarize_recent_execution(
-            await audit_repository.list_events(limit=20, session_id=session_id)
-        )
-    except Exception:
-        logger.debug("Failed to load recent execution summary for guardian state", exc_info=True)
-        recent_execution_summary = ""
-
-    try:
-        active_projects = tuple(await screen_observation_repo.get_recent_projects(limit=3))
-    except Exception:
-        logger.debug("Failed to load recent projects for guardian state", exc_info=True)
-        active_projects = ()
 
     query = user_message or memory_query or ""
     memory_requested = bool(query.strip())
-    retrieval = await plan_memory_retrieval(
-        query=query,
-        active_projects=active_projects,
+    snapshot_session_key = None
+    if session_id is not None and session_record is not None:
+        created_at = getattr(session_record, "created_at", None)
+        if created_at is not None:
+            snapshot_session_key = f"{session_id}:{created_at.isoformat()}"
+        else:
+            snapshot_session_key = session_id
+
+    async def _load_bounded_snapshot() -> str:
+        try:
+            return await get_or_create_bounded_guardian_snapshot(
+                soul_context=soul_context,
+                session_id=snapshot_session_key,
+            )
+        except Exception:
+            logger.debug("Failed to load bounded guardian snapshot", exc_info=True)
+            snapshot, _ = await render_bounded_guardian_snapshot(
+                soul_context=soul_context,
+            )
+            return snapshot
+
+    # Stage 2: inputs that depend on stage-1 results.
+    recent_intervention_feedback, retrieval, bounded_snapshot = await asyncio.gather(
+        _load_source(
+            "intervention_feedback",
+            guardian_feedback_repository.summarize_recent_for_scope(
+                scope=live_learning_resolution.dominant_scope,
+                limit=5,
+                session_id=session_id,
+                active_project=observer_context.active_project,
+            ),
+            fallback="",
+            timings=timings,
+        ),
+        _load_source(
+            "memory_retrieval",
+            plan_memory_retrieval(
+                query=query,
+                active_projects=active_projects,
+            ),
+            fallback=MemoryRetrievalPlanResult(
+                semantic_context="",
+                episodic_context="",
+                memory_buckets={},
+                degraded=True,
+                lane="unavailable",
+            ),
+            timings=timings,
+        ),
+        _load_source(
+            "bounded_snapshot",
+            _load_bounded_snapshot(),
+            fallback="",
+            timings=timings,
+        ),
     )
     memory_context = retrieval.semantic_context
     episodic_memory_context = retrieval.episodic_context
     memory_buckets = retrieval.memory_buckets
     memory_benchmark_diagnostics = _memory_benchmark_diagnostic_lines(retrieval.retrieval_diagnostics)
     memory_provider_diagnostics = _memory_provider_diagnostic_lines(retrieval.provider_diagnostics)
-    try:
-        memory_reconciliation_summary = await summarize_memory_reconciliation_state()
-    except Exception:
-        logger.debug("Failed to load memory reconciliation diagnostics", exc_info=True)
-        memory_reconciliation_summary = {}
     memory_reconciliation_diagnostics = _memory_reconciliation_diagnostic_lines(
         memory_reconciliation_summary
     )
-    try:
-        snapshot_session_key = None
-        if session_id is not None and session_record is not None:
-            created_at = getattr(session_record, "created_at", None)
-            if created_at is not None:
-                snapshot_session_key = f"{session_id}:{created_at.isoformat()}"
-            else:
-                snapshot_session_key = session_id
-        bounded_snapshot = await get_or_create_bounded_guardian_snapshot(
-            soul_context=soul_context,
-            session_id=snapshot_session_key,
-        )
-    except Exception:
-        logger.debug("Failed to load bounded guardian snapshot", exc_info=True)
-        bounded_snapshot, _ = await render_bounded_guardian_snapshot(
-            soul_context=soul_context,
-        )
+    timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+    slowest = sorted(
+        ((name, ms) for name, ms in timings.items() if name != "total"),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:3]
+    logger.info(
+        "Guardian state assembled in %.1fms (slowest inputs: %s)",
+        timings["total"],
+        ", ".join(f"{name}={ms:.1f}ms" for name, ms in slowest),
+    )
     bounded_memory_context = _merge_memory_contexts(
         bounded_snapshot,
         _summarize_bounded_todos(
@@ -1122,5 +1285,6 @@ async def build_guardian_state(
         judgment_proof_lines=judgment_proof_lines,
         restraint_reasons=restraint_reasons,
         user_model_benchmark_diagnostics=user_model_benchmark_diagnostics,
+        source_timings_ms=timings,
         confidence=confidence,
     )
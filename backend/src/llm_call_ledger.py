@@ -0,0 +1,286 @@
+"""SQLite-indexed ledger of LLM calls kept next to the rotating JSONL log.
+
+``SeraphLLMLogger`` appends every call to ``llm_calls.jsonl`` (the full record,
+optionally with message content) and to this ledger (the same record without
+content). The ledger indexes timestamp, session, request and model so recent
+calls and per-model usage can be queried without decoding the JSONL files.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+LEDGER_FILENAME = "llm_calls.index.sqlite3"
+
+# Content fields stay in the JSONL log only; the ledger holds call metadata.
+_CONTENT_FIELDS = ("messages", "response")
+
+_PRUNE_EVERY = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS llm_calls (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT,
+        ts_epoch REAL,
+        session_id TEXT,
+        request_id TEXT,
+        model TEXT,
+        provider TEXT,
+        status TEXT,
+        input_tokens INTEGER NOT NULL DEFAULT 0,
+        output_tokens INTEGER NOT NULL DEFAULT 0,
+        total_tokens INTEGER NOT NULL DEFAULT 0,
+        cost_usd REAL NOT NULL DEFAULT 0,
+        latency_ms REAL NOT NULL DEFAULT 0,
+        entry_json TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_llm_calls_ts_epoch ON llm_calls (ts_epoch)",
+    "CREATE INDEX IF NOT EXISTS ix_llm_calls_session_id ON llm_calls (session_id, id)",
+    "CREATE INDEX IF NOT EXISTS ix_llm_calls_request_id ON llm_calls (request_id)",
+    "CREATE INDEX IF NOT EXISTS ix_llm_calls_model ON llm_calls (model, ts_epoch)",
+    "CREATE TABLE IF NOT EXISTS ledger_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+
+def _coerce_timestamp(value: Any) -> datetime | None:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class LLMCallLedger:
+    """Append-only LLM call store with a SQLite index, safe to share across threads."""
+
+    def __init__(self, path: str | Path, *, max_rows: int = 500_000) -> None:
+        self.path = Path(path)
+        self._max_rows = max(1, int(max_rows))
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._writes_since_prune = 0
+
+    def append(self, entry: dict[str, Any], *, session_id: str | None = None) -> None:
+        self.append_many([(entry, session_id)])
+
+    def append_many(self, rows: Iterable[tuple[dict[str, Any], str | None]]) -> int:
+        values = [self._row_values(entry, session_id) for entry, session_id in rows]
+        if not values:
+            return 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO llm_calls (
+                        timestamp, ts_epoch, session_id, request_id, model, provider, status,
+                        input_tokens, output_tokens, total_tokens, cost_usd, latency_ms, entry_json
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    values,
+                )
+            self._writes_since_prune += len(values)
+            if self._writes_since_prune >= _PRUNE_EVERY:
+                self._writes_since_prune = 0
+                self._prune(conn)
+        return len(values)
+
+    def is_ready(self) -> bool:
+        """Whether the ledger holds every logged call (backfill from JSONL completed)."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value FROM ledger_meta WHERE key = 'backfilled'"
+            ).fetchone()
+        return bool(row and row[0] == "1")
+
+    def mark_ready(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ledger_meta (key, value) VALUES ('backfilled', '1')"
+                )
+
+    def list_recent(
+        self,
+        *,
+        limit: int = 100,
+        session_id: str | None = None,
+        since: datetime | None = None,
+    ) -> list[tuple[dict[str, Any], str | None]]:
+        """Return ``(entry, indexed_session_id)`` pairs, newest first."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if since is not None:
+            # Calls without a parseable timestamp are kept, as in the JSONL scan.
+            clauses.append("(ts_epoch IS NULL OR ts_epoch >= ?)")
+            params.append(_coerce_timestamp(since).timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(max(limit, 1))
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT entry_json, session_id FROM llm_calls {where} ORDER BY id DESC LIMIT ?",
+                params,
+            ).fetchall()
+        results: list[tuple[dict[str, Any], str | None]] = []
+        for entry_json, indexed_session_id in rows:
+            try:
+                entry = json.loads(entry_json)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict):
+                results.append((entry, indexed_session_id))
+        return results
+
+    def summarize_by_model(
+        self,
+        *,
+        session_id: str | None = None,
+        since: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate call counts, tokens, cost and latency per model."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if since is not None:
+            clauses.append("ts_epoch >= ?")
+            params.append(_coerce_timestamp(since).timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._connection().execute(
+                f"""
+                SELECT
+                    COALESCE(model, ''),
+                    COUNT(*),
+                    SUM(CASE WHEN status = 'failure' THEN 1 ELSE 0 END),
+                    SUM(input_tokens),
+                    SUM(output_tokens),
+                    SUM(total_tokens),
+                    SUM(cost_usd),
+                    AVG(latency_ms)
+                FROM llm_calls {where}
+                GROUP BY COALESCE(model, '')
+                ORDER BY SUM(cost_usd) DESC, COUNT(*) DESC
+                """,
+                params,
+            ).fetchall()
+        return [
+            {
+                "model": model,
+                "calls": int(calls or 0),
+                "failures": int(failures or 0),
+                "input_tokens": int(input_tokens or 0),
+                "output_tokens": int(output_tokens or 0),
+                "total_tokens": int(total_tokens or 0),
+                "cost_usd": round(float(cost or 0.0), 6),
+                "avg_latency_ms": round(float(latency or 0.0), 2),
+            }
+            for model, calls, failures, input_tokens, output_tokens, total_tokens, cost, latency in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        row = conn.execute("SELECT MAX(id) FROM llm_calls").fetchone()
+        max_id = int(row[0] or 0) if row else 0
+        if max_id <= self._max_rows:
+            return
+        with conn:
+            conn.execute("DELETE FROM llm_calls WHERE id <= ?", (max_id - self._max_rows,))
+
+    @staticmethod
+    def _row_values(entry: dict[str, Any], session_id: str | None) -> tuple[Any, ...]:
+        stored = {key: value for key, value in entry.items() if key not in _CONTENT_FIELDS}
+        tokens = stored.get("tokens") if isinstance(stored.get("tokens"), dict) else {}
+        timestamp = _coerce_timestamp(stored.get("timestamp"))
+        request_id = stored.get("request_id")
+        return (
+            str(stored.get("timestamp") or "") or None,
+            timestamp.timestamp() if timestamp is not None else None,
+            session_id,
+            request_id if isinstance(request_id, str) else None,
+            str(stored.get("model") or ""),
+            str(stored.get("provider") or ""),
+            str(stored.get("status") or ""),
+            _as_int(tokens.get("input")),
+            _as_int(tokens.get("output")),
+            _as_int(tokens.get("total")),
+            _as_float(stored.get("cost_usd")),
+            _as_float(stored.get("latency_ms")),
+            json.dumps(stored, default=str),
+        )
+
+
+_ledgers: dict[str, LLMCallLedger] = {}
+_ledgers_lock = threading.Lock()
+
+
+def get_llm_call_ledger(log_dir: str, *, max_rows: int = 500_000) -> LLMCallLedger:
+    """Return the shared ledger for ``log_dir``."""
+    path = str(Path(log_dir) / LEDGER_FILENAME)
+    with _ledgers_lock:
+        ledger = _ledgers.get(path)
+        if ledger is None:
+            ledger = LLMCallLedger(path, max_rows=max_rows)
+            _ledgers[path] = ledger
+        return ledger
+
+
+def ledger_exists(log_dir: str) -> bool:
+    return (Path(log_dir) / LEDGER_FILENAME).exists()
+
+
+def _reset_llm_call_ledgers() -> None:
+    with _ledgers_lock:
+        for ledger in _ledgers.values():
+            ledger.close()
+        _ledgers.clear()
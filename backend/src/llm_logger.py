@@ -2,7 +2,8 @@
 
 Registers a `CustomLogger` with `litellm.callbacks` so that every
 `litellm.completion()` call (direct or via smolagents) is captured
-without touching any call site.
+without touching any call site. Each call is also recorded in the indexed
+call ledger (`src.llm_call_ledger`) that serves recent-call queries.
 """
 
 import json
@@ -17,6 +18,8 @@ from litellm.integrations.custom_logger import CustomLogger
 
 from config.settings import settings
 from src.approval.runtime import get_current_session_id
+from src.llm_call_ledger import LLMCallLedger, get_llm_call_ledger, ledger_exists
+from src.llm_prompt_cache import PromptPrefixTracker
 from src.llm_runtime import get_current_llm_request_id
 
 logger = logging.getLogger(__name__)
@@ -66,13 +69,104 @@ def _log_file_candidates() -> list[Path]:
     return candidates
 
 
+def _annotate_entry(entry: dict[str, Any], inferred_session_id: str | None) -> dict[str, Any]:
+    request_id = entry.get("request_id") if isinstance(entry.get("request_id"), str) else None
+    actor, source = _infer_request_origin(request_id, inferred_session_id)
+    entry["session_id"] = inferred_session_id
+    entry["actor"] = actor
+    entry["source"] = source
+    return entry
+
+
+def _cached_input_tokens(response_obj: Any) -> int | None:
+    """Prompt tokens the provider served from its prefix cache, when it reports them."""
+    usage = getattr(response_obj, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    if cached is None:
+        cached = getattr(usage, "cache_read_input_tokens", None)
+    return cached if isinstance(cached, int) else None
+
+
+def _ready_ledger() -> LLMCallLedger | None:
+    if not settings.llm_log_index_enabled or not ledger_exists(settings.llm_log_dir):
+        return None
+    try:
+        ledger = get_llm_call_ledger(settings.llm_log_dir, max_rows=settings.llm_log_index_max_rows)
+        return ledger if ledger.is_ready() else None
+    except Exception:
+        logger.debug("llm_logger: call ledger unavailable, scanning JSONL", exc_info=True)
+        return None
+
+
+def backfill_llm_call_ledger(ledger: LLMCallLedger, *, batch_size: int = 1000) -> int:
+    """Index every call still in the rotating JSONL files, oldest first. Returns rows indexed."""
+    indexed = 0
+    batch: list[tuple[dict[str, Any], str | None]] = []
+    for path in reversed(_log_file_candidates()):
+        if not path.exists():
+            continue
+        try:
+            with path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if not isinstance(entry, dict):
+                        continue
+                    batch.append((entry, _infer_session_id(entry)))
+                    if len(batch) >= batch_size:
+                        indexed += ledger.append_many(batch)
+                        batch = []
+        except OSError:
+            continue
+    indexed += ledger.append_many(batch)
+    ledger.mark_ready()
+    return indexed
+
+
+def open_llm_call_ledger() -> LLMCallLedger | None:
+    """Open the call ledger, indexing the existing JSONL history the first time."""
+    if not settings.llm_log_index_enabled:
+        return None
+    try:
+        ledger = get_llm_call_ledger(settings.llm_log_dir, max_rows=settings.llm_log_index_max_rows)
+        if not ledger.is_ready():
+            indexed = backfill_llm_call_ledger(ledger)
+            logger.info("llm_logger: indexed %d existing LLM call(s)", indexed)
+        return ledger
+    except Exception:
+        logger.warning("llm_logger: call ledger unavailable, JSONL only", exc_info=True)
+        return None
+
+
 def list_recent_llm_calls(
     *,
     limit: int = 100,
     session_id: str | None = None,
     since: datetime | None = None,
 ) -> list[dict[str, Any]]:
-    """Return recent LLM call records from the rotating JSONL log, newest first."""
+    """Return recent LLM call records, newest first.
+
+    Served from the indexed call ledger when it is available; otherwise the
+    rotating JSONL log is scanned.
+    """
+    ledger = _ready_ledger()
+    if ledger is not None:
+        try:
+            return [
+                _annotate_entry(entry, indexed_session_id)
+                for entry, indexed_session_id in ledger.list_recent(
+                    limit=limit,
+                    session_id=session_id,
+                    since=since,
+                )
+            ]
+        except Exception:
+            logger.debug("llm_logger: call ledger query failed, scanning JSONL", exc_info=True)
     entries: list[dict[str, Any]] = []
     remaining = max(limit, 1)
     for path in _log_file_candidates():
@@ -95,22 +189,66 @@ def list_recent_llm_calls(
             timestamp = _coerce_timestamp(entry.get("timestamp"))
             if since and timestamp and timestamp < since:
                 continue
-            request_id = entry.get("request_id") if isinstance(entry.get("request_id"), str) else None
-            actor, source = _infer_request_origin(request_id, inferred_session_id)
-            entry["session_id"] = inferred_session_id
-            entry["actor"] = actor
-            entry["source"] = source
-            entries.append(entry)
+            entries.append(_annotate_entry(entry, inferred_session_id))
             remaining -= 1
             if remaining <= 0:
                 return entries
     return entries
 
 
+def summarize_llm_usage_by_model(
+    *,
+    session_id: str | None = None,
+    since: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Return per-model call, token, cost and latency totals for the matching calls."""
+    ledger = _ready_ledger()
+    if ledger is not None:
+        try:
+            return ledger.summarize_by_model(session_id=session_id, since=since)
+        except Exception:
+            logger.debug("llm_logger: call ledger aggregate failed, scanning JSONL", exc_info=True)
+
+    totals: dict[str, dict[str, Any]] = {}
+    for entry in list_recent_llm_calls(limit=1_000_000, session_id=session_id, since=since):
+        if since and _coerce_timestamp(entry.get("timestamp")) is None:
+            continue
+        model = str(entry.get("model") or "")
+        tokens = entry.get("tokens") if isinstance(entry.get("tokens"), dict) else {}
+        bucket = totals.setdefault(
+            model,
+            {
+                "model": model,
+                "calls": 0,
+                "failures": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "total_tokens": 0,
+                "cost_usd": 0.0,
+                "latency_total_ms": 0.0,
+            },
+        )
+        bucket["calls"] += 1
+        bucket["failures"] += 1 if entry.get("status") == "failure" else 0
+        bucket["input_tokens"] += int(tokens.get("input") or 0)
+        bucket["output_tokens"] += int(tokens.get("output") or 0)
+        bucket["total_tokens"] += int(tokens.get("total") or 0)
+        bucket["cost_usd"] += float(entry.get("cost_usd") or 0.0)
+        bucket["latency_total_ms"] += float(entry.get("latency_ms") or 0.0)
+    summaries = []
+    for bucket in totals.values():
+        latency_total_ms = bucket.pop("latency_total_ms")
+        bucket["cost_usd"] = round(bucket["cost_usd"], 6)
+        bucket["avg_latency_ms"] = round(latency_total_ms / bucket["calls"], 2) if bucket["calls"] else 0.0
+        summaries.append(bucket)
+    summaries.sort(key=lambda item: (-item["cost_usd"], -item["calls"]))
+    return summaries
+
+
 class SeraphLLMLogger(CustomLogger):
     """Writes one JSON line per LLM call to a dedicated rotating log."""
 
-    def __init__(self) -> None:
+    def __init__(self, ledger: LLMCallLedger | None = None) -> None:
         self._log = logging.getLogger("seraph.llm_calls")
         self._log.propagate = False
         self._log.setLevel(logging.INFO)
@@ -125,6 +263,9 @@ class SeraphLLMLogger(CustomLogger):
         handler.setFormatter(logging.Formatter("%(message)s"))
         self._log.addHandler(handler)
 
+        self._prefix_tracker = PromptPrefixTracker()
+        self._ledger = ledger
+
     # ------------------------------------------------------------------
     # Sync callbacks (called by LiteLLM for non-async completions)
     # ------------------------------------------------------------------
@@ -133,6 +274,7 @@ class SeraphLLMLogger(CustomLogger):
         try:
             entry = self._build_entry(kwargs, response_obj, start_time, end_time, success=True)
             self._log.info(json.dumps(entry, default=str))
+            self._index(entry)
         except Exception:
             logger.debug("llm_logger: failed to log success event", exc_info=True)
 
@@ -140,9 +282,18 @@ class SeraphLLMLogger(CustomLogger):
         try:
             entry = self._build_entry(kwargs, response_obj, start_time, end_time, success=False)
             self._log.info(json.dumps(entry, default=str))
+            self._index(entry)
         except Exception:
             logger.debug("llm_logger: failed to log failure event", exc_info=True)
 
+    def _index(self, entry: dict) -> None:
+        if self._ledger is None:
+            return
+        try:
+            self._ledger.append(entry, session_id=_infer_session_id(entry))
+        except Exception:
+            logger.debug("llm_logger: failed to index LLM call", exc_info=True)
+
     # ------------------------------------------------------------------
     # Async callbacks
     # ------------------------------------------------------------------
@@ -189,12 +340,25 @@ class SeraphLLMLogger(CustomLogger):
             "source": source,
         }
 
+        cached_input = _cached_input_tokens(response_obj) if success else None
+        if cached_input is not None:
+            entry["tokens"]["cached_input"] = cached_input
+
+        messages = kwargs.get("messages")
+        if messages:
+            try:
+                entry["prompt_prefix"] = self._prefix_tracker.observe(
+                    messages,
+                    scope=f"{session_id or source}:{entry['model']}",
+                )
+            except Exception:
+                logger.debug("llm_logger: failed to measure prompt prefix", exc_info=True)
+
         if not success:
             exc = kwargs.get("exception") or kwargs.get("traceback_exception")
             entry["error"] = str(exc) if exc else slo.get("error_str", "")
 
         if settings.llm_log_content:
-            messages = kwargs.get("messages")
             if messages:
                 entry["messages"] = messages
             if response_obj:
@@ -218,7 +382,8 @@ def init_llm_logging() -> None:
     import litellm
 
     try:
-        callback = SeraphLLMLogger()
+        # Index the JSONL history before the callback starts appending to it.
+        callback = SeraphLLMLogger(ledger=open_llm_call_ledger())
     except OSError:
         logger.warning("LLM call logging failed — cannot create log dir %s", settings.llm_log_dir)
         return
@@ -0,0 +1,153 @@
+"""Prompt-cache-friendly system prompt layout and prefix stability tracking.
+
+Agent instructions are assembled as stable segments (persona, skills, soul)
+followed by volatile ones (guardian state, observer context, memories,
+history). ``VOLATILE_CONTEXT_HEADER`` separates the two, so the runtime can
+put a ``cache_control`` breakpoint right before the per-turn content on
+providers with explicit prompt caching, while providers with automatic prefix
+caching benefit from the ordering alone. ``PromptPrefixTracker`` measures how
+much of each prompt repeats the previous call of the same kind, which is what
+a provider prefix cache could reuse.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from config.settings import settings
+
+VOLATILE_CONTEXT_HEADER = "=== LIVE CONTEXT (refreshed every turn) ==="
+
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Prompts are grouped by their opening text so a session's chat agent, title
+# generator and strategist calls are compared with their own previous call.
+_PROMPT_FAMILY_CHARS = 256
+
+
+def compose_instructions(stable: Iterable[str], volatile: Iterable[str]) -> str:
+    """Join instruction segments, stable first, with the volatile header in between."""
+    stable_text = "\n\n".join(segment for segment in stable if segment)
+    volatile_text = "\n\n".join(segment for segment in volatile if segment)
+    if not volatile_text:
+        return stable_text
+    return f"{stable_text}\n\n{VOLATILE_CONTEXT_HEADER}\n\n{volatile_text}"
+
+
+def prompt_cache_control_for(model_id: str | None) -> dict[str, str] | None:
+    """Return the cache_control marker for ``model_id``, or ``None`` when it has no explicit prompt caching."""
+    if not settings.llm_prompt_cache_enabled or not model_id:
+        return None
+    lowered = model_id.lower()
+    if lowered.startswith("anthropic/") or "claude" in lowered:
+        return dict(_CACHE_CONTROL)
+    return None
+
+
+def apply_prompt_cache_control(
+    messages: list[dict[str, Any]],
+    cache_control: dict[str, str] | None,
+) -> list[dict[str, Any]]:
+    """Mark the stable part of the system message with ``cache_control``.
+
+    The system message is split at ``VOLATILE_CONTEXT_HEADER`` into a cached
+    block and an uncached one; without the header the whole system message is
+    cached. ``messages`` is not mutated.
+    """
+    if not cache_control:
+        return messages
+    for index, message in enumerate(messages):
+        if message.get("role") != "system":
+            continue
+        blocks = _content_blocks(message.get("content"))
+        if not blocks:
+            return messages
+        marked: list[dict[str, Any]] = []
+        breakpoint_set = False
+        for block in blocks:
+            text = block.get("text") if block.get("type") == "text" else None
+            if breakpoint_set or not isinstance(text, str) or VOLATILE_CONTEXT_HEADER not in text:
+                marked.append(dict(block))
+                continue
+            stable, _, volatile = text.partition(VOLATILE_CONTEXT_HEADER)
+            if stable.strip():
+                marked.append({"type": "text", "text": stable, "cache_control": dict(cache_control)})
+            marked.append({"type": "text", "text": VOLATILE_CONTEXT_HEADER + volatile})
+            breakpoint_set = True
+        if not breakpoint_set:
+            for block in reversed(marked):
+                if block.get("type") == "text":
+                    block["cache_control"] = dict(cache_control)
+                    break
+        updated = list(messages)
+        updated[index] = {**message, "content": marked}
+        return updated
+    return messages
+
+
+def prompt_text(messages: Iterable[Any]) -> str:
+    """Flatten chat messages into the text a prefix cache would see, in order."""
+    parts: list[str] = []
+    for message in messages:
+        if not isinstance(message, dict):
+            continue
+        texts = [
+            block["text"]
+            for block in _content_blocks(message.get("content"))
+            if block.get("type") == "text" and isinstance(block.get("text"), str)
+        ]
+        parts.append(f"{message.get('role', '')}\n" + "".join(texts))
+    return "\n\n".join(parts)
+
+
+class PromptPrefixTracker:
+    """Compare each prompt with the previous prompt of the same session and family."""
+
+    def __init__(self, *, max_keys: int = 256) -> None:
+        self._max_keys = max(1, max_keys)
+        self._previous: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def observe(self, messages: Iterable[Any], *, scope: str = "") -> dict[str, Any]:
+        text = prompt_text(messages)
+        stable_prefix = text.split(VOLATILE_CONTEXT_HEADER, 1)[0]
+        stable_hash = hashlib.sha256(stable_prefix.encode("utf-8")).hexdigest()[:16]
+        family = hashlib.sha256(text[:_PROMPT_FAMILY_CHARS].encode("utf-8")).hexdigest()[:12]
+        key = f"{scope}:{family}"
+        with self._lock:
+            previous = self._previous.pop(key, None)
+            self._previous[key] = (text, stable_hash)
+            while len(self._previous) > self._max_keys:
+                self._previous.popitem(last=False)
+
+        summary: dict[str, Any] = {
+            "prompt_chars": len(text),
+            "stable_prefix_chars": len(stable_prefix),
+            "stable_prefix_hash": stable_hash,
+            "stable_prefix_reused": None,
+            "shared_prefix_chars": 0,
+            "shared_prefix_ratio": 0.0,
+        }
+        if previous is not None:
+            previous_text, previous_hash = previous
+            shared = len(os.path.commonprefix([previous_text, text]))
+            summary["stable_prefix_reused"] = previous_hash == stable_hash
+            summary["shared_prefix_chars"] = shared
+            summary["shared_prefix_ratio"] = round(shared / len(text), 4) if text else 0.0
+        return summary
+
+    def reset(self) -> None:
+        with self._lock:
+            self._previous.clear()
+
+
+def _content_blocks(content: Any) -> list[dict[str, Any]]:
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}]
+    if isinstance(content, list):
+        return [block for block in content if isinstance(block, dict)]
+    return []
@@ -6,6 +6,7 @@ import asyncio
 import contextvars
 from dataclasses import dataclass
 import hashlib
+import itertools
 import json
 import logging
 import math
@@ -14,15 +15,16 @@ from fnmatch import fnmatchcase
 from threading import Lock
 from time import monotonic
 from types import SimpleNamespace
-from typing import Any
+from typing import Any, Callable, Iterator
 from uuid import uuid4
 
 from smolagents import LiteLLMModel as BaseLiteLLMModel
-from smolagents.models import ChatMessage, MessageRole
+from smolagents.models import ChatMessage, ChatMessageStreamDelta, MessageRole
 
 from config.settings import settings
 from src.approval.runtime import get_current_session_id
 from src.audit.repository import audit_repository
+from src.llm_prompt_cache import apply_prompt_cache_control, prompt_cache_control_for
 from src.local_runtime_profiles import local_runtime_profile
 from src.operators.local_codex import is_local_codex_model, local_codex_chat_timeout_seconds, run_local_codex
 
@@ -1015,6 +1017,9 @@ def build_model_kwargs(
     api_base = _profile_api_base(resolved_profile)
     if api_base:
         kwargs["api_base"] = api_base
+    cache_control = prompt_cache_control_for(kwargs["model_id"])
+    if cache_control:
+        kwargs["prompt_cache_control"] = cache_control
     return kwargs
 
 
@@ -1133,6 +1138,35 @@ def _local_operator_chat_message(
     )
 
 
+def _primed_stream(stream: Iterator[ChatMessageStreamDelta]) -> Iterator[ChatMessageStreamDelta]:
+    """Pull the first delta so a target that fails before emitting anything can still fall back."""
+    iterator = iter(stream)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+    return itertools.chain((first,), iterator)
+
+
+def _settled_stream(
+    stream: Iterator[ChatMessageStreamDelta],
+    *,
+    on_success: Callable[[], None],
+    on_failure: Callable[[Exception], None],
+) -> Iterator[ChatMessageStreamDelta]:
+    """Yield ``stream`` and report its outcome once it is exhausted or raises."""
+    try:
+        yield from stream
+    except Exception as error:
+        on_failure(error)
+        raise
+    on_success()
+
+
+def _message_as_stream(message: ChatMessage) -> Iterator[ChatMessageStreamDelta]:
+    return iter((ChatMessageStreamDelta(content=message.content, token_usage=message.token_usage),))
+
+
 def _run_local_codex_completion(prompt: str, *, session_id: str | None) -> dict[str, Any]:
     async def _run() -> dict[str, Any]:
         return await run_local_codex(
@@ -2413,7 +2447,24 @@ def _log_llm_runtime_event_sync(
         logger.debug("Failed to run LLM runtime audit logger", exc_info=True)
 
 
-class FallbackLiteLLMModel(BaseLiteLLMModel):
+class PromptCachingLiteLLMModel(BaseLiteLLMModel):
+    """LiteLLM model that marks the stable system-prompt prefix with ``cache_control``."""
+
+    def __init__(self, *args, prompt_cache_control: dict[str, str] | None = None, **kwargs):
+        self.prompt_cache_control = prompt_cache_control
+        super().__init__(*args, **kwargs)
+
+    def _prepare_completion_kwargs(self, *args, **kwargs) -> dict[str, Any]:
+        completion_kwargs = super()._prepare_completion_kwargs(*args, **kwargs)
+        if self.prompt_cache_control and completion_kwargs.get("messages"):
+            completion_kwargs["messages"] = apply_prompt_cache_control(
+                completion_kwargs["messages"],
+                self.prompt_cache_control,
+            )
+        return completion_kwargs
+
+
+class FallbackLiteLLMModel(PromptCachingLiteLLMModel):
     """LiteLLM model wrapper that retries via the configured fallback model."""
 
     def __init__(
@@ -2425,6 +2476,7 @@ class FallbackLiteLLMModel(BaseLiteLLMModel):
         flatten_messages_as_text: bool | None = None,
         runtime_profile: str | None = None,
         runtime_path: str | None = None,
+        prompt_cache_control: dict[str, str] | None = None,
         **kwargs,
     ):
         self._runtime_profile = runtime_profile or "default"
@@ -2435,6 +2487,7 @@ class FallbackLiteLLMModel(BaseLiteLLMModel):
             api_key=api_key,
             custom_role_conversions=custom_role_conversions,
             flatten_messages_as_text=flatten_messages_as_text,
+            prompt_cache_control=prompt_cache_control,
             **kwargs,
         )
         self._fallback_models: tuple[BaseLiteLLMModel, ...] = ()
@@ -2456,11 +2509,12 @@ class FallbackLiteLLMModel(BaseLiteLLMModel):
                 **fallback_kwargs,
                 **dict(target.get("options") or {}),
             }
-            fallback_model = BaseLiteLLMModel(
+            fallback_model = PromptCachingLiteLLMModel(
                     model_id=str(target["model_id"]),
                     api_base=target["api_base"] or None,
                     api_key=target["api_key"] or None,
                     custom_role_conversions=custom_role_conversions,
+                    prompt_cache_control=prompt_cache_control_for(str(target["model_id"])),
                     **target_kwargs,
                 )
             setattr(fallback_model, "runtime_profile", target.get("profile"))
@@ -2477,6 +2531,47 @@ class FallbackLiteLLMModel(BaseLiteLLMModel):
         response_format=None,
         tools_to_call_from=None,
         **kwargs,
+    ):
+        return self._generate_with_fallback(
+            messages,
+            stream=False,
+            stop_sequences=stop_sequences,
+            response_format=response_format,
+            tools_to_call_from=tools_to_call_from,
+            **kwargs,
+        )
+
+    def generate_stream(
+        self,
+        messages,
+        stop_sequences=None,
+        response_format=None,
+        tools_to_call_from=None,
+        **kwargs,
+    ) -> Iterator[ChatMessageStreamDelta]:
+        """Stream response deltas, switching fallback targets only until the first delta arrives.
+
+        Once a target has emitted output, a later failure is raised to the caller
+        instead of being retried, since the partial answer has already been seen.
+        """
+        yield from self._generate_with_fallback(
+            messages,
+            stream=True,
+            stop_sequences=stop_sequences,
+            response_format=response_format,
+            tools_to_call_from=tools_to_call_from,
+            **kwargs,
+        )
+
+    def _generate_with_fallback(
+        self,
+        messages,
+        *,
+        stream: bool,
+        stop_sequences=None,
+        response_format=None,
+        tools_to_call_from=None,
+        **kwargs,
     ):
         primary_model = self.model_id
         request_id = _current_llm_request_id()
@@ -2584,6 +2679,18 @@ class FallbackLiteLLMModel(BaseLiteLLMModel):
                             raw=local_result,
                             stop_sequences=stop_sequences,
                         )
+                        if stream:
+                            response = _message_as_stream(response)
+                    elif stream:
+                        response = _primed_stream(
+                            super().generate_stream(
+                                messages,
+                                stop_sequences=stop_sequences,
+                                response_format=response_format,
+                                tools_to_call_from=tools_to_call_from,
+                                **kwargs,
+                            )
+                        )
                     else:
                         response = super().generate(
                             messages,
@@ -2592,26 +2699,58 @@ class FallbackLiteLLMModel(BaseLiteLLMModel):
                             tools_to_call_from=tools_to_call_from,
                             **kwargs,
                         )
-                    _mark_target_succeeded(
-                        model_id=primary_model,
-                        api_base=self.api_base,
-                        api_key=self.api_key,
-                    )
-                    if _can_log_request(request_id):
-                        details = {
-                            "runtime_path": "agent_generate",
-                            "primary_model": primary_model,
-                            "used_fallback": False,
-                        }
-                        if attempted_fallback_models:
-                            details["attempted_fallback_models"] = attempted_fallback_models
-                            details["fallback_attempts"] = len(attempted_fallback_models)
-                        _log_llm_runtime_event_sync(
-                            event_type="llm_primary_success",
-                            summary=f"Primary agent model generate succeeded via {primary_model}",
-                            details=details,
-                            request_id=request_id,
+                    def _primary_succeeded() -> None:
+                        _mark_target_succeeded(
+                            model_id=primary_model,
+                            api_base=self.api_base,
+                            api_key=self.api_key,
+                        )
+                        if _can_log_request(request_id):
+                            details = {
+                                "runtime_path": "agent_generate",
+                                "primary_model": primary_model,
+                                "used_fallback": False,
+                            }
+                            if attempted_fallback_models:
+                                details["attempted_fallback_models"] = attempted_fallback_models
+                                details["fallback_attempts"] = len(attempted_fallback_models)
+                            _log_llm_runtime_event_sync(
+                                event_type="llm_primary_success",
+                                summary=f"Primary agent model generate succeeded via {primary_model}",
+                                details=details,
+                                request_id=request_id,
+                            )
+
+                    def _primary_stream_failed(error: Exception) -> None:
+                        _mark_target_failed(
+                            model_id=primary_model,
+                            api_base=self.api_base,
+                            api_key=self.api_key,
+                            error=error,
                         )
+                        if _can_log_request(request_id):
+                            _log_llm_runtime_event_sync(
+                                event_type="llm_primary_failure",
+                                summary=f"Primary agent model stream failed via {primary_model}",
+                                details={
+                                    "runtime_path": "agent_generate",
+                                    "primary_model": primary_model,
+                                    "used_fallback": False,
+                                    "error": _safe_error(error),
+                                    "stream_interrupted": True,
+                                },
+                                request_id=request_id,
+                            )
+
+                    if stream:
+                        # Deltas already reached the caller, so a mid-stream error
+                        # cannot fall back; the outcome is recorded when it settles.
+                        return _settled_stream(
+                            response,
+                            on_success=_primary_succeeded,
+                            on_failure=_primary_stream_failed,
+                        )
+                    _primary_succeeded()
                     return response
 
                 fallback_model = target["model"]
@@ -2634,6 +2773,18 @@ class FallbackLiteLLMModel(BaseLiteLLMModel):
                         raw=local_result,
                         stop_sequences=stop_sequences,
                     )
+                    if stream:
+                        response = _message_as_stream(response)
+                elif stream:
+                    response = _primed_stream(
+                        fallback_model.generate_stream(
+                            messages,
+                            stop_sequences=stop_sequences,
+                            response_format=response_format,
+                            tools_to_call_from=tools_to_call_from,
+                            **kwargs,
+                        )
+                    )
                 else:
                     response = fallback_model.generate(
                         messages,
@@ -2642,33 +2793,67 @@ class FallbackLiteLLMModel(BaseLiteLLMModel):
                         tools_to_call_from=tools_to_call_from,
                         **kwargs,
                     )
-                _mark_target_succeeded(
-                    model_id=fallback_model.model_id,
-                    api_base=fallback_model.api_base,
-                    api_key=fallback_model.api_key,
-                )
-                if _can_log_request(request_id):
-                    details = {
-                        "runtime_path": "agent_generate",
-                        "primary_model": primary_model,
-                        "fallback_model": fallback_model.model_id,
-                        "attempted_fallback_models": attempted_fallback_models,
-                        "fallback_attempts": len(attempted_fallback_models),
-                        "used_fallback": True,
-                        "primary_attempted": primary_attempted,
-                    }
-                    if primary_error is not None:
-                        details["primary_error"] = _safe_error(primary_error)
-                    if rerouted and primary_unhealthy:
-                        details["rerouted_from_unhealthy_primary"] = True
-                    if rerouted_due_to_policy:
-                        details["rerouted_from_policy_guardrails"] = True
-                    _log_llm_runtime_event_sync(
-                        event_type="llm_fallback_success",
-                        summary=f"Fallback agent model generate succeeded via {fallback_model.model_id}",
-                        details=details,
-                        request_id=request_id,
+                def _fallback_succeeded() -> None:
+                    _mark_target_succeeded(
+                        model_id=fallback_model.model_id,
+                        api_base=fallback_model.api_base,
+                        api_key=fallback_model.api_key,
+                    )
+                    if _can_log_request(request_id):
+                        details = {
+                            "runtime_path": "agent_generate",
+                            "primary_model": primary_model,
+                            "fallback_model": fallback_model.model_id,
+                            "attempted_fallback_models": attempted_fallback_models,
+                            "fallback_attempts": len(attempted_fallback_models),
+                            "used_fallback": True,
+                            "primary_attempted": primary_attempted,
+                        }
+                        if primary_error is not None:
+                            details["primary_error"] = _safe_error(primary_error)
+                        if rerouted and primary_unhealthy:
+                            details["rerouted_from_unhealthy_primary"] = True
+                        if rerouted_due_to_policy:
+                            details["rerouted_from_policy_guardrails"] = True
+                        _log_llm_runtime_event_sync(
+                            event_type="llm_fallback_success",
+                            summary=f"Fallback agent model generate succeeded via {fallback_model.model_id}",
+                            details=details,
+                            request_id=request_id,
+                        )
+
+                def _fallback_stream_failed(error: Exception) -> None:
+                    _mark_target_failed(
+                        model_id=fallback_model.model_id,
+                        api_base=fallback_model.api_base,
+                        api_key=fallback_model.api_key,
+                        error=error,
+                    )
+                    if _can_log_request(request_id):
+                        _log_llm_runtime_event_sync(
+                            event_type="llm_fallback_failure",
+                            summary=f"Fallback agent model stream failed via {fallback_model.model_id}",
+                            details={
+                                "runtime_path": "agent_generate",
+                                "primary_model": primary_model,
+                                "fallback_model": fallback_model.model_id,
+                                "attempted_fallback_models": attempted_fallback_models,
+                                "fallback_attempts": len(attempted_fallback_models),
+                                "used_fallback": True,
+                                "fallback_error": _safe_error(error),
+                                "primary_attempted": primary_attempted,
+                                "stream_interrupted": True,
+                            },
+                            request_id=request_id,
+                        )
+
+                if stream:
+                    return _settled_stream(
+                        response,
+                        on_success=_fallback_succeeded,
+                        on_failure=_fallback_stream_failed,
                     )
+                _fallback_succeeded()
                 return response
             except Exception as error:
                 last_error = error
@@ -9,6 +9,7 @@ from src.audit.runtime import log_background_task_event
 from src.llm_runtime import completion_with_fallback
 from src.memory.linking import resolve_memory_links
 from src.memory.decay import apply_memory_decay_policies
+from src.memory.embedder import prime_embeddings
 from src.memory.pipeline.capture import capture_session_memory
 from src.memory.pipeline.extract import extract_session_memories
 from src.memory.pipeline.merge import persist_extracted_memories
@@ -96,6 +97,14 @@ async def consolidate_session(
                 outcome="timed_out",
                 should_cache_fingerprint=False,
             )
+        try:
+            # One batched forward pass instead of one per extracted memory.
+            await asyncio.to_thread(
+                prime_embeddings,
+                [item.text for item in extraction.memories],
+            )
+        except Exception:
+            logger.debug("Embedding warm-up failed for session %s", session_id[:8], exc_info=True)
         persist_result = await persist_extracted_memories(
             extracted_memories=extraction.memories,
             session_id=session_id,
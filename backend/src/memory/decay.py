@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from dataclasses import dataclass
@@ -81,6 +82,21 @@ _AMBIGUOUS_STATUS_POSITIVE_CUES = {
     "available",
 }
 
+
+def _cue_pattern(cue: str) -> re.Pattern[str]:
+    return re.compile(r"\b" + r"\s+".join(re.escape(part) for part in cue.lower().split()) + r"\b")
+
+
+_CUE_PATTERNS = {cue: _cue_pattern(cue) for cue in (*_POSITIVE_CUES, *_NEGATIVE_CUES)}
+
+_CUE_WORDS = frozenset(
+    token
+    for cue in (*_POSITIVE_CUES, *_NEGATIVE_CUES)
+    for token in re.findall(r"[a-z0-9]+", cue)
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
 _STALE_WINDOWS_DAYS = {
     MemoryKind.commitment: 30,
     MemoryKind.project: 45,
@@ -286,18 +302,18 @@ def _normalized_text(memory: Memory) -> str:
 
 
 def _contains_cue(text: str, cue: str) -> bool:
-    pattern = r"\b" + r"\s+".join(re.escape(part) for part in cue.lower().split()) + r"\b"
-    return re.search(pattern, text) is not None
+    pattern = _CUE_PATTERNS.get(cue) or _cue_pattern(cue)
+    return pattern.search(text) is not None
 
 
-def _cue_polarity(text: str) -> int:
-    anchor_tokens = _anchor_tokens(text)
+def _cue_polarity(text: str, anchor_tokens: set[str] | None = None) -> int:
+    if anchor_tokens is None:
+        anchor_tokens = _anchor_tokens(text)
     negative = any(_contains_cue(text, cue) for cue in _NEGATIVE_CUES)
     positive_text = text
     if negative:
         for cue in _NEGATIVE_CUES:
-            pattern = r"\b" + r"\s+".join(re.escape(part) for part in cue.lower().split()) + r"\b"
-            positive_text = re.sub(pattern, " ", positive_text)
+            positive_text = _CUE_PATTERNS[cue].sub(" ", positive_text)
     positive = any(
         _contains_cue(positive_text, cue)
         for cue in _POSITIVE_CUES
@@ -311,19 +327,41 @@ def _cue_polarity(text: str) -> int:
 
 
 def _anchor_tokens(text: str) -> set[str]:
-    cue_words = {
-        token
-        for cue in (*_POSITIVE_CUES, *_NEGATIVE_CUES)
-        for token in re.findall(r"[a-z0-9]+", cue)
-    }
     tokens = [
         token
-        for token in re.findall(r"[a-z0-9]+", text)
-        if token not in _STOPWORDS and token not in cue_words
+        for token in _TOKEN_PATTERN.findall(text)
+        if token not in _STOPWORDS and token not in _CUE_WORDS
     ]
     return set(tokens[:4])
 
 
+@dataclass(frozen=True)
+class _ContradictionFeatures:
+    """Per-memory text features reused across every pair the memory is compared in."""
+
+    anchors: frozenset[str]
+    polarity: int
+    signature: str
+
+
+def _contradiction_features(memory: Memory) -> _ContradictionFeatures:
+    text = _normalized_text(memory)
+    anchors = _anchor_tokens(text)
+    signature_source = "\x1f".join(
+        [
+            str(memory.kind.value if hasattr(memory.kind, "value") else memory.kind),
+            memory.subject_entity_id or "",
+            memory.project_entity_id or "",
+            text,
+        ]
+    )
+    return _ContradictionFeatures(
+        anchors=frozenset(anchors),
+        polarity=_cue_polarity(text, anchors),
+        signature=hashlib.sha1(signature_source.encode("utf-8")).hexdigest(),
+    )
+
+
 def _shares_entity(memory: Memory, peer: Memory) -> bool:
     return (
         memory.subject_entity_id
@@ -334,7 +372,12 @@ def _shares_entity(memory: Memory, peer: Memory) -> bool:
     )
 
 
-def _comparable(memory: Memory, peer: Memory) -> bool:
+def _comparable(
+    memory: Memory,
+    peer: Memory,
+    memory_features: _ContradictionFeatures | None = None,
+    peer_features: _ContradictionFeatures | None = None,
+) -> bool:
     if memory.id == peer.id:
         return False
     if memory.kind != peer.kind or memory.kind not in _COMPARABLE_KINDS:
@@ -356,16 +399,23 @@ def _comparable(memory: Memory, peer: Memory) -> bool:
     shared_entity = _shares_entity(memory, peer)
     if shared_entity:
         return True
-    return len(_anchor_tokens(_normalized_text(memory)) & _anchor_tokens(_normalized_text(peer))) >= 2
-
-
-def _contradictory(memory: Memory, peer: Memory) -> bool:
-    if not _comparable(memory, peer):
+    memory_features = memory_features or _contradiction_features(memory)
+    peer_features = peer_features or _contradiction_features(peer)
+    return len(memory_features.anchors & peer_features.anchors) >= 2
+
+
+def _contradictory(
+    memory: Memory,
+    peer: Memory,
+    memory_features: _ContradictionFeatures | None = None,
+    peer_features: _ContradictionFeatures | None = None,
+) -> bool:
+    memory_features = memory_features or _contradiction_features(memory)
+    peer_features = peer_features or _contradiction_features(peer)
+    if not _comparable(memory, peer, memory_features, peer_features):
         return False
-    left_text = _normalized_text(memory)
-    right_text = _normalized_text(peer)
-    left_anchors = _anchor_tokens(left_text)
-    right_anchors = _anchor_tokens(right_text)
+    left_anchors = memory_features.anchors
+    right_anchors = peer_features.anchors
     overlap = len(left_anchors & right_anchors)
     required_overlap = 2
     if (
@@ -377,11 +427,58 @@ def _contradictory(memory: Memory, peer: Memory) -> bool:
         required_overlap = 1
     if overlap < required_overlap:
         return False
-    left_polarity = _cue_polarity(left_text)
-    right_polarity = _cue_polarity(right_text)
+    left_polarity = memory_features.polarity
+    right_polarity = peer_features.polarity
     return left_polarity != 0 and right_polarity != 0 and left_polarity != right_polarity
 
 
+# Contradiction signatures of memories that were active after the last committed
+# decay pass. A pair whose members are both unchanged was already compared then,
+# so later passes only compare changed or new memories against their buckets.
+_checked_contradiction_signatures: dict[str, str] = {}
+
+
+def _reset_contradiction_check_state() -> None:
+    _checked_contradiction_signatures.clear()
+
+
+def _contradiction_candidates(
+    memories: list[Memory],
+    features: list[_ContradictionFeatures],
+) -> list[list[int]]:
+    """Return, per memory index, the later indexes worth comparing against it.
+
+    Every contradiction needs at least one shared anchor token within the same
+    kind, so memories are bucketed by (kind, anchor token) and only bucket peers
+    are compared. Pairs where neither side changed since the last pass are skipped.
+    """
+    buckets: dict[tuple[object, str], list[int]] = {}
+    for index, (memory, memory_features) in enumerate(zip(memories, features)):
+        if memory.kind not in _COMPARABLE_KINDS:
+            continue
+        for token in memory_features.anchors:
+            buckets.setdefault((memory.kind, token), []).append(index)
+
+    dirty = [
+        _checked_contradiction_signatures.get(memory.id) != memory_features.signature
+        for memory, memory_features in zip(memories, features)
+    ]
+    candidates: list[set[int]] = [set() for _ in memories]
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        changed = [index for index in members if dirty[index]]
+        if not changed:
+            continue
+        for index in changed:
+            for peer_index in members:
+                if peer_index == index:
+                    continue
+                low, high = (index, peer_index) if index < peer_index else (peer_index, index)
+                candidates[low].add(high)
+    return [sorted(peers) for peers in candidates]
+
+
 def _priority(memory: Memory) -> tuple[float, float]:
     anchor = _memory_age_anchor(memory)
     recency = anchor.timestamp()
@@ -430,11 +527,21 @@ async def apply_memory_decay_policies(
             )
         ).scalars().all()
 
+        features = [_contradiction_features(memory) for memory in active_memories]
+        candidates = _contradiction_candidates(list(active_memories), features)
+        pending_edges: list[tuple[str, str]] = []
+
         for index, memory in enumerate(active_memories):
             if memory.status != MemoryStatus.active:
                 continue
-            for peer in active_memories[index + 1 :]:
-                if peer.status != MemoryStatus.active or not _contradictory(memory, peer):
+            for peer_index in candidates[index]:
+                peer = active_memories[peer_index]
+                if peer.status != MemoryStatus.active or not _contradictory(
+                    memory,
+                    peer,
+                    features[index],
+                    features[peer_index],
+                ):
                     continue
                 winner, loser = (memory, peer)
                 if _priority(peer) > _priority(memory):
@@ -451,22 +558,30 @@ async def apply_memory_decay_policies(
 
                 contradiction_count += 1
                 superseded_count += 1
+                pending_edges.append((winner.id, loser.id))
 
-                for edge_type in (MemoryEdgeType.contradicts, MemoryEdgeType.supersedes):
-                    existing_edge = (
-                        await db.execute(
-                            select(MemoryEdge)
-                            .where(MemoryEdge.from_memory_id == winner.id)
-                            .where(MemoryEdge.to_memory_id == loser.id)
-                            .where(MemoryEdge.edge_type == edge_type)
-                        )
-                    ).scalars().first()
-                    if existing_edge is not None:
+        if pending_edges:
+            edge_types = (MemoryEdgeType.contradicts, MemoryEdgeType.supersedes)
+            existing_edges = {
+                (edge.from_memory_id, edge.to_memory_id, edge.edge_type)
+                for edge in (
+                    await db.execute(
+                        select(MemoryEdge)
+                        .where(col(MemoryEdge.from_memory_id).in_({winner_id for winner_id, _ in pending_edges}))
+                        .where(col(MemoryEdge.to_memory_id).in_({loser_id for _, loser_id in pending_edges}))
+                        .where(col(MemoryEdge.edge_type).in_(edge_types))
+                    )
+                ).scalars().all()
+            }
+            for winner_id, loser_id in pending_edges:
+                for edge_type in edge_types:
+                    if (winner_id, loser_id, edge_type) in existing_edges:
                         continue
+                    existing_edges.add((winner_id, loser_id, edge_type))
                     db.add(
                         MemoryEdge(
-                            from_memory_id=winner.id,
-                            to_memory_id=loser.id,
+                            from_memory_id=winner_id,
+                            to_memory_id=loser_id,
                             edge_type=edge_type,
                             weight=1.0,
                             metadata_json=json.dumps(
@@ -516,6 +631,15 @@ async def apply_memory_decay_policies(
                 archived_count += 1
 
         await db.flush()
+        checked_signatures = {
+            memory.id: memory_features.signature
+            for memory, memory_features in zip(active_memories, features)
+            if memory.status == MemoryStatus.active
+        }
+
+    # Record checked pairs only once the session has committed the pass.
+    _checked_contradiction_signatures.clear()
+    _checked_contradiction_signatures.update(checked_signatures)
 
     return DecayMaintenanceResult(
         contradiction_count=contradiction_count,
@@ -1,5 +1,9 @@
+import hashlib
 import logging
 import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Optional
 
 from config.settings import settings
@@ -12,6 +16,167 @@ _model_lock = threading.Lock()
 _LOAD_EVENT_EMITTED = False
 
 
+@dataclass
+class _PendingEmbedding:
+    text: str
+    key: str
+    done: threading.Event = field(default_factory=threading.Event)
+    vector: tuple[float, ...] | None = None
+    error: BaseException | None = None
+
+
+class _EmbeddingService:
+    """Coalesce concurrent ``embed()`` calls and cache recent vectors.
+
+    The first caller to miss the cache becomes the batch leader: it waits a
+    short window for other threads to queue their texts, then encodes every
+    pending text in one ``model.encode`` call and hands results back to the
+    waiting callers. Vectors are cached by content hash in a bounded LRU.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+        self._pending: list[_PendingEmbedding] = []
+        self._leader_active = False
+        self._requests = 0
+        self._cache_hits = 0
+        self._batches = 0
+        self._encoded_texts = 0
+        self._max_batch_size = 0
+
+    def _cache_key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{_embedder_name()}:{digest}"
+
+    def _lookup(self, key: str) -> tuple[float, ...] | None:
+        vector = self._cache.get(key)
+        if vector is not None:
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+        return vector
+
+    def _store(self, key: str, vector: tuple[float, ...]) -> None:
+        capacity = settings.embedding_cache_size
+        if capacity <= 0:
+            return
+        self._cache[key] = vector
+        self._cache.move_to_end(key)
+        while len(self._cache) > capacity:
+            self._cache.popitem(last=False)
+
+    def _encode(self, texts: list[str]) -> list[tuple[float, ...]]:
+        model = _get_model()
+        try:
+            if len(texts) == 1:
+                vectors = [model.encode(texts[0], normalize_embeddings=True).tolist()]
+            else:
+                vectors = model.encode(texts, normalize_embeddings=True).tolist()
+        except Exception as exc:
+            _log_embedding_event(
+                "failed",
+                details={"stage": "encode", "batch_size": len(texts), "error": str(exc)},
+            )
+            raise
+        with self._lock:
+            self._batches += 1
+            self._encoded_texts += len(texts)
+            self._max_batch_size = max(self._max_batch_size, len(texts))
+        return [tuple(vector) for vector in vectors]
+
+    def embed(self, text: str) -> list[float]:
+        key = self._cache_key(text)
+        request = _PendingEmbedding(text=text, key=key)
+        with self._lock:
+            self._requests += 1
+            cached = self._lookup(key)
+            if cached is not None:
+                return list(cached)
+            self._pending.append(request)
+            lead = not self._leader_active
+            self._leader_active = True
+        if lead:
+            self._drain_pending()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        assert request.vector is not None
+        return list(request.vector)
+
+    def _drain_pending(self) -> None:
+        window_seconds = settings.embedding_batch_window_ms / 1000
+        if window_seconds > 0:
+            time.sleep(window_seconds)
+        max_batch_size = max(1, settings.embedding_max_batch_size)
+        while True:
+            with self._lock:
+                batch = self._pending[:max_batch_size]
+                del self._pending[:max_batch_size]
+                if not batch:
+                    self._leader_active = False
+                    return
+            texts_by_key: dict[str, str] = {}
+            for request in batch:
+                texts_by_key.setdefault(request.key, request.text)
+            try:
+                vectors = self._encode(list(texts_by_key.values()))
+            except BaseException as exc:
+                for request in batch:
+                    request.error = exc
+                    request.done.set()
+                continue
+            vectors_by_key = dict(zip(texts_by_key, vectors))
+            with self._lock:
+                for key, vector in vectors_by_key.items():
+                    self._store(key, vector)
+            for request in batch:
+                request.vector = vectors_by_key[request.key]
+                request.done.set()
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        keys = [self._cache_key(text) for text in texts]
+        resolved: dict[str, tuple[float, ...]] = {}
+        missing: dict[str, str] = {}
+        with self._lock:
+            self._requests += len(texts)
+            for key, text in zip(keys, texts):
+                if key in resolved or key in missing:
+                    continue
+                cached = self._lookup(key)
+                if cached is not None:
+                    resolved[key] = cached
+                else:
+                    missing[key] = text
+        if missing:
+            vectors = self._encode(list(missing.values()))
+            with self._lock:
+                for key, vector in zip(missing, vectors):
+                    self._store(key, vector)
+                    resolved[key] = vector
+        return [list(resolved[key]) for key in keys]
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            requests = self._requests
+            return {
+                "model": _embedder_name(),
+                "requests": requests,
+                "cache_hits": self._cache_hits,
+                "cache_size": len(self._cache),
+                "cache_capacity": settings.embedding_cache_size,
+                "hit_rate": round(self._cache_hits / requests, 4) if requests else 0.0,
+                "batches": self._batches,
+                "encoded_texts": self._encoded_texts,
+                "average_batch_size": (
+                    round(self._encoded_texts / self._batches, 2) if self._batches else 0.0
+                ),
+                "max_batch_size": self._max_batch_size,
+            }
+
+
+_service = _EmbeddingService()
+
+
 def _embedder_name() -> str:
     return settings.embedding_model
 
@@ -50,34 +215,40 @@ def _get_model():
 
 
 def embed(text: str) -> list[float]:
-    """Embed a single text string into a vector."""
-    model = _get_model()
-    try:
-        return model.encode(text, normalize_embeddings=True).tolist()
-    except Exception as exc:
-        _log_embedding_event(
-            "failed",
-            details={"stage": "encode", "batch_size": 1, "error": str(exc)},
-        )
-        raise
+    """Embed a single text string into a vector.
+
+    Concurrent callers are coalesced into one ``model.encode`` batch and
+    repeated texts are served from the content-hash cache.
+    """
+    return _service.embed(text)
 
 
 def embed_batch(texts: list[str]) -> list[list[float]]:
-    """Embed multiple texts into vectors."""
-    model = _get_model()
-    try:
-        return model.encode(texts, normalize_embeddings=True).tolist()
-    except Exception as exc:
-        _log_embedding_event(
-            "failed",
-            details={"stage": "encode", "batch_size": len(texts), "error": str(exc)},
-        )
-        raise
+    """Embed multiple texts into vectors, reusing cached vectors where possible."""
+    return _service.embed_batch(texts)
+
+
+def prime_embeddings(texts: list[str]) -> int:
+    """Warm the cache for texts about to be embedded one by one.
+
+    Only runs when the model is already resident so callers never pay a
+    model load for a speculative warm-up. Returns the number of texts primed.
+    """
+    unique_texts = list(dict.fromkeys(text for text in texts if text))
+    if not unique_texts or _model is None:
+        return 0
+    return len(_service.embed_batch(unique_texts))
+
+
+def get_embedding_service_stats() -> dict[str, object]:
+    """Return cache hit-rate and batch-size counters for the embedding service."""
+    return _service.stats()
 
 
 def _reset_embedder_state() -> None:
     """Reset cached embedder state for tests and deterministic evals."""
-    global _model, _LOAD_EVENT_EMITTED
+    global _model, _LOAD_EVENT_EMITTED, _service
     with _model_lock:
         _model = None
         _LOAD_EVENT_EMITTED = False
+        _service = _EmbeddingService()
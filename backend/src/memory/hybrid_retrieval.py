@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, text as sql_text
 from sqlmodel import col, select
 
 from src.db.engine import get_session
@@ -14,6 +15,7 @@ from src.memory.repository import memory_repository
 from src.memory.types import bucket_name_for_kind
 from src.memory.vector_store import search_with_status
 
+logger = logging.getLogger(__name__)
 
 _STOPWORDS = {
     "about",
@@ -111,6 +113,64 @@ def _query_terms(query: str) -> tuple[str, ...]:
     return tuple(terms)
 
 
+def _fts_match_expression(terms: tuple[str, ...]) -> str | None:
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+async def _lexical_candidate_ids(
+    db,
+    *,
+    source_type: str,
+    match_expression: str,
+    candidate_limit: int,
+) -> list[str] | None:
+    """Return BM25-ordered ids from ``memory_recall_fts``, or ``None`` if unavailable."""
+    join_clause = ""
+    status_filter = ""
+    if source_type == "memory":
+        join_clause = "JOIN memories ON memories.id = memory_recall_fts.source_id"
+        status_filter = "AND memories.status = 'active'"
+    try:
+        rows = (
+            await db.execute(
+                sql_text(
+                    f"""
+                    SELECT memory_recall_fts.source_id, bm25(memory_recall_fts) AS rank
+                    FROM memory_recall_fts
+                    {join_clause}
+                    WHERE memory_recall_fts MATCH :match
+                      AND memory_recall_fts.source_type = :source_type
+                      {status_filter}
+                    ORDER BY rank ASC
+                    LIMIT :candidate_limit
+                    """
+                ),
+                {
+                    "match": match_expression,
+                    "source_type": source_type,
+                    "candidate_limit": candidate_limit,
+                },
+            )
+        ).all()
+    except Exception:
+        logger.debug("FTS memory recall failed; falling back to LIKE search", exc_info=True)
+        return None
+    return [str(row[0]) for row in rows]
+
+
+def _bm25_boosts(ranked_ids: list[str]) -> dict[str, float]:
+    """Map BM25 rank positions onto a small additive hybrid score."""
+    if len(ranked_ids) < 2:
+        return {}
+    last = len(ranked_ids) - 1
+    return {
+        item_id: 0.2 * (1.0 - position / last)
+        for position, item_id in enumerate(ranked_ids)
+    }
+
+
 def _term_overlap_score(text: str, terms: tuple[str, ...]) -> float:
     normalized = text.lower()
     if not terms:
@@ -281,7 +341,11 @@ async def retrieve_hybrid_memory(
         dict.fromkeys(entity.id for entity in project_entities.values())
     )
     query_term_patterns = [f"%{term}%" for term in terms]
+    match_expression = _fts_match_expression(terms)
+    candidate_limit = max(limit * 6, 24)
     now = _now()
+    memory_bm25_boosts: dict[str, float] = {}
+    episode_bm25_boosts: dict[str, float] = {}
 
     async with get_session() as db:
         memory_text = func.lower(func.coalesce(Memory.summary, "") + " " + func.coalesce(Memory.content, ""))
@@ -289,22 +353,44 @@ async def retrieve_hybrid_memory(
             func.coalesce(MemoryEpisode.summary, "") + " " + func.coalesce(MemoryEpisode.content, "")
         )
 
-        semantic_stmt = (
-            select(Memory)
-            .where(Memory.status == MemoryStatus.active)
-            .order_by(
-                col(Memory.importance).desc(),
-                col(Memory.last_confirmed_at).desc(),
-                col(Memory.created_at).desc(),
+        ranked_memory_ids = None
+        if match_expression:
+            ranked_memory_ids = await _lexical_candidate_ids(
+                db,
+                source_type="memory",
+                match_expression=match_expression,
+                candidate_limit=candidate_limit,
             )
-            .limit(max(limit * 6, 24))
-        )
-        if query_term_patterns:
-            semantic_stmt = semantic_stmt.where(
-                or_(*[memory_text.like(pattern) for pattern in query_term_patterns])
+        if ranked_memory_ids is not None:
+            semantic_memories = []
+            if ranked_memory_ids:
+                semantic_result = await db.execute(
+                    select(Memory).where(col(Memory.id).in_(ranked_memory_ids))
+                )
+                memories_by_id = {memory.id: memory for memory in semantic_result.scalars().all()}
+                semantic_memories = [
+                    memories_by_id[memory_id]
+                    for memory_id in ranked_memory_ids
+                    if memory_id in memories_by_id
+                ]
+            memory_bm25_boosts = _bm25_boosts(ranked_memory_ids)
+        else:
+            semantic_stmt = (
+                select(Memory)
+                .where(Memory.status == MemoryStatus.active)
+                .order_by(
+                    col(Memory.importance).desc(),
+                    col(Memory.last_confirmed_at).desc(),
+                    col(Memory.created_at).desc(),
+                )
+                .limit(candidate_limit)
             )
-        semantic_result = await db.execute(semantic_stmt)
-        semantic_memories = semantic_result.scalars().all()
+            if query_term_patterns:
+                semantic_stmt = semantic_stmt.where(
+                    or_(*[memory_text.like(pattern) for pattern in query_term_patterns])
+                )
+            semantic_result = await db.execute(semantic_stmt)
+            semantic_memories = semantic_result.scalars().all()
 
         linked_memories: list[Memory] = []
         if project_entity_ids:
@@ -322,21 +408,43 @@ async def retrieve_hybrid_memory(
             linked_result = await db.execute(linked_stmt)
             linked_memories = linked_result.scalars().all()
 
-        episode_stmt = (
-            select(MemoryEpisode)
-            .order_by(
-                col(MemoryEpisode.salience).desc(),
-                col(MemoryEpisode.observed_at).desc(),
-                col(MemoryEpisode.created_at).desc(),
+        ranked_episode_ids = None
+        if match_expression:
+            ranked_episode_ids = await _lexical_candidate_ids(
+                db,
+                source_type="episode",
+                match_expression=match_expression,
+                candidate_limit=candidate_limit,
             )
-            .limit(max(limit * 6, 24))
-        )
-        if query_term_patterns:
-            episode_stmt = episode_stmt.where(
-                or_(*[episode_text.like(pattern) for pattern in query_term_patterns])
+        if ranked_episode_ids is not None:
+            episodic_hits = []
+            if ranked_episode_ids:
+                episode_result = await db.execute(
+                    select(MemoryEpisode).where(col(MemoryEpisode.id).in_(ranked_episode_ids))
+                )
+                episodes_by_id = {episode.id: episode for episode in episode_result.scalars().all()}
+                episodic_hits = [
+                    episodes_by_id[episode_id]
+                    for episode_id in ranked_episode_ids
+                    if episode_id in episodes_by_id
+                ]
+            episode_bm25_boosts = _bm25_boosts(ranked_episode_ids)
+        else:
+            episode_stmt = (
+                select(MemoryEpisode)
+                .order_by(
+                    col(MemoryEpisode.salience).desc(),
+                    col(MemoryEpisode.observed_at).desc(),
+                    col(MemoryEpisode.created_at).desc(),
+                )
+                .limit(candidate_limit)
             )
-        episode_result = await db.execute(episode_stmt)
-        episodic_hits = episode_result.scalars().all()
+            if query_term_patterns:
+                episode_stmt = episode_stmt.where(
+                    or_(*[episode_text.like(pattern) for pattern in query_term_patterns])
+                )
+            episode_result = await db.execute(episode_stmt)
+            episodic_hits = episode_result.scalars().all()
 
         linked_episodes: list[MemoryEpisode] = []
         if project_entity_ids:
@@ -406,6 +514,7 @@ async def retrieve_hybrid_memory(
             + (memory.importance * 1.8)
             + (memory.confidence * 0.4)
             + _recency_boost(memory.last_confirmed_at or memory.created_at, now=now)
+            + memory_bm25_boosts.get(memory.id, 0.0)
         )
         if memory.project_entity_id in project_entity_ids:
             score += 0.7
@@ -429,6 +538,7 @@ async def retrieve_hybrid_memory(
             + (episode.salience * 1.4)
             + (episode.confidence * 0.4)
             + _recency_boost(episode.observed_at or episode.created_at, now=now)
+            + episode_bm25_boosts.get(episode.id, 0.0)
         )
         if episode.project_entity_id in project_entity_ids:
             score += 0.65
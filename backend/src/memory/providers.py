@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Protocol
 
 from config.settings import settings
 from src.db.models import MemoryKind
 from src.extensions.registry import ExtensionRegistry, default_manifest_roots_for_workspace
-from src.extensions.state import connector_enabled_overrides, load_extension_state_payload
+from src.extensions.state import (
+    connector_enabled_overrides,
+    extension_state_signature,
+    load_extension_state_payload,
+)
 from src.memory.types import ConsolidatedMemoryItem, normalize_memory_kind
 
 logger = logging.getLogger(__name__)
@@ -207,7 +214,33 @@ class _ScoredProviderHit:
     topic_matches: tuple[str, ...] = ()
 
 
+@dataclass
+class _ProviderRetrievalState:
+    hits: list[MemoryProviderHit] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+    summaries: list[str] = field(default_factory=list)
+    attempted_capabilities: list[str] = field(default_factory=list)
+    capabilities_used: list[str] = field(default_factory=list)
+    failed_capabilities: list[str] = field(default_factory=list)
+    degraded: bool = False
+    timed_out: bool = False
+    quality_gate_suppressed_reason_counts: dict[str, int] = field(default_factory=dict)
+    stale_bucket_counts: dict[str, int] = field(default_factory=dict)
+    suppressed_irrelevant_bucket_counts: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _MemoryProviderInventoryCacheEntry:
+    key: tuple[Any, ...]
+    expires_at: float
+    inventory: dict[str, Any]
+    state_by_id: dict[str, Any]
+
+
 _REGISTERED_MEMORY_PROVIDER_ADAPTERS: dict[str, MemoryProviderAdapter] = {}
+# Bumped whenever the adapter registry changes; part of the inventory cache key.
+_adapter_registry_generation = 0
+_memory_provider_inventory_cache: _MemoryProviderInventoryCacheEntry | None = None
 
 
 def _canonical_memory_contract_payload() -> dict[str, Any]:
@@ -367,16 +400,24 @@ def _provider_adapter_model_payload(
     }
 
 
+def _bump_adapter_registry_generation() -> None:
+    global _adapter_registry_generation
+    _adapter_registry_generation += 1
+
+
 def register_memory_provider_adapter(adapter: MemoryProviderAdapter) -> None:
     _REGISTERED_MEMORY_PROVIDER_ADAPTERS[str(adapter.name)] = adapter
+    _bump_adapter_registry_generation()
 
 
 def unregister_memory_provider_adapter(name: str) -> None:
     _REGISTERED_MEMORY_PROVIDER_ADAPTERS.pop(name, None)
+    _bump_adapter_registry_generation()
 
 
 def clear_memory_provider_adapters() -> None:
     _REGISTERED_MEMORY_PROVIDER_ADAPTERS.clear()
+    _bump_adapter_registry_generation()
 
 
 def get_memory_provider_adapter(name: str) -> MemoryProviderAdapter | None:
@@ -766,11 +807,47 @@ def _redact_provider_notes(notes: tuple[str, ...] | list[str], *, config: dict[s
     return tuple(_redact_provider_text(str(note), config=config) for note in notes if str(note or "").strip())
 
 
-def list_memory_provider_inventory() -> dict[str, Any]:
-    state_payload = load_extension_state_payload()
-    state_by_id = state_payload.get("extensions")
+def invalidate_memory_provider_inventory_cache() -> None:
+    """Drop the cached inventory, e.g. after an extension lifecycle change."""
+    global _memory_provider_inventory_cache
+    _memory_provider_inventory_cache = None
+
+
+def _memory_provider_inventory_snapshot() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(inventory, extension state by id)``, rebuilt only when state or adapters change.
+
+    The cache is keyed on the workspace, the extension state file signature and
+    the adapter registry generation; ``memory_provider_inventory_cache_seconds``
+    bounds how long adapter health and manifest edits can go unnoticed.
+    """
+    global _memory_provider_inventory_cache
+    ttl_seconds = float(settings.memory_provider_inventory_cache_seconds or 0)
+    key = (str(settings.workspace_dir), extension_state_signature(), _adapter_registry_generation)
+    now = time.monotonic()
+    cached = _memory_provider_inventory_cache
+    if ttl_seconds > 0 and cached is not None and cached.key == key and now < cached.expires_at:
+        return cached.inventory, cached.state_by_id
+
+    state_by_id = load_extension_state_payload().get("extensions")
     if not isinstance(state_by_id, dict):
         state_by_id = {}
+    inventory = _build_memory_provider_inventory(state_by_id)
+    if ttl_seconds > 0:
+        _memory_provider_inventory_cache = _MemoryProviderInventoryCacheEntry(
+            key=key,
+            expires_at=now + ttl_seconds,
+            inventory=inventory,
+            state_by_id=state_by_id,
+        )
+    return inventory, state_by_id
+
+
+def list_memory_provider_inventory() -> dict[str, Any]:
+    inventory, _state_by_id = _memory_provider_inventory_snapshot()
+    return copy.deepcopy(inventory)
+
+
+def _build_memory_provider_inventory(state_by_id: dict[str, Any]) -> dict[str, Any]:
     enabled_overrides = connector_enabled_overrides(state_by_id)
     snapshot = ExtensionRegistry(
         manifest_roots=default_manifest_roots_for_workspace(settings.workspace_dir),
@@ -975,6 +1052,357 @@ def list_memory_provider_inventory() -> dict[str, Any]:
     }
 
 
+def _planned_provider_capabilities(
+    item: dict[str, Any],
+    adapter: MemoryProviderAdapter,
+    *,
+    query: str,
+    active_projects: tuple[str, ...],
+    include_user_model: bool,
+) -> list[str]:
+    capability_states = item.get("capability_states")
+    if not isinstance(capability_states, dict):
+        capability_states = {}
+    declared = item.get("capabilities", [])
+    planned: list[str] = []
+    if (
+        query.strip()
+        and str(capability_states.get("retrieval") or "") in {"ready", "degraded"}
+        and "retrieval" in declared
+    ):
+        planned.append("retrieval")
+    if (
+        include_user_model
+        and active_projects
+        and str(capability_states.get("user_model") or "") in {"ready", "degraded"}
+        and "user_model" in declared
+        and callable(getattr(adapter, "augment_model", None))
+    ):
+        planned.append("user_model")
+    return planned
+
+
+def _absorb_provider_result(
+    state: _ProviderRetrievalState,
+    capability: str,
+    result: MemoryProviderRetrievalResult,
+    hits: tuple[MemoryProviderHit, ...],
+    *,
+    capability_state: str,
+    provider_declaration_complete: bool,
+    config: dict[str, Any],
+    query: str,
+    active_projects: tuple[str, ...],
+    limit: int,
+    now: datetime,
+) -> None:
+    gated_hits, quality_counts = _filter_quality_gated_provider_hits(
+        hits,
+        provider_declaration_complete=provider_declaration_complete,
+    )
+    for reason, count in quality_counts.items():
+        state.quality_gate_suppressed_reason_counts[reason] = (
+            state.quality_gate_suppressed_reason_counts.get(reason, 0) + count
+        )
+    fresh_hits, stale_counts = _filter_stale_provider_hits(gated_hits, now=now)
+    for bucket, count in stale_counts.items():
+        state.stale_bucket_counts[bucket] = state.stale_bucket_counts.get(bucket, 0) + count
+    ranked_hits, suppressed_counts = _filter_ranked_provider_hits(
+        fresh_hits,
+        query=query,
+        active_projects=active_projects,
+        now=now,
+        limit=limit,
+    )
+    state.hits.extend(item.hit for item in ranked_hits)
+    for bucket, count in suppressed_counts.items():
+        state.suppressed_irrelevant_bucket_counts[bucket] = (
+            state.suppressed_irrelevant_bucket_counts.get(bucket, 0) + count
+        )
+    state.summaries.append(_redact_provider_text(result.summary, config=config))
+    _merge_provider_notes(state.notes, _redact_provider_notes(result.notes, config=config))
+    if ranked_hits:
+        state.capabilities_used.append(capability)
+    state.degraded = state.degraded or result.degraded or capability_state == "degraded"
+
+
+async def _retrieve_from_memory_provider(
+    item: dict[str, Any],
+    adapter: MemoryProviderAdapter,
+    capabilities: list[str],
+    *,
+    config: dict[str, Any],
+    query: str,
+    active_projects: tuple[str, ...],
+    limit: int,
+    now: datetime,
+) -> _ProviderRetrievalState:
+    """Run one provider's planned capabilities and gate their hits."""
+    name = str(item.get("name") or "")
+    capability_states = item.get("capability_states")
+    if not isinstance(capability_states, dict):
+        capability_states = {}
+    provider_declaration_complete = _provider_declaration_complete(item)
+    state = _ProviderRetrievalState()
+
+    if "retrieval" in capabilities:
+        state.attempted_capabilities.append("retrieval")
+        try:
+            result = await adapter.retrieve(
+                query=query,
+                active_projects=active_projects,
+                limit=limit,
+                config=config,
+            )
+        except Exception:
+            logger.debug("Memory provider retrieval failed", exc_info=True)
+            state.failed_capabilities.append("retrieval")
+            state.notes.append("Provider retrieval failed; canonical guardian memory remained in control.")
+        else:
+            _absorb_provider_result(
+                state,
+                "retrieval",
+                result,
+                result.hits,
+                capability_state=str(capability_states.get("retrieval") or ""),
+                provider_declaration_complete=provider_declaration_complete,
+                config=config,
+                query=query,
+                active_projects=active_projects,
+                limit=limit,
+                now=now,
+            )
+
+    if "user_model" in capabilities:
+        state.attempted_capabilities.append("user_model")
+        try:
+            result = await adapter.augment_model(
+                active_projects=active_projects,
+                limit=limit,
+                config=config,
+            )
+        except Exception:
+            logger.debug("Memory provider user-model augmentation failed", exc_info=True)
+            state.failed_capabilities.append("user_model")
+            state.notes.append("Provider user-model augmentation failed; canonical guardian memory remained in control.")
+        else:
+            _absorb_provider_result(
+                state,
+                "user_model",
+                result,
+                _normalize_modeling_hits(result.hits, provider_name=name),
+                capability_state=str(capability_states.get("user_model") or ""),
+                provider_declaration_complete=provider_declaration_complete,
+                config=config,
+                query=query,
+                active_projects=active_projects,
+                limit=limit,
+                now=now,
+            )
+    return state
+
+
+def _timed_out_provider_state(capabilities: list[str]) -> _ProviderRetrievalState:
+    return _ProviderRetrievalState(
+        notes=["Provider retrieval missed its deadline and was cancelled; canonical guardian memory remained in control."],
+        attempted_capabilities=list(capabilities),
+        failed_capabilities=list(capabilities),
+        degraded=True,
+        timed_out=True,
+    )
+
+
+async def _gather_memory_provider_retrievals(
+    planned: list[tuple[dict[str, Any], MemoryProviderAdapter, list[str]]],
+    *,
+    state_by_id: dict[str, Any],
+    query: str,
+    active_projects: tuple[str, ...],
+    limit: int,
+    now: datetime,
+) -> list[_ProviderRetrievalState]:
+    """Query providers concurrently, each under its own deadline and all under one budget.
+
+    Providers that miss either deadline are cancelled and reported as timed out
+    and degraded; results keep the inventory order.
+    """
+    provider_timeout = float(settings.memory_provider_timeout_seconds or 0)
+    budget = float(settings.memory_provider_retrieval_budget_seconds or 0)
+
+    async def _bounded(item: dict[str, Any], adapter: MemoryProviderAdapter, capabilities: list[str]):
+        call = _retrieve_from_memory_provider(
+            item,
+            adapter,
+            capabilities,
+            config=_memory_provider_config(state_by_id, str(item.get("extension_id") or ""), str(item.get("name") or "")),
+            query=query,
+            active_projects=active_projects,
+            limit=limit,
+            now=now,
+        )
+        try:
+            if provider_timeout > 0:
+                return await asyncio.wait_for(call, timeout=provider_timeout)
+            return await call
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Memory provider '%s' missed its %.1fs retrieval deadline",
+                item.get("name"),
+                provider_timeout,
+            )
+            return _timed_out_provider_state(capabilities)
+
+    if not planned:
+        return []
+    tasks = [
+        asyncio.create_task(_bounded(item, adapter, capabilities), name=f"memory_provider:{item.get('name')}")
+        for item, adapter, capabilities in planned
+    ]
+    _done, pending = await asyncio.wait(tasks, timeout=budget if budget > 0 else None)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.warning(
+            "Cancelled %d memory provider(s) still running after the %.1fs retrieval budget",
+            len(pending),
+            budget,
+        )
+
+    states: list[_ProviderRetrievalState] = []
+    for (item, _adapter, capabilities), task in zip(planned, tasks):
+        if task.cancelled():
+            states.append(_timed_out_provider_state(capabilities))
+            continue
+        exc = task.exception()
+        if exc is not None:
+            logger.debug("Memory provider '%s' retrieval raised", item.get("name"), exc_info=exc)
+            states.append(
+                _ProviderRetrievalState(
+                    notes=["Provider retrieval failed; canonical guardian memory remained in control."],
+                    attempted_capabilities=list(capabilities),
+                    failed_capabilities=list(capabilities),
+                )
+            )
+            continue
+        states.append(task.result())
+    return states
+
+
+def _provider_retrieval_diagnostic(
+    item: dict[str, Any],
+    state: _ProviderRetrievalState,
+    *,
+    query: str,
+    active_projects: tuple[str, ...],
+    now: datetime,
+) -> dict[str, Any]:
+    provider_hits = state.hits
+    provider_notes = state.notes
+    stale_hit_count = sum(state.stale_bucket_counts.values())
+    quality_gate_suppressed_count = sum(state.quality_gate_suppressed_reason_counts.values())
+    suppressed_irrelevant_hit_count = sum(state.suppressed_irrelevant_bucket_counts.values())
+    if quality_gate_suppressed_count:
+        provider_notes.append(
+            "Provider evidence missing quality-gate requirements was suppressed before guardian context assembly."
+        )
+    if stale_hit_count:
+        provider_notes.append(
+            "Stale provider evidence was suppressed so canonical guardian memory remained the active source of truth."
+        )
+    if suppressed_irrelevant_hit_count:
+        provider_notes.append(
+            "Provider evidence that did not line up with the live query or active projects was suppressed."
+        )
+
+    bucket_counts: dict[str, int] = {}
+    for hit in provider_hits:
+        bucket_counts[hit.bucket] = bucket_counts.get(hit.bucket, 0) + 1
+    scored_provider_hits = [
+        _score_provider_hit(
+            hit,
+            query=query,
+            active_projects=active_projects,
+            now=now,
+        )
+        for hit in provider_hits
+    ]
+    freshness_counts = {
+        "fresh": sum(1 for item in scored_provider_hits if item.freshness_score > 0.0),
+        "undated": sum(1 for item in scored_provider_hits if item.hit.created_at is None),
+    }
+    freshness_counts["neutral"] = max(0, len(scored_provider_hits) - freshness_counts["fresh"] - freshness_counts["undated"])
+    average_rank_score = (
+        sum(item.rank_score for item in scored_provider_hits) / len(scored_provider_hits)
+        if scored_provider_hits
+        else 0.0
+    )
+    topic_matches = sorted(
+        {
+            topic
+            for item in scored_provider_hits
+            for topic in item.topic_matches
+            if topic
+        }
+    )
+    failed_capabilities = state.failed_capabilities
+    capabilities_used = state.capabilities_used
+    if state.timed_out:
+        runtime_state = "degraded"
+    elif failed_capabilities and not capabilities_used:
+        runtime_state = "unavailable"
+    else:
+        runtime_state = "degraded" if state.degraded or failed_capabilities else "ready"
+    return {
+        "name": str(item.get("name") or ""),
+        "provider_declaration_complete": _provider_declaration_complete(item),
+        "quality_declaration": item.get("quality_declaration") if isinstance(item.get("quality_declaration"), dict) else {},
+        "canonical_authority": _CANONICAL_MEMORY_AUTHORITY,
+        "provider_role": _PROVIDER_ROLE,
+        "provenance": _PROVENANCE_EXTERNAL_ADVISORY,
+        "conflict_policy": _CONFLICT_POLICY,
+        "reconciliation_policy": _RECONCILIATION_POLICY,
+        "sync_policy": _RETRIEVAL_SYNC_POLICY,
+        "runtime_state": runtime_state,
+        "hit_count": len(provider_hits),
+        "degraded": state.degraded,
+        "timed_out": state.timed_out,
+        "summary": " ".join(summary for summary in state.summaries if summary).strip(),
+        "notes": provider_notes,
+        "attempted_capabilities": state.attempted_capabilities,
+        "capabilities_used": capabilities_used,
+        "capability_contracts_used": _used_capability_contracts_payload(capabilities_used),
+        "failed_capabilities": failed_capabilities,
+        "bucket_counts": bucket_counts,
+        "quality_gate_policy": memory_provider_quality_gate_policy_payload(),
+        "quality_gate_state": "passed" if provider_hits and not quality_gate_suppressed_count else (
+            "guarded" if provider_hits else "suppressed" if quality_gate_suppressed_count else "idle"
+        ),
+        "quality_gate_passed_count": len(provider_hits),
+        "quality_gate_suppressed_count": quality_gate_suppressed_count,
+        "quality_gate_suppressed_reason_counts": state.quality_gate_suppressed_reason_counts,
+        "accepted_evidence_ids": [
+            str(hit.evidence_id)
+            for hit in provider_hits
+            if str(hit.evidence_id or "").strip()
+        ],
+        "stale_hit_count": stale_hit_count,
+        "stale_bucket_counts": state.stale_bucket_counts,
+        "suppressed_irrelevant_hit_count": suppressed_irrelevant_hit_count,
+        "suppressed_irrelevant_bucket_counts": state.suppressed_irrelevant_bucket_counts,
+        "freshness_counts": freshness_counts,
+        "average_rank_score": round(average_rank_score, 3),
+        "quality_state": _summarize_quality_state(
+            hit_count=len(provider_hits),
+            quality_gate_suppressed_count=quality_gate_suppressed_count,
+            stale_hit_count=stale_hit_count,
+            suppressed_irrelevant_hit_count=suppressed_irrelevant_hit_count,
+            failed_capabilities=failed_capabilities,
+        ),
+        "topic_matches": topic_matches,
+    }
+
+
 async def retrieve_additive_memory_provider_context(
     *,
     query: str,
@@ -982,13 +1410,14 @@ async def retrieve_additive_memory_provider_context(
     limit: int = 4,
     include_user_model: bool = False,
 ) -> MemoryProviderAggregateResult:
-    inventory = list_memory_provider_inventory()
+    inventory, state_by_id = _memory_provider_inventory_snapshot()
     items = inventory.get("providers", [])
     all_hits: list[MemoryProviderHit] = []
     diagnostics: list[dict[str, Any]] = []
     degraded = False
     now = datetime.now(timezone.utc)
 
+    planned: list[tuple[dict[str, Any], MemoryProviderAdapter, list[str]]] = []
     for item in items:
         if not isinstance(item, dict):
             continue
@@ -996,231 +1425,39 @@ async def retrieve_additive_memory_provider_context(
             continue
         if str(item.get("runtime_state") or "") not in {"ready", "degraded"}:
             continue
-        name = str(item.get("name") or "")
-        adapter = get_memory_provider_adapter(name)
+        adapter = get_memory_provider_adapter(str(item.get("name") or ""))
         if adapter is None:
             continue
-        capability_states = item.get("capability_states")
-        if not isinstance(capability_states, dict):
-            capability_states = {}
-        config = _memory_provider_config(
-            load_extension_state_payload().get("extensions")
-            if isinstance(load_extension_state_payload().get("extensions"), dict)
-            else {},
-            str(item.get("extension_id") or ""),
-            name,
+        capabilities = _planned_provider_capabilities(
+            item,
+            adapter,
+            query=query,
+            active_projects=active_projects,
+            include_user_model=include_user_model,
         )
-        provider_declaration_complete = _provider_declaration_complete(item)
-        provider_hits: list[MemoryProviderHit] = []
-        provider_notes: list[str] = []
-        provider_summaries: list[str] = []
-        attempted_capabilities: list[str] = []
-        capabilities_used: list[str] = []
-        failed_capabilities: list[str] = []
-        provider_degraded = False
-        quality_gate_suppressed_reason_counts: dict[str, int] = {}
-        stale_bucket_counts: dict[str, int] = {}
-        suppressed_irrelevant_bucket_counts: dict[str, int] = {}
-
-        retrieval_state = str(capability_states.get("retrieval") or "")
-        if query.strip() and retrieval_state in {"ready", "degraded"} and "retrieval" in item.get("capabilities", []):
-            attempted_capabilities.append("retrieval")
-            try:
-                result = await adapter.retrieve(
-                    query=query,
-                    active_projects=active_projects,
-                    limit=limit,
-                    config=config,
-                )
-            except Exception:
-                logger.debug("Memory provider retrieval failed", exc_info=True)
-                failed_capabilities.append("retrieval")
-                provider_notes.append("Provider retrieval failed; canonical guardian memory remained in control.")
-            else:
-                gated_hits, quality_counts = _filter_quality_gated_provider_hits(
-                    result.hits,
-                    provider_declaration_complete=provider_declaration_complete,
-                )
-                for reason, count in quality_counts.items():
-                    quality_gate_suppressed_reason_counts[reason] = (
-                        quality_gate_suppressed_reason_counts.get(reason, 0) + count
-                    )
-                fresh_hits, stale_counts = _filter_stale_provider_hits(gated_hits, now=now)
-                for bucket, count in stale_counts.items():
-                    stale_bucket_counts[bucket] = stale_bucket_counts.get(bucket, 0) + count
-                ranked_hits, suppressed_counts = _filter_ranked_provider_hits(
-                    fresh_hits,
-                    query=query,
-                    active_projects=active_projects,
-                    now=now,
-                    limit=limit,
-                )
-                provider_hits.extend(item.hit for item in ranked_hits)
-                for bucket, count in suppressed_counts.items():
-                    suppressed_irrelevant_bucket_counts[bucket] = (
-                        suppressed_irrelevant_bucket_counts.get(bucket, 0) + count
-                    )
-                provider_summaries.append(_redact_provider_text(result.summary, config=config))
-                _merge_provider_notes(provider_notes, _redact_provider_notes(result.notes, config=config))
-                if ranked_hits:
-                    capabilities_used.append("retrieval")
-                provider_degraded = provider_degraded or result.degraded or retrieval_state == "degraded"
-
-        user_model_state = str(capability_states.get("user_model") or "")
-        augment_model = getattr(adapter, "augment_model", None)
-        if (
-            include_user_model
-            and active_projects
-            and user_model_state in {"ready", "degraded"}
-            and "user_model" in item.get("capabilities", [])
-            and callable(augment_model)
-        ):
-            attempted_capabilities.append("user_model")
-            try:
-                result = await augment_model(
-                    active_projects=active_projects,
-                    limit=limit,
-                    config=config,
-                )
-            except Exception:
-                logger.debug("Memory provider user-model augmentation failed", exc_info=True)
-                failed_capabilities.append("user_model")
-                provider_notes.append("Provider user-model augmentation failed; canonical guardian memory remained in control.")
-            else:
-                normalized_hits = _normalize_modeling_hits(result.hits, provider_name=name)
-                gated_hits, quality_counts = _filter_quality_gated_provider_hits(
-                    normalized_hits,
-                    provider_declaration_complete=provider_declaration_complete,
-                )
-                for reason, count in quality_counts.items():
-                    quality_gate_suppressed_reason_counts[reason] = (
-                        quality_gate_suppressed_reason_counts.get(reason, 0) + count
-                    )
-                fresh_hits, stale_counts = _filter_stale_provider_hits(gated_hits, now=now)
-                for bucket, count in stale_counts.items():
-                    stale_bucket_counts[bucket] = stale_bucket_counts.get(bucket, 0) + count
-                ranked_hits, suppressed_counts = _filter_ranked_provider_hits(
-                    fresh_hits,
-                    query=query,
-                    active_projects=active_projects,
-                    now=now,
-                    limit=limit,
-                )
-                provider_hits.extend(item.hit for item in ranked_hits)
-                for bucket, count in suppressed_counts.items():
-                    suppressed_irrelevant_bucket_counts[bucket] = (
-                        suppressed_irrelevant_bucket_counts.get(bucket, 0) + count
-                    )
-                provider_summaries.append(_redact_provider_text(result.summary, config=config))
-                _merge_provider_notes(provider_notes, _redact_provider_notes(result.notes, config=config))
-                if ranked_hits:
-                    capabilities_used.append("user_model")
-                provider_degraded = provider_degraded or result.degraded or user_model_state == "degraded"
-
-        stale_hit_count = sum(stale_bucket_counts.values())
-        quality_gate_suppressed_count = sum(quality_gate_suppressed_reason_counts.values())
-        suppressed_irrelevant_hit_count = sum(suppressed_irrelevant_bucket_counts.values())
-        if quality_gate_suppressed_count:
-            provider_notes.append(
-                "Provider evidence missing quality-gate requirements was suppressed before guardian context assembly."
-            )
-        if stale_hit_count:
-            provider_notes.append(
-                "Stale provider evidence was suppressed so canonical guardian memory remained the active source of truth."
-            )
-        if suppressed_irrelevant_hit_count:
-            provider_notes.append(
-                "Provider evidence that did not line up with the live query or active projects was suppressed."
-            )
-
-        if not attempted_capabilities and not failed_capabilities:
-            continue
-
-        all_hits.extend(provider_hits)
-        bucket_counts: dict[str, int] = {}
-        for hit in provider_hits:
-            bucket_counts[hit.bucket] = bucket_counts.get(hit.bucket, 0) + 1
-        scored_provider_hits = [
-            _score_provider_hit(
-                hit,
+        if capabilities:
+            planned.append((item, adapter, capabilities))
+
+    provider_states = await _gather_memory_provider_retrievals(
+        planned,
+        state_by_id=state_by_id,
+        query=query,
+        active_projects=active_projects,
+        limit=limit,
+        now=now,
+    )
+    for (item, _adapter, _capabilities), state in zip(planned, provider_states):
+        all_hits.extend(state.hits)
+        diagnostics.append(
+            _provider_retrieval_diagnostic(
+                item,
+                state,
                 query=query,
                 active_projects=active_projects,
                 now=now,
             )
-            for hit in provider_hits
-        ]
-        freshness_counts = {
-            "fresh": sum(1 for item in scored_provider_hits if item.freshness_score > 0.0),
-            "undated": sum(1 for item in scored_provider_hits if item.hit.created_at is None),
-        }
-        freshness_counts["neutral"] = max(0, len(scored_provider_hits) - freshness_counts["fresh"] - freshness_counts["undated"])
-        average_rank_score = (
-            sum(item.rank_score for item in scored_provider_hits) / len(scored_provider_hits)
-            if scored_provider_hits
-            else 0.0
-        )
-        topic_matches = sorted(
-            {
-                topic
-                for item in scored_provider_hits
-                for topic in item.topic_matches
-                if topic
-            }
-        )
-        diagnostics.append(
-            {
-                "name": name,
-                "provider_declaration_complete": provider_declaration_complete,
-                "quality_declaration": item.get("quality_declaration") if isinstance(item.get("quality_declaration"), dict) else {},
-                "canonical_authority": _CANONICAL_MEMORY_AUTHORITY,
-                "provider_role": _PROVIDER_ROLE,
-                "provenance": _PROVENANCE_EXTERNAL_ADVISORY,
-                "conflict_policy": _CONFLICT_POLICY,
-                "reconciliation_policy": _RECONCILIATION_POLICY,
-                "sync_policy": _RETRIEVAL_SYNC_POLICY,
-                "runtime_state": (
-                    "unavailable"
-                    if failed_capabilities and not capabilities_used
-                    else "degraded" if provider_degraded or failed_capabilities else "ready"
-                ),
-                "hit_count": len(provider_hits),
-                "degraded": provider_degraded,
-                "summary": " ".join(summary for summary in provider_summaries if summary).strip(),
-                "notes": provider_notes,
-                "attempted_capabilities": attempted_capabilities,
-                "capabilities_used": capabilities_used,
-                "capability_contracts_used": _used_capability_contracts_payload(capabilities_used),
-                "failed_capabilities": failed_capabilities,
-                "bucket_counts": bucket_counts,
-                "quality_gate_policy": memory_provider_quality_gate_policy_payload(),
-                "quality_gate_state": "passed" if provider_hits and not quality_gate_suppressed_count else (
-                    "guarded" if provider_hits else "suppressed" if quality_gate_suppressed_count else "idle"
-                ),
-                "quality_gate_passed_count": len(provider_hits),
-                "quality_gate_suppressed_count": quality_gate_suppressed_count,
-                "quality_gate_suppressed_reason_counts": quality_gate_suppressed_reason_counts,
-                "accepted_evidence_ids": [
-                    str(hit.evidence_id)
-                    for hit in provider_hits
-                    if str(hit.evidence_id or "").strip()
-                ],
-                "stale_hit_count": stale_hit_count,
-                "stale_bucket_counts": stale_bucket_counts,
-                "suppressed_irrelevant_hit_count": suppressed_irrelevant_hit_count,
-                "suppressed_irrelevant_bucket_counts": suppressed_irrelevant_bucket_counts,
-                "freshness_counts": freshness_counts,
-                "average_rank_score": round(average_rank_score, 3),
-                "quality_state": _summarize_quality_state(
-                    hit_count=len(provider_hits),
-                    quality_gate_suppressed_count=quality_gate_suppressed_count,
-                    stale_hit_count=stale_hit_count,
-                    suppressed_irrelevant_hit_count=suppressed_irrelevant_hit_count,
-                    failed_capabilities=failed_capabilities,
-                ),
-                "topic_matches": topic_matches,
-            }
         )
-        degraded = degraded or provider_degraded
+        degraded = degraded or state.degraded
 
     seen_lines: set[str] = set()
     bucket_values: dict[str, list[str]] = {}
@@ -1253,7 +1490,7 @@ async def writeback_additive_memory_providers(
     if not memories:
         return MemoryProviderWritebackAggregateResult()
 
-    inventory = list_memory_provider_inventory()
+    inventory, state_by_id = _memory_provider_inventory_snapshot()
     items = inventory.get("providers", [])
     diagnostics: list[dict[str, Any]] = []
     partial_write_count = 0
@@ -1282,13 +1519,7 @@ async def writeback_additive_memory_providers(
         if not callable(writeback):
             continue
 
-        config = _memory_provider_config(
-            load_extension_state_payload().get("extensions")
-            if isinstance(load_extension_state_payload().get("extensions"), dict)
-            else {},
-            str(item.get("extension_id") or ""),
-            name,
-        )
+        config = _memory_provider_config(state_by_id, str(item.get("extension_id") or ""), name)
         provider_notes: list[str] = []
         if suppressed_reason_counts["low_quality"]:
             provider_notes.append(
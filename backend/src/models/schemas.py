@@ -25,12 +25,13 @@ class WSMessage(BaseModel):
 
 
 class WSResponse(BaseModel):
-    type: str = Field(..., description="Response type: step | final | error | pong | proactive | proactive_bundle | ambient | approval_required | clarification_required")
+    type: str = Field(..., description="Response type: step | final_delta | final | error | pong | proactive | proactive_bundle | ambient | approval_required | clarification_required")
     content: str = ""
     session_id: str = ""
     intervention_id: str | None = None
     step: int | None = None
     seq: int | None = None
+    broadcast_seq: int | None = None
     approval_id: str | None = None
     tool_name: str | None = None
     risk_level: str | None = None
@@ -471,6 +471,7 @@ async def deliver_or_queue(
                             "attempted_connections": broadcast_result.attempted_connections,
                             "delivered_connections": broadcast_result.delivered_connections,
                             "failed_connections": broadcast_result.failed_connections,
+                            "queued_connections": broadcast_result.queued_connections,
                         }
                     )
                     if broadcast_result.delivered_connections > 0:
@@ -21,7 +21,7 @@ _UNBLOCKED_STATES = {UserState.available.value, UserState.transitioning.value}
 async def _gather_time_source() -> dict:
     from src.observer.sources.time_source import gather_time
 
-    return gather_time()
+    return await asyncio.to_thread(gather_time)
 
 
 async def _gather_calendar_source() -> dict:
@@ -33,7 +33,7 @@ async def _gather_calendar_source() -> dict:
 async def _gather_git_source() -> dict:
     from src.observer.sources.git_source import gather_git
 
-    result = gather_git()
+    result = await asyncio.to_thread(gather_git)
     return result or {}
 
 
@@ -82,6 +82,59 @@ def _active_observer_definitions() -> list[tuple[str, str]]:
     ]
 
 
+async def _run_observer_source(
+    source_type: str,
+    source_name: str,
+    runner: Callable[[], Awaitable[dict]],
+    timeout_seconds: float,
+) -> dict | None:
+    """Run one source runner under its deadline. Returns ``None`` when it fails or times out."""
+    try:
+        if timeout_seconds > 0:
+            return await asyncio.wait_for(runner(), timeout=timeout_seconds)
+        return await runner()
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Observer source '%s' (%s) timed out after %.1fs during refresh",
+            source_type,
+            source_name,
+            timeout_seconds,
+        )
+    except Exception:
+        logger.exception("Observer source '%s' (%s) failed during refresh", source_type, source_name)
+    return None
+
+
+async def _gather_observer_sources(active_sources: list[tuple[str, str]]) -> tuple[dict[str, dict], int]:
+    """Run the active source runners concurrently. Returns per-source results and the success count."""
+    from config.settings import settings
+
+    timeout_seconds = float(settings.observer_source_timeout_seconds or 0)
+    scheduled: list[tuple[str, str, Callable[[], Awaitable[dict]]]] = []
+    for source_type, source_name in active_sources:
+        runner = _OBSERVER_SOURCE_RUNNERS.get(source_type)
+        if runner is None:
+            logger.warning("Observer source '%s' has no runtime runner", source_type)
+            continue
+        scheduled.append((source_type, source_name, runner))
+
+    outcomes = await asyncio.gather(
+        *(
+            _run_observer_source(source_type, source_name, runner, timeout_seconds)
+            for source_type, source_name, runner in scheduled
+        )
+    )
+    source_results: dict[str, dict] = {}
+    sources_ok = 0
+    for (source_type, _source_name, _runner), outcome in zip(scheduled, outcomes):
+        if outcome is None:
+            source_results[source_type] = {}
+            continue
+        source_results[source_type] = outcome
+        sources_ok += 1
+    return source_results, sources_ok
+
+
 class ContextManager:
     def __init__(self) -> None:
         self._context = CurrentContext()
@@ -111,21 +164,8 @@ class ContextManager:
                 old = self._context
 
                 active_sources = _active_observer_definitions()
-                source_results: dict[str, dict] = {}
-                sources_ok = 0
                 sources_total = len(active_sources)
-
-                for source_type, source_name in active_sources:
-                    runner = _OBSERVER_SOURCE_RUNNERS.get(source_type)
-                    if runner is None:
-                        logger.warning("Observer source '%s' has no runtime runner", source_type)
-                        continue
-                    try:
-                        source_results[source_type] = await runner()
-                        sources_ok += 1
-                    except Exception:
-                        logger.exception("Observer source '%s' (%s) failed during refresh", source_type, source_name)
-                        source_results[source_type] = {}
+                source_results, sources_ok = await _gather_observer_sources(active_sources)
 
                 time_data = source_results.get("time", {})
                 calendar_data = source_results.get("calendar", {})
@@ -1,22 +1,158 @@
-"""Screen observation repository — CRUD and aggregation for activity tracking."""
-
+"""Screen observation repository — CRUD and aggregation for activity tracking.
+
+Daily and weekly summaries read pre-aggregated rollups rather than raw
+observations: ``create()`` keeps per-hour and per-day buckets (by activity,
+project and app) and per-day focus streaks current as observations and their
+backfilled durations land. An observation timestamped before one already
+stored is spliced between its neighbours and rebuilds the rollups from its
+day on, which is only cheap for recent backfills. ``rebuild_rollups()`` (also
+``python -m src.observer.screen_repository rebuild``) recomputes them from the
+raw observations; ``init_db()`` runs it once, via ``ensure_rollups()``, for
+databases that predate the rollup tables.
+"""
+
+import argparse
+import asyncio
 import json
 import logging
+import sys
+from collections.abc import Sequence
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import select, func, col
 
 from src.audit.runtime import log_integration_event
 from src.db.engine import get_session
-from src.db.models import ScreenObservation
+from src.db.models import ScreenActivityRollup, ScreenActivityStreak, ScreenObservation
 
 logger = logging.getLogger(__name__)
 
+_ROLLUP_GRANULARITIES = ("hour", "day")
+_REBUILD_BATCH_SIZE = 5000
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite strips timezone info; stored timestamps are UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    ts = _as_utc(timestamp)
+    if granularity == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _rollup_id(granularity: str, bucket_start: datetime, dimension: str, key: str) -> str:
+    return f"{granularity}:{bucket_start.isoformat()}:{dimension}:{key}"
+
+
+def _rollup_keys(obs: ScreenObservation) -> list[tuple[str, str]]:
+    keys = [("total", ""), ("activity", obs.activity_type), ("app", obs.app_name)]
+    if obs.project:
+        keys.append(("project", obs.project))
+    return keys
+
+
+async def _bump_rollups(db, obs: ScreenObservation, *, observations: int, tracked_s: int) -> None:
+    """Add to the hour and day buckets ``obs`` falls in, creating them as needed."""
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": _rollup_id(granularity, _bucket_start(obs.timestamp, granularity), dimension, key),
+            "granularity": granularity,
+            "bucket_start": _bucket_start(obs.timestamp, granularity),
+            "dimension": dimension,
+            "key": key,
+            "observation_count": observations,
+            "tracked_s": tracked_s,
+            "updated_at": now,
+        }
+        for granularity in _ROLLUP_GRANULARITIES
+        for dimension, key in _rollup_keys(obs)
+    ]
+    stmt = sqlite_insert(ScreenActivityRollup).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["granularity", "bucket_start", "dimension", "key"],
+            set_={
+                "observation_count": ScreenActivityRollup.observation_count + stmt.excluded.observation_count,
+                "tracked_s": ScreenActivityRollup.tracked_s + stmt.excluded.tracked_s,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+
+
+async def _latest_streak(db, bucket_date: str, before: datetime) -> ScreenActivityStreak | None:
+    result = await db.execute(
+        select(ScreenActivityStreak)
+        .where(col(ScreenActivityStreak.bucket_date) == bucket_date)
+        .where(col(ScreenActivityStreak.started_at) <= before)
+        .order_by(col(ScreenActivityStreak.started_at).desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _record_observation(db, obs: ScreenObservation) -> None:
+    """Count a new non-blocked observation and extend or start its day's streak."""
+    await _bump_rollups(db, obs, observations=1, tracked_s=0)
+
+    ts = _as_utc(obs.timestamp)
+    streak = await _latest_streak(db, ts.date().isoformat(), ts)
+    if streak is not None and streak.activity_type == obs.activity_type:
+        streak.last_observed_at = ts
+        streak.observation_count += 1
+        db.add(streak)
+        return
+    db.add(ScreenActivityStreak(
+        bucket_date=ts.date().isoformat(),
+        activity_type=obs.activity_type,
+        started_at=ts,
+        last_observed_at=ts,
+        observation_count=1,
+    ))
+
+
+async def _record_duration(db, obs: ScreenObservation, duration_s: int) -> None:
+    """Credit a backfilled duration to the buckets and streak of ``obs``."""
+    if duration_s == 0:
+        return
+    await _bump_rollups(db, obs, observations=0, tracked_s=duration_s)
+
+    ts = _as_utc(obs.timestamp)
+    streak = await _latest_streak(db, ts.date().isoformat(), ts)
+    if streak is not None:
+        streak.duration_s += duration_s
+        db.add(streak)
+
+
+def _sorted_totals(totals: dict[str, int]) -> dict[str, int]:
+    return dict(sorted(totals.items(), key=lambda x: -x[1]))
+
 
 class ScreenObservationRepository:
     """Async CRUD and aggregation for screen observations."""
 
+    def __init__(self) -> None:
+        # create() upserts the rollups that a rebuild deletes and rewrites, so
+        # the two take turns or a rebuild could drop a concurrent observation.
+        self._rollup_lock: asyncio.Lock | None = None
+        self._rollup_lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def _lock_for_loop(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._rollup_lock is None or self._rollup_lock_loop is not loop:
+            self._rollup_lock = asyncio.Lock()
+            self._rollup_lock_loop = loop
+        return self._rollup_lock
+
     async def create(
         self,
         app_name: str,
@@ -42,44 +178,62 @@ class ScreenObservationRepository:
             blocked=blocked,
         )
 
-        async with get_session() as db:
-            # Backfill duration on the previous observation
-            result = await db.execute(
-                select(ScreenObservation)
-                .where(col(ScreenObservation.duration_s).is_(None))
-                .where(col(ScreenObservation.timestamp) < now)
-                .order_by(col(ScreenObservation.timestamp).desc())
-                .limit(1)
-            )
-            prev = result.scalar_one_or_none()
-            if prev is not None:
-                # SQLite strips timezone info; ensure both are tz-aware
-                prev_ts = prev.timestamp
-                if prev_ts.tzinfo is None:
-                    prev_ts = prev_ts.replace(tzinfo=timezone.utc)
-                delta = (now - prev_ts).total_seconds()
-                prev.duration_s = int(delta)
-                db.add(prev)
-
-            db.add(obs)
-
-        return obs
-
-    async def get_daily_summary(self, target_date: date) -> dict[str, Any]:
-        """Aggregate observations for a single day."""
-        start = datetime(target_date.year, target_date.month, target_date.day, tzinfo=timezone.utc)
-        end = start + timedelta(days=1)
-
-        try:
+        async with self._lock_for_loop():
             async with get_session() as db:
                 result = await db.execute(
                     select(ScreenObservation)
-                    .where(col(ScreenObservation.timestamp) >= start)
-                    .where(col(ScreenObservation.timestamp) < end)
-                    .where(col(ScreenObservation.blocked) == False)  # noqa: E712
+                    .where(col(ScreenObservation.timestamp) > now)
                     .order_by(col(ScreenObservation.timestamp))
+                    .limit(1)
                 )
-                observations = list(result.scalars().all())
+                later = result.scalar_one_or_none()
+                if later is None:
+                    # Backfill duration on the previous observation
+                    result = await db.execute(
+                        select(ScreenObservation)
+                        .where(col(ScreenObservation.duration_s).is_(None))
+                        .where(col(ScreenObservation.timestamp) < now)
+                        .order_by(col(ScreenObservation.timestamp).desc())
+                        .limit(1)
+                    )
+                    prev = result.scalar_one_or_none()
+                    if prev is not None:
+                        # SQLite strips timezone info; ensure both are tz-aware
+                        prev.duration_s = int((now - _as_utc(prev.timestamp)).total_seconds())
+                        db.add(prev)
+                        if not prev.blocked:
+                            await _record_duration(db, prev, prev.duration_s)
+
+                    db.add(obs)
+                    if not blocked:
+                        await _record_observation(db, obs)
+                else:
+                    # Out of order: splice between its neighbours. The
+                    # incremental streaks only extend the latest run, so the
+                    # affected days are rebuilt below instead.
+                    result = await db.execute(
+                        select(ScreenObservation)
+                        .where(col(ScreenObservation.timestamp) < now)
+                        .order_by(col(ScreenObservation.timestamp).desc())
+                        .limit(1)
+                    )
+                    prev = result.scalar_one_or_none()
+                    if prev is not None:
+                        prev.duration_s = int((now - _as_utc(prev.timestamp)).total_seconds())
+                        db.add(prev)
+                    obs.duration_s = int((_as_utc(later.timestamp) - now).total_seconds())
+                    db.add(obs)
+
+            if later is not None:
+                await self._rebuild_rollups(_as_utc(prev.timestamp if prev is not None else now).date())
+
+        return obs
+
+    async def get_daily_summary(self, target_date: date) -> dict[str, Any]:
+        """Aggregate observations for a single day from its rollups."""
+        try:
+            days = await self._load_day_rollups(target_date, days=1)
+            streaks = await self._load_streaks(target_date)
         except Exception as e:
             await log_integration_event(
                 integration_type="screen_repository",
@@ -92,7 +246,8 @@ class ScreenObservationRepository:
             )
             raise
 
-        if not observations:
+        day = days[0]
+        if not day["total_observations"]:
             await log_integration_event(
                 integration_type="screen_repository",
                 name="daily_summary",
@@ -104,35 +259,15 @@ class ScreenObservationRepository:
             )
             return {"date": target_date.isoformat(), "total_observations": 0}
 
-        # Aggregate by activity type
-        by_activity: dict[str, int] = {}
-        by_project: dict[str, int] = {}
-        by_app: dict[str, int] = {}
-        total_tracked_s = 0
-
-        for obs in observations:
-            dur = obs.duration_s or 0
-            total_tracked_s += dur
-
-            by_activity[obs.activity_type] = by_activity.get(obs.activity_type, 0) + dur
-
-            if obs.project:
-                by_project[obs.project] = by_project.get(obs.project, 0) + dur
-
-            by_app[obs.app_name] = by_app.get(obs.app_name, 0) + dur
-
-        # Find longest focus streaks (consecutive same-activity observations)
-        streaks = self._compute_streaks(observations)
-
         summary = {
             "date": target_date.isoformat(),
-            "total_observations": len(observations),
-            "total_tracked_minutes": total_tracked_s // 60,
-            "switch_count": len(observations),
-            "by_activity": dict(sorted(by_activity.items(), key=lambda x: -x[1])),
-            "by_project": dict(sorted(by_project.items(), key=lambda x: -x[1])),
-            "by_app": dict(sorted(by_app.items(), key=lambda x: -x[1])),
-            "longest_streaks": streaks[:3],
+            "total_observations": day["total_observations"],
+            "total_tracked_minutes": day["total_tracked_s"] // 60,
+            "switch_count": day["total_observations"],
+            "by_activity": _sorted_totals(day["by_activity"]),
+            "by_project": _sorted_totals(day["by_project"]),
+            "by_app": _sorted_totals(day["by_app"]),
+            "longest_streaks": streaks,
         }
         await log_integration_event(
             integration_type="screen_repository",
@@ -150,24 +285,11 @@ class ScreenObservationRepository:
 
     async def get_weekly_summary(self, week_start: date) -> dict[str, Any]:
         """Aggregate observations for a 7-day period starting from week_start."""
-        daily_summaries = []
         combined_activity: dict[str, int] = {}
         combined_project: dict[str, int] = {}
-        total_observations = 0
-        total_minutes = 0
 
         try:
-            for i in range(7):
-                day = week_start + timedelta(days=i)
-                daily = await self.get_daily_summary(day)
-                daily_summaries.append(daily)
-                total_observations += daily.get("total_observations", 0)
-                total_minutes += daily.get("total_tracked_minutes", 0)
-
-                for act, secs in daily.get("by_activity", {}).items():
-                    combined_activity[act] = combined_activity.get(act, 0) + secs
-                for proj, secs in daily.get("by_project", {}).items():
-                    combined_project[proj] = combined_project.get(proj, 0) + secs
+            daily_summaries = await self._load_day_rollups(week_start, days=7)
         except Exception as e:
             await log_integration_event(
                 integration_type="screen_repository",
@@ -180,6 +302,16 @@ class ScreenObservationRepository:
             )
             raise
 
+        total_observations = 0
+        total_minutes = 0
+        for daily in daily_summaries:
+            total_observations += daily["total_observations"]
+            total_minutes += daily["total_tracked_s"] // 60
+            for act, secs in daily["by_activity"].items():
+                combined_activity[act] = combined_activity.get(act, 0) + secs
+            for proj, secs in daily["by_project"].items():
+                combined_project[proj] = combined_project.get(proj, 0) + secs
+
         if total_observations == 0:
             await log_integration_event(
                 integration_type="screen_repository",
@@ -200,7 +332,7 @@ class ScreenObservationRepository:
                     "total_observations": total_observations,
                     "total_tracked_minutes": total_minutes,
                     "active_days": sum(
-                        1 for daily in daily_summaries if daily.get("total_observations", 0) > 0
+                        1 for daily in daily_summaries if daily["total_observations"] > 0
                     ),
                 },
             )
@@ -210,18 +342,229 @@ class ScreenObservationRepository:
             "week_end": (week_start + timedelta(days=6)).isoformat(),
             "total_observations": total_observations,
             "total_tracked_minutes": total_minutes,
-            "by_activity": dict(sorted(combined_activity.items(), key=lambda x: -x[1])),
-            "by_project": dict(sorted(combined_project.items(), key=lambda x: -x[1])),
+            "by_activity": _sorted_totals(combined_activity),
+            "by_project": _sorted_totals(combined_project),
             "daily_breakdown": [
                 {
-                    "date": d.get("date"),
-                    "observations": d.get("total_observations", 0),
-                    "tracked_minutes": d.get("total_tracked_minutes", 0),
+                    "date": d["date"],
+                    "observations": d["total_observations"],
+                    "tracked_minutes": d["total_tracked_s"] // 60,
                 }
                 for d in daily_summaries
             ],
         }
 
+    async def get_hourly_breakdown(self, target_date: date) -> list[dict[str, Any]]:
+        """Return tracked time per hour of ``target_date`` (UTC) that saw activity."""
+        start = datetime(target_date.year, target_date.month, target_date.day, tzinfo=timezone.utc)
+        async with get_session() as db:
+            result = await db.execute(
+                select(ScreenActivityRollup)
+                .where(col(ScreenActivityRollup.granularity) == "hour")
+                .where(col(ScreenActivityRollup.bucket_start) >= start)
+                .where(col(ScreenActivityRollup.bucket_start) < start + timedelta(days=1))
+                .order_by(col(ScreenActivityRollup.bucket_start))
+            )
+            rows = list(result.scalars().all())
+
+        hours: dict[datetime, dict[str, Any]] = {}
+        for row in rows:
+            bucket = hours.setdefault(row.bucket_start, {
+                "hour": _as_utc(row.bucket_start).hour,
+                "observations": 0,
+                "tracked_minutes": 0,
+                "by_activity": {},
+            })
+            if row.dimension == "total":
+                bucket["observations"] = row.observation_count
+                bucket["tracked_minutes"] = row.tracked_s // 60
+            elif row.dimension == "activity":
+                bucket["by_activity"][row.key] = row.tracked_s
+        return [
+            {**bucket, "by_activity": _sorted_totals(bucket["by_activity"])}
+            for bucket in hours.values()
+        ]
+
+    async def _load_day_rollups(self, first_day: date, *, days: int) -> list[dict[str, Any]]:
+        """Read day-bucket rollups for ``days`` consecutive days in one query."""
+        start = datetime(first_day.year, first_day.month, first_day.day, tzinfo=timezone.utc)
+        async with get_session() as db:
+            result = await db.execute(
+                select(ScreenActivityRollup)
+                .where(col(ScreenActivityRollup.granularity) == "day")
+                .where(col(ScreenActivityRollup.bucket_start) >= start)
+                .where(col(ScreenActivityRollup.bucket_start) < start + timedelta(days=days))
+                .order_by(col(ScreenActivityRollup.tracked_s).desc(), col(ScreenActivityRollup.key))
+            )
+            rows = list(result.scalars().all())
+
+        by_day = {
+            (first_day + timedelta(days=offset)).isoformat(): {
+                "date": (first_day + timedelta(days=offset)).isoformat(),
+                "total_observations": 0,
+                "total_tracked_s": 0,
+                "by_activity": {},
+                "by_project": {},
+                "by_app": {},
+            }
+            for offset in range(days)
+        }
+        for row in rows:
+            day = by_day.get(_as_utc(row.bucket_start).date().isoformat())
+            if day is None:
+                continue
+            if row.dimension == "total":
+                day["total_observations"] = row.observation_count
+                day["total_tracked_s"] = row.tracked_s
+            elif row.dimension in {"activity", "project", "app"}:
+                day[f"by_{row.dimension}"][row.key] = row.tracked_s
+        return list(by_day.values())
+
+    async def _load_streaks(self, target_date: date, *, limit: int = 3) -> list[dict]:
+        """Longest focus streaks of the day (consecutive same-activity observations)."""
+        async with get_session() as db:
+            result = await db.execute(
+                select(ScreenActivityStreak)
+                .where(col(ScreenActivityStreak.bucket_date) == target_date.isoformat())
+                .where(col(ScreenActivityStreak.duration_s) > 0)
+                .order_by(
+                    (col(ScreenActivityStreak.duration_s) // 60).desc(),
+                    col(ScreenActivityStreak.started_at),
+                )
+                .limit(limit)
+            )
+            streaks = list(result.scalars().all())
+        return [
+            {
+                "activity": streak.activity_type,
+                "duration_minutes": streak.duration_s // 60,
+                "started_at": _as_utc(streak.started_at).isoformat(),
+            }
+            for streak in streaks
+        ]
+
+    async def ensure_rollups(self) -> dict[str, Any] | None:
+        """Rebuild rollups once when there are observations but no rollups yet."""
+        async with self._lock_for_loop():
+            async with get_session() as db:
+                has_rollups = (
+                    await db.execute(select(ScreenActivityRollup.id).limit(1))
+                ).first() is not None
+                has_observations = (
+                    await db.execute(
+                        select(ScreenObservation.id)
+                        .where(col(ScreenObservation.blocked) == False)  # noqa: E712
+                        .limit(1)
+                    )
+                ).first() is not None
+            if has_rollups or not has_observations:
+                return None
+            return await self._rebuild_rollups(None)
+
+    async def rebuild_rollups(self, since: date | None = None) -> dict[str, Any]:
+        """Recompute rollups and streaks from raw observations (all, or from ``since`` on)."""
+        async with self._lock_for_loop():
+            return await self._rebuild_rollups(since)
+
+    async def _rebuild_rollups(self, since: date | None) -> dict[str, Any]:
+        start = (
+            datetime(since.year, since.month, since.day, tzinfo=timezone.utc)
+            if since is not None
+            else None
+        )
+        rollups: dict[tuple[str, datetime, str, str], list[int]] = {}
+        streaks: list[ScreenActivityStreak] = []
+        scanned = 0
+        cursor: tuple[datetime, str] | None = None
+
+        async with get_session() as db:
+            while True:
+                query = select(ScreenObservation).where(
+                    col(ScreenObservation.blocked) == False  # noqa: E712
+                )
+                if start is not None:
+                    query = query.where(col(ScreenObservation.timestamp) >= start)
+                if cursor is not None:
+                    query = query.where(
+                        (col(ScreenObservation.timestamp) > cursor[0])
+                        | (
+                            (col(ScreenObservation.timestamp) == cursor[0])
+                            & (col(ScreenObservation.id) > cursor[1])
+                        )
+                    )
+                result = await db.execute(
+                    query.order_by(col(ScreenObservation.timestamp), col(ScreenObservation.id))
+                    .limit(_REBUILD_BATCH_SIZE)
+                )
+                batch = list(result.scalars().all())
+                if not batch:
+                    break
+                for obs in batch:
+                    duration_s = obs.duration_s or 0
+                    for granularity in _ROLLUP_GRANULARITIES:
+                        bucket_start = _bucket_start(obs.timestamp, granularity)
+                        for dimension, key in _rollup_keys(obs):
+                            totals = rollups.setdefault((granularity, bucket_start, dimension, key), [0, 0])
+                            totals[0] += 1
+                            totals[1] += duration_s
+                    ts = _as_utc(obs.timestamp)
+                    bucket_date = ts.date().isoformat()
+                    last = streaks[-1] if streaks else None
+                    if (
+                        last is not None
+                        and last.bucket_date == bucket_date
+                        and last.activity_type == obs.activity_type
+                    ):
+                        last.last_observed_at = ts
+                        last.observation_count += 1
+                        last.duration_s += duration_s
+                    else:
+                        streaks.append(ScreenActivityStreak(
+                            bucket_date=bucket_date,
+                            activity_type=obs.activity_type,
+                            started_at=ts,
+                            last_observed_at=ts,
+                            observation_count=1,
+                            duration_s=duration_s,
+                        ))
+                scanned += len(batch)
+                cursor = (batch[-1].timestamp, batch[-1].id)
+                db.expunge_all()
+
+            rollup_delete = delete(ScreenActivityRollup)
+            streak_delete = delete(ScreenActivityStreak)
+            if start is not None:
+                rollup_delete = rollup_delete.where(col(ScreenActivityRollup.bucket_start) >= start)
+                streak_delete = streak_delete.where(col(ScreenActivityStreak.bucket_date) >= since.isoformat())
+            await db.execute(rollup_delete)
+            await db.execute(streak_delete)
+            db.add_all(
+                ScreenActivityRollup(
+                    id=_rollup_id(granularity, bucket_start, dimension, key),
+                    granularity=granularity,
+                    bucket_start=bucket_start,
+                    dimension=dimension,
+                    key=key,
+                    observation_count=count,
+                    tracked_s=tracked_s,
+                )
+                for (granularity, bucket_start, dimension, key), (count, tracked_s) in rollups.items()
+            )
+            db.add_all(streaks)
+
+        logger.info(
+            "Rebuilt screen activity rollups from %d observations (%d rollups, %d streaks)",
+            scanned,
+            len(rollups),
+            len(streaks),
+        )
+        return {
+            "since": since.isoformat() if since is not None else None,
+            "observations_scanned": scanned,
+            "rollups_written": len(rollups),
+            "streaks_written": len(streaks),
+        }
+
     async def cleanup_old(self, retention_days: int) -> int:
         """Delete observations older than retention_days. Returns count deleted."""
         cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
@@ -234,6 +577,16 @@ class ScreenObservationRepository:
                 old = list(result.scalars().all())
                 for obs in old:
                     await db.delete(obs)
+                await db.execute(
+                    delete(ScreenActivityRollup).where(
+                        col(ScreenActivityRollup.bucket_start) < _bucket_start(cutoff, "day")
+                    )
+                )
+                await db.execute(
+                    delete(ScreenActivityStreak).where(
+                        col(ScreenActivityStreak.bucket_date) < cutoff.date().isoformat()
+                    )
+                )
         except Exception as e:
             await log_integration_event(
                 integration_type="screen_repository",
@@ -303,40 +656,43 @@ class ScreenObservationRepository:
                 projects.append(project)
         return projects
 
-    @staticmethod
-    def _compute_streaks(observations: list[ScreenObservation]) -> list[dict]:
-        """Find longest consecutive same-activity streaks."""
-        if not observations:
-            return []
-
-        streaks: list[dict] = []
-        current_activity = observations[0].activity_type
-        streak_start = observations[0].timestamp
-        streak_duration = observations[0].duration_s or 0
-
-        for obs in observations[1:]:
-            if obs.activity_type == current_activity:
-                streak_duration += obs.duration_s or 0
-            else:
-                if streak_duration > 0:
-                    streaks.append({
-                        "activity": current_activity,
-                        "duration_minutes": streak_duration // 60,
-                        "started_at": streak_start.isoformat(),
-                    })
-                current_activity = obs.activity_type
-                streak_start = obs.timestamp
-                streak_duration = obs.duration_s or 0
-
-        # Final streak
-        if streak_duration > 0:
-            streaks.append({
-                "activity": current_activity,
-                "duration_minutes": streak_duration // 60,
-                "started_at": streak_start.isoformat(),
-            })
 
-        return sorted(streaks, key=lambda s: -s["duration_minutes"])
+screen_observation_repo = ScreenObservationRepository()
+
 
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Maintain screen activity rollups.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    rebuild = subcommands.add_parser("rebuild", help="Recompute rollups from raw screen observations.")
+    rebuild.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=None,
+        help="Only rebuild days from this ISO date (UTC) on; defaults to all observations.",
+    )
+    return parser
 
-screen_observation_repo = ScreenObservationRepository()
+
+async def _rebuild(since: date | None) -> dict[str, Any]:
+    from src.db.engine import close_db, init_db
+
+    await init_db()
+    try:
+        return await screen_observation_repo.rebuild_rollups(since)
+    finally:
+        await close_db()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        result = asyncio.run(_rebuild(args.since))
+    except Exception as exc:
+        print(f"Rollup rebuild failed: {exc}", file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,16 +6,19 @@ import hashlib
 import asyncio
 import json
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
+from sqlalchemy import delete, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import col, select
 
 from config.settings import settings
 from src.audit.runtime import log_integration_event
 from src.db.engine import get_session
-from src.db.models import ScreenObservation
+from src.db.models import ScreenObservation, ScreenshotFolderDirectory, ScreenshotFolderFile
 from src.observer.image_metadata import image_metadata_label, local_image_metadata
 from src.observer.screen_repository import screen_observation_repo
 from src.observer.screenshot_semantic_analysis import (
@@ -44,6 +47,46 @@ SCREENSHOT_FOLDER_PROVIDER = "screenshot_folder"
 SCREENSHOT_FOLDER_HASH_PREFIX = "screenshot_folder_image_sha256"
 SCREENSHOT_FOLDER_ENV = "SERAPH_SCREENSHOT_FOLDER"
 _SCAN_LOCK = asyncio.Lock()
+_HASH_BATCH_SIZE = 32
+_HASH_QUERY_CHUNK = 50
+_MANIFEST_WRITE_CHUNK = 100
+# Directory listings are only reused once their mtime is older than this, so a
+# file added within the same coarse mtime tick as the listing is not missed.
+_DIRECTORY_MTIME_GRACE_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class _KnownFile:
+    size: int
+    mtime_ns: int
+    inode: int
+    captured_at_epoch: float
+
+
+@dataclass(frozen=True)
+class _KnownDirectory:
+    mtime_ns: int
+    inode: int
+    images: tuple[str, ...]
+    subdirs: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _ScanEntry:
+    path: Path
+    size: int
+    mtime_ns: int
+    inode: int
+    captured_at_epoch: float
+    known: bool
+
+
+@dataclass
+class _FolderWalk:
+    entries: list[_ScanEntry] = field(default_factory=list)
+    listings: dict[str, _KnownDirectory] = field(default_factory=dict)
+    seen_files: set[str] = field(default_factory=set)
+    seen_directories: set[str] = field(default_factory=set)
 
 
 def resolve_screenshot_folder(configured: str | None = None) -> Path:
@@ -67,31 +110,78 @@ def resolve_screenshot_folder(configured: str | None = None) -> Path:
 
 
 async def scan_screenshot_folder(root: Path, *, limit: int = 100) -> ScreenshotFolderScanResult:
-    """Scan a local screenshot directory and persist new images as observations."""
+    """Scan a local screenshot directory and persist new images as observations.
+
+    Files recorded in the scan manifest with an unchanged ``(size, mtime_ns,
+    inode)`` count as duplicates without being hashed, and directories whose
+    mtime is unchanged reuse their recorded listing instead of being re-read.
+    New files are hashed in batches and checked against earlier ingests with
+    one query per batch.
+    """
     async with _SCAN_LOCK:
         screenshot_root = root.expanduser().resolve()
         validate_screenshot_folder_root(screenshot_root)
         ingest_limit = max(limit, 1)
-        image_paths = await asyncio.to_thread(_image_paths, screenshot_root)
+        known_files, known_directories = await _load_scan_manifest(screenshot_root)
+        walk = await asyncio.to_thread(
+            _walk_screenshot_folder,
+            screenshot_root,
+            known_files,
+            known_directories,
+            now_ns=time.time_ns(),
+        )
+        entries = sorted(walk.entries, key=lambda entry: entry.captured_at_epoch, reverse=True)
         scanned = 0
         ingested = 0
         skipped = 0
         rejected: list[dict[str, str]] = []
+        recorded: list[dict[str, object]] = []
+        ingested_hashes: set[str] = set()
 
-        for image_path in image_paths:
-            if ingested >= ingest_limit:
-                break
-            scanned += 1
-            await asyncio.sleep(0)
-            try:
-                observation = await _image_to_observation(image_path, screenshot_root)
-                if observation is None:
-                    skipped += 1
-                    continue
-                await screen_observation_repo.create(**observation)
-                ingested += 1
-            except Exception as exc:
-                rejected.append({"image_path": str(image_path.resolve()), "reason": str(exc)})
+        try:
+            index = 0
+            while index < len(entries) and ingested < ingest_limit:
+                # Hash at most as many new files as could still be ingested.
+                batch_end = index
+                new_entries: list[_ScanEntry] = []
+                while batch_end < len(entries) and len(new_entries) < min(_HASH_BATCH_SIZE, ingest_limit - ingested):
+                    if not entries[batch_end].known:
+                        new_entries.append(entries[batch_end])
+                    batch_end += 1
+                hashes = await asyncio.to_thread(_hash_scan_entries, new_entries, screenshot_root)
+                existing_hashes = await _ingested_image_hashes(
+                    {value for value in hashes.values() if isinstance(value, str)}
+                )
+
+                for entry in entries[index:batch_end]:
+                    if ingested >= ingest_limit:
+                        break
+                    scanned += 1
+                    await asyncio.sleep(0)
+                    if entry.known:
+                        skipped += 1
+                        continue
+                    try:
+                        image_sha256 = hashes[entry.path]
+                        if isinstance(image_sha256, Exception):
+                            raise image_sha256
+                        if image_sha256 in existing_hashes or image_sha256 in ingested_hashes:
+                            skipped += 1
+                        else:
+                            observation = await _image_to_observation(
+                                entry.path,
+                                screenshot_root,
+                                image_sha256=image_sha256,
+                            )
+                            await screen_observation_repo.create(**observation)
+                            ingested += 1
+                            ingested_hashes.add(image_sha256)
+                        recorded.append(_manifest_file_row(entry, screenshot_root, image_sha256))
+                    except Exception as exc:
+                        rejected.append({"image_path": str(entry.path.resolve()), "reason": str(exc)})
+                index = batch_end
+        finally:
+            await _save_scan_manifest(screenshot_root, walk, known_files, known_directories, recorded)
 
         await log_integration_event(
             integration_type="screenshot_folder",
@@ -138,21 +228,103 @@ def _dangerous_scan_roots() -> set[Path]:
     return roots
 
 
-def _image_paths(root: Path) -> list[Path]:
+def _walk_screenshot_folder(
+    root: Path,
+    known_files: dict[str, _KnownFile],
+    known_directories: dict[str, _KnownDirectory],
+    *,
+    now_ns: int,
+) -> _FolderWalk:
+    """List every image under ``root``, reusing manifest listings for unchanged directories.
+
+    Adding, removing or renaming a file bumps its directory's mtime, so an
+    unchanged directory still holds the files recorded for it and is not
+    re-read. Rewriting a file in place leaves the directory mtime alone, so
+    every listed file is still ``stat``-ed and counts as known only if its
+    ``(size, mtime_ns, inode)`` matches the manifest. Symlinked directories
+    are not followed.
+    """
+    walk = _FolderWalk()
     if not root.exists() or not root.is_dir():
-        return []
-    return sorted(
-        (
-            path
-            for path in root.rglob("*")
-            if path.is_file() and path.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS
-        ),
-        key=lambda path: _capture_timestamp(path, root)[0].timestamp(),
-        reverse=True,
-    )
-
-
-async def _image_to_observation(image_path: Path, root: Path) -> dict[str, object] | None:
+        return walk
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        key = str(directory)
+        try:
+            directory_stat = directory.stat()
+        except OSError:
+            continue
+        walk.seen_directories.add(key)
+        cached = known_directories.get(key)
+        unchanged = (
+            cached is not None
+            and cached.mtime_ns == directory_stat.st_mtime_ns
+            and cached.inode == directory_stat.st_ino
+        )
+        if unchanged:
+            images, subdirs = cached.images, cached.subdirs
+        else:
+            listed_images: list[str] = []
+            listed_subdirs: list[str] = []
+            try:
+                with os.scandir(directory) as iterator:
+                    for dir_entry in iterator:
+                        try:
+                            if dir_entry.is_dir(follow_symlinks=False):
+                                listed_subdirs.append(dir_entry.name)
+                            elif (
+                                dir_entry.is_file()
+                                and Path(dir_entry.name).suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS
+                            ):
+                                listed_images.append(dir_entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            images, subdirs = tuple(sorted(listed_images)), tuple(sorted(listed_subdirs))
+            if now_ns - directory_stat.st_mtime_ns > _DIRECTORY_MTIME_GRACE_NS:
+                walk.listings[key] = _KnownDirectory(
+                    mtime_ns=directory_stat.st_mtime_ns,
+                    inode=directory_stat.st_ino,
+                    images=images,
+                    subdirs=subdirs,
+                )
+
+        for name in images:
+            image_path = directory / name
+            path_key = str(image_path)
+            try:
+                image_stat = image_path.stat()
+            except OSError:
+                continue
+            walk.seen_files.add(path_key)
+            known = known_files.get(path_key)
+            unchanged_file = known is not None and (known.size, known.mtime_ns, known.inode) == (
+                image_stat.st_size,
+                image_stat.st_mtime_ns,
+                image_stat.st_ino,
+            )
+            if unchanged_file:
+                captured_at_epoch = known.captured_at_epoch
+            else:
+                captured_at, _ = _capture_timestamp(image_path, root, mtime=image_stat.st_mtime)
+                captured_at_epoch = captured_at.timestamp()
+            walk.entries.append(
+                _ScanEntry(
+                    path=image_path,
+                    size=image_stat.st_size,
+                    mtime_ns=image_stat.st_mtime_ns,
+                    inode=image_stat.st_ino,
+                    captured_at_epoch=captured_at_epoch,
+                    known=unchanged_file,
+                )
+            )
+        pending.extend(directory / name for name in subdirs)
+    return walk
+
+
+def _validated_image_path(image_path: Path, root: Path) -> Path:
     resolved = image_path.resolve()
     if not resolved.is_relative_to(root):
         raise ScreenshotFolderImageError("image is outside screenshot folder root")
@@ -160,11 +332,21 @@ async def _image_to_observation(image_path: Path, root: Path) -> dict[str, objec
         raise ScreenshotFolderImageError("unsupported image type")
     if not resolved.is_file():
         raise ScreenshotFolderImageError("image file not found")
+    return resolved
 
-    image_sha256 = await asyncio.to_thread(_sha256_file, resolved)
-    if await _image_already_ingested(image_sha256):
-        return None
 
+def _hash_scan_entries(entries: list[_ScanEntry], root: Path) -> dict[Path, str | Exception]:
+    hashes: dict[Path, str | Exception] = {}
+    for entry in entries:
+        try:
+            hashes[entry.path] = _sha256_file(_validated_image_path(entry.path, root))
+        except Exception as exc:
+            hashes[entry.path] = exc
+    return hashes
+
+
+async def _image_to_observation(image_path: Path, root: Path, *, image_sha256: str) -> dict[str, object]:
+    resolved = _validated_image_path(image_path, root)
     stat = resolved.stat()
     metadata = await asyncio.to_thread(local_image_metadata, resolved)
     captured_at, captured_at_source = _capture_timestamp(resolved, root)
@@ -214,13 +396,15 @@ async def _image_to_observation(image_path: Path, root: Path) -> dict[str, objec
     }
 
 
-def _capture_timestamp(image_path: Path, root: Path) -> tuple[datetime, str]:
+def _capture_timestamp(image_path: Path, root: Path, *, mtime: float | None = None) -> tuple[datetime, str]:
     relative = image_path.relative_to(root)
     for part in (image_path.stem, *reversed(relative.parts[:-1])):
         parsed = _parse_capture_timestamp_token(part)
         if parsed is not None:
             return parsed, "path"
-    return datetime.fromtimestamp(image_path.stat().st_mtime, timezone.utc), "file_mtime"
+    if mtime is None:
+        mtime = image_path.stat().st_mtime
+    return datetime.fromtimestamp(mtime, timezone.utc), "file_mtime"
 
 
 def _parse_capture_timestamp_token(token: str) -> datetime | None:
@@ -237,17 +421,138 @@ def _parse_capture_timestamp_token(token: str) -> datetime | None:
     return datetime.fromtimestamp(seconds + fractional / 1_000_000_000, timezone.utc)
 
 
-async def _image_already_ingested(image_sha256: str) -> bool:
-    marker = f"{SCREENSHOT_FOLDER_HASH_PREFIX}:{image_sha256}"
+async def _ingested_image_hashes(image_hashes: set[str]) -> set[str]:
+    """Return the hashes among ``image_hashes`` that were already ingested."""
+    if not image_hashes:
+        return set()
     async with get_session() as db:
         result = await db.execute(
-            select(ScreenObservation)
-            .where(col(ScreenObservation.details_json).contains(marker))
-            .limit(1)
+            select(ScreenshotFolderFile.image_sha256).where(
+                col(ScreenshotFolderFile.image_sha256).in_(sorted(image_hashes))
+            )
+        )
+        found = set(result.scalars().all())
+        # Observations ingested before the manifest existed are only findable by marker.
+        remaining = sorted(image_hashes - found)
+        for start in range(0, len(remaining), _HASH_QUERY_CHUNK):
+            markers = {
+                f"{SCREENSHOT_FOLDER_HASH_PREFIX}:{image_sha256}": image_sha256
+                for image_sha256 in remaining[start : start + _HASH_QUERY_CHUNK]
+            }
+            result = await db.execute(
+                select(ScreenObservation.details_json).where(
+                    or_(*(col(ScreenObservation.details_json).contains(marker) for marker in markers))
+                )
+            )
+            for details_json in result.scalars().all():
+                for marker, image_sha256 in markers.items():
+                    if details_json and marker in details_json:
+                        found.add(image_sha256)
+    return found
+
+
+async def _load_scan_manifest(root: Path) -> tuple[dict[str, _KnownFile], dict[str, _KnownDirectory]]:
+    async with get_session() as db:
+        file_rows = await db.execute(
+            select(
+                ScreenshotFolderFile.path,
+                ScreenshotFolderFile.size,
+                ScreenshotFolderFile.mtime_ns,
+                ScreenshotFolderFile.inode,
+                ScreenshotFolderFile.captured_at_epoch,
+            ).where(ScreenshotFolderFile.root == str(root))
         )
-        if result.scalar_one_or_none() is not None:
-            return True
-    return False
+        directory_rows = await db.execute(
+            select(ScreenshotFolderDirectory).where(ScreenshotFolderDirectory.root == str(root))
+        )
+        known_files = {
+            path: _KnownFile(size=size, mtime_ns=mtime_ns, inode=inode, captured_at_epoch=captured_at_epoch)
+            for path, size, mtime_ns, inode, captured_at_epoch in file_rows.all()
+        }
+        known_directories = {
+            directory.path: _KnownDirectory(
+                mtime_ns=directory.mtime_ns,
+                inode=directory.inode,
+                images=tuple(json.loads(directory.images_json or "[]")),
+                subdirs=tuple(json.loads(directory.subdirs_json or "[]")),
+            )
+            for directory in directory_rows.scalars().all()
+        }
+    return known_files, known_directories
+
+
+def _manifest_file_row(entry: _ScanEntry, root: Path, image_sha256: str) -> dict[str, object]:
+    return {
+        "path": str(entry.path),
+        "root": str(root),
+        "size": entry.size,
+        "mtime_ns": entry.mtime_ns,
+        "inode": entry.inode,
+        "image_sha256": image_sha256,
+        "captured_at_epoch": entry.captured_at_epoch,
+        "seen_at": datetime.now(timezone.utc),
+    }
+
+
+async def _save_scan_manifest(
+    root: Path,
+    walk: _FolderWalk,
+    known_files: dict[str, _KnownFile],
+    known_directories: dict[str, _KnownDirectory],
+    recorded: list[dict[str, object]],
+) -> None:
+    """Record processed files and fresh directory listings; forget paths that disappeared."""
+    now = datetime.now(timezone.utc)
+    directory_rows = [
+        {
+            "path": path,
+            "root": str(root),
+            "mtime_ns": listing.mtime_ns,
+            "inode": listing.inode,
+            "images_json": json.dumps(list(listing.images)),
+            "subdirs_json": json.dumps(list(listing.subdirs)),
+            "scanned_at": now,
+        }
+        for path, listing in walk.listings.items()
+        if known_directories.get(path) != listing
+    ]
+    stale_files = sorted(set(known_files) - walk.seen_files)
+    stale_directories = sorted(set(known_directories) - walk.seen_directories)
+    async with get_session() as db:
+        for start in range(0, len(recorded), _MANIFEST_WRITE_CHUNK):
+            stmt = sqlite_insert(ScreenshotFolderFile).values(recorded[start : start + _MANIFEST_WRITE_CHUNK])
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["path"],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in ("root", "size", "mtime_ns", "inode", "image_sha256", "captured_at_epoch", "seen_at")
+                    },
+                )
+            )
+        for start in range(0, len(directory_rows), _MANIFEST_WRITE_CHUNK):
+            stmt = sqlite_insert(ScreenshotFolderDirectory).values(directory_rows[start : start + _MANIFEST_WRITE_CHUNK])
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["path"],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in ("root", "mtime_ns", "inode", "images_json", "subdirs_json", "scanned_at")
+                    },
+                )
+            )
+        for start in range(0, len(stale_files), _MANIFEST_WRITE_CHUNK):
+            await db.execute(
+                delete(ScreenshotFolderFile).where(
+                    col(ScreenshotFolderFile.path).in_(stale_files[start : start + _MANIFEST_WRITE_CHUNK])
+                )
+            )
+        for start in range(0, len(stale_directories), _MANIFEST_WRITE_CHUNK):
+            await db.execute(
+                delete(ScreenshotFolderDirectory).where(
+                    col(ScreenshotFolderDirectory.path).in_(stale_directories[start : start + _MANIFEST_WRITE_CHUNK])
+                )
+            )
 
 
 def _sha256_file(path: Path) -> str:
@@ -7,9 +7,11 @@ not present, it silently returns empty data.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from config.settings import settings
 from src.audit.runtime import log_integration_event
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,50 @@ logger = logging.getLogger(__name__)
 _CREDENTIALS_PATH = Path("/app/config/google_credentials.json")
 _CALENDAR_TOKEN_PATH = Path("/app/data/google_calendar_token.json")
 
+# Last successful fetch as (monotonic fetched_at, result), reused between polls.
+_calendar_cache: tuple[float, dict] | None = None
+# Fetch shared by concurrent pollers; it keeps running (and fills the cache)
+# even when a poller stops waiting for it.
+_calendar_fetch: asyncio.Task | None = None
+
+
+def _reset_calendar_cache() -> None:
+    global _calendar_cache, _calendar_fetch
+    _calendar_cache = None
+    _calendar_fetch = None
+
+
+def _cached_events() -> dict | None:
+    ttl_seconds = max(0, settings.observer_calendar_cache_seconds)
+    if _calendar_cache is None or ttl_seconds == 0:
+        return None
+    fetched_at, result = _calendar_cache
+    if time.monotonic() - fetched_at >= ttl_seconds:
+        return None
+    return {
+        "upcoming_events": [dict(event) for event in result.get("upcoming_events", [])],
+        "current_event": result.get("current_event"),
+    }
+
+
+async def _fetch_and_cache_events() -> dict:
+    global _calendar_cache
+    result = await asyncio.to_thread(_fetch_events)
+    _calendar_cache = (time.monotonic(), result)
+    return result
+
+
+def _shared_fetch() -> asyncio.Task:
+    global _calendar_fetch
+    loop = asyncio.get_running_loop()
+    task = _calendar_fetch
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(_fetch_and_cache_events(), name="observer_calendar_fetch")
+        # Retrieve failures of fetches nobody is still awaiting.
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        _calendar_fetch = task
+    return task
+
 
 def _fetch_events() -> dict:
     """Synchronous calendar fetch (run via asyncio.to_thread)."""
@@ -67,8 +113,12 @@ async def gather_calendar() -> dict:
         )
         return {"upcoming_events": [], "current_event": None}
 
+    cached = _cached_events()
+    if cached is not None:
+        return cached
+
     try:
-        result = await asyncio.to_thread(_fetch_events)
+        result = await asyncio.shield(_shared_fetch())
         upcoming_events = result.get("upcoming_events", [])
         current_event = result.get("current_event")
         if not upcoming_events and not current_event:
@@ -1,7 +1,11 @@
 """Git context source — reads reflog from filesystem, no subprocess."""
 
 import logging
+import os
 import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,6 +19,87 @@ _REFLOG_RE = re.compile(
     r"^[0-9a-f]+ [0-9a-f]+ .+ <.+> (\d+) [+-]\d{4}\t(.+)$"
 )
 
+_MAX_RECENT_ENTRIES = 3
+# On first read only the reflog tail is parsed; it comfortably holds the last
+# few entries even for long commit messages.
+_INITIAL_TAIL_BYTES = 64 * 1024
+
+
+@dataclass
+class _ReflogTail:
+    """Read position in one reflog plus its newest parsed entries."""
+
+    inode: int = -1
+    offset: int = 0
+    last_line: bytes = b""
+    entries: deque[tuple[int, str]] = field(default_factory=lambda: deque(maxlen=_MAX_RECENT_ENTRIES))
+
+
+_reflog_tails: dict[str, _ReflogTail] = {}
+_reflog_lock = threading.Lock()
+
+
+def _reset_reflog_tails() -> None:
+    with _reflog_lock:
+        _reflog_tails.clear()
+
+
+def _parse_reflog_lines(chunk: bytes, entries: deque[tuple[int, str]]) -> None:
+    for raw_line in chunk.splitlines():
+        match = _REFLOG_RE.match(raw_line.decode("utf-8", errors="replace"))
+        if match:
+            entries.append((int(match.group(1)), match.group(2)))
+
+
+def _tail_reflog(reflog_path: Path) -> list[tuple[int, str]]:
+    """Return the newest reflog entries, reading only bytes appended since the last call."""
+    key = str(reflog_path)
+    with _reflog_lock:
+        tail = _reflog_tails.get(key) or _ReflogTail()
+        with reflog_path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            appended_only = (
+                tail.inode == stat.st_ino
+                and tail.offset <= stat.st_size
+                and _still_ends_with(handle, tail)
+            )
+            if not appended_only:
+                # New, rotated or rewritten reflog: start over from its tail.
+                tail = _ReflogTail(inode=stat.st_ino)
+                start = max(0, stat.st_size - _INITIAL_TAIL_BYTES)
+                handle.seek(start)
+                chunk = handle.read()
+                if start > 0:
+                    # Drop the partial first line of the tail window.
+                    newline = chunk.find(b"\n")
+                    chunk = chunk[newline + 1:] if newline >= 0 else b""
+                    start = stat.st_size - len(chunk)
+            else:
+                start = tail.offset
+                handle.seek(start)
+                chunk = handle.read()
+        # Leave an unterminated trailing line for the next read.
+        complete_length = chunk.rfind(b"\n") + 1
+        complete = chunk[:complete_length]
+        if complete:
+            _parse_reflog_lines(complete, tail.entries)
+            tail.offset = start + complete_length
+            tail.last_line = complete.rstrip(b"\n").rsplit(b"\n", 1)[-1] + b"\n"
+        elif not appended_only:
+            tail.offset = start
+        _reflog_tails[key] = tail
+        return list(tail.entries)
+
+
+def _still_ends_with(handle, tail: _ReflogTail) -> bool:
+    """Check the bytes before the stored offset still hold the last line read."""
+    if not tail.last_line:
+        return tail.offset == 0
+    if tail.offset < len(tail.last_line):
+        return False
+    handle.seek(tail.offset - len(tail.last_line))
+    return handle.read(len(tail.last_line)) == tail.last_line
+
 
 def gather_git() -> dict | None:
     """Parse recent git reflog entries. Returns None if no .git dir found."""
@@ -41,7 +126,7 @@ def gather_git() -> dict | None:
         return None
 
     try:
-        lines = reflog_path.read_text().strip().splitlines()
+        entries = _tail_reflog(reflog_path)
     except OSError as exc:
         log_integration_event_sync(
             integration_type="observer_source",
@@ -56,20 +141,13 @@ def gather_git() -> dict | None:
     cutoff = now.timestamp() - 3600  # last 60 minutes
 
     recent = []
-    for line in reversed(lines):
-        match = _REFLOG_RE.match(line)
-        if not match:
-            continue
-        timestamp = int(match.group(1))
+    for timestamp, message in reversed(entries):
         if timestamp < cutoff:
             break
-        message = match.group(2)
         recent.append({
             "timestamp": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
             "message": message,
         })
-        if len(recent) >= 3:
-            break
 
     if not recent:
         log_integration_event_sync(
@@ -1,59 +1,323 @@
+"""Registry of browser WebSocket connections with per-connection outbound queues.
+
+Each connection gets a bounded queue drained by its own writer task (started
+whenever frames are waiting), so a slow or half-dead client only backs up its
+own queue instead of delaying every other tab. ``broadcast`` enqueues on every
+connection at once and waits at most ``ws_broadcast_ack_timeout_ms`` for the
+first send to finish. Broadcast frames carry a manager-wide
+``broadcast_seq`` (separate from the per-socket ``seq`` chat frames use) and
+the most recent ones are kept in a replay buffer, so a client reconnecting
+with the last ``broadcast_seq`` it saw gets what it missed instead of
+refetching everything.
+"""
+
+import asyncio
 import logging
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
 
 from fastapi import WebSocket
 
+from config.settings import settings
 from src.models.schemas import WSResponse
+from src.utils.background import track_task
 
 logger = logging.getLogger(__name__)
 
+_SLOW_CONSUMER_POLICIES = {"drop_oldest", "drop_newest", "disconnect"}
+
 
 @dataclass(frozen=True)
 class BroadcastResult:
     attempted_connections: int
     delivered_connections: int
     failed_connections: int
+    # Connections whose frame was still queued when the ack window closed; not
+    # counted as delivered. If no connection got the frame it was withdrawn
+    # from their queues so the caller can deliver it later.
+    queued_connections: int = 0
+
+
+@dataclass
+class _Frame:
+    seq: int
+    type: str
+    payload: str
+    enqueued_at: float
+    ack: asyncio.Future | None = None
+
+    def resolve(self, sent: bool) -> None:
+        if self.ack is not None and not self.ack.done():
+            self.ack.set_result(sent)
+
+
+@dataclass
+class _Outbound:
+    ws: WebSocket
+    pending: deque[_Frame] = field(default_factory=deque)
+    writer: asyncio.Task | None = None
+    connected_at: float = field(default_factory=time.monotonic)
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    last_sent_seq: int = 0
+    last_send_ms: float = 0.0
 
 
 class ConnectionManager:
     """Registry of active WebSocket connections for broadcasting proactive messages."""
 
     def __init__(self) -> None:
-        self._connections: set[WebSocket] = set()
+        self._connections: dict[WebSocket, _Outbound] = {}
+        self._seq = 0
+        self._replay: deque[tuple[int, str, str]] = deque()
+        self._replayed = 0
+        self._disconnected_slow = 0
 
     @property
     def active_count(self) -> int:
         return len(self._connections)
 
-    def connect(self, ws: WebSocket) -> None:
-        self._connections.add(ws)
+    @property
+    def last_broadcast_seq(self) -> int:
+        return self._seq
+
+    def connect(self, ws: WebSocket, *, last_broadcast_seq: int | None = None) -> None:
+        """Register ``ws``; with ``last_broadcast_seq``, queue the buffered broadcasts it has not seen."""
+        outbound = _Outbound(ws=ws)
+        self._connections[ws] = outbound
+        if last_broadcast_seq is not None:
+            # A seq ahead of ours means the server restarted since the client last heard from it.
+            floor = last_broadcast_seq if last_broadcast_seq <= self._seq else 0
+            missed = [item for item in self._replay if item[0] > floor]
+            now = time.monotonic()
+            for seq, message_type, payload in missed:
+                self._enqueue(outbound, _Frame(seq=seq, type=message_type, payload=payload, enqueued_at=now))
+            self._replayed += len(missed)
         logger.debug("WS registered (%d active)", self.active_count)
 
     def disconnect(self, ws: WebSocket) -> None:
-        self._connections.discard(ws)
+        outbound = self._connections.pop(ws, None)
+        if outbound is not None:
+            self._close_outbound(outbound)
         logger.debug("WS unregistered (%d active)", self.active_count)
 
     async def broadcast(self, message: WSResponse) -> BroadcastResult:
-        """Send a message to all connected clients, dropping any that error."""
-        payload = message.model_dump_json()
-        dead: list[WebSocket] = []
-        attempted_connections = len(self._connections)
+        """Queue a message for every connected client and wait briefly for a send.
+
+        Returns once any client has the frame, every send has failed, or
+        ``ws_broadcast_ack_timeout_ms`` has passed. Clients whose send fails
+        are dropped; slow ones are reported in ``queued_connections``. Once
+        any client has the frame (or is mid-send when the window closes) the
+        slow ones keep it queued. Otherwise the still-queued frames are
+        withdrawn and forgotten by the replay buffer, so a caller that queues
+        the message for later delivery does not also have it sent when the
+        slow clients drain. With a zero window nothing is awaited and queued
+        frames count as delivered.
+        """
+        self._seq += 1
+        seq = self._seq
+        payload = message.model_copy(update={"broadcast_seq": seq}).model_dump_json()
+        self._remember(seq, message.type, payload)
+
+        loop = asyncio.get_running_loop()
+        queued: list[tuple[_Outbound, _Frame]] = []
         failed_connections = 0
-        for ws in self._connections:
-            try:
-                await ws.send_text(payload)
-            except Exception:
-                dead.append(ws)
+        attempted_connections = len(self._connections)
+        now = time.monotonic()
+        for outbound in list(self._connections.values()):
+            frame = _Frame(seq=seq, type=message.type, payload=payload, enqueued_at=now, ack=loop.create_future())
+            if self._enqueue(outbound, frame):
+                queued.append((outbound, frame))
+            else:
                 failed_connections += 1
-        for ws in dead:
-            self._connections.discard(ws)
-            logger.debug("Removed dead WS connection (%d active)", self.active_count)
-        delivered_connections = attempted_connections - failed_connections
+        acks = [frame.ack for _outbound, frame in queued]
+
+        # Wait until one client has the frame, every send has failed, or the window closes.
+        deadline = loop.time() + max(0, settings.ws_broadcast_ack_timeout_ms) / 1000
+        waiting = set(acks)
+        while waiting and (remaining := deadline - loop.time()) > 0:
+            done, waiting = await asyncio.wait(waiting, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            sent = [ack.result() for ack in done]
+            failed_connections += sent.count(False)
+            if any(sent):
+                break
+        delivered_connections = attempted_connections - failed_connections - len(waiting)
+        queued_connections = len(waiting)
+        if settings.ws_broadcast_ack_timeout_ms <= 0:
+            # Fire-and-forget: frames still queued are expected to go out.
+            delivered_connections, queued_connections = delivered_connections + queued_connections, 0
+        elif waiting and delivered_connections == 0:
+            unsent = [
+                (outbound, frame)
+                for outbound, frame in queued
+                if frame.ack in waiting and any(item is frame for item in outbound.pending)
+            ]
+            # A frame the writer already handed to the socket cannot be taken back.
+            delivered_connections = len(waiting) - len(unsent)
+            queued_connections = len(unsent)
+            if not delivered_connections:
+                for outbound, frame in unsent:
+                    outbound.pending.remove(frame)
+                    frame.resolve(False)
+                self._forget(seq)
         return BroadcastResult(
             attempted_connections=attempted_connections,
             delivered_connections=delivered_connections,
             failed_connections=failed_connections,
+            queued_connections=queued_connections,
         )
 
+    def stats(self) -> dict[str, Any]:
+        """Return per-connection lag and drop counters plus replay buffer state."""
+        now = time.monotonic()
+        connections = []
+        for outbound in self._connections.values():
+            oldest = outbound.pending[0].enqueued_at if outbound.pending else None
+            connections.append(
+                {
+                    "queued": len(outbound.pending),
+                    "lag_ms": round((now - oldest) * 1000, 1) if oldest is not None else 0.0,
+                    "sent": outbound.sent,
+                    "dropped": outbound.dropped,
+                    "coalesced": outbound.coalesced,
+                    "last_sent_seq": outbound.last_sent_seq,
+                    "last_send_ms": outbound.last_send_ms,
+                    "connected_seconds": round(now - outbound.connected_at, 1),
+                }
+            )
+        return {
+            "active_connections": len(connections),
+            "last_broadcast_seq": self._seq,
+            "replay_buffered": len(self._replay),
+            "replay_oldest_seq": self._replay[0][0] if self._replay else None,
+            "replayed": self._replayed,
+            "disconnected_slow_consumers": self._disconnected_slow,
+            "connections": connections,
+        }
+
+    def reset(self) -> None:
+        """Forget connections, the replay buffer and counters for tests and deterministic evals."""
+        for outbound in self._connections.values():
+            self._close_outbound(outbound)
+        self._connections.clear()
+        self._seq = 0
+        self._replay.clear()
+        self._replayed = 0
+        self._disconnected_slow = 0
+
+    def _remember(self, seq: int, message_type: str, payload: str) -> None:
+        limit = max(0, settings.ws_replay_buffer_size)
+        self._replay.append((seq, message_type, payload))
+        while len(self._replay) > limit:
+            self._replay.popleft()
+
+    def _forget(self, seq: int) -> None:
+        self._replay = deque(item for item in self._replay if item[0] != seq)
+
+    def _enqueue(self, outbound: _Outbound, frame: _Frame) -> bool:
+        """Queue ``frame`` on ``outbound`` under the slow-consumer policy; ``False`` if it was not queued."""
+        if frame.type in _coalesced_types():
+            for queued in [item for item in outbound.pending if item.type == frame.type]:
+                outbound.pending.remove(queued)
+                queued.resolve(True)
+                outbound.coalesced += 1
+        if len(outbound.pending) >= max(1, settings.ws_outbound_queue_size):
+            policy = settings.ws_slow_consumer_policy
+            if policy not in _SLOW_CONSUMER_POLICIES:
+                policy = "drop_oldest"
+            if policy == "drop_newest":
+                outbound.dropped += 1
+                frame.resolve(False)
+                return False
+            if policy == "disconnect":
+                logger.info("Disconnecting slow WS consumer with %d queued frames", len(outbound.pending))
+                self._disconnected_slow += 1
+                self._drop(outbound, close=True)
+                frame.resolve(False)
+                return False
+            outbound.pending.popleft().resolve(False)
+            outbound.dropped += 1
+        outbound.pending.append(frame)
+        self._ensure_writer(outbound)
+        return True
+
+    def _ensure_writer(self, outbound: _Outbound) -> None:
+        if outbound.writer is not None and not outbound.writer.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Started by the next broadcast once an event loop is running.
+            return
+        outbound.writer = loop.create_task(self._write(outbound), name="ws_outbound_writer")
+
+    async def _write(self, outbound: _Outbound) -> None:
+        while outbound.pending:
+            frame = outbound.pending.popleft()
+            started = time.perf_counter()
+            try:
+                send = outbound.ws.send_text(frame.payload)
+                if settings.ws_send_timeout_seconds > 0:
+                    await asyncio.wait_for(send, timeout=settings.ws_send_timeout_seconds)
+                else:
+                    await send
+            except asyncio.CancelledError:
+                frame.resolve(False)
+                raise
+            except asyncio.TimeoutError:
+                frame.resolve(False)
+                self._drop(outbound, close=True)
+                logger.info("Removed stalled WS connection (%d active)", self.active_count)
+                return
+            except Exception:
+                frame.resolve(False)
+                self._drop(outbound)
+                logger.debug("Removed dead WS connection (%d active)", self.active_count)
+                return
+            outbound.sent += 1
+            outbound.last_sent_seq = frame.seq
+            outbound.last_send_ms = round((time.perf_counter() - started) * 1000, 2)
+            frame.resolve(True)
+
+    def _drop(self, outbound: _Outbound, *, close: bool = False) -> None:
+        if self._connections.get(outbound.ws) is outbound:
+            del self._connections[outbound.ws]
+        self._close_outbound(outbound)
+        if close:
+            # Closing makes the client reconnect and resume from its last seq.
+            track_task(_close_quietly(outbound.ws), name="ws_outbound_close")
+
+    def _close_outbound(self, outbound: _Outbound) -> None:
+        while outbound.pending:
+            outbound.pending.popleft().resolve(False)
+        writer = outbound.writer
+        if writer is not None and not writer.done() and writer is not _current_task():
+            try:
+                writer.cancel()
+            except RuntimeError:
+                # The writer's loop is already closed, e.g. when resetting between tests.
+                pass
+
+
+def _coalesced_types() -> set[str]:
+    return {item.strip() for item in settings.ws_coalesce_message_types.split(",") if item.strip()}
+
+
+async def _close_quietly(ws: WebSocket) -> None:
+    try:
+        await asyncio.wait_for(ws.close(code=1013), timeout=5)
+    except Exception:
+        logger.debug("Closing slow WS connection failed", exc_info=True)
+
+
+def _current_task() -> asyncio.Task | None:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
 
 ws_manager = ConnectionManager()
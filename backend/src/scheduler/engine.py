@@ -83,6 +83,7 @@ def init_scheduler() -> AsyncIOScheduler | None:
     from src.scheduler.jobs.screenshot_observation_digest import run_screenshot_observation_digest
     from src.scheduler.jobs.weekly_activity_review import run_weekly_activity_review
     from src.scheduler.jobs.screen_cleanup import run_screen_cleanup
+    from src.scheduler.jobs.benchmark_report_refresh import run_benchmark_report_refresh
 
     jobs = [
         {
@@ -177,6 +178,14 @@ def init_scheduler() -> AsyncIOScheduler | None:
             "id": "screen_cleanup",
             "name": "Screen observation cleanup",
         },
+        {
+            "func": _async_job_wrapper(run_benchmark_report_refresh, loop),
+            "trigger": IntervalTrigger(
+                minutes=_settings_int("operator_benchmark_refresh_interval_min", 60, minimum=1, maximum=10080)
+            ),
+            "id": "benchmark_report_refresh",
+            "name": "Operator benchmark report refresh",
+        },
     ]
 
     for job in jobs:
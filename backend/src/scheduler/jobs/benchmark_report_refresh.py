@@ -0,0 +1,51 @@
+"""Benchmark report refresh — re-runs materialized operator benchmark suites."""
+
+import logging
+from time import perf_counter
+
+from src.audit.runtime import log_scheduler_job_event
+
+logger = logging.getLogger(__name__)
+
+
+async def run_benchmark_report_refresh(*, warm: bool = False) -> None:
+    """Re-run every materialized benchmark suite set on eval worker processes.
+
+    With ``warm=True`` every operator benchmark report is materialized instead.
+    """
+    started_at = perf_counter()
+    try:
+        from src.evals.report_store import benchmark_report_store
+
+        if warm:
+            from src.api.operator import warm_operator_benchmark_reports
+
+            refreshed = await warm_operator_benchmark_reports()
+            mode = "warm"
+        elif benchmark_report_store.stats()["entries"]:
+            refreshed = await benchmark_report_store.refresh_all()
+            mode = "refresh"
+        else:
+            refreshed = 0
+            mode = "skipped"
+
+        await log_scheduler_job_event(
+            job_name="benchmark_report_refresh",
+            outcome="succeeded",
+            details={
+                "duration_ms": int((perf_counter() - started_at) * 1000),
+                "mode": mode,
+                "suite_sets": refreshed,
+            },
+        )
+        logger.info("benchmark_report_refresh: %s %d suite set(s)", mode, refreshed)
+    except Exception as exc:
+        await log_scheduler_job_event(
+            job_name="benchmark_report_refresh",
+            outcome="failed",
+            details={
+                "duration_ms": int((perf_counter() - started_at) * 1000),
+                "error": str(exc),
+            },
+        )
+        logger.exception("benchmark_report_refresh failed")
@@ -21,6 +21,7 @@ class SkillManager:
         self._config_path: str = ""
         self._disabled: set[str] = set()
         self._registry: ExtensionRegistry | None = None
+        self._generation = 0
 
     def init(self, skills_dir: str, *, manifest_roots: list[str] | None = None) -> None:
         """Load skills from disk and restore disabled state from config."""
@@ -167,6 +168,12 @@ class SkillManager:
         for skill in self._skills:
             if skill.name in self._disabled:
                 skill.enabled = False
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever skills are (re)loaded, enabled or disabled."""
+        return self._generation
 
     def get_active_skills(self, available_tools: list[str]) -> list[Skill]:
         """Return enabled skills whose tool requirements are met."""
@@ -238,6 +245,7 @@ class SkillManager:
             return False
         skill.enabled = True
         self._disabled.discard(name)
+        self._generation += 1
         self._save_config()
         return True
 
@@ -248,6 +256,7 @@ class SkillManager:
             return False
         skill.enabled = False
         self._disabled.add(name)
+        self._generation += 1
         self._save_config()
         return True
 
@@ -1,6 +1,5 @@
 """Approval wrappers for high-risk tool invocations."""
 
-import asyncio
 from typing import Any
 
 from smolagents import Tool
@@ -10,10 +9,11 @@ from src.approval.repository import approval_repository, fingerprint_tool_call
 from src.approval.runtime import get_current_approval_mode, get_current_session_id
 from src.audit.formatting import format_tool_call_summary, redact_for_audit
 from src.tools.policy import get_tool_approval_behavior, get_tool_risk_level
+from src.utils.async_bridge import run_coroutine_sync
 
 
 def _run_async(coro):
-    return asyncio.run(coro)
+    return run_coroutine_sync(coro)
 
 
 def _tool_approval_context(tool: Tool, arguments: dict[str, Any]) -> dict[str, Any] | None:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -13,12 +12,13 @@ from src.audit.formatting import format_tool_call_summary, redact_for_audit, sum
 from src.audit.repository import audit_repository
 from src.llm_runtime import get_current_llm_request_id
 from src.tools.policy import get_current_tool_policy_mode, get_tool_risk_level, get_tool_source_context
+from src.utils.async_bridge import run_coroutine_sync
 
 logger = logging.getLogger(__name__)
 
 
 def _run_async(coro):
-    return asyncio.run(coro)
+    return run_coroutine_sync(coro)
 
 
 def _custom_result_payload(tool: Any, arguments: dict[str, Any], result: Any) -> tuple[str, dict[str, Any]] | None:
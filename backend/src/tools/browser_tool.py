@@ -1,6 +1,5 @@
 """Browser automation tool — extracts content from web pages using Playwright."""
 
-import asyncio
 import logging
 from urllib.parse import urlparse
 
@@ -8,6 +7,7 @@ from smolagents import tool
 
 from config.settings import settings
 from src.audit.runtime import log_integration_event_sync
+from src.browser.pool import browser_pool
 from src.security.site_policy import SiteAccessDecision, evaluate_site_access
 
 logger = logging.getLogger(__name__)
@@ -51,65 +51,59 @@ async def _route_guarded_browser_request(route, request) -> None:
     await route.continue_()
 
 
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+
 async def _browse(url: str, action: str) -> str:
-    """Async Playwright browsing implementation."""
-    from playwright.async_api import async_playwright
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-        )
+    """Async Playwright browsing implementation, on a context from the warm browser pool."""
+    async with browser_pool.context(user_agent=_USER_AGENT) as context:
         page = await context.new_page()
         await page.route("**/*", _route_guarded_browser_request)
 
-        try:
-            response = await page.goto(
-                url,
-                wait_until="domcontentloaded",
-                timeout=settings.browser_timeout * 1000,
-            )
-            final_url = getattr(response, "url", None) or page.url
-            final_decision = evaluate_site_access(str(final_url), resolve_dns=True)
-            if not final_decision.allowed:
-                raise PermissionError(_blocked_site_message(final_decision))
-            # Wait a bit for dynamic content
-            await page.wait_for_timeout(1000)
-
-            if action == "screenshot":
-                screenshot = await page.screenshot(type="png")
-                import base64
-                encoded = base64.b64encode(screenshot).decode("utf-8")
-                return f"Screenshot captured ({len(screenshot)} bytes). Base64 data: {encoded}"
-
-            elif action == "html":
-                html = await page.content()
-                if len(html) > 50000:
-                    html = html[:50000] + "\n... (truncated)"
-                return html
-
-            else:  # "extract" — default
-                # Remove script/style tags, get text content
-                text = await page.evaluate("""() => {
-                    const scripts = document.querySelectorAll('script, style, nav, footer, header');
-                    scripts.forEach(el => el.remove());
-                    return document.body.innerText;
-                }""")
-                if len(text) > 20000:
-                    text = text[:20000] + "\n... (truncated)"
-                return text if text.strip() else "(page had no readable text content)"
-
-        finally:
-            await browser.close()
+        response = await page.goto(
+            url,
+            wait_until="domcontentloaded",
+            timeout=settings.browser_timeout * 1000,
+        )
+        final_url = getattr(response, "url", None) or page.url
+        final_decision = evaluate_site_access(str(final_url), resolve_dns=True)
+        if not final_decision.allowed:
+            raise PermissionError(_blocked_site_message(final_decision))
+        # Wait a bit for dynamic content
+        await page.wait_for_timeout(1000)
+
+        if action == "screenshot":
+            screenshot = await page.screenshot(type="png")
+            import base64
+            encoded = base64.b64encode(screenshot).decode("utf-8")
+            return f"Screenshot captured ({len(screenshot)} bytes). Base64 data: {encoded}"
+
+        elif action == "html":
+            html = await page.content()
+            if len(html) > 50000:
+                html = html[:50000] + "\n... (truncated)"
+            return html
+
+        else:  # "extract" — default
+            # Remove script/style tags, get text content
+            text = await page.evaluate("""() => {
+                const scripts = document.querySelectorAll('script, style, nav, footer, header');
+                scripts.forEach(el => el.remove());
+                return document.body.innerText;
+            }""")
+            if len(text) > 20000:
+                text = text[:20000] + "\n... (truncated)"
+            return text if text.strip() else "(page had no readable text content)"
 
 
 def _run_browse_sync(url: str, action: str) -> str:
-    """Bridge the async browser implementation into the thread pool."""
-    return asyncio.run(_browse(url, action))
+    """Run the async browser implementation on the browser pool's loop."""
+    # Navigation has its own browser_timeout; this backstops hung launches or page scripts.
+    return browser_pool.run(_browse(url, action), timeout_seconds=settings.browser_timeout * 2)
 
 
 @tool
@@ -152,9 +146,7 @@ def browse_webpage(url: str, action: str = "extract") -> str:
         PlaywrightTimeoutError = TimeoutError
 
     try:
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            result = pool.submit(_run_browse_sync, url, action).result()
+        result = _run_browse_sync(url, action)
         log_integration_event_sync(
             integration_type="browser",
             name="playwright",
@@ -1,20 +1,18 @@
-import asyncio
-import concurrent.futures
 from typing import Optional
 
 from smolagents import tool
 
 from src.goals.repository import goal_repository
+from src.utils.async_bridge import run_coroutine_sync
 
 
 def _run(coro):
     """Run an async coroutine from sync context (for smolagents tools).
 
-    Always uses a thread pool to avoid creating nested event loops
-    that could conflict with the main FastAPI/SQLite event loop.
+    Submits to the shared bridge loop so calls never nest inside the main
+    FastAPI/SQLite event loop.
     """
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(asyncio.run, coro).result()
+    return run_coroutine_sync(coro)
 
 
 @tool
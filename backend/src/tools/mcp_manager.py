@@ -5,29 +5,43 @@ their tools for use by the smolagents ToolCallingAgent.
 
 Server configuration loaded from mcp-servers.json at startup. Servers can be
 added/removed/toggled at runtime via the MCP API endpoints.
+
+Startup and reload never wait on the network: enabled servers are connected in
+parallel on a small thread pool, each with its own handshake deadline, and
+their tools appear as soon as each one answers. Failed connections are retried
+in the background with exponential backoff. Tool schemas from the last
+successful handshake are cached next to the config so a server's tools stay
+visible to the agent while it is still connecting.
 """
 
-import asyncio
-import concurrent.futures
 import hashlib
 import json
 import logging
 import os
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse
 
 from smolagents import MCPClient
 
+from config.settings import settings
 from src.audit.formatting import redact_for_audit
 from src.audit.runtime import log_integration_event_sync
 from src.security.site_policy import evaluate_site_access
+from src.utils.async_bridge import run_coroutine_sync
 from src.vault.repository import vault_repository
 
 logger = logging.getLogger(__name__)
 
 _ENV_VAR_RE = re.compile(r"\$\{(\w+)\}")
 _VAULT_SECRET_RE = re.compile(r"\$\{vault:([A-Za-z0-9_.:-]+)\}")
+_TOOL_CACHE_FILENAME = "mcp-tool-cache.json"
+# Statuses after which a server will not come up without operator action.
+_TERMINAL_STATUSES = {"auth_required", "blocked"}
 
 
 class _InstrumentedMCPTool:
@@ -68,6 +82,46 @@ class _InstrumentedMCPTool:
         return self.wrapped_tool(*args, sanitize_inputs_outputs=sanitize_inputs_outputs, **kwargs)
 
 
+class _CachedMCPTool:
+    """Stand-in for an MCP tool rebuilt from the schema cached at the last handshake.
+
+    Keeps a connecting server's tools on the agent's tool surface. Calls are
+    forwarded to the live tool once the server is connected and fail with a
+    clear message until then.
+    """
+
+    seraph_cached_schema = True
+
+    def __init__(self, manager: "MCPManager", *, server_name: str, schema: dict) -> None:
+        self._manager = manager
+        self.server_name = server_name
+        self.name = str(schema.get("name") or "mcp_tool")
+        description = schema.get("description")
+        self.description = description if isinstance(description, str) else ""
+        inputs = schema.get("inputs")
+        self.inputs = inputs if isinstance(inputs, dict) else {}
+        output_type = schema.get("output_type")
+        self.output_type = output_type if isinstance(output_type, str) else "string"
+        output_schema = schema.get("output_schema")
+        self.output_schema = output_schema if isinstance(output_schema, dict) else None
+        self.is_initialized = True
+
+    def _live_tool(self):
+        tool = self._manager._live_tool(self.server_name, self.name)
+        if tool is None:
+            raise RuntimeError(
+                f"MCP server '{self.server_name}' is still connecting; "
+                f"'{self.name}' will be available once it is connected."
+            )
+        return tool
+
+    def forward(self, *args, **kwargs):
+        return self._live_tool()(*args, **kwargs)
+
+    def __call__(self, *args, sanitize_inputs_outputs: bool = False, **kwargs):
+        return self._live_tool()(*args, sanitize_inputs_outputs=sanitize_inputs_outputs, **kwargs)
+
+
 class MCPManager:
     """Connects to multiple named MCP servers and provides their tools."""
 
@@ -77,12 +131,30 @@ class MCPManager:
         self._config_path: str | None = None
         self._config: dict[str, dict] = {}
         self._status: dict[str, dict] = {}
-        # Each: {"status": "connected"|"disconnected"|"auth_required"|"error", "error": str|None}
+        # Each: {"status": "connected"|"connecting"|"disconnected"|"auth_required"|"blocked"|"error", "error": str|None}
+        self._generation = 0
+        # Background connection state. Every connection attempt gets a fresh id
+        # per server; a finishing attempt only commits while its id is current,
+        # so disconnects and config changes supersede in-flight handshakes.
+        self._lock = threading.RLock()
+        self._attempt_ids: dict[str, int] = {}
+        self._pending: dict[str, Future] = {}
+        self._retry_timers: dict[str, threading.Timer] = {}
+        self._failures: dict[str, int] = {}
+        self._cached_servers: set[str] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._tool_cache_lock = threading.Lock()
 
     # --- Config loading ---
 
     def load_config(self, config_path: str) -> None:
-        """Load MCP server config from JSON file and connect enabled servers."""
+        """Load MCP server config from JSON and start connecting enabled servers.
+
+        Returns without waiting for any handshake; see ``connect_in_background``.
+        Calling it again reloads the file: removed or disabled servers are
+        disconnected, servers whose endpoint changed are reconnected, and
+        unchanged live connections are kept.
+        """
         path = Path(config_path)
         self._config_path = config_path
         if not path.exists():
@@ -90,12 +162,27 @@ class MCPManager:
             return
         with open(path) as f:
             data = json.load(f)
-        for name, server in data.get("mcpServers", {}).items():
+        servers = data.get("mcpServers", {})
+        for name in list(self._config):
+            if name not in servers:
+                if self._is_active(name):
+                    self.disconnect(name)
+                del self._config[name]
+        cached_tools = self._read_tool_cache()
+        for name, server in servers.items():
+            previous = self._config.get(name)
             self._config[name] = server
             if not server.get("enabled", True):
                 logger.info("MCP server '%s' disabled — skipping", name)
+                if self._is_active(name):
+                    self.disconnect(name)
                 continue
-            self.connect(name, server["url"], headers=server.get("headers"))
+            if self._is_active(name) and previous is not None and _endpoint(previous) == _endpoint(server):
+                continue
+            if name in self._clients:
+                self.disconnect(name)
+            self._restore_cached_tools(name, server, cached_tools.get(name))
+            self.connect_in_background(name, server["url"], headers=server.get("headers"))
 
     def _save_config(self) -> None:
         """Write current config back to the JSON file."""
@@ -280,8 +367,7 @@ class MCPManager:
     @staticmethod
     def _run_async(coro):
         """Run an async coroutine from sync context, even under an active event loop."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            return pool.submit(asyncio.run, coro).result()
+        return run_coroutine_sync(coro)
 
     @staticmethod
     def _flatten_exception_text(exc: BaseException) -> str:
@@ -396,13 +482,22 @@ class MCPManager:
         digest = hashlib.sha1(name.strip().encode("utf-8")).hexdigest()[:10]
         return f"mcp.server.{normalized or 'default'}.{digest}.bearer_token"
 
-    def connect(self, name: str, url: str, headers: dict[str, str] | None = None) -> None:
-        """Connect to a named MCP server via HTTP/SSE. Fails gracefully."""
+    def connect(
+        self,
+        name: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        *,
+        _attempt: int | None = None,
+    ) -> None:
+        """Connect to a named MCP server via HTTP/SSE, blocking until it answers. Fails gracefully."""
+        attempt = self._begin_attempt(name) if _attempt is None else _attempt
         try:
             endpoint_issues = self.endpoint_policy_issues(url)
             if endpoint_issues:
                 msg = " ".join(endpoint_issues)
-                self._status[name] = {"status": "blocked", "error": msg}
+                if not self._set_status(name, attempt, "blocked", msg):
+                    return
                 logger.warning("MCP server '%s' blocked by endpoint policy: %s", name, msg)
                 log_integration_event_sync(
                     integration_type="mcp_server",
@@ -423,7 +518,8 @@ class MCPManager:
                 missing_details.append(f"Missing vault secrets: {', '.join(missing_vault_keys)}")
             if missing_details:
                 msg = "; ".join(missing_details)
-                self._status[name] = {"status": "auth_required", "error": msg}
+                if not self._set_status(name, attempt, "auth_required", msg):
+                    return
                 logger.warning("MCP server '%s' requires auth: %s", name, msg)
                 log_integration_event_sync(
                     integration_type="mcp_server",
@@ -442,7 +538,11 @@ class MCPManager:
             params: dict = {"url": url, "transport": "streamable-http"}
             if resolved_headers:
                 params["headers"] = resolved_headers
-            client = MCPClient(params, structured_output=False)
+            client_kwargs: dict = {"structured_output": False}
+            if settings.mcp_connect_timeout_seconds > 0:
+                # Per-server deadline for the handshake, enforced by the MCP adapter.
+                client_kwargs["adapter_kwargs"] = {"connect_timeout": settings.mcp_connect_timeout_seconds}
+            client = MCPClient(params, **client_kwargs)
             source_context = self._build_source_context(
                 name=name,
                 url=url,
@@ -466,14 +566,26 @@ class MCPManager:
                 credential_sources=credential_sources,
                 used_headers=bool(resolved_headers),
             )
+            raw_tools = client.get_tools()
             tools = [
                 self._instrument_mcp_tool(tool, source_context)
-                for tool in client.get_tools()
+                for tool in raw_tools
             ]
-            self._clients[name] = client
-            self._tools[name] = tools
-            self._status[name] = {"status": "connected", "error": None}
+            with self._lock:
+                superseded = self._attempt_ids.get(name) != attempt
+                if not superseded:
+                    self._clients[name] = client
+                    self._tools[name] = tools
+                    self._cached_servers.discard(name)
+                    self._failures.pop(name, None)
+                    self._generation += 1
+                    self._status[name] = {"status": "connected", "error": None}
+            if superseded:
+                # Disconnected or reconfigured while the handshake was running.
+                self._close_client(name, client)
+                return
             logger.info("Connected to MCP server '%s': %d tools loaded", name, len(tools))
+            self._remember_tool_schemas(name, url, source_context, raw_tools)
             log_integration_event_sync(
                 integration_type="mcp_server",
                 name=name,
@@ -488,7 +600,8 @@ class MCPManager:
         except BaseException as exc:
             exc_str = self._flatten_exception_text(exc)
             if any(kw in exc_str for kw in ("401", "403", "unauthorized", "forbidden")):
-                self._status[name] = {"status": "auth_required", "error": str(exc)}
+                if not self._set_status(name, attempt, "auth_required", str(exc)):
+                    return
                 logger.warning("MCP server '%s' auth failed: %s", name, exc)
                 log_integration_event_sync(
                     integration_type="mcp_server",
@@ -500,8 +613,15 @@ class MCPManager:
                     },
                 )
             else:
-                self._status[name] = {"status": "error", "error": str(exc)}
-                logger.warning("Failed to connect to MCP server '%s' at %s", name, url, exc_info=True)
+                if not self._set_status(name, attempt, "error", str(exc)):
+                    return
+                logger.warning(
+                    "Failed to connect to MCP server '%s' at %s",
+                    name,
+                    url,
+                    # Background retries repeat the same failure; keep the traceback to the first one.
+                    exc_info=name not in self._failures,
+                )
                 log_integration_event_sync(
                     integration_type="mcp_server",
                     name=name,
@@ -512,16 +632,124 @@ class MCPManager:
                     },
                 )
 
+    def connect_in_background(self, name: str, url: str, headers: dict[str, str] | None = None) -> None:
+        """Start connecting a named MCP server on the connection pool and return immediately.
+
+        The server reports ``connecting`` until its handshake finishes; a
+        failure other than missing auth or a policy block is retried with
+        exponential backoff.
+        """
+        with self._lock:
+            attempt = self._begin_attempt(name)
+            self._status[name] = {"status": "connecting", "error": None}
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.mcp_connect_max_concurrency),
+                    thread_name_prefix="mcp-connect",
+                )
+            self._pending[name] = self._executor.submit(self._run_attempt, name, url, headers, attempt)
+
+    def wait_for_pending(self, timeout_seconds: float | None = None) -> bool:
+        """Block until in-flight background connections finish; ``False`` on timeout.
+
+        Scheduled reconnects are not waited for.
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+        if not pending:
+            return True
+        _done, not_done = wait_for_futures(pending, timeout=timeout_seconds)
+        return not not_done
+
+    def _run_attempt(self, name: str, url: str, headers: dict[str, str] | None, attempt: int) -> None:
+        try:
+            self.connect(name, url, headers=headers, _attempt=attempt)
+        finally:
+            with self._lock:
+                if self._attempt_ids.get(name) == attempt:
+                    self._pending.pop(name, None)
+                    if self._status.get(name, {}).get("status") == "error":
+                        retrying = self._schedule_retry(name, attempt)
+                        if not retrying or self._cached_tools_expired(name):
+                            self._drop_cached_tools(name)
+
+    def _cached_tools_expired(self, name: str) -> bool:
+        """Whether ``name`` has failed often enough that its cached stand-ins should leave the agent surface."""
+        failures = self._failures.get(name, 0)
+        if failures >= max(1, settings.mcp_cached_tools_max_failures):
+            return True
+        retry_in = self._status.get(name, {}).get("retry_in_seconds", 0)
+        return retry_in >= max(settings.mcp_reconnect_initial_seconds, settings.mcp_reconnect_max_seconds)
+
+    def _schedule_retry(self, name: str, attempt: int) -> bool:
+        initial = settings.mcp_reconnect_initial_seconds
+        if initial <= 0:
+            return False
+        failures = self._failures.get(name, 0) + 1
+        self._failures[name] = failures
+        delay = min(initial * 2 ** (failures - 1), max(initial, settings.mcp_reconnect_max_seconds))
+        timer = threading.Timer(delay, self._retry, args=(name, attempt))
+        timer.daemon = True
+        self._retry_timers[name] = timer
+        timer.start()
+        self._status[name]["retry_in_seconds"] = delay
+        logger.info("Retrying MCP server '%s' in %.1fs (failure %d)", name, delay, failures)
+        return True
+
+    def _retry(self, name: str, attempt: int) -> None:
+        with self._lock:
+            if self._attempt_ids.get(name) != attempt:
+                return
+            self._retry_timers.pop(name, None)
+            server = self._config.get(name)
+            if not server or not server.get("enabled", True):
+                return
+            self.connect_in_background(name, server["url"], headers=server.get("headers"))
+
+    def _begin_attempt(self, name: str) -> int:
+        """Supersede any in-flight or scheduled attempt for ``name`` and return a new attempt id."""
+        with self._lock:
+            attempt = self._attempt_ids.get(name, 0) + 1
+            self._attempt_ids[name] = attempt
+            self._pending.pop(name, None)
+            timer = self._retry_timers.pop(name, None)
+            if timer is not None:
+                timer.cancel()
+            return attempt
+
+    def _set_status(self, name: str, attempt: int, status: str, error: str | None) -> bool:
+        """Record ``status`` for ``attempt``; ``False`` if a newer attempt has superseded it."""
+        with self._lock:
+            if self._attempt_ids.get(name) != attempt:
+                return False
+            self._status[name] = {"status": status, "error": error}
+            if status in _TERMINAL_STATUSES:
+                self._drop_cached_tools(name)
+            return True
+
+    def _is_active(self, name: str) -> bool:
+        """True if ``name`` is connected, connecting, or waiting to retry."""
+        return name in self._clients or name in self._pending or name in self._retry_timers
+
+    @staticmethod
+    def _close_client(name: str, client: MCPClient) -> None:
+        try:
+            client.disconnect()
+        except Exception:
+            logger.warning("Error disconnecting MCP client '%s'", name, exc_info=True)
+
     def disconnect(self, name: str) -> None:
         """Disconnect a specific named MCP server."""
-        client = self._clients.pop(name, None)
-        self._tools.pop(name, None)
-        self._status[name] = {"status": "disconnected", "error": None}
+        with self._lock:
+            self._begin_attempt(name)
+            self._failures.pop(name, None)
+            self._cached_servers.discard(name)
+            client = self._clients.pop(name, None)
+            if self._tools.pop(name, None) is not None:
+                self._generation += 1
+            self._status[name] = {"status": "disconnected", "error": None}
         if client:
-            try:
-                client.disconnect()
-            except Exception:
-                logger.warning("Error disconnecting MCP client '%s'", name, exc_info=True)
+            self._close_client(name, client)
         log_integration_event_sync(
             integration_type="mcp_server",
             name=name,
@@ -530,17 +758,136 @@ class MCPManager:
         )
 
     def disconnect_all(self) -> None:
-        """Disconnect all MCP servers."""
+        """Disconnect all MCP servers and stop any background connection work."""
+        with self._lock:
+            for name in list(self._pending) + list(self._retry_timers):
+                self._begin_attempt(name)
+                if name not in self._clients:
+                    self._status[name] = {"status": "disconnected", "error": None}
+            for name in list(self._cached_servers):
+                self._drop_cached_tools(name)
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         for name in list(self._clients):
             self.disconnect(name)
 
+    # --- Cached tool schemas ---
+
+    def _tool_cache_path(self) -> Path | None:
+        if not self._config_path or not settings.mcp_tool_schema_cache_enabled:
+            return None
+        return Path(self._config_path).with_name(_TOOL_CACHE_FILENAME)
+
+    def _read_tool_cache(self) -> dict[str, dict]:
+        path = self._tool_cache_path()
+        if path is None or not path.exists():
+            return {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable MCP tool cache at %s", path, exc_info=True)
+            return {}
+        servers = data.get("servers") if isinstance(data, dict) else None
+        return servers if isinstance(servers, dict) else {}
+
+    def _write_tool_cache(self, update) -> None:
+        path = self._tool_cache_path()
+        if path is None:
+            return
+        with self._tool_cache_lock:
+            servers = self._read_tool_cache()
+            update(servers)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f".{path.name}.tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump({"servers": servers}, f, indent=2, default=str)
+                    f.write("\n")
+                os.replace(tmp_path, path)
+            except OSError:
+                logger.warning("Failed to write MCP tool cache at %s", path, exc_info=True)
+
+    def _remember_tool_schemas(
+        self,
+        name: str,
+        url: str,
+        source_context: dict[str, object],
+        tools: list,
+    ) -> None:
+        schemas = [schema for schema in (_tool_schema(tool) for tool in tools) if schema is not None]
+
+        def _update(servers: dict[str, dict]) -> None:
+            servers[name] = {
+                "url": url,
+                "cached_at": datetime.now(timezone.utc).isoformat(),
+                "source_context": dict(source_context),
+                "tools": schemas,
+            }
+
+        self._write_tool_cache(_update)
+
+    def _forget_tool_schemas(self, name: str) -> None:
+        self._write_tool_cache(lambda servers: servers.pop(name, None))
+
+    def _restore_cached_tools(self, name: str, server: dict, entry: dict | None) -> None:
+        """Expose tools cached for ``name`` until its live connection replaces them."""
+        if not isinstance(entry, dict) or entry.get("url") != server.get("url"):
+            return
+        schemas = entry.get("tools")
+        if not isinstance(schemas, list) or not schemas:
+            return
+        source_context = entry.get("source_context")
+        source_context = dict(source_context) if isinstance(source_context, dict) else self._build_source_context(
+            name=name,
+            url=str(server.get("url") or ""),
+        )
+        source_context["cached_schema"] = True
+        tools = [
+            self._instrument_mcp_tool(_CachedMCPTool(self, server_name=name, schema=schema), source_context)
+            for schema in schemas
+            if isinstance(schema, dict) and schema.get("name")
+        ]
+        with self._lock:
+            if name in self._clients or not tools:
+                return
+            self._tools[name] = tools
+            self._cached_servers.add(name)
+            self._generation += 1
+        logger.info("Using %d cached tool schemas for MCP server '%s' while it connects", len(tools), name)
+
+    def _drop_cached_tools(self, name: str) -> None:
+        with self._lock:
+            if name not in self._cached_servers:
+                return
+            self._cached_servers.discard(name)
+            if self._tools.pop(name, None) is not None:
+                self._generation += 1
+
+    def _live_tool(self, server_name: str, tool_name: str):
+        """Return the connected tool ``tool_name`` of ``server_name``, if it is live."""
+        with self._lock:
+            if server_name not in self._clients or server_name in self._cached_servers:
+                return None
+            for tool in self._tools.get(server_name, []):
+                if getattr(tool, "name", None) == tool_name:
+                    return tool
+        return None
+
     # --- Tool access ---
 
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the set of connected MCP tools changes."""
+        return self._generation
+
     def get_tools(self) -> list:
         """Return a flat list of tools from all connected servers."""
         tools: list = []
-        for server_tools in self._tools.values():
-            tools.extend(server_tools)
+        with self._lock:
+            for server_tools in self._tools.values():
+                tools.extend(server_tools)
         return tools
 
     def get_server_tools(self, name: str) -> list:
@@ -571,6 +918,8 @@ class MCPManager:
                 "description": server.get("description", ""),
                 "status": status_info["status"],
                 "status_message": status_info.get("error"),
+                "retry_in_seconds": status_info.get("retry_in_seconds"),
+                "tools_cached": name in self._cached_servers,
                 "has_headers": "headers" in server,
                 "auth_hint": server.get("auth_hint", ""),
                 "extension_id": server.get("extension_id"),
@@ -584,7 +933,7 @@ class MCPManager:
     # --- Token management ---
 
     def set_token(self, name: str, token: str) -> bool:
-        """Set auth token for a server. Reconnects if enabled. Returns False if not found."""
+        """Set auth token for a server. Reconnects in the background if enabled. Returns False if not found."""
         if name not in self._config:
             return False
         server = self._config[name]
@@ -600,7 +949,7 @@ class MCPManager:
         self._save_config()
         if server.get("enabled", True):
             self.disconnect(name)
-            self.connect(name, server["url"], headers=server.get("headers"))
+            self.connect_in_background(name, server["url"], headers=server.get("headers"))
         log_integration_event_sync(
             integration_type="mcp_server",
             name=name,
@@ -624,7 +973,7 @@ class MCPManager:
                    extension_reference: str | None = None,
                    extension_display_name: str | None = None,
                    source: str | None = None) -> None:
-        """Add a new server to config and optionally connect it."""
+        """Add a new server to config and optionally start connecting it in the background."""
         self._raise_for_endpoint_policy(url)
         self._config[name] = {
             "url": url,
@@ -644,7 +993,7 @@ class MCPManager:
         if source:
             self._config[name]["source"] = source
         if enabled:
-            self.connect(name, url, headers=headers)
+            self.connect_in_background(name, url, headers=headers)
         self._save_config()
 
     def update_server(self, name: str, **kwargs) -> bool:
@@ -668,7 +1017,7 @@ class MCPManager:
         if "enabled" in kwargs:
             server["enabled"] = kwargs["enabled"]
             if kwargs["enabled"] and not was_enabled:
-                self.connect(name, server["url"], headers=server.get("headers"))
+                self.connect_in_background(name, server["url"], headers=server.get("headers"))
                 reconnected_from_toggle = True
             elif not kwargs["enabled"] and was_enabled:
                 self.disconnect(name)
@@ -714,7 +1063,7 @@ class MCPManager:
         )
         if reconnect_required:
             self.disconnect(name)
-            self.connect(name, server["url"], headers=server.get("headers"))
+            self.connect_in_background(name, server["url"], headers=server.get("headers"))
 
         self._save_config()
         return True
@@ -726,7 +1075,31 @@ class MCPManager:
         self.disconnect(name)
         del self._config[name]
         self._save_config()
+        self._forget_tool_schemas(name)
         return True
 
 
+def _endpoint(server: dict) -> tuple[object, object]:
+    """The parts of a server entry that require a reconnect when they change."""
+    return server.get("url"), server.get("headers")
+
+
+def _tool_schema(tool: object) -> dict | None:
+    """JSON-safe schema of a connected MCP tool for the tool cache."""
+    name = getattr(tool, "name", None)
+    if not isinstance(name, str) or not name:
+        return None
+    description = getattr(tool, "description", "")
+    inputs = getattr(tool, "inputs", {})
+    output_type = getattr(tool, "output_type", "string")
+    output_schema = getattr(tool, "output_schema", None)
+    return {
+        "name": name,
+        "description": description if isinstance(description, str) else "",
+        "inputs": inputs if isinstance(inputs, dict) else {},
+        "output_type": output_type if isinstance(output_type, str) else "string",
+        "output_schema": output_schema if isinstance(output_schema, dict) else None,
+    }
+
+
 mcp_manager = MCPManager()
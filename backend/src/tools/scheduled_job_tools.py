@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import concurrent.futures
 import logging
 from typing import Any
 
@@ -12,13 +10,13 @@ from smolagents import Tool, tool
 from src.approval.runtime import get_current_session_id
 from src.scheduler.engine import get_scheduler, sync_scheduled_jobs_blocking
 from src.scheduler.scheduled_jobs import scheduled_job_repository
+from src.utils.async_bridge import run_coroutine_sync
 
 logger = logging.getLogger(__name__)
 
 
 def _run(coro):
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(asyncio.run, coro).result()
+    return run_coroutine_sync(coro)
 
 
 def _parse_urgency(raw_value: Any) -> int:
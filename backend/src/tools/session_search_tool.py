@@ -1,17 +1,14 @@
 """Hermes-style search across prior session history."""
 
-import asyncio
-import concurrent.futures
-
 from smolagents import tool
 
 from src.approval.runtime import get_current_session_id
 from src.agent.session import session_manager
+from src.utils.async_bridge import run_coroutine_sync
 
 
 def _run(coro):
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(asyncio.run, coro).result()
+    return run_coroutine_sync(coro)
 
 
 @tool
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import concurrent.futures
 import contextvars
 from typing import Any
 
@@ -11,6 +9,7 @@ from smolagents import Tool
 
 from src.approval.runtime import get_current_session_id
 from src.agent.session import session_manager
+from src.utils.async_bridge import run_coroutine_sync
 
 _todo_audit_payload: contextvars.ContextVar[tuple[str, dict[str, Any]] | None] = contextvars.ContextVar(
     "todo_audit_payload",
@@ -210,8 +209,7 @@ class TodoTool(Tool):
 
 
 def _run(coro):
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(asyncio.run, coro).result()
+    return run_coroutine_sync(coro)
 
 
 todo = TodoTool()
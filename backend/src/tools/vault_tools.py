@@ -1,5 +1,3 @@
-import asyncio
-import concurrent.futures
 import logging
 
 from smolagents import tool
@@ -8,14 +6,14 @@ from src.approval.runtime import get_current_session_id
 from src.audit.repository import audit_repository
 from src.tools.policy import get_current_tool_policy_mode, get_tool_risk_level
 from src.vault.repository import vault_repository
+from src.utils.async_bridge import run_coroutine_sync
 
 logger = logging.getLogger(__name__)
 
 
 def _run(coro):
     """Run an async coroutine from sync context (for smolagents tools)."""
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(asyncio.run, coro).result()
+    return run_coroutine_sync(coro)
 
 
 def _log_secret_event(
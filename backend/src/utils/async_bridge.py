@@ -0,0 +1,175 @@
+"""Long-lived background event loop for running coroutines from sync tool code.
+
+smolagents tools execute synchronously, but approval checks, audit writes,
+durable workflow state and vault lookups are async. Rather than spinning up a
+fresh event loop (and fresh DB connections) per call with ``asyncio.run``,
+sync callers submit coroutines to one daemon loop thread that stays up for the
+life of the process, so pooled aiosqlite connections stay bound to a live loop
+and are reused across tool calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import threading
+from typing import Any, Coroutine, TypeVar
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncBridge:
+    """Run coroutines on a shared background loop and block for their result."""
+
+    def __init__(self, *, name: str = "async_bridge") -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._submitted = 0
+        self._timeouts = 0
+        self._fallbacks = 0
+
+    def run(self, coro: Coroutine[Any, Any, T], *, timeout_seconds: float | None = None) -> T:
+        """Run ``coro`` on the bridge loop with the caller's context and return its result.
+
+        Raises ``TimeoutError`` (after cancelling the coroutine) when it does not
+        finish within ``timeout_seconds``; defaults to ``sync_bridge_timeout_seconds``.
+        """
+        if threading.current_thread() is self._thread:
+            # A coroutine on the bridge loop re-entered sync code; blocking here
+            # would deadlock the loop, so run this call on a throwaway loop.
+            return self._run_isolated(coro)
+
+        loop = self._ensure_loop()
+        context = contextvars.copy_context()
+        result: concurrent.futures.Future = concurrent.futures.Future()
+        task_holder: dict[str, asyncio.Task] = {}
+
+        def _start() -> None:
+            if not result.set_running_or_notify_cancel():
+                coro.close()
+                return
+            task = loop.create_task(coro, context=context)
+            task_holder["task"] = task
+
+            def _done(finished: asyncio.Task) -> None:
+                if finished.cancelled():
+                    result.cancel()
+                    return
+                exc = finished.exception()
+                if exc is not None:
+                    result.set_exception(exc)
+                else:
+                    result.set_result(finished.result())
+
+            task.add_done_callback(_done)
+
+        with self._lock:
+            self._submitted += 1
+        loop.call_soon_threadsafe(_start)
+
+        timeout = timeout_seconds if timeout_seconds is not None else settings.sync_bridge_timeout_seconds
+        try:
+            return result.result(timeout=timeout if timeout and timeout > 0 else None)
+        except concurrent.futures.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+
+            def _cancel() -> None:
+                task = task_holder.get("task")
+                if task is not None:
+                    task.cancel()
+
+            loop.call_soon_threadsafe(_cancel)
+            raise TimeoutError(f"{self._name} call timed out after {timeout}s") from None
+
+    def shutdown(self, *, timeout_seconds: float = 5.0) -> None:
+        """Drain tracked tasks on the bridge loop, then stop and join its thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+
+        from src.utils.background import drain_tracked_tasks
+
+        drain = asyncio.run_coroutine_threadsafe(
+            drain_tracked_tasks(timeout_seconds=timeout_seconds),
+            loop,
+        )
+        try:
+            drain.result(timeout=timeout_seconds * 3)
+        except Exception:
+            logger.warning("%s: draining tracked tasks during shutdown failed", self._name, exc_info=True)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout_seconds)
+        if thread.is_alive():
+            logger.error("%s: loop thread did not stop within %.1fs", self._name, timeout_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "submitted": self._submitted,
+                "timeouts": self._timeouts,
+                "fallbacks": self._fallbacks,
+            }
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._thread is not None and self._thread.is_alive():
+                return self._loop
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+            thread = threading.Thread(
+                target=self._serve,
+                args=(loop, started),
+                name=self._name,
+                daemon=True,
+            )
+            self._loop = loop
+            self._thread = thread
+            thread.start()
+        started.wait()
+        return loop
+
+    def _serve(self, loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def _run_isolated(self, coro: Coroutine[Any, Any, T]) -> T:
+        with self._lock:
+            self._fallbacks += 1
+        context = contextvars.copy_context()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(context.run, asyncio.run, coro).result()
+
+
+async_bridge = AsyncBridge()
+
+
+def run_coroutine_sync(coro: Coroutine[Any, Any, T], *, timeout_seconds: float | None = None) -> T:
+    """Run ``coro`` to completion from sync code via the shared bridge loop."""
+    return async_bridge.run(coro, timeout_seconds=timeout_seconds)
+
+
+def shutdown_async_bridge(*, timeout_seconds: float = 5.0) -> None:
+    async_bridge.shutdown(timeout_seconds=timeout_seconds)
@@ -2,11 +2,18 @@
 
 import asyncio
 import logging
-from typing import Coroutine
+from typing import Awaitable, Callable, Coroutine
 
 logger = logging.getLogger(__name__)
 
 _tasks: set[asyncio.Task] = set()
+_drain_hooks: list[Callable[[], Awaitable[object]]] = []
+
+
+def register_drain_hook(hook: Callable[[], Awaitable[object]]) -> None:
+    """Run ``hook`` at the start of every drain, e.g. to flush in-process buffers."""
+    if hook not in _drain_hooks:
+        _drain_hooks.append(hook)
 
 
 def track_task(coro: Coroutine, name: str = "background") -> asyncio.Task:
@@ -30,10 +37,19 @@ async def drain_tracked_tasks(*, timeout_seconds: float | None = None) -> None:
     """Wait for tracked tasks on the current loop before tearing shared state down."""
     loop = asyncio.get_running_loop()
 
+    for hook in tuple(_drain_hooks):
+        try:
+            await hook()
+        except Exception:
+            logger.warning("Drain hook %r failed", hook, exc_info=True)
+
+    # A tracked task that drains (e.g. an eval scenario inside a background
+    # benchmark run) must not wait on itself.
+    current = asyncio.current_task()
     while True:
         pending = [
             task for task in tuple(_tasks)
-            if task.get_loop() is loop and not task.done()
+            if task.get_loop() is loop and not task.done() and task is not current
         ]
         if not pending:
             return
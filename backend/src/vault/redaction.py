@@ -2,6 +2,7 @@
 
 import logging
 import re
+from typing import Iterable
 
 from src.vault.repository import vault_repository
 
@@ -13,20 +14,52 @@ async def redact_secrets_in_text(text: str) -> str:
     """Replace known secret values with a generic redaction marker."""
     if not text:
         return text
+    redact = await load_secret_redactor()
+    return redact(text)
 
+
+async def load_secret_redactor() -> "SecretRedactor":
+    """Return a sync redactor bound to the current vault secrets.
+
+    Use this when many fragments of one response are redacted (streamed
+    answers), so the vault is read once instead of once per fragment. If the
+    vault cannot be read, text is returned unchanged.
+    """
     try:
         secret_pairs = await vault_repository.list_secret_values()
     except Exception:
         logger.warning("Vault redaction lookup failed; returning original text", exc_info=True)
-        return text
+        secret_pairs = []
+    return SecretRedactor(secret_value for _, secret_value in secret_pairs or ())
 
-    if not secret_pairs:
-        return text
 
-    redacted = text
-    # Replace longer secrets first to avoid partial matches masking the full value.
-    for _, secret_value in sorted(secret_pairs, key=lambda item: len(item[1]), reverse=True):
-        if len(secret_value) < _MIN_SECRET_LENGTH:
-            continue
-        redacted = re.sub(re.escape(secret_value), "[redacted secret]", redacted)
-    return redacted
+class SecretRedactor:
+    """Replace a fixed set of secret values; callable like ``redact(text)``."""
+
+    def __init__(self, secret_values: Iterable[str]):
+        # Replace longer secrets first to avoid partial matches masking the full value.
+        self._secrets = sorted(
+            (secret_value for secret_value in secret_values if len(secret_value) >= _MIN_SECRET_LENGTH),
+            key=len,
+            reverse=True,
+        )
+
+    def __call__(self, text: str) -> str:
+        redacted = text
+        for secret_value in self._secrets:
+            redacted = re.sub(re.escape(secret_value), "[redacted secret]", redacted)
+        return redacted
+
+    def pending_prefix_length(self, text: str) -> int:
+        """Length of the longest tail of ``text`` that is the start of a secret but not all of it.
+
+        Streaming callers hold that tail back: once more text arrives it
+        either completes the secret (and is redacted) or stops matching.
+        """
+        longest = 0
+        for secret_value in self._secrets:
+            for size in range(min(len(secret_value) - 1, len(text)), longest, -1):
+                if text.endswith(secret_value[:size]):
+                    longest = size
+                    break
+        return longest
@@ -16,9 +16,12 @@ from typing import Any
 
 from sqlmodel import col, select
 
+from config.settings import settings
 from src.db.engine import get_session
 from src.db.models import WorkflowArtifactReview, WorkflowRunState, WorkflowStepState
 from src.db.session_refs import ensure_sessions_exist
+from src.utils.background import register_drain_hook
+from src.workflows.step_journal import WorkflowStepJournal
 
 
 DURABLE_WORKFLOW_ENGINE_SUITE_NAME = "durable_workflow_engine_v1"
@@ -395,6 +398,14 @@ def durable_workflow_snapshot_dict(run: dict[str, Any]) -> dict[str, Any]:
 
 
 class WorkflowStateRepository:
+    def __init__(self) -> None:
+        self.step_journal = WorkflowStepJournal(
+            writer=self._write_step_transitions,
+            batch_size=settings.workflow_state_batch_size,
+            commit_delay_seconds=settings.workflow_state_commit_delay_ms / 1000,
+            max_run_failures=settings.workflow_state_max_run_failures,
+        )
+
     def _serialize_run(self, run: WorkflowRunState, steps: list[WorkflowStepState] | None = None) -> dict[str, Any]:
         step_records = [
             self._serialize_step(step)
@@ -520,37 +531,21 @@ class WorkflowStateRepository:
         step_index: int,
         tool_name: str,
         arguments: dict[str, Any],
-    ) -> dict[str, Any]:
-        now = _utc_now()
-        async with get_session() as db:
-            existing = (
-                await db.execute(
-                    select(WorkflowStepState)
-                    .where(WorkflowStepState.run_identity == run_identity)
-                    .where(WorkflowStepState.step_id == step_id)
-                )
-            ).scalars().first()
-            step = existing or WorkflowStepState(
-                run_identity=run_identity,
-                workflow_name=workflow_name,
-                step_id=step_id,
-                step_index=step_index,
-                tool_name=tool_name,
-            )
-            step.status = "running"
-            step.arguments_json = _dumps(arguments)
-            step.updated_at = now
-            if existing is None:
-                db.add(step)
-            run = (
-                await db.execute(select(WorkflowRunState).where(WorkflowRunState.run_identity == run_identity))
-            ).scalars().first()
-            if run is not None:
-                run.heartbeat_at = now
-                run.updated_at = now
-            await db.flush()
-            db.expunge(step)
-            return self._serialize_step(step)
+        defer: bool = False,
+    ) -> dict[str, Any] | None:
+        """Record a step start; with ``defer`` it is committed by the step journal later."""
+        return await self._record_step_transition(
+            {
+                "run_identity": run_identity,
+                "step_id": step_id,
+                "workflow_name": workflow_name,
+                "step_index": step_index,
+                "tool_name": tool_name,
+                "at": _utc_now(),
+                "fields": {"status": "running", "arguments_json": _dumps(arguments)},
+            },
+            defer=defer,
+        )
 
     async def record_step_completed(
         self,
@@ -564,45 +559,86 @@ class WorkflowStateRepository:
         checkpoint: dict[str, Any] | None = None,
         error_kind: str | None = None,
         error_summary: str | None = None,
-    ) -> dict[str, Any]:
+        defer: bool = False,
+    ) -> dict[str, Any] | None:
+        """Record a step outcome; with ``defer`` it is committed by the step journal later."""
         now = _utc_now()
+        return await self._record_step_transition(
+            {
+                "run_identity": run_identity,
+                "step_id": step_id,
+                "at": now,
+                "fields": {
+                    "status": status,
+                    "result_json": _dumps(result) if result is not None else None,
+                    "result_summary": result_summary,
+                    "artifact_paths_json": _dumps(artifact_paths or []),
+                    "checkpoint_json": _dumps(checkpoint) if checkpoint is not None else None,
+                    "error_kind": error_kind,
+                    "error_summary": error_summary,
+                    "completed_at": now,
+                },
+            },
+            defer=defer,
+        )
+
+    async def flush_step_journal(self) -> None:
+        """Commit deferred step transitions so subsequent reads observe them."""
+        await self.step_journal.flush()
+
+    async def _record_step_transition(self, transition: dict[str, Any], *, defer: bool) -> dict[str, Any] | None:
+        steps = await self.step_journal.append(transition, defer=defer)
+        if not steps:
+            return None
+        return steps.get((transition["run_identity"], transition["step_id"]))
+
+    async def _write_step_transitions(
+        self,
+        transitions: list[dict[str, Any]],
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Apply journaled step transitions, in order, in a single transaction."""
         async with get_session() as db:
-            step = (
+            steps: dict[tuple[str, str], WorkflowStepState] = {}
+            heartbeats: dict[str, datetime] = {}
+            for transition in transitions:
+                key = (transition["run_identity"], transition["step_id"])
+                step = steps.get(key)
+                if step is None:
+                    step = (
+                        await db.execute(
+                            select(WorkflowStepState)
+                            .where(WorkflowStepState.run_identity == key[0])
+                            .where(WorkflowStepState.step_id == key[1])
+                        )
+                    ).scalars().first()
+                    if step is None:
+                        step = WorkflowStepState(
+                            run_identity=key[0],
+                            workflow_name=transition.get("workflow_name") or "",
+                            step_id=key[1],
+                            step_index=transition.get("step_index") or 0,
+                            tool_name=transition.get("tool_name") or "unknown",
+                        )
+                        db.add(step)
+                    steps[key] = step
+                for field, value in transition["fields"].items():
+                    setattr(step, field, value)
+                step.updated_at = transition["at"]
+                heartbeats[key[0]] = transition["at"]
+            runs = (
                 await db.execute(
-                    select(WorkflowStepState)
-                    .where(WorkflowStepState.run_identity == run_identity)
-                    .where(WorkflowStepState.step_id == step_id)
-                )
-            ).scalars().first()
-            if step is None:
-                step = WorkflowStepState(
-                    run_identity=run_identity,
-                    workflow_name="",
-                    step_id=step_id,
-                    step_index=0,
-                    tool_name="unknown",
+                    select(WorkflowRunState).where(col(WorkflowRunState.run_identity).in_(list(heartbeats)))
                 )
-                db.add(step)
-            step.status = status
-            step.result_json = _dumps(result) if result is not None else None
-            step.result_summary = result_summary
-            step.artifact_paths_json = _dumps(artifact_paths or [])
-            step.checkpoint_json = _dumps(checkpoint) if checkpoint is not None else None
-            step.error_kind = error_kind
-            step.error_summary = error_summary
-            step.completed_at = now
-            step.updated_at = now
-            run = (
-                await db.execute(select(WorkflowRunState).where(WorkflowRunState.run_identity == run_identity))
-            ).scalars().first()
-            if run is not None:
-                run.heartbeat_at = now
-                run.updated_at = now
+            ).scalars().all()
+            for run in runs:
+                run.heartbeat_at = heartbeats[run.run_identity]
+                run.updated_at = heartbeats[run.run_identity]
             await db.flush()
-            db.expunge(step)
-            return self._serialize_step(step)
+            for step in steps.values():
+                db.expunge(step)
+            return {key: self._serialize_step(step) for key, step in steps.items()}
 
-    async def record_step_failed(self, **kwargs: Any) -> dict[str, Any]:
+    async def record_step_failed(self, **kwargs: Any) -> dict[str, Any] | None:
         kwargs.setdefault("status", "failed")
         return await self.record_step_completed(**kwargs)
 
@@ -618,6 +654,8 @@ class WorkflowStateRepository:
         error: str | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any] | None:
+        # Deferred step transitions must land before the run reports its outcome.
+        await self.step_journal.flush(run_identity=run_identity)
         now = _utc_now()
         async with get_session() as db:
             run = (
@@ -1518,6 +1556,7 @@ class WorkflowStateRepository:
 
 
 workflow_state_repository = WorkflowStateRepository()
+register_drain_hook(workflow_state_repository.flush_step_journal)
 
 
 def _canonical_state_id(prefix: str, payload: Any) -> str:
@@ -42,6 +42,7 @@ class WorkflowStep:
     arguments: dict[str, Any] = field(default_factory=dict)
     id: str = ""
     continue_on_error: bool = False
+    depends_on: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -158,12 +159,30 @@ def parse_workflow_content(
         if not isinstance(arguments, dict):
             _record_workflow_error(errors, path=path, message=f"Workflow file {path} step {idx} has invalid 'arguments'")
             return None
+        depends_on = step_raw.get("depends_on", [])
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        if not isinstance(depends_on, list) or not all(isinstance(item, str) for item in depends_on):
+            _record_workflow_error(errors, path=path, message=f"Workflow file {path} step {idx} has invalid 'depends_on'")
+            return None
+        unknown_dependencies = [item for item in depends_on if item not in seen_ids or item == step_id]
+        if unknown_dependencies:
+            _record_workflow_error(
+                errors,
+                path=path,
+                message=(
+                    f"Workflow file {path} step {idx} depends on unknown or later steps: "
+                    f"{', '.join(unknown_dependencies)}"
+                ),
+            )
+            return None
         parsed_steps.append(
             WorkflowStep(
                 tool=tool,
                 arguments=arguments,
                 id=step_id,
                 continue_on_error=bool(step_raw.get("continue_on_error", False)),
+                depends_on=list(dict.fromkeys(depends_on)),
             )
         )
 
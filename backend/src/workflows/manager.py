@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
-import asyncio
+import concurrent.futures
+import contextvars
 from datetime import datetime, timezone
+import functools
 import json
 import logging
 import os
 import re
-import threading
 import time
 from typing import Any
 
 from smolagents import Tool
 from sqlmodel import col, select
 
+from config.settings import settings
+
 from src.audit.formatting import format_tool_call_summary, redact_for_audit
 from src.approval.runtime import get_current_session_id
 from src.db.engine import get_session
@@ -26,8 +29,9 @@ from src.extensions.state import extension_state_entries, load_extension_state_p
 from src.memory.flush import flush_session_memory_sync
 from src.approval.repository import fingerprint_tool_call
 from src.native_tools.registry import TOOL_METADATA, canonical_tool_name
-from src.tools.policy import get_tool_source_context, tool_accepts_secret_refs
-from src.workflows.loader import Workflow, scan_workflow_paths
+from src.tools.policy import get_tool_risk_level, get_tool_source_context, tool_accepts_secret_refs
+from src.utils.async_bridge import run_coroutine_sync
+from src.workflows.loader import Workflow, WorkflowStep, sanitize_workflow_name, scan_workflow_paths
 from src.workflows.durable_state import workflow_state_repository
 from src.workflows.run_identity import build_workflow_run_identity, parse_workflow_run_identity
 
@@ -62,30 +66,16 @@ _WORKFLOW_CONTROL_INPUTS: dict[str, dict[str, Any]] = {
     },
 }
 _WORKFLOW_CONTROL_FIELD_NAMES = set(_WORKFLOW_CONTROL_INPUTS)
+# (result, failure) audit payloads of each WorkflowTool's latest call in this
+# context, keyed by id(tool). Cached tool instances are shared across turns, so
+# the payloads must not live on the instance.
+_WORKFLOW_AUDIT_PAYLOADS: contextvars.ContextVar[
+    dict[int, tuple[tuple[str, dict[str, Any]] | None, tuple[str, dict[str, Any]] | None]]
+] = contextvars.ContextVar("workflow_audit_payloads", default={})
 
 
 def _run_async(coro):
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
-
-    result: dict[str, Any] = {}
-
-    def runner() -> None:
-        try:
-            result["value"] = asyncio.run(coro)
-        except BaseException as exc:
-            result["error"] = exc
-
-    thread = threading.Thread(target=runner, daemon=True)
-    thread.start()
-    thread.join()
-    if "error" in result:
-        raise result["error"]
-    if "value" in result:
-        return result["value"]
-    return None
+    return run_coroutine_sync(coro)
 
 def _run_durable_state_write(coro) -> Any | None:
     try:
@@ -843,6 +833,119 @@ def _approval_context_for_workflow(
     }
 
 
+def _template_step_references(value: Any) -> tuple[set[str], bool]:
+    """Return step ids referenced as ``{{ steps.<id> }}`` and whether ``{{ last_result }}`` is used."""
+    step_ids: set[str] = set()
+    uses_last_result = False
+    if isinstance(value, str):
+        for template_match in _TEMPLATE_RE.finditer(value):
+            parts = [part.strip() for part in template_match.group(1).split(".") if part.strip()]
+            if len(parts) > 1 and parts[0] == "steps":
+                step_ids.add(parts[1])
+            elif parts and parts[0] == "last_result":
+                uses_last_result = True
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            nested_ids, nested_last = _template_step_references(item)
+            step_ids |= nested_ids
+            uses_last_result = uses_last_result or nested_last
+    elif isinstance(value, dict):
+        return _template_step_references(list(value.values()))
+    return step_ids, uses_last_result
+
+
+def _workflow_step_dependencies(workflow: Workflow, canonical_step_tools: list[str]) -> list[set[int]]:
+    """Indexes of the earlier steps each step must wait for.
+
+    Dependencies come from ``{{ steps.<id> }}`` / ``{{ last_result }}``
+    references and explicit ``depends_on``. Steps whose tool is not low-risk
+    (writes, execution, MCP, nested workflows) may have side effects that later
+    steps rely on without referencing them, so every step waits for the latest
+    such barrier before it, and (unless it declares ``depends_on``) a
+    side-effecting step also waits for every step before it.
+    """
+    positions = {step.id: index for index, step in enumerate(workflow.steps)}
+    dependencies: list[set[int]] = []
+    last_barrier: int | None = None
+    for index, step in enumerate(workflow.steps):
+        referenced, uses_last_result = _template_step_references(step.arguments)
+        required = {
+            positions[step_id]
+            for step_id in (*referenced, *step.depends_on)
+            if step_id in positions and positions[step_id] < index
+        }
+        if uses_last_result and index > 0:
+            required.add(index - 1)
+        side_effecting = get_tool_risk_level(canonical_step_tools[index]) != "low"
+        if last_barrier is not None:
+            required.add(last_barrier)
+        if side_effecting and not step.depends_on:
+            required.update(range(index))
+        if side_effecting:
+            last_barrier = index
+        dependencies.append(required)
+    return dependencies
+
+
+def _has_parallel_steps(dependencies: list[set[int]], *, start_index: int) -> bool:
+    ancestors: list[set[int]] = []
+    for required in dependencies:
+        closure = set(required)
+        for dependency in required:
+            closure |= ancestors[dependency]
+        ancestors.append(closure)
+    return any(
+        index - 1 not in ancestors[index]
+        for index in range(start_index + 1, len(dependencies))
+    )
+
+
+def _insert_step_record(step_records: list[dict[str, Any]], record: dict[str, Any]) -> None:
+    """Keep step records in workflow order even when steps finish out of order."""
+    step_records.append(record)
+    step_records.sort(key=lambda item: int(item.get("index") or 0))
+
+
+def _argument_keys(arguments: Any) -> list[str]:
+    return sorted(str(key) for key in arguments.keys()) if isinstance(arguments, dict) else []
+
+
+def _record_failed_step(
+    step_records: list[dict[str, Any]],
+    step: WorkflowStep,
+    launch: dict[str, Any],
+    exc: Exception,
+    *,
+    durable_run_identity: str,
+) -> None:
+    safe_error_summary = _safe_workflow_error_summary(exc)
+    _insert_step_record(step_records, {
+        "id": step.id,
+        "index": launch["index"] + 1,
+        "tool": launch["tool_name"],
+        "status": "failed",
+        "argument_keys": _argument_keys(launch["arguments"]),
+        "artifact_paths": launch["artifact_paths"],
+        "result_summary": None,
+        "error_kind": type(exc).__name__,
+        "error_summary": safe_error_summary,
+        "started_at": launch["started_at"],
+        "completed_at": _utc_now_iso(),
+        "duration_ms": int((time.perf_counter() - launch["started"]) * 1000),
+    })
+    _run_durable_state_write(workflow_state_repository.record_step_failed(
+        run_identity=durable_run_identity,
+        step_id=step.id,
+        status="failed",
+        result=None,
+        result_summary=None,
+        artifact_paths=launch["artifact_paths"],
+        checkpoint=None,
+        error_kind=type(exc).__name__,
+        error_summary=safe_error_summary,
+    ))
+
+
 class WorkflowTool(Tool):
     """Dynamic Tool wrapper that executes a reusable workflow definition."""
 
@@ -865,15 +968,12 @@ class WorkflowTool(Tool):
         self.inputs.update(_WORKFLOW_CONTROL_INPUTS)
         self.output_type = "string"
         self.is_initialized = True
-        self._last_audit_payload: tuple[str, dict[str, Any]] | None = None
-        self._last_audit_failure_payload: tuple[str, dict[str, Any]] | None = None
 
     def forward(self, *args, **kwargs):
         return self.__call__(*args, **kwargs)
 
     def __call__(self, *args, sanitize_inputs_outputs: bool = False, **kwargs):
-        self._last_audit_payload = None
-        self._last_audit_failure_payload = None
+        self._record_audit_payloads()
         workflow_inputs, control_inputs = self._normalize_inputs(args, kwargs)
         audit_arguments = {**workflow_inputs, **control_inputs}
         approval_context = self.get_approval_context(workflow_inputs)
@@ -927,7 +1027,7 @@ class WorkflowTool(Tool):
                 )
             except Exception as exc:
                 safe_error_summary = _safe_workflow_error_summary(exc)
-                self._last_audit_failure_payload = self._build_audit_payload(
+                self._record_audit_payloads(failure=self._build_audit_payload(
                     status="failed",
                     run_fingerprint=run_fingerprint,
                     approval_context=approval_context,
@@ -941,7 +1041,7 @@ class WorkflowTool(Tool):
                     control_inputs=control_inputs,
                     error=safe_error_summary,
                     durable_run_identity=durable_run_identity,
-                )
+                ))
                 durable_audit_receipt_id = _durable_audit_receipt_id(durable_run_identity, "failed")
                 _run_durable_state_write(workflow_state_repository.finish_run(
                     run_identity=durable_run_identity,
@@ -967,169 +1067,190 @@ class WorkflowTool(Tool):
                 if path not in artifact_paths:
                     artifact_paths.append(path)
 
-        for index, (step, canonical_step_tool) in enumerate(zip(self.workflow.steps, canonical_step_tools, strict=False)):
-            if index < start_index:
-                continue
-            tool = self.tools_by_name.get(step.tool)
-            if tool is None:
-                tool = self.tools_by_name.get(canonical_step_tool)
-            if tool is None:
-                raise RuntimeError(
-                    f"Workflow '{self.workflow.name}' requires unavailable tool '{step.tool}'"
-                )
-            rendered_arguments = _render_value(step.arguments, context)
-            _run_required_durable_state_write(workflow_state_repository.record_step_started(
-                run_identity=durable_run_identity,
-                workflow_name=self.workflow.name,
-                step_id=step.id,
-                step_index=len(step_records) + 1,
-                tool_name=canonical_step_tool,
-                arguments=_durable_arguments(rendered_arguments, checkpoint_context_allowed=checkpoint_context_allowed),
-            ), phase=f"step_start:{step.id}")
-            step_artifact_paths = _collect_artifact_paths(rendered_arguments)
-            step_status = "succeeded"
-            error_kind: str | None = None
-            error_summary: str | None = None
-            step_started_at = _utc_now_iso()
-            started = time.perf_counter()
-            try:
-                result = tool(
-                    **rendered_arguments,
-                    sanitize_inputs_outputs=sanitize_inputs_outputs,
-                )
-            except Exception as exc:
-                safe_error_summary = _safe_workflow_error_summary(exc)
-                step_completed_at = _utc_now_iso()
-                duration_ms = int((time.perf_counter() - started) * 1000)
-                if not step.continue_on_error:
-                    step_records.append({
+        steps = self.workflow.steps
+        dependencies = _workflow_step_dependencies(self.workflow, canonical_step_tools)
+        max_concurrency = max(1, int(settings.workflow_step_max_concurrency))
+        executor: concurrent.futures.ThreadPoolExecutor | None = None
+        if max_concurrency > 1 and _has_parallel_steps(dependencies, start_index=start_index):
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_concurrency,
+                thread_name_prefix=f"workflow-{sanitize_workflow_name(self.workflow.name)[:24]}",
+            )
+        running: dict[concurrent.futures.Future, dict[str, Any]] = {}
+        completed_indexes: set[int] = set(range(start_index))
+        failures: list[tuple[dict[str, Any], Exception]] = []
+        next_index = start_index
+        try:
+            while True:
+                # Steps are issued in workflow order as soon as their dependencies
+                # are done, so every step before a failed one has been started and
+                # will finish; resume-from-step checkpoints stay complete.
+                while (
+                    not failures
+                    and next_index < len(steps)
+                    and len(running) < max_concurrency
+                    and dependencies[next_index] <= completed_indexes
+                ):
+                    try:
+                        launch = self._start_step(
+                            next_index,
+                            canonical_step_tools=canonical_step_tools,
+                            context=context,
+                            durable_run_identity=durable_run_identity,
+                            checkpoint_context_allowed=checkpoint_context_allowed,
+                        )
+                    except Exception as exc:
+                        # An unavailable tool or failed required write fails the
+                        # step like its tool raising would: stop launching and
+                        # drain what is already running.
+                        launch = {
+                            "index": next_index,
+                            "tool_name": canonical_step_tools[next_index],
+                            "arguments": {},
+                            "artifact_paths": [],
+                            "started_at": _utc_now_iso(),
+                            "started": time.perf_counter(),
+                        }
+                        _record_failed_step(
+                            step_records,
+                            steps[next_index],
+                            launch,
+                            exc,
+                            durable_run_identity=durable_run_identity,
+                        )
+                        failures.append((launch, exc))
+                        break
+                    running[self._submit_step(executor, launch, sanitize_inputs_outputs)] = launch
+                    next_index += 1
+                if not running:
+                    break
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in sorted(done, key=lambda item: running[item]["index"]):
+                    launch = running.pop(future)
+                    step = steps[launch["index"]]
+                    step_status = "succeeded"
+                    error_kind: str | None = None
+                    error_summary: str | None = None
+                    exc = future.exception()
+                    step_completed_at = _utc_now_iso()
+                    duration_ms = int((time.perf_counter() - launch["started"]) * 1000)
+                    if exc is not None:
+                        if not isinstance(exc, Exception):
+                            raise exc
+                        if not step.continue_on_error:
+                            _record_failed_step(
+                                step_records,
+                                step,
+                                launch,
+                                exc,
+                                durable_run_identity=durable_run_identity,
+                            )
+                            failures.append((launch, exc))
+                            continue
+                        safe_error_summary = _safe_workflow_error_summary(exc)
+                        result = f"Error: {safe_error_summary}"
+                        continued_error_steps.append(step.id)
+                        step_status = "continued_error"
+                        error_kind = type(exc).__name__
+                        error_summary = safe_error_summary
+                    else:
+                        result = future.result()
+                    context["steps"][step.id] = {
+                        "tool": launch["tool_name"],
+                        "arguments": launch["arguments"],
+                        "result": result,
+                    }
+                    checkpoint_context[step.id] = _json_safe_value(context["steps"][step.id])
+                    for path in launch["artifact_paths"]:
+                        if path not in artifact_paths:
+                            artifact_paths.append(path)
+                    _insert_step_record(step_records, {
                         "id": step.id,
-                        "index": len(step_records) + 1,
-                        "tool": canonical_step_tool,
-                        "status": "failed",
-                        "argument_keys": (
-                            sorted(str(key) for key in rendered_arguments.keys())
-                            if isinstance(rendered_arguments, dict)
-                            else []
-                        ),
-                        "artifact_paths": step_artifact_paths,
-                        "result_summary": None,
-                        "error_kind": type(exc).__name__,
-                        "error_summary": safe_error_summary,
-                        "started_at": step_started_at,
+                        "index": launch["index"] + 1,
+                        "tool": launch["tool_name"],
+                        "status": step_status,
+                        "argument_keys": _argument_keys(launch["arguments"]),
+                        "artifact_paths": launch["artifact_paths"],
+                        "result_summary": _summarize_value_shape(result),
+                        "error_kind": error_kind,
+                        "error_summary": error_summary,
+                        "started_at": launch["started_at"],
                         "completed_at": step_completed_at,
                         "duration_ms": duration_ms,
                     })
-                    _run_durable_state_write(workflow_state_repository.record_step_failed(
+                    _run_durable_state_write(workflow_state_repository.record_step_completed(
                         run_identity=durable_run_identity,
                         step_id=step.id,
-                        status="failed",
-                        result=None,
-                        result_summary=None,
-                        artifact_paths=step_artifact_paths,
-                        checkpoint=None,
-                        error_kind=type(exc).__name__,
-                        error_summary=safe_error_summary,
-                    ))
-                    self._last_audit_failure_payload = self._build_audit_payload(
-                        status="failed",
-                        run_fingerprint=run_fingerprint,
-                        approval_context=approval_context,
-                        canonical_step_tools=canonical_step_tools,
-                        step_records=step_records,
-                        artifact_paths=artifact_paths,
-                        continued_error_steps=continued_error_steps,
-                        canvas_output=None,
-                        checkpoint_context=checkpoint_context,
-                        checkpoint_context_allowed=checkpoint_context_allowed,
-                        control_inputs=control_inputs,
-                        error=safe_error_summary,
-                        durable_run_identity=durable_run_identity,
-                    )
-                    durable_audit_receipt_id = _durable_audit_receipt_id(durable_run_identity, "failed")
-                    _run_durable_state_write(workflow_state_repository.finish_run(
-                        run_identity=durable_run_identity,
-                        status="failed",
-                        checkpoint_context=checkpoint_context if checkpoint_context_allowed else {},
-                        artifact_paths=artifact_paths,
-                        continued_error_steps=continued_error_steps,
-                        last_completed_step_id=next(
-                            (
-                                str(record["id"])
-                                for record in reversed(step_records)
-                                if record.get("id") and str(record.get("status") or "") not in {"failed", "continued_error"}
-                            ),
-                            None,
+                        status=step_status,
+                        result=_durable_result(result, checkpoint_context_allowed=checkpoint_context_allowed),
+                        result_summary=_summarize_value_shape(result),
+                        artifact_paths=launch["artifact_paths"],
+                        checkpoint=_durable_checkpoint(
+                            context["steps"][step.id],
+                            checkpoint_context_allowed=checkpoint_context_allowed,
                         ),
-                        error=safe_error_summary,
-                        metadata={
-                            "summary": f"{self.name} failed",
-                            "durable_audit_receipt_id": durable_audit_receipt_id,
-                            "content_redacted": True,
-                        },
+                        error_kind=error_kind,
+                        error_summary=error_summary,
+                        defer=True,
                     ))
-                    _record_delegated_artifact_reviews(
-                        run_identity=durable_run_identity,
-                        root_run_identity=root_run_identity,
-                        parent_run_identity=parent_run_identity,
-                        workflow_name=self.workflow.name,
-                        approval_context=approval_context,
-                        artifact_paths=artifact_paths,
-                        durable_audit_receipt_id=durable_audit_receipt_id,
-                    )
-                    raise
-                result = f"Error: {safe_error_summary}"
-                continued_error_steps.append(step.id)
-                step_status = "continued_error"
-                error_kind = type(exc).__name__
-                error_summary = safe_error_summary
-                step_completed_at = _utc_now_iso()
-                duration_ms = int((time.perf_counter() - started) * 1000)
-            else:
-                step_completed_at = _utc_now_iso()
-                duration_ms = int((time.perf_counter() - started) * 1000)
-            context["steps"][step.id] = {
-                "tool": canonical_step_tool,
-                "arguments": rendered_arguments,
-                "result": result,
-            }
-            context["last_result"] = result
-            checkpoint_context[step.id] = _json_safe_value(context["steps"][step.id])
-            for path in step_artifact_paths:
-                if path not in artifact_paths:
-                    artifact_paths.append(path)
-            step_records.append({
-                "id": step.id,
-                "index": len(step_records) + 1,
-                "tool": canonical_step_tool,
-                "status": step_status,
-                "argument_keys": (
-                    sorted(str(key) for key in rendered_arguments.keys())
-                    if isinstance(rendered_arguments, dict)
-                    else []
-                ),
-                "artifact_paths": step_artifact_paths,
-                "result_summary": _summarize_value_shape(result),
-                "error_kind": error_kind,
-                "error_summary": error_summary,
-                "started_at": step_started_at,
-                "completed_at": step_completed_at,
-                "duration_ms": duration_ms,
-            })
-            _run_durable_state_write(workflow_state_repository.record_step_completed(
+                    completed_indexes.add(launch["index"])
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        if steps and steps[-1].id in context["steps"]:
+            context["last_result"] = context["steps"][steps[-1].id]["result"]
+
+        if failures:
+            # Report the earliest failed step in workflow order, as a sequential run would.
+            _, failure = min(failures, key=lambda item: item[0]["index"])
+            safe_error_summary = _safe_workflow_error_summary(failure)
+            self._record_audit_payloads(failure=self._build_audit_payload(
+                status="failed",
+                run_fingerprint=run_fingerprint,
+                approval_context=approval_context,
+                canonical_step_tools=canonical_step_tools,
+                step_records=step_records,
+                artifact_paths=artifact_paths,
+                continued_error_steps=continued_error_steps,
+                canvas_output=None,
+                checkpoint_context=checkpoint_context,
+                checkpoint_context_allowed=checkpoint_context_allowed,
+                control_inputs=control_inputs,
+                error=safe_error_summary,
+                durable_run_identity=durable_run_identity,
+            ))
+            durable_audit_receipt_id = _durable_audit_receipt_id(durable_run_identity, "failed")
+            _run_durable_state_write(workflow_state_repository.finish_run(
                 run_identity=durable_run_identity,
-                step_id=step.id,
-                status=step_status,
-                result=_durable_result(result, checkpoint_context_allowed=checkpoint_context_allowed),
-                result_summary=_summarize_value_shape(result),
-                artifact_paths=step_artifact_paths,
-                checkpoint=_durable_checkpoint(
-                    context["steps"][step.id],
-                    checkpoint_context_allowed=checkpoint_context_allowed,
+                status="failed",
+                checkpoint_context=checkpoint_context if checkpoint_context_allowed else {},
+                artifact_paths=artifact_paths,
+                continued_error_steps=continued_error_steps,
+                last_completed_step_id=next(
+                    (
+                        str(record["id"])
+                        for record in reversed(step_records)
+                        if record.get("id") and str(record.get("status") or "") not in {"failed", "continued_error"}
+                    ),
+                    None,
                 ),
-                error_kind=error_kind,
-                error_summary=error_summary,
+                error=safe_error_summary,
+                metadata={
+                    "summary": f"{self.name} failed",
+                    "durable_audit_receipt_id": durable_audit_receipt_id,
+                    "content_redacted": True,
+                },
             ))
+            _record_delegated_artifact_reviews(
+                run_identity=durable_run_identity,
+                root_run_identity=root_run_identity,
+                parent_run_identity=parent_run_identity,
+                workflow_name=self.workflow.name,
+                approval_context=approval_context,
+                artifact_paths=artifact_paths,
+                durable_audit_receipt_id=durable_audit_receipt_id,
+            )
+            raise failure
 
         result_text = ""
         if self.workflow.result_template:
@@ -1150,7 +1271,7 @@ class WorkflowTool(Tool):
             summary += f" with {len(continued_error_steps)} continued error step"
             if len(continued_error_steps) != 1:
                 summary += "s"
-        self._last_audit_payload = self._build_audit_payload(
+        self._record_audit_payloads(result=self._build_audit_payload(
             status=status,
             run_fingerprint=run_fingerprint,
             approval_context=approval_context,
@@ -1164,7 +1285,7 @@ class WorkflowTool(Tool):
             control_inputs=control_inputs,
             summary=summary,
             durable_run_identity=durable_run_identity,
-        )
+        ))
         durable_audit_receipt_id = _durable_audit_receipt_id(durable_run_identity, status)
         _run_durable_state_write(workflow_state_repository.finish_run(
             run_identity=durable_run_identity,
@@ -1204,19 +1325,97 @@ class WorkflowTool(Tool):
             )
         return result_text
 
+    def _start_step(
+        self,
+        index: int,
+        *,
+        canonical_step_tools: list[str],
+        context: dict[str, Any],
+        durable_run_identity: str,
+        checkpoint_context_allowed: bool,
+    ) -> dict[str, Any]:
+        step = self.workflow.steps[index]
+        canonical_step_tool = canonical_step_tools[index]
+        tool = self.tools_by_name.get(step.tool)
+        if tool is None:
+            tool = self.tools_by_name.get(canonical_step_tool)
+        if tool is None:
+            raise RuntimeError(
+                f"Workflow '{self.workflow.name}' requires unavailable tool '{step.tool}'"
+            )
+        render_context = context
+        if index > 0:
+            # last_result always means the previous step's result, even when
+            # later-listed steps finished first.
+            previous = context["steps"].get(self.workflow.steps[index - 1].id)
+            if previous is not None:
+                render_context = {**context, "last_result": previous["result"]}
+        rendered_arguments = _render_value(step.arguments, render_context)
+        # Read-only steps may start before their state is committed; anything
+        # with side effects waits for the journal (and its own start) to land.
+        _run_required_durable_state_write(workflow_state_repository.record_step_started(
+            run_identity=durable_run_identity,
+            workflow_name=self.workflow.name,
+            step_id=step.id,
+            step_index=index + 1,
+            tool_name=canonical_step_tool,
+            arguments=_durable_arguments(rendered_arguments, checkpoint_context_allowed=checkpoint_context_allowed),
+            defer=get_tool_risk_level(canonical_step_tool) == "low",
+        ), phase=f"step_start:{step.id}")
+        return {
+            "index": index,
+            "tool": tool,
+            "tool_name": canonical_step_tool,
+            "arguments": rendered_arguments,
+            "artifact_paths": _collect_artifact_paths(rendered_arguments),
+            "started_at": _utc_now_iso(),
+            "started": time.perf_counter(),
+        }
+
+    @staticmethod
+    def _submit_step(
+        executor: concurrent.futures.ThreadPoolExecutor | None,
+        launch: dict[str, Any],
+        sanitize_inputs_outputs: bool,
+    ) -> concurrent.futures.Future:
+        call = functools.partial(
+            launch["tool"],
+            **launch["arguments"],
+            sanitize_inputs_outputs=sanitize_inputs_outputs,
+        )
+        if executor is not None:
+            # Each step gets its own copy of the caller's context (session, approvals).
+            return executor.submit(contextvars.copy_context().run, call)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            future.set_result(call())
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
     def get_audit_result_payload(
         self,
         _arguments: dict[str, Any],
         _result: Any,
     ) -> tuple[str, dict[str, Any]] | None:
-        return self._last_audit_payload
+        return _WORKFLOW_AUDIT_PAYLOADS.get().get(id(self), (None, None))[0]
 
     def get_audit_failure_payload(
         self,
         _arguments: dict[str, Any],
         _error: Exception,
     ) -> tuple[str, dict[str, Any]] | None:
-        return self._last_audit_failure_payload
+        return _WORKFLOW_AUDIT_PAYLOADS.get().get(id(self), (None, None))[1]
+
+    def _record_audit_payloads(
+        self,
+        *,
+        result: tuple[str, dict[str, Any]] | None = None,
+        failure: tuple[str, dict[str, Any]] | None = None,
+    ) -> None:
+        # Copy on write: a copied context (parallel step, concurrent turn) must
+        # never see this call's payloads through a shared dict.
+        _WORKFLOW_AUDIT_PAYLOADS.set({**_WORKFLOW_AUDIT_PAYLOADS.get(), id(self): (result, failure)})
 
     def get_audit_call_payload(self, arguments: dict[str, Any]) -> tuple[str, dict[str, Any]]:
         workflow_inputs, control_inputs = self._normalize_provided_inputs(
@@ -1503,6 +1702,7 @@ class WorkflowManager:
         self._config_path: str = ""
         self._disabled: set[str] = set()
         self._registry: ExtensionRegistry | None = None
+        self._generation = 0
 
     def init(self, workflows_dir: str, *, manifest_roots: list[str] | None = None) -> None:
         self._workflows_dir = workflows_dir
@@ -1728,6 +1928,12 @@ class WorkflowManager:
         for workflow in self._workflows:
             if workflow.name in self._disabled:
                 workflow.enabled = False
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever workflows are (re)loaded, enabled or disabled."""
+        return self._generation
 
     def list_workflows(
         self,
@@ -1830,6 +2036,7 @@ class WorkflowManager:
             return False
         workflow.enabled = True
         self._disabled.discard(name)
+        self._generation += 1
         self._save_config()
         return True
 
@@ -1839,6 +2046,7 @@ class WorkflowManager:
             return False
         workflow.enabled = False
         self._disabled.add(name)
+        self._generation += 1
         self._save_config()
         return True
 
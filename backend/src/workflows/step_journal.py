@@ -0,0 +1,198 @@
+"""Write-behind journal that batches durable workflow step transitions."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Awaitable, Callable
+
+from src.utils.background import track_task
+
+logger = logging.getLogger(__name__)
+
+StepTransitionWriter = Callable[[list[dict[str, Any]]], Awaitable[Any]]
+
+
+class WorkflowStepJournal:
+    """Hold step transitions in memory and commit them in ordered batches.
+
+    Deferred transitions are committed by a tracked task on the enqueuing loop
+    once ``commit_delay_seconds`` has elapsed, or inline once ``batch_size`` are
+    pending. :meth:`flush` commits everything pending in one transaction and is
+    what callers use at safety-critical boundaries (side-effecting steps, run
+    finish). Flushes are serialized per event loop, so on any one loop a step's
+    completion is never committed ahead of its start. Unlike the audit buffer
+    nothing is dropped for backpressure; a batch whose write fails is retried
+    one ``run_identity`` at a time, and the runs that still fail are counted,
+    logged and put back at the front of the queue for the next flush. A run
+    that fails ``max_run_failures`` flushes in a row has its pending
+    transitions dropped with a warning so it cannot wedge every other run.
+    """
+
+    def __init__(
+        self,
+        *,
+        writer: StepTransitionWriter,
+        batch_size: int,
+        commit_delay_seconds: float,
+        max_run_failures: int = 3,
+    ) -> None:
+        self._writer = writer
+        self._batch_size = max(1, batch_size)
+        self._commit_delay_seconds = max(0.0, commit_delay_seconds)
+        self._max_run_failures = max(1, max_run_failures)
+        self._pending: list[dict[str, Any]] = []
+        self._run_failures: dict[Any, int] = {}
+        self._lock = threading.Lock()
+        self._flush_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._timers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._enqueued = 0
+        self._committed = 0
+        self._batches = 0
+        self._failed = 0
+        self._dropped = 0
+
+    async def append(self, transition: dict[str, Any], *, defer: bool = True) -> Any:
+        """Queue ``transition``; without ``defer`` commit it (and everything before it) now.
+
+        A non-deferred append returns the writer's result and raises if the
+        write fails. Deferred appends never raise and return ``None``.
+        """
+        with self._lock:
+            self._pending.append(transition)
+            self._enqueued += 1
+            batch_ready = len(self._pending) >= self._batch_size
+        if not defer:
+            return await self.flush(run_identity=transition.get("run_identity"))
+        if batch_ready or self._commit_delay_seconds <= 0:
+            await self._flush_quietly()
+        else:
+            self._schedule_flush()
+        return None
+
+    async def flush(self, *, run_identity: Any = None) -> Any:
+        """Commit every pending transition in one batch. Returns the writer's result.
+
+        Raises the first write failure; with ``run_identity``, only a failure
+        to write that run's transitions.
+        """
+        async with self._flush_lock():
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return None
+            try:
+                result = await self._writer(batch)
+            except Exception as exc:
+                runs: dict[Any, list[dict[str, Any]]] = {}
+                for transition in batch:
+                    runs.setdefault(transition.get("run_identity"), []).append(transition)
+                if len(runs) == 1:
+                    result, failures = None, {next(iter(runs)): exc}
+                else:
+                    result, failures = await self._write_runs_separately(runs)
+                self._requeue_failed(batch, failures)
+                error = failures.get(run_identity) if run_identity is not None else next(iter(failures.values()), None)
+                if error is not None:
+                    raise error
+                return result
+            self._record_committed(batch)
+            return result
+
+    async def _write_runs_separately(
+        self,
+        runs: dict[Any, list[dict[str, Any]]],
+    ) -> tuple[dict[Any, Any], dict[Any, Exception]]:
+        merged: dict[Any, Any] = {}
+        failures: dict[Any, Exception] = {}
+        for run_identity, transitions in runs.items():
+            try:
+                result = await self._writer(transitions)
+            except Exception as exc:
+                failures[run_identity] = exc
+                continue
+            self._record_committed(transitions)
+            if isinstance(result, dict):
+                merged.update(result)
+        return merged, failures
+
+    def _record_committed(self, transitions: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._committed += len(transitions)
+            self._batches += 1
+            for transition in transitions:
+                self._run_failures.pop(transition.get("run_identity"), None)
+
+    def _requeue_failed(self, batch: list[dict[str, Any]], failures: dict[Any, Exception]) -> None:
+        with self._lock:
+            abandoned = set()
+            for run_identity, exc in failures.items():
+                count = self._run_failures.get(run_identity, 0) + 1
+                if count >= self._max_run_failures:
+                    self._run_failures.pop(run_identity, None)
+                    abandoned.add(run_identity)
+                    logger.warning(
+                        "Dropping durable workflow step transitions for run %s after %d failed writes: %s",
+                        run_identity,
+                        count,
+                        exc,
+                    )
+                else:
+                    self._run_failures[run_identity] = count
+            failed = [transition for transition in batch if transition.get("run_identity") in failures]
+            requeued = [transition for transition in failed if transition.get("run_identity") not in abandoned]
+            self._pending[:0] = requeued
+            self._failed += len(failed)
+            self._dropped += len(failed) - len(requeued)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "enqueued": self._enqueued,
+                "committed": self._committed,
+                "batches": self._batches,
+                "failed": self._failed,
+                "dropped": self._dropped,
+            }
+
+    def reset(self) -> None:
+        """Discard pending transitions and counters for tests and deterministic evals."""
+        with self._lock:
+            self._pending.clear()
+            self._run_failures.clear()
+            self._enqueued = 0
+            self._committed = 0
+            self._batches = 0
+            self._failed = 0
+            self._dropped = 0
+
+    def _flush_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = self._flush_locks.get(loop)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._flush_locks[loop] = lock
+        return lock
+
+    def _schedule_flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        timer = self._timers.get(loop)
+        if timer is None or timer.done():
+            self._timers[loop] = track_task(self._flush_later(), name="workflow_state:step_journal")
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._commit_delay_seconds)
+        await self._flush_quietly()
+
+    async def _flush_quietly(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exc:
+            logger.warning("Durable workflow step journal flush failed: %s", exc)
@@ -16,12 +16,25 @@ os.environ.setdefault("OPENROUTER_API_KEY", "test-key")
 os.environ.setdefault("WORKSPACE_DIR", "/tmp/seraph-test")
 
 from config.settings import settings
+from src.agent.factory import _reset_tool_surface_cache
 from src.app import create_app
+from src.audit.repository import audit_repository
+from src.browser.pool import shutdown_browser_pool
 from src.llm_runtime import _reset_target_health
 from src.db.engine import _ensure_search_indexes
+from src.evals.report_store import benchmark_report_store
+from src.extensions.registry import invalidate_extension_registry_cache
+from src.guardian.state import _reset_guardian_state_cache
+from src.memory.decay import _reset_contradiction_check_state
 from src.memory.flush import _reset_memory_flush_state
+from src.memory.providers import invalidate_memory_provider_inventory_cache
 from src.memory.snapshots import _reset_bounded_guardian_snapshot_cache
+from src.observer.sources.calendar_source import _reset_calendar_cache
+from src.observer.sources.git_source import _reset_reflog_tails
+from src.scheduler.connection_manager import ws_manager
+from src.utils.async_bridge import shutdown_async_bridge
 from src.utils.background import drain_tracked_tasks
+from src.workflows.durable_state import workflow_state_repository
 
 # Every place get_session is imported — use the local attribute name.
 _PATCH_TARGETS = [
@@ -137,6 +150,20 @@ def reset_llm_target_health():
     _reset_target_health()
 
 
+@pytest.fixture(autouse=True)
+def reset_runtime_audit_buffer():
+    audit_repository.buffer.reset()
+    yield
+    audit_repository.buffer.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_workflow_step_journal():
+    workflow_state_repository.step_journal.reset()
+    yield
+    workflow_state_repository.step_journal.reset()
+
+
 @pytest.fixture(autouse=True)
 def reset_bounded_snapshot_cache():
     _reset_bounded_guardian_snapshot_cache()
@@ -144,6 +171,71 @@ def reset_bounded_snapshot_cache():
     _reset_bounded_guardian_snapshot_cache()
 
 
+@pytest.fixture(autouse=True)
+def reset_benchmark_report_store():
+    benchmark_report_store.reset()
+    yield
+    benchmark_report_store.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_extension_registry_cache():
+    invalidate_extension_registry_cache()
+    yield
+    invalidate_extension_registry_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_websocket_broadcast_state():
+    ws_manager.reset()
+    yield
+    ws_manager.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_contradiction_check_state():
+    _reset_contradiction_check_state()
+    yield
+    _reset_contradiction_check_state()
+
+
+@pytest.fixture(autouse=True)
+def reset_observer_source_caches():
+    _reset_calendar_cache()
+    _reset_reflog_tails()
+    yield
+    _reset_calendar_cache()
+    _reset_reflog_tails()
+
+
+@pytest.fixture(autouse=True)
+def reset_tool_surface_cache():
+    _reset_tool_surface_cache()
+    yield
+    _reset_tool_surface_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_memory_provider_inventory_cache():
+    invalidate_memory_provider_inventory_cache()
+    yield
+    invalidate_memory_provider_inventory_cache()
+
+
+@pytest.fixture(autouse=True)
+def stop_async_bridge():
+    yield
+    shutdown_browser_pool(timeout_seconds=1.0)
+    shutdown_async_bridge(timeout_seconds=1.0)
+
+
+@pytest.fixture(autouse=True)
+def reset_guardian_state_cache():
+    _reset_guardian_state_cache()
+    yield
+    _reset_guardian_state_cache()
+
+
 @pytest.fixture(autouse=True)
 def reset_memory_flush_cache():
     _reset_memory_flush_state()
@@ -458,6 +458,10 @@ async def test_activity_ledger_summary_counts_full_window_beyond_visible_limit(c
         patch("src.api.activity.guardian_feedback_repository.list_recent", AsyncMock(return_value=[])),
         patch("src.api.activity.audit_repository.list_events", AsyncMock(return_value=[])),
         patch("src.api.activity.list_recent_llm_calls", return_value=llm_entries),
+        patch(
+            "src.api.activity.summarize_llm_usage_by_model",
+            return_value=[{"model": "openrouter/anthropic/claude-sonnet-4", "calls": 6, "cost_usd": 0.006}],
+        ) as summarize_usage,
         patch(
             "src.api.activity.session_manager.list_sessions",
             AsyncMock(return_value=[{"id": "session-1", "title": "Research thread"}]),
@@ -474,6 +478,10 @@ async def test_activity_ledger_summary_counts_full_window_beyond_visible_limit(c
     assert payload["summary"]["llm_call_count"] == 6
     assert payload["summary"]["llm_cost_usd"] == pytest.approx(0.006)
     assert payload["summary"]["user_triggered_llm_calls"] == 6
+    assert payload["summary"]["llm_usage_by_model"] == [
+        {"model": "openrouter/anthropic/claude-sonnet-4", "calls": 6, "cost_usd": 0.006}
+    ]
+    assert summarize_usage.call_args.kwargs["session_id"] == "session-1"
 
 
 @pytest.mark.asyncio
@@ -35,6 +35,29 @@ class TestAgentFactory:
 
         assert "delegate_task" in {tool.name for tool in tools}
 
+    @patch("src.agent.factory.mcp_manager")
+    @patch("src.tools.policy.context_manager.get_context")
+    def test_get_tools_reuses_wrapped_surface_until_an_input_changes(self, mock_context, mock_mcp):
+        mock_context.return_value = CurrentContext(tool_policy_mode="full", mcp_policy_mode="full")
+        mock_mcp.get_tools.return_value = []
+        mock_mcp.generation = 1
+
+        first = get_tools()
+        second = get_tools()
+        assert [id(tool) for tool in first] == [id(tool) for tool in second]
+
+        mock_mcp.generation = 2
+        after_mcp_change = get_tools()
+        assert after_mcp_change[0] is not first[0]
+
+        mock_context.return_value = CurrentContext(tool_policy_mode="safe", mcp_policy_mode="full")
+        safe_tools = get_tools()
+        assert "execute_code" in {tool.name for tool in after_mcp_change}
+        assert "execute_code" not in {tool.name for tool in safe_tools}
+
+        with patch("src.agent.factory.settings.tool_surface_cache_seconds", 0):
+            assert get_tools()[0] is not get_tools()[0]
+
     @patch("src.agent.factory.LiteLLMModel")
     def test_get_model(self, mock_litellm_cls):
         mock_litellm_cls.return_value = MagicMock()
@@ -226,6 +249,41 @@ class TestAgentFactory:
         assert "CURRENT CONTEXT" in call_kwargs["instructions"]
         assert "VS Code" in call_kwargs["instructions"]
 
+    @patch("src.agent.factory.skill_manager")
+    @patch("src.agent.factory.ToolCallingAgent")
+    @patch("src.agent.factory.get_model")
+    def test_create_agent_places_stable_segments_before_volatile_context(
+        self, mock_get_model, mock_agent_cls, mock_skill_mgr
+    ):
+        from src.llm_prompt_cache import VOLATILE_CONTEXT_HEADER
+
+        mock_get_model.return_value = MagicMock()
+        mock_agent_cls.return_value = MagicMock()
+        mock_skill_mgr.get_active_skills.return_value = [
+            Skill(
+                name="test-skill",
+                description="A test skill",
+                instructions="Do the thing.",
+                requires_tools=[],
+                user_invocable=False,
+                enabled=True,
+            )
+        ]
+
+        create_agent(
+            additional_context="User: Hello",
+            soul_context="Name: Ada",
+            memory_context="- likes tea",
+            observer_context="Time: morning",
+        )
+        instructions = mock_agent_cls.call_args[1]["instructions"]
+        boundary = instructions.index(VOLATILE_CONTEXT_HEADER)
+        assert instructions.index("Available Skills") < boundary
+        assert instructions.index("USER IDENTITY") < boundary
+        assert boundary < instructions.index("CURRENT CONTEXT")
+        assert boundary < instructions.index("RELEVANT MEMORIES")
+        assert boundary < instructions.index("CONVERSATION HISTORY")
+
     @patch("src.agent.factory.ToolCallingAgent")
     @patch("src.agent.factory.get_model")
     def test_create_agent_empty_observer_context_omitted(self, mock_get_model, mock_agent_cls):
@@ -0,0 +1,78 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from src.utils.async_bridge import AsyncBridge
+
+_request_marker: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "async_bridge_test_marker",
+    default=None,
+)
+
+
+def test_async_bridge_reuses_one_loop_and_propagates_context():
+    bridge = AsyncBridge(name="test_bridge")
+
+    async def _probe():
+        return asyncio.get_running_loop(), threading.current_thread().name, _request_marker.get()
+
+    token = _request_marker.set("req-1")
+    try:
+        first_loop, thread_name, marker = bridge.run(_probe())
+        second_loop, _, _ = bridge.run(_probe())
+    finally:
+        _request_marker.reset(token)
+        bridge.shutdown(timeout_seconds=1.0)
+
+    assert first_loop is second_loop
+    assert thread_name == "test_bridge"
+    assert marker == "req-1"
+    assert first_loop.is_closed()
+    assert bridge.stats()["submitted"] == 2
+    assert bridge.stats()["running"] is False
+
+
+def test_async_bridge_surfaces_errors_and_cancels_on_timeout():
+    bridge = AsyncBridge(name="test_bridge")
+    cancelled = threading.Event()
+
+    async def _fail():
+        raise ValueError("boom")
+
+    async def _stall():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    try:
+        with pytest.raises(ValueError, match="boom"):
+            bridge.run(_fail())
+        with pytest.raises(TimeoutError):
+            bridge.run(_stall(), timeout_seconds=0.05)
+        assert cancelled.wait(timeout=1.0)
+        assert bridge.stats()["timeouts"] == 1
+    finally:
+        bridge.shutdown(timeout_seconds=1.0)
+
+
+@pytest.mark.asyncio
+async def test_async_bridge_runs_from_inside_a_running_loop_and_on_reentry():
+    bridge = AsyncBridge(name="test_bridge")
+
+    async def _inner():
+        return "inner"
+
+    async def _outer():
+        # Sync code reached from a coroutine on the bridge loop must not deadlock.
+        return bridge.run(_inner())
+
+    try:
+        assert bridge.run(_outer(), timeout_seconds=2.0) == "inner"
+    finally:
+        bridge.shutdown(timeout_seconds=1.0)
+
+    assert bridge.stats()["fallbacks"] == 1
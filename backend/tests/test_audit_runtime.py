@@ -38,3 +38,61 @@ def test_log_background_task_event_sync_persists_without_running_loop(async_db):
     assert events
     assert events[0]["tool_name"] == "nightly-refresh"
     assert events[0]["details"]["source"] == "test"
+
+
+async def test_sync_integration_events_are_batched_into_one_write(async_db):
+    from unittest.mock import patch
+
+    with patch.object(
+        audit_repository,
+        "log_events",
+        wraps=audit_repository.log_events,
+    ) as log_events:
+        for index in range(5):
+            log_integration_event_sync(
+                integration_type="vector_store",
+                name="memories",
+                outcome="succeeded",
+                details={"index": index},
+            )
+        events = await audit_repository.list_events(limit=10)
+
+    assert log_events.await_count == 1
+    assert len(log_events.await_args.args[0]) == 5
+    assert sorted(event["details"]["index"] for event in events) == [0, 1, 2, 3, 4]
+
+
+async def test_audit_buffer_drops_and_counts_events_when_full():
+    from unittest.mock import AsyncMock
+
+    from src.audit.buffer import AuditEventBuffer
+
+    writer = AsyncMock()
+    buffer = AuditEventBuffer(
+        writer=writer,
+        max_pending=2,
+        batch_size=10,
+        flush_interval_seconds=60,
+    )
+
+    accepted = [buffer.enqueue({"event_type": f"e{index}"}) for index in range(4)]
+    assert accepted == [True, True, False, False]
+    assert buffer.stats()["dropped"] == 2
+
+    assert await buffer.drain() == 2
+    writer.assert_awaited_once_with([{"event_type": "e0"}, {"event_type": "e1"}])
+    assert buffer.stats()["written"] == 2
+    assert buffer.stats()["pending"] == 0
+
+
+async def test_isolated_audit_buffer_never_touches_the_live_buffer():
+    live = audit_repository.buffer
+
+    with audit_repository.isolated_buffer() as scoped:
+        assert audit_repository.buffer is scoped
+        audit_repository.enqueue_event(event_type="scenario", summary="scenario event")
+        assert scoped.stats()["pending"] == 1
+
+    assert audit_repository.buffer is live
+    assert scoped.stats()["pending"] == 0
+    assert live.stats()["enqueued"] == 0
@@ -0,0 +1,138 @@
+"""Tests for the materialized benchmark report store."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.evals.report_store import (
+    BenchmarkReportStore,
+    materialized_report_scope,
+    report_materialization_mode,
+    suite_fingerprint,
+)
+from src.utils.background import drain_tracked_tasks
+
+
+def _summary(label: str) -> SimpleNamespace:
+    return SimpleNamespace(label=label, total=1, passed=1, failed=0)
+
+
+def test_materialized_report_scope_sets_and_resets_mode():
+    assert report_materialization_mode() is None
+    with materialized_report_scope():
+        assert report_materialization_mode() == "serve"
+        with materialized_report_scope(refresh=True):
+            assert report_materialization_mode() == "refresh"
+        with materialized_report_scope(warm=True):
+            assert report_materialization_mode() == "warm"
+        assert report_materialization_mode() == "serve"
+    assert report_materialization_mode() is None
+
+
+def test_suite_fingerprint_tracks_resolved_scenarios():
+    base = suite_fingerprint(["suite_a"], ["scenario_1"])
+    assert base == suite_fingerprint(["suite_a"], ["scenario_1"])
+    assert base != suite_fingerprint(["suite_a"], ["scenario_1", "scenario_2"])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_run():
+    store = BenchmarkReportStore()
+    release = asyncio.Event()
+
+    async def _runner(_names):
+        await release.wait()
+        return _summary("fresh")
+
+    runner = AsyncMock(side_effect=_runner)
+    first = asyncio.create_task(store.get(["suite_a"], fingerprint="fp", runner=runner))
+    second = asyncio.create_task(store.get(["suite_a"], fingerprint="fp", runner=runner))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await first).label == (await second).label == "fresh"
+    assert runner.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fingerprint_change_reruns_and_stale_entry_refreshes_in_background():
+    store = BenchmarkReportStore()
+    runner = AsyncMock(side_effect=[_summary("v1"), _summary("v2"), _summary("v3")])
+
+    assert (await store.get(["suite_a"], fingerprint="fp1", runner=runner)).label == "v1"
+    assert (await store.get(["suite_a"], fingerprint="fp1", runner=runner)).label == "v1"
+    assert (await store.get(["suite_a"], fingerprint="fp2", runner=runner)).label == "v2"
+    assert runner.await_count == 2
+
+    with patch("src.evals.report_store.settings.operator_benchmark_report_ttl_minutes", 0):
+        stale = await store.get(["suite_a"], fingerprint="fp2", runner=runner)
+    assert stale.label == "v2"
+    await drain_tracked_tasks(timeout_seconds=1.0)
+
+    assert runner.await_count == 3
+    assert store.stats()["background_refreshes"] == 1
+    [entry] = store.entries()
+    assert entry["suite_names"] == ["suite_a"]
+    assert entry["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_all_reruns_every_stored_suite_set():
+    store = BenchmarkReportStore()
+    runner = AsyncMock(return_value=_summary("run"))
+    await store.get(["suite_a"], fingerprint="a", runner=runner)
+    await store.get(["suite_b"], fingerprint="b", runner=runner)
+
+    assert await store.refresh_all() == 2
+    assert runner.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_background_runner_serves_stale_reruns_refresh_all_and_warmups():
+    store = BenchmarkReportStore()
+    runner = AsyncMock(return_value=_summary("inline"))
+    background_runner = AsyncMock(return_value=_summary("worker"))
+
+    first = await store.get(
+        ["suite_a"], fingerprint="fp", runner=runner, background_runner=background_runner
+    )
+    assert first.label == "inline"
+
+    with patch("src.evals.report_store.settings.operator_benchmark_report_ttl_minutes", 0):
+        await store.get(["suite_a"], fingerprint="fp", runner=runner, background_runner=background_runner)
+    await drain_tracked_tasks(timeout_seconds=1.0)
+    assert await store.refresh_all() == 1
+    warmed = await store.get(
+        ["suite_b"],
+        fingerprint="fp",
+        runner=runner,
+        background_runner=background_runner,
+        background=True,
+    )
+
+    assert warmed.label == "worker"
+    assert runner.await_count == 1
+    assert background_runner.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_refresh_job_skips_without_entries_and_warms_only_on_request():
+    from src.scheduler.jobs.benchmark_report_refresh import run_benchmark_report_refresh
+
+    warm = AsyncMock(return_value=3)
+    with (
+        patch("src.api.operator.warm_operator_benchmark_reports", warm),
+        patch(
+            "src.scheduler.jobs.benchmark_report_refresh.log_scheduler_job_event",
+            AsyncMock(),
+        ) as log_event,
+    ):
+        await run_benchmark_report_refresh()
+        assert warm.await_count == 0
+        assert log_event.await_args.kwargs["details"]["mode"] == "skipped"
+
+        await run_benchmark_report_refresh(warm=True)
+        assert warm.await_count == 1
+        assert log_event.await_args.kwargs["details"]["mode"] == "warm"
@@ -173,6 +173,7 @@ async def test_browser_session_rest_surface_is_owner_scoped_and_provenanced(clie
     list_response = await client.get("/api/browser/sessions?owner_session_id=session-a")
     assert list_response.status_code == 200
     assert [item["session_id"] for item in list_response.json()["sessions"]] == [session["session_id"]]
+    assert list_response.json()["browser_pool"]["size_limit"] >= 1
 
     operator_response = await client.get(
         "/api/operator/browser-computer-use-control?owner_session_id=session-a"
@@ -0,0 +1,129 @@
+"""Tests for the warm Playwright browser pool."""
+
+import asyncio
+
+import pytest
+
+from config.settings import settings
+from src.browser.pool import BrowserPool
+
+
+class _FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self, index):
+        self.index = index
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = _FakeContext(self)
+        context.options = options
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    monkeypatch.setattr(settings, "browser_pool_size", 2)
+    monkeypatch.setattr(settings, "browser_pool_max_pages", 3)
+    monkeypatch.setattr(settings, "browser_pool_idle_seconds", 0)
+    launched = []
+
+    async def _launch():
+        browser = _FakeBrowser(len(launched))
+        launched.append(browser)
+        return browser
+
+    pool = BrowserPool(launcher=_launch, name="test_browser_pool")
+    yield pool, launched
+    pool.shutdown(timeout_seconds=1.0)
+
+
+def test_browser_pool_reuses_warm_browser_with_fresh_contexts(fake_pool):
+    pool, launched = fake_pool
+
+    async def _use():
+        async with pool.context(user_agent="ua") as context:
+            return context
+
+    first = pool.run(_use())
+    second = pool.run(_use())
+
+    assert len(launched) == 1
+    assert first is not second
+    assert first.browser is second.browser
+    assert first.closed and second.closed
+    assert first.options == {"user_agent": "ua"}
+    assert pool.stats()["contexts_served"] == 2
+
+
+def test_browser_pool_grows_for_concurrent_use_up_to_size(fake_pool):
+    pool, launched = fake_pool
+
+    async def _use_concurrently():
+        async def _hold():
+            async with pool.context() as context:
+                await asyncio.sleep(0.01)
+                return context.browser
+
+        return await asyncio.gather(*(_hold() for _ in range(3)))
+
+    browsers = pool.run(_use_concurrently())
+
+    assert len(launched) == 2
+    assert {browser.index for browser in browsers} == {0, 1}
+    assert pool.stats()["active_contexts"] == 0
+
+
+def test_browser_pool_recycles_after_max_pages_and_replaces_dead_browsers(fake_pool):
+    pool, launched = fake_pool
+
+    async def _use():
+        async with pool.context() as context:
+            return context.browser
+
+    for _ in range(3):
+        pool.run(_use())
+    assert launched[0].closed
+    assert pool.stats()["recycled"] == 1
+
+    assert pool.run(_use()) is launched[1]
+    launched[1].connected = False
+    assert pool.run(_use()) is launched[2]
+    assert pool.stats()["health_evictions"] == 1
+
+
+def test_browser_pool_evicts_idle_browsers(fake_pool, monkeypatch):
+    pool, launched = fake_pool
+    monkeypatch.setattr(settings, "browser_pool_idle_seconds", 0.01)
+
+    async def _use_then_idle():
+        async with pool.context():
+            pass
+        # The reaper wakes at least once a second.
+        for _ in range(300):
+            if not pool.stats()["warm_browsers"]:
+                return
+            await asyncio.sleep(0.01)
+
+    pool.run(_use_then_idle(), timeout_seconds=5.0)
+
+    assert launched[0].closed
+    assert pool.stats()["idle_evictions"] == 1
+
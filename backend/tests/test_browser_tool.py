@@ -11,25 +11,6 @@ from src.tools.browser_tool import browse_webpage
 from src.tools.browser_tool import _route_guarded_browser_request
 
 
-class _ImmediateFuture:
-    def __init__(self, value):
-        self._value = value
-
-    def result(self):
-        return self._value
-
-
-class _ImmediateExecutor:
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
-
-    def submit(self, fn, *args, **kwargs):
-        return _ImmediateFuture(fn(*args, **kwargs))
-
-
 @pytest.fixture(autouse=True)
 def reset_browser_site_policy():
     original_allowlist = settings.browser_site_allowlist
@@ -57,10 +38,7 @@ def test_browse_webpage_logs_blocked_runtime_audit(async_db):
 
 
 def test_browse_webpage_logs_success_runtime_audit(async_db):
-    with (
-        patch("src.tools.browser_tool._browse", new=AsyncMock(return_value="hello from page")),
-        patch("concurrent.futures.ThreadPoolExecutor", return_value=_ImmediateExecutor()),
-    ):
+    with patch("src.tools.browser_tool._browse", new=AsyncMock(return_value="hello from page")):
         result = browse_webpage("https://example.com/docs")
 
     assert result == "hello from page"
@@ -135,10 +113,7 @@ def test_browser_route_guard_allows_external_subrequest():
 
 
 def test_browse_webpage_logs_timeout_runtime_audit(async_db):
-    with (
-        patch("src.tools.browser_tool._browse", new=AsyncMock(side_effect=TimeoutError("Timed out"))),
-        patch("concurrent.futures.ThreadPoolExecutor", return_value=_ImmediateExecutor()),
-    ):
+    with patch("src.tools.browser_tool._browse", new=AsyncMock(side_effect=TimeoutError("Timed out"))):
         result = browse_webpage("https://example.com/slow")
 
     assert "timed out after" in result.lower()
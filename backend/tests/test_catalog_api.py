@@ -401,7 +401,7 @@ class TestCatalogAPI:
         self, client, catalog_data, catalog_extension_runtime
     ):
         with patch("src.api.catalog._load_catalog", return_value=catalog_data), \
-             patch.object(mcp_manager, "connect") as connect_mock:
+             patch.object(mcp_manager, "connect_in_background") as connect_mock:
             resp = await client.post("/api/catalog/install/test-mcp")
 
         assert resp.status_code == 409
@@ -412,7 +412,7 @@ class TestCatalogAPI:
         assert approve.status_code == 200
 
         with patch("src.api.catalog._load_catalog", return_value=catalog_data), \
-             patch.object(mcp_manager, "connect") as connect_mock:
+             patch.object(mcp_manager, "connect_in_background") as connect_mock:
             resp = await client.post("/api/catalog/install/test-mcp")
 
         assert resp.status_code == 201
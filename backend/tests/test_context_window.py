@@ -7,7 +7,9 @@ import pytest
 
 from src.audit.repository import audit_repository
 from src.agent.context_window import (
+    RollingSummary,
     build_context_window,
+    requires_middle_summary,
     _format_messages,
     _count_tokens,
     _summary_cache,
@@ -152,6 +154,91 @@ class TestBuildContextWindow:
         assert "User: only one" in result
 
 
+class TestStoredTokenCounts:
+    def test_budget_uses_stored_counts_without_retokenizing(self):
+        msgs = [
+            {**_msg("user", f"short {i}"), "token_count": 100}
+            for i in range(10)
+        ]
+        with patch("src.agent.context_window._count_tokens") as mock_count:
+            assert requires_middle_summary(msgs, token_budget=500, keep_first=1, keep_recent=2)
+            assert not requires_middle_summary(msgs, token_budget=5000, keep_first=1, keep_recent=2)
+        mock_count.assert_not_called()
+
+
+class TestRollingSummary:
+    def setup_method(self):
+        _summary_cache.clear()
+
+    def _history(self, count: int) -> list[dict]:
+        return [
+            {**_msg("user", f"message number {i}"), "id": f"m{i}", "token_count": 100}
+            for i in range(count)
+        ]
+
+    @patch("src.agent.context_window.completion_with_fallback_sync")
+    def test_folds_only_newly_evicted_messages(self, mock_completion):
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "rolling summary"
+        mock_completion.return_value = mock_response
+        rolling = RollingSummary()
+
+        build_context_window(
+            self._history(10), token_budget=500, keep_first=1, keep_recent=2,
+            session_id="roll", rolling_summary=rolling,
+        )
+        assert rolling.changed
+        assert rolling.through_message_id == "m7"
+        assert rolling.message_count == 7
+
+        rolling.changed = False
+        result = build_context_window(
+            self._history(12), token_budget=500, keep_first=1, keep_recent=2,
+            session_id="roll", rolling_summary=rolling,
+        )
+
+        assert "rolling summary" in result
+        assert mock_completion.call_count == 2
+        prompt = mock_completion.call_args.kwargs["messages"][0]["content"]
+        assert "Running summary:\nrolling summary" in prompt
+        assert "message number 8" in prompt
+        assert "message number 9" in prompt
+        assert "message number 7" not in prompt
+        assert rolling.through_message_id == "m9"
+        assert rolling.message_count == 9
+
+    @patch("src.agent.context_window.completion_with_fallback_sync")
+    def test_unchanged_window_reuses_summary_without_llm_call(self, mock_completion):
+        rolling = RollingSummary(summary="stored summary", through_message_id="m7", message_count=7)
+
+        result = build_context_window(
+            self._history(10), token_budget=500, keep_first=1, keep_recent=2,
+            session_id="roll", rolling_summary=rolling,
+        )
+
+        assert "stored summary" in result
+        mock_completion.assert_not_called()
+        assert not rolling.changed
+
+    @patch(
+        "src.agent.context_window.completion_with_fallback_sync",
+        side_effect=RuntimeError("provider down"),
+    )
+    def test_degraded_fold_is_not_persisted(self, _mock_completion):
+        rolling = RollingSummary(summary="stored summary", through_message_id="m7", message_count=7)
+
+        result = build_context_window(
+            self._history(12), token_budget=500, keep_first=1, keep_recent=2,
+            session_id="roll-fail", rolling_summary=rolling,
+        )
+
+        assert "stored summary" in result
+        assert "truncated" in result
+        assert not rolling.changed
+        assert rolling.through_message_id == "m7"
+
+
 class TestSummaryCache:
     def setup_method(self):
         _summary_cache.clear()
@@ -324,15 +411,17 @@ class TestOfflineReliability:
                 "src.agent.context_window.completion_with_fallback_sync",
                 return_value=mock_response,
             ),
-            patch("src.audit.runtime.audit_repository.log_event", AsyncMock()) as mock_log_event,
+            patch("src.audit.runtime.audit_repository.log_events", AsyncMock(return_value=1)) as mock_log_events,
         ):
             result = _summarize_middle(
                 [_msg("user", "hello world")],
                 session_id="offline-sync",
                 range_key="0-1",
             )
+            asyncio.run(audit_repository.flush_pending())
 
         assert result == "offline summary"
-        mock_log_event.assert_awaited_once()
-        assert mock_log_event.await_args.kwargs["event_type"] == "background_task_succeeded"
-        assert mock_log_event.await_args.kwargs["tool_name"] == "context_window_summary"
+        mock_log_events.assert_awaited_once()
+        [event] = mock_log_events.await_args.args[0]
+        assert event["event_type"] == "background_task_succeeded"
+        assert event["tool_name"] == "context_window_summary"
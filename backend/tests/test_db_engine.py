@@ -87,6 +87,75 @@ async def test_ensure_legacy_columns_adds_guardian_intervention_active_project(t
         await engine.dispose()
 
 
+async def test_ensure_legacy_columns_backfills_session_last_message_columns(tmp_path):
+    db_path = tmp_path / "legacy-sessions.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    event.listen(engine.sync_engine, "connect", _configure_sqlite_connection)
+
+    try:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(
+                """
+                CREATE TABLE sessions (
+                    id VARCHAR PRIMARY KEY,
+                    title VARCHAR,
+                    created_at DATETIME,
+                    updated_at DATETIME
+                )
+                """
+            )
+            await conn.exec_driver_sql(
+                """
+                CREATE TABLE messages (
+                    id VARCHAR PRIMARY KEY,
+                    session_id VARCHAR,
+                    role VARCHAR,
+                    content VARCHAR,
+                    created_at DATETIME
+                )
+                """
+            )
+            await conn.exec_driver_sql(
+                """
+                INSERT INTO sessions (id, title, created_at, updated_at) VALUES
+                    ('s1', 'Thread', '2026-03-25 00:00:00', '2026-03-25 00:03:00'),
+                    ('s2', 'Empty', '2026-03-25 00:00:00', '2026-03-25 00:00:00')
+                """
+            )
+            await conn.exec_driver_sql(
+                """
+                INSERT INTO messages (id, session_id, role, content, created_at) VALUES
+                    ('m1', 's1', 'user', 'hello', '2026-03-25 00:01:00'),
+                    ('m2', 's1', 'assistant', 'hi there', '2026-03-25 00:02:00'),
+                    ('m3', 's1', 'step', 'thinking', '2026-03-25 00:03:00')
+                """
+            )
+
+            await _ensure_legacy_columns(conn)
+
+            rows = {
+                row[0]: row[1:]
+                for row in (
+                    await conn.exec_driver_sql(
+                        """
+                        SELECT id, last_message_at, last_message_preview, last_message_role, message_count
+                        FROM sessions
+                        """
+                    )
+                ).fetchall()
+            }
+            indexes = {
+                row[1]
+                for row in (await conn.exec_driver_sql("PRAGMA index_list(sessions)")).fetchall()
+            }
+
+            assert rows["s1"] == ("2026-03-25 00:02:00", "thinking", "step", 2)
+            assert rows["s2"] == (None, None, None, 0)
+            assert "ix_sessions_updated_at_id" in indexes
+    finally:
+        await engine.dispose()
+
+
 async def test_sqlite_connection_enables_foreign_keys(tmp_path):
     db_path = tmp_path / "fk-check.db"
     engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
@@ -194,3 +263,84 @@ async def test_ensure_search_indexes_backfills_session_message_and_event_rows(tm
             assert rows[2][0] == "event"
     finally:
         await engine.dispose()
+
+
+async def test_ensure_search_indexes_backfills_memory_recall_rows_for_existing_databases(tmp_path):
+    db_path = tmp_path / "memory-fts-check.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    event.listen(engine.sync_engine, "connect", _configure_sqlite_connection)
+
+    try:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(
+                "CREATE TABLE sessions (id VARCHAR PRIMARY KEY, title VARCHAR, created_at DATETIME, updated_at DATETIME)"
+            )
+            await conn.exec_driver_sql(
+                """
+                CREATE TABLE messages (
+                    id VARCHAR PRIMARY KEY,
+                    session_id VARCHAR,
+                    role VARCHAR,
+                    content VARCHAR,
+                    created_at DATETIME
+                )
+                """
+            )
+            await conn.exec_driver_sql(
+                """
+                CREATE TABLE memories (
+                    id VARCHAR PRIMARY KEY,
+                    content VARCHAR,
+                    summary VARCHAR,
+                    status VARCHAR
+                )
+                """
+            )
+            await conn.exec_driver_sql(
+                """
+                CREATE TABLE memory_episodes (
+                    id VARCHAR PRIMARY KEY,
+                    session_id VARCHAR,
+                    episode_type VARCHAR,
+                    summary VARCHAR,
+                    content VARCHAR,
+                    observed_at DATETIME,
+                    created_at DATETIME
+                )
+                """
+            )
+            await conn.exec_driver_sql(
+                """
+                INSERT INTO memories (id, content, summary, status)
+                VALUES ('mem-1', 'Atlas redeployment runs on Fridays', 'Atlas redeploys Friday', 'active')
+                """
+            )
+            await conn.exec_driver_sql(
+                """
+                INSERT INTO memory_episodes (id, session_id, episode_type, summary, content, observed_at, created_at)
+                VALUES ('ep-1', NULL, 'workflow', 'Upload failed', 'Atlas deploy upload failed', '2026-03-25T00:02:00Z', '2026-03-25T00:02:00Z')
+                """
+            )
+
+            await _ensure_search_indexes(conn)
+
+            rows = (
+                await conn.exec_driver_sql(
+                    """
+                    SELECT source_type, source_id
+                    FROM memory_recall_fts
+                    WHERE memory_recall_fts MATCH '"deploy"'
+                    ORDER BY source_type
+                    """
+                )
+            ).fetchall()
+            assert rows == [("episode", "ep-1"), ("memory", "mem-1")]
+
+            await conn.exec_driver_sql("DELETE FROM memories WHERE id = 'mem-1'")
+            await _ensure_search_indexes(conn)
+            remaining = (
+                await conn.exec_driver_sql("SELECT entry_key FROM memory_recall_fts")
+            ).fetchall()
+            assert remaining == [("episode:ep-1",)]
+    finally:
+        await engine.dispose()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -292,6 +293,62 @@ async def test_workflow_state_repository_persists_run_steps_and_checkpoint(async
     assert checkpoint["state_source"] == "durable_workflow_state"
 
 
+@pytest.mark.asyncio
+async def test_workflow_state_repository_batches_deferred_step_transitions(async_db):
+    run_identity = "session-5:workflow_digest:abc"
+    await workflow_state_repository.create_run(
+        run_identity=run_identity,
+        workflow_name="digest",
+        tool_name="workflow_digest",
+        session_id="session-5",
+        run_fingerprint="abc",
+        arguments={},
+        approval_context={"risk_level": "low"},
+    )
+    # Long enough that the journal's timer cannot commit mid-test.
+    with patch.object(workflow_state_repository.step_journal, "_commit_delay_seconds", 1.0):
+        for index, step_id in enumerate(("fetch", "summarize"), start=1):
+            assert await workflow_state_repository.record_step_started(
+                run_identity=run_identity,
+                workflow_name="digest",
+                step_id=step_id,
+                step_index=index,
+                tool_name="web_search",
+                arguments={"query": step_id},
+                defer=True,
+            ) is None
+            await workflow_state_repository.record_step_completed(
+                run_identity=run_identity,
+                step_id=step_id,
+                status="succeeded",
+                result=step_id,
+                defer=True,
+            )
+
+        assert workflow_state_repository.step_journal.stats()["pending"] == 4
+        pending_checkpoint = await workflow_state_repository.get_checkpoint_payload(run_identity)
+        assert pending_checkpoint["step_records"] == []
+
+        # A synchronous write commits everything queued before it in the same batch.
+        saved = await workflow_state_repository.record_step_started(
+            run_identity=run_identity,
+            workflow_name="digest",
+            step_id="save",
+            step_index=3,
+            tool_name="write_file",
+            arguments={"file_path": "digest.md"},
+        )
+    stats = workflow_state_repository.step_journal.stats()
+    assert saved is not None and saved["status"] == "running"
+    assert stats["pending"] == 0
+    assert stats["committed"] == 5
+    assert stats["batches"] == 1
+
+    run = await workflow_state_repository.finish_run(run_identity=run_identity, status="succeeded")
+    statuses = {step["id"]: step["status"] for step in run["step_records"]}
+    assert statuses == {"fetch": "succeeded", "summarize": "succeeded", "save": "running"}
+
+
 @pytest.mark.asyncio
 async def test_workflow_state_repository_marks_stale_runs_interrupted(async_db):
     await workflow_state_repository.create_run(
@@ -95,3 +95,74 @@ def test_embed_logs_model_load_failure(async_db):
     assert events[0]["tool_name"] == f"embedding_model:{settings.embedding_model}"
     assert events[0]["details"]["stage"] == "load"
     assert events[0]["details"]["error"] == "model missing"
+
+
+class _CountingSentenceTransformer(_FakeSentenceTransformer):
+    calls: list[object] = []
+
+    def encode(self, value, normalize_embeddings: bool = True):
+        type(self).calls.append(value)
+        return super().encode(value, normalize_embeddings=normalize_embeddings)
+
+
+def test_embed_serves_repeated_text_from_cache():
+    _CountingSentenceTransformer.calls = []
+    fake_module = types.SimpleNamespace(SentenceTransformer=_CountingSentenceTransformer)
+
+    with (
+        patch.dict("sys.modules", {"sentence_transformers": fake_module}),
+        patch("src.memory.embedder._log_embedding_event"),
+    ):
+        assert embedder.embed("guardian state") == [0.1, 0.2]
+        assert embedder.embed("guardian state") == [0.1, 0.2]
+
+    stats = embedder.get_embedding_service_stats()
+    assert _CountingSentenceTransformer.calls == ["guardian state"]
+    assert stats["requests"] == 2
+    assert stats["cache_hits"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["batches"] == 1
+
+
+def test_concurrent_embed_calls_are_coalesced_into_one_batch():
+    _CountingSentenceTransformer.calls = []
+    fake_module = types.SimpleNamespace(SentenceTransformer=_CountingSentenceTransformer)
+    texts = [f"memory {index}" for index in range(6)]
+
+    with (
+        patch.dict("sys.modules", {"sentence_transformers": fake_module}),
+        patch("src.memory.embedder._log_embedding_event"),
+        patch.object(settings, "embedding_batch_window_ms", 200),
+    ):
+        embedder._get_model()
+
+        async def _embed_all():
+            return await asyncio.gather(*(asyncio.to_thread(embedder.embed, text) for text in texts))
+
+        vectors = asyncio.run(_embed_all())
+
+    assert vectors == [[0.1, 0.2]] * len(texts)
+    stats = embedder.get_embedding_service_stats()
+    assert stats["encoded_texts"] == len(texts)
+    assert stats["batches"] < len(texts)
+    assert stats["max_batch_size"] > 1
+
+
+def test_prime_embeddings_batches_uncached_texts_only_when_model_is_loaded():
+    _CountingSentenceTransformer.calls = []
+    fake_module = types.SimpleNamespace(SentenceTransformer=_CountingSentenceTransformer)
+
+    with (
+        patch.dict("sys.modules", {"sentence_transformers": fake_module}),
+        patch("src.memory.embedder._log_embedding_event"),
+    ):
+        assert embedder.prime_embeddings(["a", "b"]) == 0
+        assert _CountingSentenceTransformer.calls == []
+
+        embedder._get_model()
+        assert embedder.prime_embeddings(["a", "b", "a"]) == 2
+        embedder.embed("a")
+        embedder.embed("b")
+
+    assert _CountingSentenceTransformer.calls == [["a", "b"]]
+    assert embedder.get_embedding_service_stats()["cache_hits"] == 2
@@ -4366,6 +4366,64 @@ def test_main_emits_json_summary(capsys):
     assert payload["results"][0]["name"] == "shell_tool_timeout_contract"
 
 
+def test_main_runs_only_the_requested_shard_and_reports_slowest(capsys):
+    exit_code = main([
+        "--scenario", "shell_tool_timeout_contract",
+        "--scenario", "chat_model_wrapper",
+        "--shard", "2/2",
+        "--slowest", "1",
+        "--indent", "0",
+    ])
+
+    payload = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 0
+    assert [result["name"] for result in payload["results"]] == ["chat_model_wrapper"]
+    assert payload["slowest_scenarios"] == [
+        {
+            "name": "chat_model_wrapper",
+            "category": payload["results"][0]["category"],
+            "duration_ms": payload["results"][0]["duration_ms"],
+            "passed": True,
+        }
+    ]
+
+
+def test_main_rejects_invalid_shard(capsys):
+    assert main(["--shard", "3/2"]) == 2
+    assert "Invalid shard" in capsys.readouterr().err
+
+
+def test_run_scenarios_parallel_keeps_order_and_fails_scenarios_lost_with_a_worker():
+    scenarios = [scenario for scenario in available_scenarios()[:3]]
+    first, second, third = scenarios
+
+    def _fake_workers(names, *, jobs, scenario_timeout_seconds):
+        assert jobs == 2
+        assert scenario_timeout_seconds == 600.0
+        assert names == [first.name, second.name, third.name]
+        payload = {
+            "name": third.name,
+            "category": third.category,
+            "description": third.description,
+            "passed": True,
+            "duration_ms": 12,
+            "details": {},
+            "error": None,
+        }
+        return {third.name: payload, first.name: {**payload, "name": first.name}}, {
+            second.name: "eval worker exited with code -9 while running " + second.name
+        }
+
+    with patch("src.evals.harness.run_scenarios_in_workers", side_effect=_fake_workers):
+        summary = harness.run_scenarios_parallel(scenarios, jobs=2)
+
+    assert [result.name for result in summary.results] == [first.name, second.name, third.name]
+    assert summary.failed == 1
+    assert summary.results[1].passed is False
+    assert "exited with code -9" in summary.results[1].error
+
+
 def test_make_sync_client_with_db_unwinds_patches_when_client_startup_fails():
     original_workspace_dir = settings.workspace_dir
 
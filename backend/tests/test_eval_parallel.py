@@ -0,0 +1,78 @@
+import asyncio
+import io
+import json
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.evals.parallel import (
+    EvalWorkerTimedOut,
+    _EvalWorker,
+    parse_shard,
+    serve_worker,
+    shard_items,
+    slowest_results,
+)
+
+
+def test_parse_shard_accepts_one_based_specs():
+    assert parse_shard("1/4") == (1, 4)
+    assert parse_shard("4/4") == (4, 4)
+    for invalid in ("0/4", "5/4", "1/0", "2", "a/b"):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            parse_shard(invalid)
+
+
+def test_shard_items_partition_round_robin():
+    items = list(range(7))
+
+    shards = [shard_items(items, (index, 3)) for index in range(1, 4)]
+
+    assert shards == [[0, 3, 6], [1, 4], [2, 5]]
+    assert sorted(item for shard in shards for item in shard) == items
+    assert shard_items(items, None) == items
+
+
+def test_slowest_results_ranks_by_duration():
+    results = [
+        SimpleNamespace(name="fast", category="a", duration_ms=5, passed=True),
+        SimpleNamespace(name="slow", category="b", duration_ms=50, passed=False),
+        SimpleNamespace(name="mid", category="a", duration_ms=20, passed=True),
+    ]
+
+    assert [item["name"] for item in slowest_results(results, 2)] == ["slow", "mid"]
+    assert slowest_results(results, 0) == []
+
+
+def test_serve_worker_answers_each_scenario_on_its_own_line():
+    async def _run_one(name):
+        print("scenario chatter must not reach the protocol stream")
+        return {"name": name, "passed": True}
+
+    stdin = io.StringIO("alpha\n\nbeta\n")
+    stdout = io.StringIO()
+
+    assert asyncio.run(serve_worker(_run_one, stdin=stdin, stdout=stdout)) == 0
+
+    lines = stdout.getvalue().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["alpha", "beta"]
+
+
+def test_eval_worker_is_killed_when_a_scenario_overruns_its_deadline(tmp_path):
+    worker = _EvalWorker.__new__(_EvalWorker)
+    worker.workspace_dir = str(tmp_path / "workspace")
+    worker.process = subprocess.Popen(
+        [sys.executable, "-c", "import sys, time; sys.stdin.readline(); time.sleep(30)"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+
+    with pytest.raises(EvalWorkerTimedOut, match="0.2s deadline while running hung_scenario"):
+        worker.run("hung_scenario", timeout_seconds=0.2)
+
+    assert not worker.alive
+    worker.close()
@@ -1179,3 +1179,69 @@ contributes:
     assert len(snapshot.load_errors) == 1
     assert snapshot.load_errors[0].phase == "layout"
     assert "escapes the package root" in snapshot.load_errors[0].message
+
+
+def test_registry_reuses_unchanged_manifests_and_reparses_changed_ones(tmp_path: Path):
+    from unittest.mock import patch
+
+    from src.extensions import registry as registry_module
+
+    pack_dir = tmp_path / "extensions" / "cached-pack"
+    (pack_dir / "skills").mkdir(parents=True)
+    (pack_dir / "skills" / "brief.md").write_text(
+        "---\nname: brief\ndescription: Short brief\n---\n\nWrite a brief.\n",
+        encoding="utf-8",
+    )
+    manifest_path = pack_dir / "manifest.yaml"
+    manifest_template = """
+id: seraph.cached-pack
+version: {version}
+display_name: Cached Pack
+kind: capability-pack
+compatibility:
+  seraph: ">=2026.4.11"
+publisher:
+  name: Seraph
+trust: local
+contributes:
+  skills:
+    - skills/brief.md
+""".strip()
+    manifest_path.write_text(manifest_template.format(version="2026.5.1"), encoding="utf-8")
+
+    def _registry() -> ExtensionRegistry:
+        return ExtensionRegistry(
+            manifest_roots=[str(tmp_path / "extensions")],
+            skill_dirs=[],
+            workflow_dirs=[],
+            mcp_runtime=None,
+        )
+
+    with patch.object(
+        registry_module,
+        "load_extension_manifest",
+        wraps=registry_module.load_extension_manifest,
+    ) as load_manifest:
+        first = _registry().snapshot()
+        second = _registry().snapshot()
+        assert load_manifest.call_count == 1
+        assert second.get_extension("seraph.cached-pack") == first.get_extension("seraph.cached-pack")
+
+        (pack_dir / "skills" / "brief.md").write_text(
+            "---\nname: brief-renamed\ndescription: Short brief\n---\n\nWrite a brief.\n",
+            encoding="utf-8",
+        )
+        renamed = _registry().snapshot().get_extension("seraph.cached-pack")
+        assert load_manifest.call_count == 2
+        assert renamed is not None
+        assert renamed.contributions[0].metadata["name"] == "brief-renamed"
+
+        manifest_path.write_text(manifest_template.format(version="2026.5.20"), encoding="utf-8")
+        bumped = _registry().snapshot().get_extension("seraph.cached-pack")
+        assert load_manifest.call_count == 3
+        assert bumped is not None
+        assert bumped.metadata["version"] == "2026.5.20"
+
+        registry_module.invalidate_extension_registry_cache()
+        _registry().snapshot()
+        assert load_manifest.call_count == 4
@@ -1705,7 +1705,7 @@ async def test_install_toggle_and_remove_workspace_connector_extension(client, e
         AsyncMock(),
     ), patch.object(
         mcp_manager,
-        "connect",
+        "connect_in_background",
     ) as connect_mock, patch.object(
         mcp_manager,
         "disconnect",
@@ -1789,7 +1789,7 @@ async def test_update_workspace_connector_refreshes_packaged_mcp_server(client,
         AsyncMock(),
     ), patch.object(
         mcp_manager,
-        "connect",
+        "connect_in_background",
     ) as connect_mock, patch.object(
         mcp_manager,
         "disconnect",
@@ -2295,7 +2295,7 @@ async def test_extension_connector_test_endpoint_uses_packaged_mcp_runtime(clien
         return_value=mock_client,
     ) as client_factory, patch.object(
         mcp_manager,
-        "connect",
+        "connect_in_background",
     ) as connect_mock:
         install_response = await client.post("/api/extensions/install", json={"path": str(package_dir)})
         assert install_response.status_code == 409
@@ -2341,7 +2341,7 @@ async def test_extension_connector_enable_endpoint_controls_packaged_mcp_runtime
         AsyncMock(),
     ), patch.object(
         mcp_manager,
-        "connect",
+        "connect_in_background",
     ) as connect_mock, patch.object(
         mcp_manager,
         "disconnect",
@@ -2409,7 +2409,7 @@ async def test_connector_lifecycle_approval_is_scoped_to_each_packaged_connector
         AsyncMock(),
     ), patch.object(
         mcp_manager,
-        "connect",
+        "connect_in_background",
     ) as connect_mock, patch.object(
         mcp_manager,
         "disconnect",
@@ -2499,7 +2499,7 @@ async def test_whole_extension_enable_repairs_packaged_mcp_ownership_metadata(cl
         AsyncMock(),
     ), patch.object(
         mcp_manager,
-        "connect",
+        "connect_in_background",
     ) as connect_mock:
         install_response = await client.post("/api/extensions/install", json={"path": str(package_dir)})
         assert install_response.status_code == 409
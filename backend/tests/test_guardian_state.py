@@ -1,5 +1,6 @@
 """Tests for explicit guardian-state synthesis."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -3583,6 +3584,44 @@ async def test_build_guardian_state_ignores_memory_query_only_for_intent_uncerta
     assert state.intent_uncertainty_diagnostics == ()
 
 
+@pytest.mark.asyncio
+async def test_build_guardian_state_degrades_slow_sources_and_reports_timings(async_db):
+    async def _slow_history(_session_id):
+        await asyncio.sleep(1)
+        return "User: too slow"
+
+    with (
+        patch("src.guardian.state.settings.guardian_state_source_timeout_seconds", 0.05),
+        patch("src.agent.session.session_manager.get_history_text", side_effect=_slow_history),
+        patch("src.audit.repository.audit_repository.list_events", AsyncMock(side_effect=RuntimeError("audit down"))),
+    ):
+        state = await build_guardian_state(session_id="slow-session", user_message="Status?")
+
+    assert state.current_session_history == ""
+    assert state.recent_execution_summary == ""
+    assert state.source_timings_ms["session_history"] >= 50
+    assert {"soul", "memory_retrieval", "bounded_snapshot", "total"} <= set(state.source_timings_ms)
+
+
+@pytest.mark.asyncio
+async def test_build_guardian_state_reuses_short_lived_inputs_across_turns(async_db):
+    recent_projects = AsyncMock(return_value=["Atlas"])
+    reconciliation = AsyncMock(return_value={})
+
+    with (
+        patch("src.observer.screen_repository.screen_observation_repo.get_recent_projects", recent_projects),
+        patch("src.memory.decay.summarize_memory_reconciliation_state", reconciliation),
+    ):
+        first = await build_guardian_state(user_message="What next?")
+        second = await build_guardian_state(user_message="And after that?")
+        with patch("src.guardian.state.settings.guardian_state_cache_ttl_seconds", 0):
+            await build_guardian_state(user_message="One more?")
+
+    assert first.world_model.active_projects == second.world_model.active_projects
+    assert recent_projects.await_count == 2
+    assert reconciliation.await_count == 2
+
+
 @patch("src.agent.factory.ToolCallingAgent")
 @patch("src.agent.factory.get_model")
 def test_create_agent_injects_guardian_state(mock_get_model, mock_agent_cls):
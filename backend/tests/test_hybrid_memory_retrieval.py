@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import text
 
 from src.agent.session import SessionManager
 from src.db.models import MemoryEpisodeType, MemoryKind
@@ -256,3 +257,43 @@ async def test_hybrid_retrieval_filters_shared_embedding_hits_when_text_is_stale
     assert "Atlas launch is delayed." not in result.context
     assert "[project] Atlas launch on track" in result.context
     assert all(hit.text != "Atlas launch is delayed." for hit in result.hits)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_retrieval_uses_fts_index_for_substring_terms_and_skips_inactive(async_db):
+    await memory_repository.create_memory(
+        content="The redeployment checklist lives in the ops wiki.",
+        kind=MemoryKind.fact,
+        summary="Redeployment checklist lives in the ops wiki",
+        importance=0.4,
+    )
+    await memory_repository.create_memory(
+        content="Old deployment notes are obsolete.",
+        kind=MemoryKind.fact,
+        summary="Old deployment notes",
+        importance=0.9,
+        status="archived",
+    )
+    updated = await memory_repository.create_memory(
+        content="Unrelated grocery list.",
+        kind=MemoryKind.fact,
+        summary="Grocery list",
+        importance=0.4,
+    )
+    async with async_db() as db:
+        await db.execute(
+            text("UPDATE memories SET summary = 'Deploy window is Thursday' WHERE id = :id"),
+            {"id": updated.memory_id},
+        )
+
+    with patch(
+        "src.memory.hybrid_retrieval.search_with_status",
+        return_value=([], False),
+    ):
+        result = await retrieve_hybrid_memory(query="deploy", limit=4)
+
+    texts = [hit.text for hit in result.hits]
+    assert "Redeployment checklist lives in the ops wiki" in texts
+    assert "Deploy window is Thursday" in texts
+    assert "Old deployment notes" not in texts
+    assert {hit.source for hit in result.hits} == {"semantic"}
@@ -11,17 +11,22 @@ import pytest
 
 @pytest.fixture()
 def log_dir():
+    from src.llm_call_ledger import _reset_llm_call_ledgers
+
     with tempfile.TemporaryDirectory() as d:
         yield d
+        _reset_llm_call_ledgers()
 
 
-def _make_settings(log_dir, *, enabled=True, content=False):
+def _make_settings(log_dir, *, enabled=True, content=False, index=True):
     mock = MagicMock()
     mock.llm_log_enabled = enabled
     mock.llm_log_content = content
     mock.llm_log_dir = log_dir
     mock.llm_log_max_bytes = 10_000_000
     mock.llm_log_backup_count = 1
+    mock.llm_log_index_enabled = index
+    mock.llm_log_index_max_rows = 1000
     return mock
 
 
@@ -170,6 +175,44 @@ class TestErrorSafety:
             lg.log_failure_event({}, None, None, None)
 
 
+class TestPromptPrefix:
+    def test_measures_prefix_reuse_across_turns(self, log_dir):
+        """Consecutive calls in a session report how much of the prompt repeated."""
+        from src.llm_prompt_cache import VOLATILE_CONTEXT_HEADER
+
+        def _turn(volatile):
+            return [
+                {"role": "system", "content": f"You are Seraph.\n\n{VOLATILE_CONTEXT_HEADER}\n\n{volatile}"},
+                {"role": "user", "content": "hi"},
+            ]
+
+        response = _make_response()
+        response.usage.prompt_tokens_details.cached_tokens = 80
+        with (
+            patch("src.llm_logger.settings", _make_settings(log_dir)),
+            patch("src.llm_logger.get_current_session_id", return_value="session-1"),
+        ):
+            from src.llm_logger import SeraphLLMLogger
+
+            lg = SeraphLLMLogger()
+            for volatile in ("time: 09:00", "time: 09:05"):
+                lg.log_success_event(
+                    _make_kwargs(messages=_turn(volatile)),
+                    response,
+                    datetime.now(timezone.utc),
+                    datetime.now(timezone.utc),
+                )
+
+        first, second = (entry["prompt_prefix"] for entry in _read_log(log_dir))
+        assert first["stable_prefix_reused"] is None
+        assert first["shared_prefix_chars"] == 0
+        assert second["stable_prefix_reused"] is True
+        assert second["stable_prefix_hash"] == first["stable_prefix_hash"]
+        assert second["stable_prefix_chars"] <= second["shared_prefix_chars"] < second["prompt_chars"]
+        assert 0 < second["shared_prefix_ratio"] < 1
+        assert _read_log(log_dir)[1]["tokens"]["cached_input"] == 80
+
+
 class TestInitLLMLogging:
     def test_disabled_does_not_register(self, log_dir):
         """init_llm_logging() with disabled setting doesn't append callback."""
@@ -197,6 +240,25 @@ class TestInitLLMLogging:
         # Clean up so other tests aren't affected
         litellm.callbacks.pop()
 
+    def test_backfill_runs_at_init_not_in_constructor(self, log_dir):
+        """Only init_llm_logging() indexes the existing JSONL history."""
+        import litellm
+
+        with open(os.path.join(log_dir, "llm_calls.jsonl"), "w", encoding="utf-8") as handle:
+            handle.write(json.dumps({"timestamp": "2026-04-01T00:00:00+00:00", "model": "old"}) + "\n")
+        index_path = os.path.join(log_dir, "llm_calls.index.sqlite3")
+
+        with patch("src.llm_logger.settings", _make_settings(log_dir, enabled=True)):
+            from src.llm_logger import SeraphLLMLogger, init_llm_logging
+
+            SeraphLLMLogger()
+            assert not os.path.exists(index_path)
+
+            init_llm_logging()
+
+        assert isinstance(litellm.callbacks.pop(), SeraphLLMLogger)
+        assert os.path.exists(index_path)
+
 
 class TestListRecentLLMCalls:
     def test_reads_recent_entries_and_infers_session_from_request_id(self, log_dir):
@@ -223,3 +285,89 @@ class TestListRecentLLMCalls:
         assert entries[0]["session_id"] == "session-9"
         assert entries[0]["actor"] == "user_request"
         assert entries[0]["source"] == "rest_chat"
+
+
+class TestIndexedCallLedger:
+    def _log_call(self, lg, *, model, session_id, request_id, tokens=(100, 50), cost=0.001, success=True):
+        kwargs = _make_kwargs()
+        slo = kwargs["standard_logging_object"]
+        slo.update(
+            {
+                "model": model,
+                "prompt_tokens": tokens[0],
+                "completion_tokens": tokens[1],
+                "total_tokens": sum(tokens),
+                "response_cost": cost,
+            }
+        )
+        with (
+            patch("src.llm_logger.get_current_session_id", return_value=session_id),
+            patch("src.llm_logger.get_current_llm_request_id", return_value=request_id),
+        ):
+            log = lg.log_success_event if success else lg.log_failure_event
+            log(kwargs, _make_response(), datetime.now(timezone.utc), datetime.now(timezone.utc))
+
+    def test_backfills_existing_jsonl_and_serves_queries_from_index(self, log_dir):
+        old_entry = {
+            "timestamp": "2026-03-20T10:00:00+00:00",
+            "status": "success",
+            "model": "openrouter/old-model",
+            "tokens": {"input": 10, "output": 5, "total": 15},
+            "cost_usd": 0.0001,
+            "latency_ms": 12.0,
+            "request_id": "agent-rest:session-9:1",
+        }
+        with open(os.path.join(log_dir, "llm_calls.jsonl"), "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(old_entry) + "\n")
+
+        with patch("src.llm_logger.settings", _make_settings(log_dir, content=True)):
+            from src.llm_logger import SeraphLLMLogger, open_llm_call_ledger, list_recent_llm_calls
+
+            lg = SeraphLLMLogger(ledger=open_llm_call_ledger())
+            self._log_call(lg, model="model-a", session_id="session-9", request_id="agent-ws:session-9:2")
+            self._log_call(lg, model="model-b", session_id="session-7", request_id="agent-ws:session-7:3")
+
+            with patch("pathlib.Path.read_text", side_effect=AssertionError("JSONL should not be rescanned")):
+                session_entries = list_recent_llm_calls(limit=10, session_id="session-9")
+                recent = list_recent_llm_calls(
+                    limit=10,
+                    since=datetime(2026, 4, 1, tzinfo=timezone.utc),
+                )
+
+        assert [entry["model"] for entry in session_entries] == ["model-a", "openrouter/old-model"]
+        assert all(entry["session_id"] == "session-9" for entry in session_entries)
+        assert session_entries[0]["source"] == "websocket_chat"
+        assert "messages" not in session_entries[0] and "response" not in session_entries[0]
+        assert [entry["model"] for entry in recent] == ["model-b", "model-a"]
+        assert os.path.exists(os.path.join(log_dir, "llm_calls.index.sqlite3"))
+
+    def test_summarizes_usage_per_model(self, log_dir):
+        with patch("src.llm_logger.settings", _make_settings(log_dir)):
+            from src.llm_logger import SeraphLLMLogger, open_llm_call_ledger, summarize_llm_usage_by_model
+
+            lg = SeraphLLMLogger(ledger=open_llm_call_ledger())
+            self._log_call(lg, model="model-a", session_id="s1", request_id="r1", tokens=(100, 50), cost=0.002)
+            self._log_call(lg, model="model-a", session_id="s1", request_id="r2", tokens=(10, 5), cost=0.001)
+            self._log_call(lg, model="model-b", session_id="s2", request_id="r3", cost=0.0, success=False)
+
+            summary = summarize_llm_usage_by_model()
+            session_summary = summarize_llm_usage_by_model(session_id="s2")
+
+        by_model = {item["model"]: item for item in summary}
+        assert by_model["model-a"]["calls"] == 2
+        assert by_model["model-a"]["input_tokens"] == 110
+        assert by_model["model-a"]["total_tokens"] == 165
+        assert by_model["model-a"]["cost_usd"] == pytest.approx(0.003)
+        assert by_model["model-b"]["failures"] == 1
+        assert [item["model"] for item in session_summary] == ["model-b"]
+
+    def test_falls_back_to_jsonl_when_index_disabled(self, log_dir):
+        with patch("src.llm_logger.settings", _make_settings(log_dir, index=False)):
+            from src.llm_logger import SeraphLLMLogger, list_recent_llm_calls
+
+            lg = SeraphLLMLogger()
+            self._log_call(lg, model="model-a", session_id="s1", request_id="r1")
+            entries = list_recent_llm_calls(limit=5)
+
+        assert [entry["model"] for entry in entries] == ["model-a"]
+        assert not os.path.exists(os.path.join(log_dir, "llm_calls.index.sqlite3"))
@@ -6,6 +6,7 @@ import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from smolagents.models import ChatMessageStreamDelta
 
 from config.settings import settings
 from src.approval.runtime import reset_runtime_context, set_runtime_context
@@ -1473,6 +1474,54 @@ def test_fallback_litellm_model_runtime_override_can_force_default_profile_over_
     assert model._fallback_model.api_base == "https://openrouter.ai/api/v1"
 
 
+def test_fallback_litellm_model_marks_stable_system_prefix_for_prompt_caching():
+    from smolagents.models import ChatMessage, MessageRole
+
+    from src.llm_prompt_cache import VOLATILE_CONTEXT_HEADER
+
+    with (
+        patch.object(settings, "default_model", "openrouter/anthropic/claude-sonnet-4"),
+        patch.object(settings, "llm_api_key", "primary-key"),
+        patch.object(settings, "llm_api_base", "https://openrouter.ai/api/v1"),
+        patch.object(settings, "fallback_model", ""),
+        patch.object(settings, "fallback_models", "openai/gpt-4o-mini"),
+        patch.object(settings, "llm_prompt_cache_enabled", True),
+    ):
+        kwargs = build_model_kwargs(temperature=0.3, max_tokens=256, runtime_path="chat_agent")
+        model = FallbackLiteLLMModel(**kwargs)
+
+    assert kwargs["prompt_cache_control"] == {"type": "ephemeral"}
+    assert model._fallback_model is not None
+    assert model._fallback_model.prompt_cache_control is None
+
+    system_text = f"You are Seraph.\n\n{VOLATILE_CONTEXT_HEADER}\n\ntime: 09:00"
+    completion_kwargs = model._prepare_completion_kwargs(
+        messages=[
+            ChatMessage(role=MessageRole.SYSTEM, content=[{"type": "text", "text": system_text}]),
+            ChatMessage(role=MessageRole.USER, content=[{"type": "text", "text": "hi"}]),
+        ],
+    )
+
+    stable_block, volatile_block = completion_kwargs["messages"][0]["content"]
+    assert stable_block == {"type": "text", "text": "You are Seraph.\n\n", "cache_control": {"type": "ephemeral"}}
+    assert volatile_block["text"].startswith(VOLATILE_CONTEXT_HEADER)
+    assert "cache_control" not in volatile_block
+    assert "cache_control" not in completion_kwargs["messages"][1]["content"][0]
+
+
+def test_build_model_kwargs_omits_prompt_cache_control_when_disabled_or_unsupported():
+    with (
+        patch.object(settings, "default_model", "openrouter/anthropic/claude-sonnet-4"),
+        patch.object(settings, "llm_prompt_cache_enabled", False),
+    ):
+        assert "prompt_cache_control" not in build_model_kwargs(temperature=0.3, max_tokens=256)
+    with (
+        patch.object(settings, "default_model", "openai/gpt-4o-mini"),
+        patch.object(settings, "llm_prompt_cache_enabled", True),
+    ):
+        assert "prompt_cache_control" not in build_model_kwargs(temperature=0.3, max_tokens=256)
+
+
 def test_completion_with_fallback_sync_retries_with_fallback():
     primary_error = RuntimeError("primary down")
     fallback_response = MagicMock()
@@ -2010,6 +2059,89 @@ def test_fallback_litellm_model_retries_generate_with_fallback(async_db):
     assert "primary down" in events[0]["details"]["primary_error"]
 
 
+def test_fallback_litellm_model_streams_and_falls_back_before_first_delta(async_db):
+    def _stream(model, messages, **kwargs):
+        if model.model_id == "openrouter/anthropic/claude-sonnet-4":
+            raise RuntimeError("primary down")
+            yield  # pragma: no cover - makes this a generator
+        yield ChatMessageStreamDelta(content="Hel")
+        yield ChatMessageStreamDelta(content="lo")
+
+    with (
+        patch.object(settings, "fallback_model", "ollama/llama3.2"),
+        patch.object(settings, "fallback_llm_api_key", ""),
+        patch.object(settings, "fallback_llm_api_base", "http://localhost:11434/v1"),
+        patch(
+            "src.llm_runtime.BaseLiteLLMModel.generate_stream",
+            autospec=True,
+            side_effect=_stream,
+        ) as mock_stream,
+    ):
+        model = FallbackLiteLLMModel(
+            model_id="openrouter/anthropic/claude-sonnet-4",
+            api_key="primary-key",
+            api_base="https://openrouter.ai/api/v1",
+            temperature=0.3,
+            max_tokens=256,
+        )
+        deltas = list(model.generate_stream([{"role": "user", "content": "hello"}]))
+
+    assert [delta.content for delta in deltas] == ["Hel", "lo"]
+    assert [call.args[0].model_id for call in mock_stream.call_args_list] == [
+        "openrouter/anthropic/claude-sonnet-4",
+        "ollama/llama3.2",
+    ]
+
+    async def _fetch():
+        events = await audit_repository.list_events(limit=5)
+        return [e for e in events if e["event_type"] == "llm_fallback_success"]
+
+    events = asyncio.run(_fetch())
+    assert events
+    assert events[0]["details"]["fallback_model"] == "ollama/llama3.2"
+
+
+def test_fallback_litellm_model_records_stream_outcome_when_it_settles(async_db):
+    def _stream(model, messages, **kwargs):
+        yield ChatMessageStreamDelta(content="Hel")
+        raise RuntimeError("connection reset")
+
+    with (
+        patch.object(settings, "fallback_model", ""),
+        patch.object(settings, "fallback_models", ""),
+        patch(
+            "src.llm_runtime.BaseLiteLLMModel.generate_stream",
+            autospec=True,
+            side_effect=_stream,
+        ),
+    ):
+        model = FallbackLiteLLMModel(
+            model_id="openrouter/anthropic/claude-sonnet-4",
+            api_key="primary-key",
+            api_base="https://openrouter.ai/api/v1",
+            temperature=0.3,
+            max_tokens=256,
+        )
+        stream = model.generate_stream([{"role": "user", "content": "hello"}])
+        assert next(stream).content == "Hel"
+
+        async def _outcomes():
+            events = await audit_repository.list_events(limit=10)
+            return [
+                e for e in events
+                if e["event_type"] in {"llm_primary_success", "llm_primary_failure"}
+            ]
+
+        assert asyncio.run(_outcomes()) == []
+        with pytest.raises(RuntimeError, match="connection reset"):
+            list(stream)
+
+    [event] = asyncio.run(_outcomes())
+    assert event["event_type"] == "llm_primary_failure"
+    assert event["details"]["stream_interrupted"] is True
+    assert "connection reset" in event["details"]["error"]
+
+
 def test_fallback_litellm_model_walks_fallback_chain(async_db):
     fallback_response = MagicMock()
 
@@ -1,10 +1,14 @@
 """Tests for MCP manager (src/tools/mcp_manager.py)."""
 
 import asyncio
+import json
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from config.settings import settings
 from src.audit.repository import audit_repository
 from src.tools.mcp_manager import MCPManager
 
@@ -235,6 +239,7 @@ class TestMCPManager:
         try:
             mgr = MCPManager()
             mgr.load_config(str(config_file))
+            assert mgr.wait_for_pending(timeout_seconds=5)
         finally:
             del os.environ["TEST_LH_TOKEN"]
 
@@ -251,6 +256,7 @@ class TestMCPManager:
         mgr = MCPManager()
         mgr._config_path = str(tmp_path / "mcp-servers.json")
         mgr.add_server("gh", "http://gh/mcp", headers={"X-Key": "val"}, enabled=True)
+        assert mgr.wait_for_pending(timeout_seconds=5)
 
         assert mgr._config["gh"]["headers"] == {"X-Key": "val"}
         call_args = MockMCPClient.call_args
@@ -552,6 +558,7 @@ class TestMCPManager:
 
         result = mgr.set_token("gh", "ghp_mytoken123")
         assert result is True
+        assert mgr.wait_for_pending(timeout_seconds=5)
         assert (
             mgr._config["gh"]["headers"]["Authorization"]
             == "Bearer ${vault:mcp.server.gh.1041179cbd.bearer_token}"
@@ -610,3 +617,225 @@ class TestMCPManager:
             and event["details"]["error"] == "Connection refused"
             for event in events
         )
+
+
+def _named_tool(name: str) -> MagicMock:
+    tool = MagicMock()
+    tool.name = name
+    tool.description = f"{name} description"
+    tool.inputs = {"query": {"type": "string", "description": "Query"}}
+    tool.output_type = "string"
+    return tool
+
+
+def _write_config(path, servers: dict) -> str:
+    path.write_text(json.dumps({"mcpServers": servers}))
+    return str(path)
+
+
+class TestBackgroundConnections:
+    @patch("src.tools.mcp_manager.MCPClient")
+    def test_load_config_returns_while_slow_servers_are_still_connecting(self, MockMCPClient, tmp_path):
+        release = threading.Event()
+
+        def _client(params, **_kwargs):
+            client = MagicMock()
+            if "slow" in params["url"]:
+                release.wait(5)
+            client.get_tools.return_value = [_named_tool(params["url"].split("//")[1].split("/")[0] + "_search")]
+            return client
+
+        MockMCPClient.side_effect = _client
+        config_path = _write_config(
+            tmp_path / "mcp-servers.json",
+            {"fast": {"url": "http://fast/mcp"}, "slow": {"url": "http://slow/mcp"}},
+        )
+
+        mgr = MCPManager()
+        try:
+            started = time.monotonic()
+            mgr.load_config(config_path)
+            assert time.monotonic() - started < 1
+
+            deadline = time.monotonic() + 5
+            while not mgr.is_connected("fast") and time.monotonic() < deadline:
+                time.sleep(0.01)
+            statuses = {entry["name"]: entry["status"] for entry in mgr.get_config()}
+            assert statuses == {"fast": "connected", "slow": "connecting"}
+            assert [tool.name for tool in mgr.get_tools()] == ["fast_search"]
+
+            release.set()
+            assert mgr.wait_for_pending(timeout_seconds=5)
+            assert sorted(tool.name for tool in mgr.get_tools()) == ["fast_search", "slow_search"]
+            assert MockMCPClient.call_args.kwargs["adapter_kwargs"] == {
+                "connect_timeout": settings.mcp_connect_timeout_seconds,
+            }
+        finally:
+            release.set()
+            mgr.disconnect_all()
+
+    @patch("src.tools.mcp_manager.MCPClient")
+    def test_failed_background_connection_retries_with_backoff(self, MockMCPClient, tmp_path):
+        MockMCPClient.side_effect = ConnectionError("Connection refused")
+        config_path = _write_config(tmp_path / "mcp-servers.json", {"gh": {"url": "http://gh/mcp"}})
+
+        mgr = MCPManager()
+        try:
+            with (
+                patch.object(settings, "mcp_reconnect_initial_seconds", 0.02),
+                patch.object(settings, "mcp_reconnect_max_seconds", 0.04),
+            ):
+                mgr.load_config(config_path)
+                deadline = time.monotonic() + 5
+                while MockMCPClient.call_count < 3 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                assert MockMCPClient.call_count >= 3
+                assert mgr._failures["gh"] >= 2
+                entry = mgr.get_config()[0]
+                assert entry["status"] in {"error", "connecting"}
+
+                mgr.disconnect_all()
+                attempts = MockMCPClient.call_count
+                time.sleep(0.15)
+                assert MockMCPClient.call_count == attempts
+                assert mgr.get_config()[0]["status"] == "disconnected"
+        finally:
+            mgr.disconnect_all()
+
+    @patch("src.tools.mcp_manager.MCPClient")
+    def test_cached_tool_schemas_serve_until_live_connection_is_up(self, MockMCPClient, tmp_path):
+        live_tool = _named_tool("gh_search")
+        live_tool.return_value = "live result"
+        client = MagicMock()
+        client.get_tools.return_value = [live_tool]
+        MockMCPClient.return_value = client
+        config_path = _write_config(tmp_path / "mcp-servers.json", {"gh": {"url": "http://gh/mcp"}})
+
+        first = MCPManager()
+        first.load_config(config_path)
+        assert first.wait_for_pending(timeout_seconds=5)
+        first.disconnect_all()
+        cache = json.loads((tmp_path / "mcp-tool-cache.json").read_text())
+        assert cache["servers"]["gh"]["url"] == "http://gh/mcp"
+        assert cache["servers"]["gh"]["tools"][0]["name"] == "gh_search"
+
+        release = threading.Event()
+
+        def _slow_client(_params, **_kwargs):
+            release.wait(5)
+            return client
+
+        MockMCPClient.side_effect = _slow_client
+        mgr = MCPManager()
+        try:
+            mgr.load_config(config_path)
+            entry = mgr.get_config()[0]
+            assert entry["status"] == "connecting"
+            assert entry["tools_cached"] is True
+            assert entry["connected"] is False
+            cached_tool = mgr.get_tools()[0]
+            assert cached_tool.name == "gh_search"
+            assert cached_tool.inputs == {"query": {"type": "string", "description": "Query"}}
+            assert cached_tool.seraph_source_context["cached_schema"] is True
+            with pytest.raises(RuntimeError, match="still connecting"):
+                cached_tool(query="issues")
+
+            generation = mgr.generation
+            release.set()
+            assert mgr.wait_for_pending(timeout_seconds=5)
+            assert mgr.generation > generation
+            assert mgr.get_config()[0]["tools_cached"] is False
+            assert cached_tool(query="issues") == "live result"
+        finally:
+            release.set()
+            mgr.disconnect_all()
+
+    @patch("src.tools.mcp_manager.MCPClient")
+    def test_cached_tool_schemas_are_dropped_after_repeated_failures(self, MockMCPClient, tmp_path):
+        client = MagicMock()
+        client.get_tools.return_value = [_named_tool("gh_search")]
+        MockMCPClient.return_value = client
+        config_path = _write_config(tmp_path / "mcp-servers.json", {"gh": {"url": "http://gh/mcp"}})
+
+        first = MCPManager()
+        first.load_config(config_path)
+        assert first.wait_for_pending(timeout_seconds=5)
+        first.disconnect_all()
+
+        MockMCPClient.side_effect = ConnectionError("Connection refused")
+        MockMCPClient.reset_mock()
+        mgr = MCPManager()
+        try:
+            with (
+                patch.object(settings, "mcp_reconnect_initial_seconds", 0.3),
+                patch.object(settings, "mcp_reconnect_max_seconds", 60.0),
+                patch.object(settings, "mcp_cached_tools_max_failures", 2),
+            ):
+                mgr.load_config(config_path)
+                assert mgr.wait_for_pending(timeout_seconds=5)
+                assert [tool.name for tool in mgr.get_tools()] == ["gh_search"]
+                assert mgr.get_config()[0]["tools_cached"] is True
+
+                deadline = time.monotonic() + 5
+                while mgr._failures.get("gh", 0) < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                assert mgr._failures["gh"] >= 2
+                assert mgr.get_tools() == []
+                assert mgr.get_config()[0]["tools_cached"] is False
+        finally:
+            mgr.disconnect_all()
+
+    @patch("src.tools.mcp_manager.MCPClient")
+    def test_disconnect_discards_handshake_that_finishes_afterwards(self, MockMCPClient, tmp_path):
+        release = threading.Event()
+        client = MagicMock()
+        client.get_tools.return_value = [_named_tool("gh_search")]
+
+        def _slow_client(_params, **_kwargs):
+            release.wait(5)
+            return client
+
+        MockMCPClient.side_effect = _slow_client
+        config_path = _write_config(tmp_path / "mcp-servers.json", {"gh": {"url": "http://gh/mcp"}})
+
+        mgr = MCPManager()
+        try:
+            mgr.load_config(config_path)
+            pending = list(mgr._pending.values())
+            mgr.disconnect("gh")
+            release.set()
+            for future in pending:
+                future.result(timeout=5)
+            time.sleep(0.05)
+
+            assert not mgr.is_connected("gh")
+            assert mgr.get_tools() == []
+            assert mgr.get_config()[0]["status"] == "disconnected"
+        finally:
+            release.set()
+            mgr.disconnect_all()
+
+    @patch("src.tools.mcp_manager.MCPClient")
+    def test_reload_keeps_unchanged_connections_and_drops_removed_servers(self, MockMCPClient, tmp_path):
+        MockMCPClient.side_effect = lambda _params, **_kwargs: MagicMock(get_tools=MagicMock(return_value=[]))
+        config_file = tmp_path / "mcp-servers.json"
+        _write_config(config_file, {"gh": {"url": "http://gh/mcp"}, "things": {"url": "http://things/mcp"}})
+
+        mgr = MCPManager()
+        try:
+            mgr.load_config(str(config_file))
+            assert mgr.wait_for_pending(timeout_seconds=5)
+            gh_client = mgr._clients["gh"]
+
+            _write_config(config_file, {"gh": {"url": "http://gh/mcp"}})
+            mgr.load_config(str(config_file))
+            assert mgr.wait_for_pending(timeout_seconds=5)
+
+            assert mgr._clients["gh"] is gh_client
+            assert mgr.get_server_names() == ["gh"]
+            assert not mgr.is_connected("things")
+            assert MockMCPClient.call_count == 2
+        finally:
+            mgr.disconnect_all()
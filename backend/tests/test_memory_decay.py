@@ -465,3 +465,73 @@ async def test_merge_refresh_resets_decay_progress_for_future_maintenance(async_
     assert "decay_age_days" not in refreshed_metadata
     assert second_decay.decayed_count == 1
     assert after_metadata["decay_step"] == 1
+
+
+@pytest.mark.asyncio
+async def test_apply_memory_decay_only_rechecks_changed_memories_against_their_buckets(async_db):
+    from unittest.mock import patch
+
+    from src.memory import decay as decay_module
+
+    atlas = await memory_repository.get_or_create_entity(
+        canonical_name="Atlas launch",
+        entity_type="project",
+    )
+    older = await memory_repository.create_memory(
+        content="Atlas launch is delayed.",
+        kind=MemoryKind.project,
+        summary="Atlas launch delayed",
+        importance=0.8,
+        confidence=0.7,
+        project_entity_id=atlas.id,
+        last_confirmed_at=datetime.now(timezone.utc) - timedelta(days=7),
+    )
+    await memory_repository.create_memory(
+        content="Atlas launch owner is the platform team.",
+        kind=MemoryKind.project,
+        summary="Atlas launch owner platform team",
+        importance=0.6,
+        confidence=0.6,
+        project_entity_id=atlas.id,
+        last_confirmed_at=datetime.now(timezone.utc) - timedelta(days=3),
+    )
+    await memory_repository.create_memory(
+        content="User prefers morning check-ins.",
+        kind=MemoryKind.preference,
+        summary="Prefers morning check-ins",
+    )
+
+    with patch.object(decay_module, "_contradictory", wraps=decay_module._contradictory) as contradictory:
+        first = await apply_memory_decay_policies()
+        assert first.contradiction_count == 0
+        # Only the two Atlas memories share a (kind, anchor) bucket.
+        assert contradictory.call_count == 1
+
+        contradictory.reset_mock()
+        steady = await apply_memory_decay_policies()
+        assert steady.contradiction_count == 0
+        assert contradictory.call_count == 0
+
+        newer = await memory_repository.create_memory(
+            content="Atlas launch is on track.",
+            kind=MemoryKind.project,
+            summary="Atlas launch on track",
+            importance=0.9,
+            confidence=0.9,
+            project_entity_id=atlas.id,
+            last_confirmed_at=datetime.now(timezone.utc),
+        )
+        contradictory.reset_mock()
+        result = await apply_memory_decay_policies()
+
+    superseded_projects = await memory_repository.list_memories(
+        kind=MemoryKind.project,
+        limit=10,
+        status="superseded",
+    )
+    edges = await memory_repository.list_edges(from_memory_id=newer.memory_id)
+
+    assert result.contradiction_count == 1
+    assert contradictory.call_count == 2
+    assert [memory.id for memory in superseded_projects] == [older.memory_id]
+    assert {edge.edge_type for edge in edges} >= {MemoryEdgeType.contradicts, MemoryEdgeType.supersedes}
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime, timedelta, timezone
@@ -16,7 +18,8 @@ from src.extensions.lifecycle import (
     list_extension_connectors,
     set_extension_connector_enabled,
 )
-from src.extensions.registry import _current_seraph_version
+from src.extensions.registry import ExtensionRegistry, _current_seraph_version
+from src.extensions.state import load_extension_state_payload, save_extension_state_payload
 from src.memory.hybrid_retrieval import HybridMemoryRetrievalResult
 from src.memory.providers import (
     MemoryProviderHit,
@@ -24,6 +27,7 @@ from src.memory.providers import (
     MemoryProviderWritebackResult,
     clear_memory_provider_adapters,
     register_memory_provider_adapter,
+    retrieve_additive_memory_provider_context,
     writeback_additive_memory_providers,
 )
 from src.memory.retrieval_planner import plan_memory_retrieval
@@ -1095,3 +1099,75 @@ async def test_memory_provider_writeback_keeps_high_quality_duplicate_when_low_q
     assert diagnostics["suppressed_reason_counts"]["low_quality"] == 1
     assert diagnostics["suppressed_reason_counts"]["duplicate"] == 0
     assert adapter.writeback_calls[0]["texts"] == ["Atlas launch is the active release project."]
+
+
+@pytest.mark.asyncio
+async def test_memory_provider_retrieval_cancels_provider_that_misses_its_deadline(tmp_path):
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    _write_memory_provider_extension(workspace)
+    adapter = FakeMemoryProviderAdapter()
+    cancelled = False
+
+    async def stalled_retrieve(*, query: str, active_projects: tuple[str, ...] = (), limit: int = 4, config=None):
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    adapter.retrieve = stalled_retrieve  # type: ignore[method-assign]
+    register_memory_provider_adapter(adapter)
+    try:
+        with (
+            patch.object(settings, "workspace_dir", str(workspace)),
+            patch.object(settings, "memory_provider_timeout_seconds", 0.05),
+            patch.object(settings, "memory_provider_retrieval_budget_seconds", 1.0),
+        ):
+            started = time.monotonic()
+            result = await retrieve_additive_memory_provider_context(query="atlas launch")
+            elapsed = time.monotonic() - started
+    finally:
+        clear_memory_provider_adapters()
+
+    assert elapsed < 1.0
+    assert cancelled is True
+    assert result.context == ""
+    assert result.degraded is True
+    diagnostics = result.diagnostics[0]
+    assert diagnostics["timed_out"] is True
+    assert diagnostics["runtime_state"] == "degraded"
+    assert diagnostics["failed_capabilities"] == ["retrieval"]
+
+
+@pytest.mark.asyncio
+async def test_memory_provider_inventory_is_cached_until_extension_state_changes(tmp_path):
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    _write_memory_provider_extension(workspace)
+    adapter = FakeMemoryProviderAdapter()
+    register_memory_provider_adapter(adapter)
+    try:
+        with (
+            patch.object(settings, "workspace_dir", str(workspace)),
+            patch("src.memory.providers.ExtensionRegistry", wraps=ExtensionRegistry) as registry_mock,
+        ):
+            first = await retrieve_additive_memory_provider_context(query="atlas launch")
+            second = await retrieve_additive_memory_provider_context(query="atlas launch")
+            assert registry_mock.call_count == 1
+
+            state = load_extension_state_payload()
+            state["extensions"]["seraph.graph-memory-pack"]["connector_state"][
+                "connectors/memory/graph-memory.yaml"
+            ]["enabled"] = False
+            save_extension_state_payload(state)
+            third = await retrieve_additive_memory_provider_context(query="atlas launch")
+            assert registry_mock.call_count == 2
+    finally:
+        clear_memory_provider_adapters()
+
+    assert "Provider recall for atlas launch" in first.context
+    assert second.context == first.context
+    assert third.context == ""
+    assert third.diagnostics == ()
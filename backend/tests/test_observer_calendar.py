@@ -89,3 +89,24 @@ class TestCalendarSource:
             and event["details"]["upcoming_event_count"] == 0
             for event in events
         )
+
+    @pytest.mark.asyncio
+    async def test_successful_fetch_is_reused_until_ttl(self, async_db):
+        mock_path = MagicMock()
+        mock_path.exists.return_value = True
+        payload = {
+            "upcoming_events": [{"summary": "Review", "start": "10:00", "end": "11:00"}],
+            "current_event": None,
+        }
+
+        with patch("src.observer.sources.calendar_source._CREDENTIALS_PATH", mock_path), \
+             patch("src.observer.sources.calendar_source._fetch_events", return_value=payload) as mock_fetch, \
+             patch("src.observer.sources.calendar_source.settings") as mock_s:
+            mock_s.observer_calendar_cache_seconds = 300
+            first = await gather_calendar()
+            second = await gather_calendar()
+            mock_s.observer_calendar_cache_seconds = 0
+            third = await gather_calendar()
+
+        assert first == second == third
+        assert mock_fetch.call_count == 2
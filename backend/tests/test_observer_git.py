@@ -3,7 +3,7 @@ import asyncio
 from unittest.mock import patch, MagicMock
 
 from src.audit.repository import audit_repository
-from src.observer.sources.git_source import gather_git
+from src.observer.sources.git_source import _reflog_tails, gather_git
 
 
 def _reflog_line(message: str, seconds_ago: int = 0) -> str:
@@ -136,7 +136,7 @@ class TestGitSource:
         reflog.write_text(_reflog_line("commit: test", seconds_ago=30) + "\n")
 
         with patch("src.observer.sources.git_source.settings") as mock_s, \
-             patch("pathlib.Path.read_text", side_effect=OSError("nope")):
+             patch("pathlib.Path.open", side_effect=OSError("nope")):
             mock_s.observer_git_repo_path = str(tmp_path)
             mock_s.workspace_dir = str(tmp_path)
             result = gather_git()
@@ -151,3 +151,51 @@ class TestGitSource:
             and event["details"]["error"] == "nope"
             for event in events
         )
+
+    def test_reflog_is_read_incrementally(self, tmp_path):
+        git_dir = tmp_path / ".git" / "logs"
+        git_dir.mkdir(parents=True)
+        reflog = git_dir / "HEAD"
+        reflog.write_text(_reflog_line("commit: first", seconds_ago=120) + "\n")
+
+        with patch("src.observer.sources.git_source.settings") as mock_s:
+            mock_s.observer_git_repo_path = str(tmp_path)
+            mock_s.workspace_dir = str(tmp_path)
+            first = gather_git()
+            first_offset = _reflog_tails[str(reflog)].offset
+
+            with reflog.open("a") as handle:
+                handle.write(_reflog_line("commit: second", seconds_ago=30) + "\n")
+                handle.write(_reflog_line("commit: partial", seconds_ago=10))
+            second = gather_git()
+
+            with reflog.open("a") as handle:
+                handle.write("\n")
+            third = gather_git()
+
+        assert [item["message"] for item in first["recent_git_activity"]] == ["commit: first"]
+        assert first_offset == len(_reflog_line("commit: first", seconds_ago=120)) + 1
+        assert [item["message"] for item in second["recent_git_activity"]] == [
+            "commit: second",
+            "commit: first",
+        ]
+        assert [item["message"] for item in third["recent_git_activity"]] == [
+            "commit: partial",
+            "commit: second",
+            "commit: first",
+        ]
+
+    def test_rewritten_reflog_is_reread(self, tmp_path):
+        git_dir = tmp_path / ".git" / "logs"
+        git_dir.mkdir(parents=True)
+        reflog = git_dir / "HEAD"
+        reflog.write_text(_reflog_line("commit: before gc", seconds_ago=60) + "\n")
+
+        with patch("src.observer.sources.git_source.settings") as mock_s:
+            mock_s.observer_git_repo_path = str(tmp_path)
+            mock_s.workspace_dir = str(tmp_path)
+            gather_git()
+            reflog.write_text(_reflog_line("commit: after gc", seconds_ago=30) + "\n")
+            result = gather_git()
+
+        assert [item["message"] for item in result["recent_git_activity"]] == ["commit: after gc"]
@@ -625,6 +625,36 @@ class TestQueuedBundleAudit:
         )
 
 
+class TestObserverSourceDeadlines:
+    @pytest.mark.asyncio
+    async def test_slow_source_times_out_without_blocking_others(self):
+        mgr = ContextManager()
+
+        async def _slow_calendar():
+            await asyncio.sleep(5)
+            return {"upcoming_events": [{"summary": "late"}], "current_event": None}
+
+        with patch("src.observer.manager._active_observer_definitions", return_value=[
+            ("time", "time"),
+            ("calendar", "calendar"),
+        ]), \
+             patch.object(settings, "observer_source_timeout_seconds", 0.05), \
+             patch("src.observer.sources.time_source.gather_time", return_value={
+                 "time_of_day": "morning",
+                 "day_of_week": "Monday",
+                 "is_working_hours": True,
+             }), \
+             patch("src.observer.sources.calendar_source.gather_calendar", _slow_calendar):
+            started = time.monotonic()
+            ctx = await mgr.refresh()
+            elapsed = time.monotonic() - started
+
+        assert elapsed < 2
+        assert ctx.time_of_day == "morning"
+        assert ctx.upcoming_events == []
+        assert ctx.data_quality == "degraded"
+
+
 class TestCurrentContextSerialization:
     def test_to_dict_with_interaction(self):
         ctx = CurrentContext(last_interaction=datetime(2025, 6, 2, 10, 0, tzinfo=timezone.utc))
@@ -892,6 +892,131 @@ async def test_screenshot_folder_scan_skips_duplicate_hash(async_db, client, tmp
     assert second.json()["skipped_duplicates"] == 1
 
 
+@pytest.mark.asyncio
+async def test_screenshot_folder_scan_manifest_skips_hashing_unchanged_files(
+    async_db, client, tmp_path, monkeypatch
+):
+    import src.observer.screenshot_folder_source as screenshot_folder_source
+
+    root = tmp_path / "screenshots"
+    _write_screenshot(root, name="1782833900-000000000.png", data=b"first")
+    _write_screenshot(root / "2026", name="1782833901-000000000.png", data=b"second")
+    monkeypatch.setattr("src.observer.screenshot_folder_source.analyze_screenshot_image", _no_semantic_analysis)
+    hashed: list[str] = []
+    real_sha256_file = screenshot_folder_source._sha256_file
+
+    def counting_sha256_file(path: Path) -> str:
+        hashed.append(path.name)
+        return real_sha256_file(path)
+
+    monkeypatch.setattr("src.observer.screenshot_folder_source._sha256_file", counting_sha256_file)
+
+    first = await client.post(
+        "/api/observer/screenshot-folder/scan",
+        json={"screenshot_folder": str(root), "limit": 10},
+    )
+    assert first.json()["ingested"] == 2
+    assert sorted(hashed) == ["1782833900-000000000.png", "1782833901-000000000.png"]
+
+    hashed.clear()
+    second = await client.post(
+        "/api/observer/screenshot-folder/scan",
+        json={"screenshot_folder": str(root), "limit": 10},
+    )
+    assert second.json()["scanned"] == 2
+    assert second.json()["skipped_duplicates"] == 2
+    assert hashed == []
+
+    _write_screenshot(root / "2026", name="1782833902-000000000.png", data=b"third")
+    third = await client.post(
+        "/api/observer/screenshot-folder/scan",
+        json={"screenshot_folder": str(root), "limit": 10},
+    )
+    assert third.json()["ingested"] == 1
+    assert third.json()["skipped_duplicates"] == 2
+    assert hashed == ["1782833902-000000000.png"]
+
+
+@pytest.mark.asyncio
+async def test_screenshot_folder_scan_detects_observations_ingested_before_manifest(async_db, client, tmp_path):
+    from sqlalchemy import delete
+
+    from src.db.models import ScreenshotFolderFile
+
+    root = tmp_path / "screenshots"
+    _write_screenshot(root, name="capture-legacy.png")
+
+    first = await client.post(
+        "/api/observer/screenshot-folder/scan",
+        json={"screenshot_folder": str(root), "limit": 10},
+    )
+    async with async_db() as db:
+        await db.execute(delete(ScreenshotFolderFile))
+    second = await client.post(
+        "/api/observer/screenshot-folder/scan",
+        json={"screenshot_folder": str(root), "limit": 10},
+    )
+
+    assert first.json()["ingested"] == 1
+    assert second.json()["ingested"] == 0
+    assert second.json()["skipped_duplicates"] == 1
+    async with async_db() as db:
+        result = await db.execute(select(ScreenshotFolderFile))
+        assert len(result.scalars().all()) == 1
+
+
+@pytest.mark.asyncio
+async def test_screenshot_folder_scan_reuses_listing_but_rehashes_files_rewritten_in_place(
+    async_db, client, tmp_path, monkeypatch
+):
+    import src.observer.screenshot_folder_source as screenshot_folder_source
+
+    root = tmp_path / "screenshots"
+    _write_screenshot(root, name="1782833900-000000000.png", data=b"first")
+    rewritten = _write_screenshot(root, name="1782833901-000000000.png", data=b"second")
+    # Age the directory past the mtime grace window so its listing is recorded.
+    old_ns = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp() * 1_000_000_000
+    os.utime(root, ns=(int(old_ns), int(old_ns)))
+    monkeypatch.setattr("src.observer.screenshot_folder_source.analyze_screenshot_image", _no_semantic_analysis)
+    hashed: list[str] = []
+    listed: list[str] = []
+    real_sha256_file = screenshot_folder_source._sha256_file
+    real_scandir = os.scandir
+
+    def counting_sha256_file(path: Path) -> str:
+        hashed.append(path.name)
+        return real_sha256_file(path)
+
+    def counting_scandir(path):
+        listed.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr("src.observer.screenshot_folder_source._sha256_file", counting_sha256_file)
+    monkeypatch.setattr(screenshot_folder_source.os, "scandir", counting_scandir)
+
+    first = await client.post(
+        "/api/observer/screenshot-folder/scan",
+        json={"screenshot_folder": str(root), "limit": 10},
+    )
+    assert first.json()["ingested"] == 2
+    assert str(root.resolve()) in listed
+
+    listed.clear()
+    hashed.clear()
+    rewritten.write_bytes(b"second, edited")
+    os.utime(root, ns=(int(old_ns), int(old_ns)))
+    second = await client.post(
+        "/api/observer/screenshot-folder/scan",
+        json={"screenshot_folder": str(root), "limit": 10},
+    )
+
+    assert str(root.resolve()) not in listed
+    assert hashed == ["1782833901-000000000.png"]
+    assert second.json()["scanned"] == 2
+    assert second.json()["ingested"] == 1
+    assert second.json()["skipped_duplicates"] == 1
+
+
 def _write_screenshot(root: Path, *, name: str, data: bytes = b"png bytes") -> Path:
     root.mkdir(parents=True, exist_ok=True)
     image = root / name
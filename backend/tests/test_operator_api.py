@@ -8163,6 +8163,32 @@ async def test_operator_memory_benchmark_surface_reports_failure_taxonomy_and_po
     assert payload["policy"]["ci_gate_mode"] == "required_benchmark_suite"
 
 
+@pytest.mark.asyncio
+async def test_operator_benchmark_reports_are_materialized_and_refreshable(client):
+    from src.evals import harness
+
+    with patch(
+        "src.evals.harness._execute_benchmark_suites",
+        AsyncMock(wraps=harness._execute_benchmark_suites),
+    ) as mock_execute:
+        first = await client.get("/api/operator/memory-benchmark")
+        second = await client.get("/api/operator/memory-benchmark")
+        assert mock_execute.await_count == 1
+        refreshed = await client.get("/api/operator/memory-benchmark?refresh=true")
+        assert mock_execute.await_count == 2
+
+    assert first.status_code == second.status_code == refreshed.status_code == 200
+    assert second.json()["summary"] == first.json()["summary"]
+
+    reports = (await client.get("/api/operator/benchmark-reports")).json()
+    assert reports["stats"]["entries"] == 1
+    assert reports["stats"]["hits"] == 1
+    [entry] = reports["entries"]
+    assert entry["suite_names"] == ["guardian_memory_quality"]
+    assert entry["fingerprint"]
+    assert entry["materialized_at"]
+
+
 @pytest.mark.asyncio
 async def test_operator_m6_memory_superiority_benchmark_surface_reports_policy_and_receipts(client):
     resp = await client.get("/api/operator/m6-memory-superiority-benchmark")
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -47,7 +48,7 @@ class TestConnectionManager:
         msg = WSResponse(type="proactive", content="hello")
         result = await mgr.broadcast(msg)
 
-        expected_payload = msg.model_dump_json()
+        expected_payload = msg.model_copy(update={"broadcast_seq": 1}).model_dump_json()
         ws1.send_text.assert_called_once_with(expected_payload)
         ws2.send_text.assert_called_once_with(expected_payload)
         assert result == BroadcastResult(
@@ -89,6 +90,121 @@ class TestConnectionManager:
         )
 
 
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_slow_connection(self):
+        mgr = ConnectionManager()
+        fast = AsyncMock()
+        slow = AsyncMock()
+        release = asyncio.Event()
+
+        async def stalled_send(_payload):
+            await release.wait()
+
+        slow.send_text.side_effect = stalled_send
+        mgr.connect(slow)
+        mgr.connect(fast)
+
+        with patch("src.scheduler.connection_manager.settings.ws_broadcast_ack_timeout_ms", 5000):
+            result = await asyncio.wait_for(mgr.broadcast(WSResponse(type="proactive", content="hi")), timeout=1)
+
+        fast.send_text.assert_awaited_once()
+        assert result == BroadcastResult(
+            attempted_connections=2,
+            delivered_connections=1,
+            failed_connections=0,
+            queued_connections=1,
+        )
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        slow.send_text.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_withdraws_frame_no_connection_sent_in_time(self):
+        mgr = ConnectionManager()
+        slow = AsyncMock()
+        release = asyncio.Event()
+
+        async def stalled_send(_payload):
+            await release.wait()
+
+        slow.send_text.side_effect = stalled_send
+        mgr.connect(slow)
+
+        with patch("src.scheduler.connection_manager.settings.ws_broadcast_ack_timeout_ms", 20):
+            in_flight = await mgr.broadcast(WSResponse(type="proactive", content="p0"))
+            behind = await mgr.broadcast(WSResponse(type="proactive", content="p1"))
+
+        assert in_flight == BroadcastResult(attempted_connections=1, delivered_connections=1, failed_connections=0)
+        assert behind == BroadcastResult(
+            attempted_connections=1,
+            delivered_connections=0,
+            failed_connections=0,
+            queued_connections=1,
+        )
+        assert mgr.stats()["connections"][0]["queued"] == 0
+        assert mgr.stats()["replay_buffered"] == 1
+
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        sent = [json.loads(call.args[0]) for call in slow.send_text.await_args_list]
+        assert [item["content"] for item in sent] == ["p0"]
+
+    @pytest.mark.asyncio
+    async def test_slow_connection_queue_drops_oldest_and_coalesces_ambient(self):
+        mgr = ConnectionManager()
+        slow = AsyncMock()
+        release = asyncio.Event()
+
+        async def stalled_send(_payload):
+            await release.wait()
+
+        slow.send_text.side_effect = stalled_send
+        mgr.connect(slow)
+
+        with (
+            patch("src.scheduler.connection_manager.settings.ws_outbound_queue_size", 2),
+            patch("src.scheduler.connection_manager.settings.ws_broadcast_ack_timeout_ms", 0),
+        ):
+            for index in range(4):
+                await mgr.broadcast(WSResponse(type="proactive", content=f"p{index}"))
+            await mgr.broadcast(WSResponse(type="ambient", state="idle"))
+            await mgr.broadcast(WSResponse(type="ambient", state="focused"))
+
+        connection = mgr.stats()["connections"][0]
+        assert connection["queued"] == 2
+        assert connection["dropped"] == 3
+        assert connection["coalesced"] == 1
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        sent = [json.loads(call.args[0]) for call in slow.send_text.await_args_list]
+        assert [item["broadcast_seq"] for item in sent] == [4, 6]
+        assert all(item["seq"] is None for item in sent)
+        assert sent[-1]["state"] == "focused"
+        assert mgr.stats()["connections"][0]["last_sent_seq"] == 6
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replays_broadcasts_after_last_broadcast_seq(self):
+        mgr = ConnectionManager()
+        first = AsyncMock()
+        mgr.connect(first)
+        for index in range(3):
+            await mgr.broadcast(WSResponse(type="proactive", content=f"p{index}"))
+        mgr.disconnect(first)
+
+        reconnected = AsyncMock()
+        mgr.connect(reconnected, last_broadcast_seq=1)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        replayed = [json.loads(call.args[0]) for call in reconnected.send_text.await_args_list]
+        assert [(item["broadcast_seq"], item["content"]) for item in replayed] == [(2, "p1"), (3, "p2")]
+        assert mgr.stats()["replayed"] == 2
+
+
 # ── Scheduler engine ───────────────────────────────────────
 
 
@@ -133,6 +249,7 @@ class TestSchedulerEngine:
                     "screenshot_observation_digest",
                     "weekly_activity_review",
                     "screen_cleanup",
+                    "benchmark_report_refresh",
                 }
             finally:
                 shutdown_scheduler()
@@ -1,5 +1,6 @@
 """Tests for screen observation repository and model."""
 
+import asyncio
 from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
@@ -213,7 +214,7 @@ class TestScreenObservationRepository:
         repo = ScreenObservationRepository()
         week_start = date.today() - timedelta(days=date.today().weekday())
 
-        with patch.object(repo, "get_daily_summary", AsyncMock(side_effect=RuntimeError("db down"))):
+        with patch.object(repo, "_load_day_rollups", AsyncMock(side_effect=RuntimeError("db down"))):
             with pytest.raises(RuntimeError, match="db down"):
                 await repo.get_weekly_summary(week_start)
 
@@ -225,6 +226,152 @@ class TestScreenObservationRepository:
             for event in events
         )
 
+    @pytest.mark.asyncio
+    async def test_rollups_track_durations_and_streaks(self, async_db):
+        repo = ScreenObservationRepository()
+        today = datetime.now(timezone.utc).date()
+        start = datetime(today.year, today.month, today.day, 9, 0, tzinfo=timezone.utc)
+
+        await repo.create(app_name="VS Code", activity_type="coding", project="seraph", timestamp=start)
+        await repo.create(
+            app_name="VS Code", activity_type="coding", project="seraph",
+            timestamp=start + timedelta(minutes=20),
+        )
+        await repo.create(app_name="1Password", blocked=True, timestamp=start + timedelta(minutes=50))
+        await repo.create(
+            app_name="Safari", activity_type="browsing", timestamp=start + timedelta(minutes=60),
+        )
+        await repo.create(
+            app_name="VS Code", activity_type="coding", project="seraph",
+            timestamp=start + timedelta(minutes=75),
+        )
+
+        summary = await repo.get_daily_summary(today)
+        assert summary["total_observations"] == 4
+        assert summary["total_tracked_minutes"] == 65
+        assert summary["by_activity"] == {"coding": 50 * 60, "browsing": 15 * 60}
+        assert summary["by_project"] == {"seraph": 50 * 60}
+        assert summary["by_app"] == {"VS Code": 50 * 60, "Safari": 15 * 60}
+        assert summary["longest_streaks"] == [
+            {"activity": "coding", "duration_minutes": 50, "started_at": start.isoformat()},
+            {
+                "activity": "browsing",
+                "duration_minutes": 15,
+                "started_at": (start + timedelta(minutes=60)).isoformat(),
+            },
+        ]
+
+        hourly = await repo.get_hourly_breakdown(today)
+        assert [(hour["hour"], hour["observations"], hour["tracked_minutes"]) for hour in hourly] == [
+            (9, 2, 50),
+            (10, 2, 15),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_rollups_matches_incremental_rollups(self, async_db):
+        repo = ScreenObservationRepository()
+        today = datetime.now(timezone.utc).date()
+        start = datetime(today.year, today.month, today.day, 9, 0, tzinfo=timezone.utc)
+
+        for minutes, app, activity in [
+            (0, "VS Code", "coding"),
+            (10, "Safari", "browsing"),
+            (25, "VS Code", "coding"),
+            (40, "Slack", "communication"),
+        ]:
+            await repo.create(
+                app_name=app, activity_type=activity,
+                project="seraph" if activity == "coding" else None,
+                timestamp=start + timedelta(minutes=minutes),
+            )
+        incremental = await repo.get_daily_summary(today)
+
+        # Simulate a database that predates the rollup tables.
+        async with async_db() as db:
+            from sqlalchemy import delete
+            from src.db.models import ScreenActivityRollup, ScreenActivityStreak
+
+            await db.execute(delete(ScreenActivityRollup))
+            await db.execute(delete(ScreenActivityStreak))
+            await db.commit()
+        assert (await repo.get_daily_summary(today))["total_observations"] == 0
+
+        result = await repo.rebuild_rollups()
+        rebuilt = await repo.get_daily_summary(today)
+
+        assert result["observations_scanned"] == 4
+        assert rebuilt == incremental
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_create_splices_durations_and_streaks(self, async_db):
+        repo = ScreenObservationRepository()
+        today = datetime.now(timezone.utc).date()
+        start = datetime(today.year, today.month, today.day, 9, 0, tzinfo=timezone.utc)
+
+        await repo.create(app_name="VS Code", activity_type="coding", timestamp=start)
+        await repo.create(app_name="VS Code", activity_type="coding", timestamp=start + timedelta(minutes=30))
+        await repo.create(app_name="Safari", activity_type="browsing", timestamp=start + timedelta(minutes=40))
+        # Arrives late: splits the first coding streak with 20 minutes of browsing.
+        late = await repo.create(
+            app_name="Safari", activity_type="browsing", timestamp=start + timedelta(minutes=10),
+        )
+
+        assert late.duration_s == 20 * 60
+        summary = await repo.get_daily_summary(today)
+        assert summary["total_observations"] == 4
+        assert summary["by_activity"] == {"coding": 20 * 60, "browsing": 20 * 60}
+        assert summary["longest_streaks"] == [
+            {
+                "activity": "browsing",
+                "duration_minutes": 20,
+                "started_at": (start + timedelta(minutes=10)).isoformat(),
+            },
+            {"activity": "coding", "duration_minutes": 10, "started_at": start.isoformat()},
+            {
+                "activity": "coding",
+                "duration_minutes": 10,
+                "started_at": (start + timedelta(minutes=30)).isoformat(),
+            },
+        ]
+
+        await repo.rebuild_rollups()
+        assert await repo.get_daily_summary(today) == summary
+
+    @pytest.mark.asyncio
+    async def test_ensure_rollups_backfills_only_when_missing(self, async_db):
+        repo = ScreenObservationRepository()
+        today = datetime.now(timezone.utc).date()
+        start = datetime(today.year, today.month, today.day, 9, 0, tzinfo=timezone.utc)
+        assert await repo.ensure_rollups() is None
+
+        await repo.create(app_name="VS Code", activity_type="coding", timestamp=start)
+        await repo.create(app_name="Safari", activity_type="browsing", timestamp=start + timedelta(minutes=10))
+        assert await repo.ensure_rollups() is None
+
+        async with async_db() as db:
+            from sqlalchemy import delete
+            from src.db.models import ScreenActivityRollup
+
+            await db.execute(delete(ScreenActivityRollup))
+            await db.commit()
+
+        result = await repo.ensure_rollups()
+        assert result["observations_scanned"] == 2
+        assert (await repo.get_daily_summary(today))["total_observations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_create_waits_for_a_running_rebuild(self, async_db):
+        repo = ScreenObservationRepository()
+        lock = repo._lock_for_loop()
+
+        async with lock:
+            pending = asyncio.create_task(repo.create(app_name="VS Code", activity_type="coding"))
+            await asyncio.sleep(0.01)
+            assert not pending.done()
+
+        obs = await pending
+        assert obs.app_name == "VS Code"
+
     @pytest.mark.asyncio
     async def test_cleanup_old(self, async_db):
         repo = ScreenObservationRepository()
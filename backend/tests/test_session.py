@@ -116,6 +116,56 @@ class TestGetHistoryText:
         assert "User: Hello" in text
         assert "Assistant: Hi!" in text
 
+    async def test_stores_token_counts_and_persists_rolling_summary(self, async_db, sm):
+        from src.db.models import Message, SessionContextSummary
+        from sqlmodel import select
+
+        await sm.get_or_create("s1")
+        for index in range(6):
+            await sm.add_message("s1", "user" if index % 2 == 0 else "assistant", f"turn {index} " * 200)
+        await sm.add_message("s1", "step", "Thinking...")
+
+        async with async_db() as db:
+            messages = (await db.execute(select(Message).where(Message.session_id == "s1"))).scalars().all()
+        assert all(m.token_count for m in messages if m.role != "step")
+        assert all(m.token_count is None for m in messages if m.role == "step")
+
+        with patch("src.agent.context_window.settings") as mock_settings, patch(
+            "src.agent.context_window._summarize", return_value=("middle summary", False)
+        ) as mock_summarize, patch("src.agent.session.flush_session_memory", new_callable=AsyncMock):
+            mock_settings.context_window_token_budget = 500
+            mock_settings.context_window_keep_first = 1
+            mock_settings.context_window_keep_recent = 2
+            text = await sm.get_history_text("s1")
+            again = await sm.get_history_text("s1")
+
+        assert "middle summary" in text
+        assert again == text
+        mock_summarize.assert_called_once()
+        async with async_db() as db:
+            stored = await db.get(SessionContextSummary, "s1")
+        assert stored is not None
+        assert stored.message_count == 3
+
+    async def test_backfills_legacy_token_counts_before_summarizing(self, async_db, sm):
+        from sqlalchemy import update
+        from src.db.models import Message
+        from sqlmodel import select
+
+        await sm.get_or_create("s1")
+        await sm.add_message("s1", "user", "Hello")
+        await sm.add_message("s1", "assistant", "Hi!")
+        async with async_db() as db:
+            await db.execute(update(Message).values(token_count=None))
+            await db.commit()
+
+        text = await sm.get_history_text("s1")
+
+        assert "User: Hello" in text
+        async with async_db() as db:
+            messages = (await db.execute(select(Message).where(Message.session_id == "s1"))).scalars().all()
+        assert all(m.token_count for m in messages)
+
     async def test_excludes_step_messages(self, async_db, sm):
         await sm.get_or_create("s1")
         await sm.add_message("s1", "user", "Hello")
@@ -197,6 +247,41 @@ class TestListSessions:
         result = await sm.list_sessions()
         assert result[0]["last_message"] == "Hello world"
 
+    async def test_add_message_maintains_listing_columns(self, async_db, sm):
+        await sm.get_or_create("s1")
+        await sm.add_message("s1", "user", "x" * 150)
+        await sm.add_message("s1", "assistant", "Answer")
+        await sm.add_message("s1", "step", "thinking")
+
+        session = await sm.get("s1")
+        assert session.message_count == 2
+        assert session.last_message_preview == "thinking"
+        assert session.last_message_role == "step"
+        assert session.last_message_at is not None
+        assert (await sm.list_sessions())[0]["last_message"] == "thinking"
+
+    async def test_keyset_pages_cover_every_session_once(self, async_db, sm):
+        for index in range(5):
+            await sm.get_or_create(f"s{index}")
+            await sm.add_message(f"s{index}", "user", f"message {index}")
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page, cursor = await sm.list_sessions_page(limit=2, cursor=cursor)
+            assert len(page) <= 2
+            seen.extend(item["id"] for item in page)
+            if cursor is None:
+                break
+
+        assert seen == [item["id"] for item in await sm.list_sessions()]
+        assert seen[0] == "s4"
+        assert sorted(seen) == [f"s{index}" for index in range(5)]
+
+    async def test_rejects_malformed_cursor(self, async_db, sm):
+        with pytest.raises(ValueError):
+            await sm.list_sessions_page(limit=2, cursor="not-a-cursor")
+
 
 class TestSearchSessions:
     async def test_matches_message_content(self, async_db, sm):
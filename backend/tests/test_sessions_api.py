@@ -30,6 +30,27 @@ class TestListSessions:
         assert res.status_code == 200
         assert len(res.json()) == 2
 
+    async def test_paginates_with_next_cursor_header(self, client, async_db):
+        sm = SessionManager()
+        for session_id in ("s1", "s2", "s3"):
+            await sm.get_or_create(session_id)
+
+        first = await client.get("/api/sessions", params={"limit": 2})
+        assert first.status_code == 200
+        assert len(first.json()) == 2
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = await client.get("/api/sessions", params={"limit": 2, "cursor": cursor})
+        assert second.status_code == 200
+        assert len(second.json()) == 1
+        assert "X-Next-Cursor" not in second.headers
+        ids = [item["id"] for item in first.json() + second.json()]
+        assert sorted(ids) == ["s1", "s2", "s3"]
+
+    async def test_invalid_cursor_is_rejected(self, client, async_db):
+        res = await client.get("/api/sessions", params={"limit": 2, "cursor": "bogus"})
+        assert res.status_code == 400
+
 
 class TestSearchSessions:
     async def test_search_success(self, client, async_db):
@@ -12,7 +12,8 @@ from starlette.testclient import TestClient
 
 # Ensure models are registered in SQLModel.metadata before create_all
 import src.db.models  # noqa: F401
-from src.api.ws import _build_agent
+from src.api.ws import _build_agent, _FinalAnswerStream, _partial_json_string
+from src.vault.redaction import SecretRedactor
 
 
 def _make_sync_client_with_db():
@@ -146,3 +147,51 @@ async def test_build_agent_passes_message_to_onboarding_agent(mock_profile, mock
     mock_create_onboarding_agent.assert_called_once_with(
         "Please review https://example.com/about during onboarding."
     )
+
+
+def _final_answer_delta(arguments: str, *, name: str | None = None):
+    return SimpleNamespace(
+        content=None,
+        tool_calls=[SimpleNamespace(index=0, function=SimpleNamespace(name=name, arguments=arguments))],
+    )
+
+
+def test_partial_json_string_decodes_unterminated_values():
+    assert _partial_json_string('{"answer": "Hi \\"there\\"\\nand', "answer") == 'Hi "there"\nand'
+    assert _partial_json_string('{"answer": "caf\\u00e9 ok"}', "answer") == "caf\u00e9 ok"
+    assert _partial_json_string('{"answ', "answer") is None
+
+
+def test_final_answer_stream_releases_redacted_words_and_resets():
+    stream = _FinalAnswerStream(SecretRedactor(["tok-secret"]))
+
+    chunks = [
+        stream.feed(_final_answer_delta("", name="final_answer")),
+        stream.feed(_final_answer_delta('{"answer": "Your key tok-')),
+        stream.feed(_final_answer_delta('secret is set')),
+        stream.feed(_final_answer_delta(' now"}')),
+    ]
+
+    assert chunks == ["", "Your key ", "[redacted secret] is ", "set "]
+    assert stream.reset() is True
+    assert stream.reset() is False
+
+
+def test_final_answer_stream_holds_back_a_secret_that_spans_whitespace():
+    stream = _FinalAnswerStream(SecretRedactor(["correct horse battery"]))
+
+    chunks = [
+        stream.feed(_final_answer_delta('{"answer": "Passphrase: correct ', name="final_answer")),
+        stream.feed(_final_answer_delta('horse ')),
+        stream.feed(_final_answer_delta('battery staple ')),
+        stream.feed(_final_answer_delta('correct answer "}')),
+    ]
+
+    assert chunks == ["Passphrase: ", "", "[redacted secret] staple ", "correct answer "]
+
+
+def test_final_answer_stream_ignores_other_tool_calls():
+    stream = _FinalAnswerStream(SecretRedactor([]))
+
+    assert stream.feed(_final_answer_delta('{"query": "weather today "}', name="web_search")) == ""
+    assert stream.reset() is False
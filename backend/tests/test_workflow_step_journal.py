@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from src.workflows.step_journal import WorkflowStepJournal
+
+
+def _journal(writer, *, batch_size=10, commit_delay_seconds=0.01):
+    return WorkflowStepJournal(
+        writer=writer,
+        batch_size=batch_size,
+        commit_delay_seconds=commit_delay_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_step_journal_commits_deferred_transitions_after_delay():
+    batches: list[list[str]] = []
+
+    async def _writer(transitions):
+        batches.append([item["step_id"] for item in transitions])
+        return len(transitions)
+
+    journal = _journal(_writer)
+    assert await journal.append({"step_id": "a"}) is None
+    assert await journal.append({"step_id": "b"}) is None
+    assert batches == []
+    assert journal.stats()["pending"] == 2
+
+    await asyncio.sleep(0.05)
+
+    assert batches == [["a", "b"]]
+    assert journal.stats() == {"pending": 0, "enqueued": 2, "committed": 2, "batches": 1, "failed": 0, "dropped": 0}
+
+
+@pytest.mark.asyncio
+async def test_step_journal_sync_append_and_batch_size_flush_in_order():
+    batches: list[list[str]] = []
+
+    async def _writer(transitions):
+        batches.append([item["step_id"] for item in transitions])
+        return len(transitions)
+
+    journal = _journal(_writer, batch_size=3)
+    await journal.append({"step_id": "read"})
+    assert await journal.append({"step_id": "write"}, defer=False) == 2
+    await journal.append({"step_id": "a"})
+    await journal.append({"step_id": "b"})
+    await journal.append({"step_id": "c"})
+
+    assert batches == [["read", "write"], ["a", "b", "c"]]
+    await asyncio.sleep(0.05)
+    assert len(batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_step_journal_raises_only_for_synchronous_flushes():
+    async def _writer(_transitions):
+        raise RuntimeError("database locked")
+
+    journal = _journal(_writer, batch_size=1)
+    assert await journal.append({"step_id": "deferred"}) is None
+    with pytest.raises(RuntimeError, match="database locked"):
+        await journal.append({"step_id": "required"}, defer=False)
+
+    # The deferred transition failed once alone and again alongside "required".
+    assert journal.stats()["failed"] == 3
+    assert journal.stats()["pending"] == 2
+
+
+@pytest.mark.asyncio
+async def test_step_journal_requeues_failed_batch_ahead_of_new_transitions():
+    batches: list[list[str]] = []
+    failures = [RuntimeError("database locked")]
+
+    async def _writer(transitions):
+        if failures:
+            raise failures.pop()
+        batches.append([item["step_id"] for item in transitions])
+        return len(transitions)
+
+    journal = _journal(_writer)
+    await journal.append({"step_id": "start"})
+    with pytest.raises(RuntimeError, match="database locked"):
+        await journal.append({"step_id": "finish"}, defer=False)
+    await journal.append({"step_id": "next"})
+
+    assert await journal.flush() == 3
+    assert batches == [["start", "finish", "next"]]
+    assert journal.stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_step_journal_isolates_a_run_whose_writes_keep_failing():
+    batches: list[list[str]] = []
+
+    async def _writer(transitions):
+        if any(item["run_identity"] == "bad" for item in transitions):
+            raise ValueError("constraint failed")
+        batches.append([item["step_id"] for item in transitions])
+        return {(item["run_identity"], item["step_id"]): item["step_id"] for item in transitions}
+
+    journal = WorkflowStepJournal(
+        writer=_writer,
+        batch_size=10,
+        commit_delay_seconds=0.01,
+        max_run_failures=2,
+    )
+    await journal.append({"run_identity": "bad", "step_id": "poisoned"})
+    assert await journal.append({"run_identity": "good", "step_id": "write"}, defer=False) == {
+        ("good", "write"): "write",
+    }
+    assert journal.stats()["pending"] == 1
+
+    with pytest.raises(ValueError, match="constraint failed"):
+        await journal.flush()
+    assert await journal.append({"run_identity": "good", "step_id": "finish"}, defer=False) == {
+        ("good", "finish"): "finish",
+    }
+
+    assert batches == [["write"], ["finish"]]
+    assert journal.stats() == {
+        "pending": 0,
+        "enqueued": 3,
+        "committed": 2,
+        "batches": 2,
+        "failed": 2,
+        "dropped": 1,
+    }
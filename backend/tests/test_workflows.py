@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import json
 import os
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,13 +16,20 @@ import pytest
 from src.approval.repository import fingerprint_tool_call
 from src.extensions.governance import governance_signature_value
 from src.extensions.registry import default_manifest_roots_for_workspace
-from src.workflows.loader import Workflow, WorkflowStep, _parse_workflow_file, load_workflows
+from src.workflows.loader import (
+    Workflow,
+    WorkflowStep,
+    _parse_workflow_file,
+    load_workflows,
+    parse_workflow_content,
+)
 from src.workflows.manager import (
     DurableWorkflowStateUnavailable,
     WorkflowManager,
     WorkflowTool,
     _approval_context_for_workflow,
     _checkpoint_context_allowed,
+    _workflow_step_dependencies,
     workflow_manager,
 )
 from src.approval.exceptions import ApprovalRequired
@@ -607,6 +617,30 @@ class TestWorkflowManager:
         assert canvas_output["summary"] == "workflow content redacted"
         assert all("items" not in section for section in canvas_output["sections"])
 
+    def test_workflow_tool_audit_payload_is_scoped_to_the_calling_context(self):
+        workflow = Workflow(
+            name="shared-tool",
+            description="Cached workflow tool shared across turns",
+            inputs={"query": {"type": "string", "required": True}},
+            steps=[WorkflowStep(tool="web_search", arguments={"query": "{{ query }}"}, id="search")],
+            requires_tools=["web_search"],
+        )
+        workflow_tool = WorkflowTool(
+            workflow,
+            tools_by_name={"web_search": DummyTool("web_search", lambda query: f"result for {query}")},
+        )
+        first_turn = contextvars.copy_context()
+        second_turn = contextvars.copy_context()
+
+        first_turn.run(workflow_tool, query="alpha")
+        second_turn.run(workflow_tool, query="beta")
+        first_payload = first_turn.run(workflow_tool.get_audit_result_payload, {"query": "alpha"}, None)
+        second_payload = second_turn.run(workflow_tool.get_audit_result_payload, {"query": "beta"}, None)
+
+        assert first_payload is not None and second_payload is not None
+        assert first_payload[1]["run_fingerprint"] != second_payload[1]["run_fingerprint"]
+        assert workflow_tool.get_audit_result_payload({}, None) is None
+
     def test_workflow_tool_resolves_legacy_shell_execute_alias(self):
         workflow = Workflow(
             name="legacy-shell-workflow",
@@ -896,6 +930,188 @@ def test_workflow_tool_allows_partial_migration_missing_durable_state_tables():
     assert durable_repository.record_step_started.await_count == 1
 
 
+def _durable_repository_mock():
+    return SimpleNamespace(
+        create_run=AsyncMock(),
+        record_step_started=AsyncMock(),
+        record_step_completed=AsyncMock(),
+        record_step_failed=AsyncMock(),
+        finish_run=AsyncMock(),
+    )
+
+
+def test_workflow_loader_reads_depends_on_and_rejects_forward_references():
+    content = """---
+name: fan-out
+description: Search twice and save
+requires:
+  tools: [web_search, write_file]
+steps:
+  - id: first
+    tool: web_search
+    arguments: {query: a}
+  - id: second
+    tool: web_search
+    depends_on: first
+    arguments: {query: b}
+---
+"""
+    workflow = parse_workflow_content(content)
+    assert workflow is not None
+    assert workflow.steps[0].depends_on == []
+    assert workflow.steps[1].depends_on == ["first"]
+
+    errors: list[dict[str, str]] = []
+    forward = content.replace("depends_on: first", "depends_on: [later]")
+    assert parse_workflow_content(forward, errors=errors) is None
+    assert "depends on unknown or later steps: later" in errors[0]["message"]
+
+
+def test_workflow_step_dependencies_follow_templates_and_side_effect_barriers():
+    workflow = Workflow(
+        name="deps",
+        description="Dependency inference",
+        inputs={},
+        steps=[
+            WorkflowStep(id="a", tool="web_search", arguments={"query": "one"}),
+            WorkflowStep(id="b", tool="web_search", arguments={"query": "two"}),
+            WorkflowStep(id="save", tool="write_file", arguments={"content": "{{ steps.a.result }}"}),
+            WorkflowStep(id="reread", tool="read_file", arguments={"file_path": "notes.md"}),
+            WorkflowStep(id="echo", tool="read_file", arguments={"file_path": "{{ last_result }}"}),
+            WorkflowStep(id="explicit", tool="write_file", arguments={}, depends_on=["a"]),
+            WorkflowStep(id="after", tool="read_file", arguments={"file_path": "notes.md"}, depends_on=["b"]),
+        ],
+    )
+
+    dependencies = _workflow_step_dependencies(workflow, [step.tool for step in workflow.steps])
+
+    # Explicit depends_on adds edges but never skips the latest side-effect barrier.
+    assert dependencies == [set(), set(), {0, 1}, {2}, {2, 3}, {0, 2}, {1, 5}]
+
+
+def test_workflow_tool_runs_independent_steps_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _search(query):
+        # Both searches must be in flight at once to pass the barrier.
+        barrier.wait()
+        return f"results for {query}"
+
+    workflow = Workflow(
+        name="parallel-brief",
+        description="Two searches then a save",
+        inputs={},
+        steps=[
+            WorkflowStep(id="first", tool="web_search", arguments={"query": "alpha"}),
+            WorkflowStep(id="second", tool="web_search", arguments={"query": "beta"}),
+            WorkflowStep(
+                id="save",
+                tool="write_file",
+                arguments={"file_path": "brief.md", "content": "{{ steps.first.result }} / {{ steps.second.result }}"},
+            ),
+        ],
+        requires_tools=["web_search", "write_file"],
+        result_template="{{ last_result }}",
+    )
+    search = DummyTool("web_search", _search)
+    write = DummyTool("write_file", lambda file_path, content: content)
+    durable_repository = _durable_repository_mock()
+
+    with patch("src.workflows.manager.workflow_state_repository", durable_repository):
+        result = WorkflowTool(workflow, {"web_search": search, "write_file": write})()
+
+    assert result == "results for alpha / results for beta"
+    assert durable_repository.record_step_completed.await_count == 3
+    started_indexes = {
+        call.kwargs["step_id"]: call.kwargs["step_index"]
+        for call in durable_repository.record_step_started.await_args_list
+    }
+    assert started_indexes == {"first": 1, "second": 2, "save": 3}
+    # Read-only steps journal their state; the file write commits it first.
+    started_deferred = {
+        call.kwargs["step_id"]: call.kwargs["defer"]
+        for call in durable_repository.record_step_started.await_args_list
+    }
+    assert started_deferred == {"first": True, "second": True, "save": False}
+    assert all(call.kwargs["defer"] for call in durable_repository.record_step_completed.await_args_list)
+
+
+def test_workflow_tool_parallel_failure_waits_for_in_flight_steps():
+    def _search(query):
+        if query == "broken":
+            raise RuntimeError("search backend down")
+        time.sleep(0.05)
+        return f"results for {query}"
+
+    workflow = Workflow(
+        name="parallel-failure",
+        description="One search fails while another is running",
+        inputs={},
+        steps=[
+            WorkflowStep(id="slow", tool="web_search", arguments={"query": "slow"}),
+            WorkflowStep(id="broken", tool="web_search", arguments={"query": "broken"}),
+            WorkflowStep(id="never", tool="web_search", arguments={"query": "never"}),
+        ],
+        requires_tools=["web_search"],
+    )
+    search = DummyTool("web_search", _search)
+    workflow_tool = WorkflowTool(workflow, {"web_search": search})
+    durable_repository = _durable_repository_mock()
+
+    with (
+        patch("src.workflows.manager.workflow_state_repository", durable_repository),
+        patch("src.workflows.manager.settings.workflow_step_max_concurrency", 2),
+    ):
+        with pytest.raises(RuntimeError, match="search backend down"):
+            workflow_tool()
+
+    assert {call["query"] for call in search.calls} == {"slow", "broken"}
+    completed = [call.kwargs["step_id"] for call in durable_repository.record_step_completed.await_args_list]
+    assert completed == ["slow"]
+    assert durable_repository.record_step_failed.await_args.kwargs["step_id"] == "broken"
+    finish = durable_repository.finish_run.await_args.kwargs
+    assert finish["status"] == "failed"
+    assert finish["last_completed_step_id"] == "slow"
+    assert set(finish["checkpoint_context"]) == {"slow"}
+
+
+def test_workflow_tool_launch_failure_drains_in_flight_steps():
+    def _search(query):
+        time.sleep(0.05)
+        return f"results for {query}"
+
+    workflow = Workflow(
+        name="parallel-launch-failure",
+        description="A later step needs a tool that is not available",
+        inputs={},
+        steps=[
+            WorkflowStep(id="slow", tool="web_search", arguments={"query": "slow"}),
+            WorkflowStep(id="missing", tool="read_file", arguments={"file_path": "notes.md"}),
+            WorkflowStep(id="never", tool="web_search", arguments={"query": "never"}),
+        ],
+        requires_tools=["web_search"],
+    )
+    search = DummyTool("web_search", _search)
+    workflow_tool = WorkflowTool(workflow, {"web_search": search})
+    durable_repository = _durable_repository_mock()
+
+    with (
+        patch("src.workflows.manager.workflow_state_repository", durable_repository),
+        patch("src.workflows.manager.settings.workflow_step_max_concurrency", 2),
+    ):
+        with pytest.raises(RuntimeError, match="requires unavailable tool 'read_file'"):
+            workflow_tool()
+
+    assert [call["query"] for call in search.calls] == ["slow"]
+    completed = [call.kwargs["step_id"] for call in durable_repository.record_step_completed.await_args_list]
+    assert completed == ["slow"]
+    assert durable_repository.record_step_failed.await_args.kwargs["step_id"] == "missing"
+    finish = durable_repository.finish_run.await_args.kwargs
+    assert finish["status"] == "failed"
+    assert finish["last_completed_step_id"] == "slow"
+    assert set(finish["checkpoint_context"]) == {"slow"}
+
+
 def test_workflow_tool_resume_rejects_when_delegation_boundary_changes():
     workflow = Workflow(
         name="delegation-replay",
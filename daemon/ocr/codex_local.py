@@ -17,6 +17,7 @@ import time
 from typing import Any
 
 from ocr.base import AnalysisResult, OCRProvider, OCRResult
+from ocr.preprocess import image_file_suffix
 
 logger = logging.getLogger("seraph_daemon")
 
@@ -252,7 +253,11 @@ def _codex_env() -> dict[str, str]:
 
 
 def _write_temp_png(png_bytes: bytes, *, temp_dir: Path | None = None) -> Path:
-    fd, name = tempfile.mkstemp(prefix="seraph-screen-", suffix=".png", dir=str(temp_dir) if temp_dir else None)
+    fd, name = tempfile.mkstemp(
+        prefix="seraph-screen-",
+        suffix=image_file_suffix(png_bytes),
+        dir=str(temp_dir) if temp_dir else None,
+    )
     try:
         with os.fdopen(fd, "wb") as handle:
             handle.write(png_bytes)
@@ -316,7 +321,7 @@ def _archive_capture(
     _ensure_private_dir(day_dir)
     digest = hashlib.sha256(png_bytes + raw_output.encode("utf-8", errors="replace")).hexdigest()[:16]
     stem = f"{now.strftime('%H%M%S')}-{_slug(app_name)}-{digest}"
-    image_path = day_dir / f"{stem}.png"
+    image_path = day_dir / f"{stem}{image_file_suffix(png_bytes)}"
     raw_output_path = day_dir / f"{stem}.codex.txt"
     normalized_path = day_dir / f"{stem}.analysis.json"
     _write_private_bytes(image_path, png_bytes)
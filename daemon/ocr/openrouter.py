@@ -7,6 +7,7 @@ import time
 import httpx
 
 from ocr.base import AnalysisResult, OCRProvider, OCRResult
+from ocr.preprocess import image_media_type
 
 logger = logging.getLogger("seraph_daemon")
 
@@ -62,7 +63,7 @@ class OpenRouterProvider(OCRProvider):
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/png;base64,{b64}",
+                                        "url": f"data:{image_media_type(png_bytes)};base64,{b64}",
                                         "detail": "low",
                                     },
                                 },
@@ -130,7 +131,7 @@ class OpenRouterProvider(OCRProvider):
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/png;base64,{b64}",
+                                        "url": f"data:{image_media_type(png_bytes)};base64,{b64}",
                                         "detail": "low",
                                     },
                                 },
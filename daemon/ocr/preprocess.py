@@ -0,0 +1,274 @@
+"""Screenshot preprocessing before provider calls.
+
+Full-resolution Retina/5K captures are several megabytes of PNG, and every
+byte is uploaded (and billed as vision tokens) on each analysis. This stage
+optionally crops a capture to the frontmost window, downscales it to a
+maximum dimension, and re-encodes it as JPEG via Quartz. It also computes a
+difference hash so the daemon can skip analysis when the screen has not
+meaningfully changed since the last analyzed capture. The hash is coarse
+(small edits in a large window barely move it), so a skip is only allowed
+while the last analysis of that app is younger than ``change_max_age_seconds``.
+
+Every step degrades gracefully: without Quartz, or for bytes that are not a
+decodable image, the original capture is passed through unchanged and no
+fingerprint is produced.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger("seraph_daemon")
+
+_HASH_SIZE = 16  # difference hash over a 17x16 grayscale thumbnail -> 256 bits
+_JPEG_SIGNATURE = b"\xff\xd8\xff"
+
+
+@dataclass(frozen=True)
+class PreprocessOptions:
+    max_dimension: int = 1568  # longest edge after downscaling (0 keeps the original size)
+    output_format: str = "jpeg"  # jpeg | png
+    jpeg_quality: float = 0.7
+    crop_to_frontmost_window: bool = False
+    change_threshold: int = 6  # hash bits that may differ while still counting as unchanged (-1 disables)
+    change_max_age_seconds: float = 300.0  # re-analyze an unchanged-looking app once its last analysis is this old (0 = no limit)
+
+
+@dataclass(frozen=True)
+class PreparedCapture:
+    image_bytes: bytes
+    media_type: str
+    original_bytes: int
+    width: int | None = None
+    height: int | None = None
+    fingerprint: int | None = None
+    cropped: bool = False
+
+
+def prepare_capture(
+    png_bytes: bytes,
+    *,
+    options: PreprocessOptions,
+    app_name: str | None = None,
+) -> PreparedCapture:
+    """Crop, downscale, re-encode and fingerprint a PNG capture.
+
+    Falls back to the untouched capture when Quartz is unavailable or the
+    image cannot be processed.
+    """
+    passthrough = PreparedCapture(
+        image_bytes=png_bytes,
+        media_type=image_media_type(png_bytes),
+        original_bytes=len(png_bytes),
+    )
+    try:
+        import Quartz
+        from Foundation import NSData, NSMutableData
+    except ImportError:
+        return passthrough
+
+    try:
+        source = Quartz.CGImageSourceCreateWithData(NSData.dataWithBytes_length_(png_bytes, len(png_bytes)), None)
+        image = Quartz.CGImageSourceCreateImageAtIndex(source, 0, None) if source is not None else None
+        if image is None:
+            return passthrough
+
+        cropped = False
+        if options.crop_to_frontmost_window:
+            window_image = _crop_to_frontmost_window(Quartz, image, app_name)
+            if window_image is not None:
+                image, cropped = window_image, True
+
+        fingerprint = None
+        if options.change_threshold >= 0:
+            gray = _render_grayscale(Quartz, image, _HASH_SIZE + 1, _HASH_SIZE)
+            if gray is not None:
+                fingerprint = difference_hash(gray, width=_HASH_SIZE + 1, height=_HASH_SIZE)
+
+        width, height = Quartz.CGImageGetWidth(image), Quartz.CGImageGetHeight(image)
+        target_width, target_height = scaled_size(width, height, options.max_dimension)
+        resized = None
+        if (target_width, target_height) != (width, height):
+            resized = _resize(Quartz, image, target_width, target_height)
+        if resized is not None:
+            image, width, height = resized, target_width, target_height
+
+        jpeg = options.output_format == "jpeg"
+        if not jpeg and not cropped and resized is None:
+            # PNG was requested and nothing changed; skip a pointless re-encode.
+            return PreparedCapture(
+                image_bytes=png_bytes,
+                media_type=passthrough.media_type,
+                original_bytes=len(png_bytes),
+                width=width,
+                height=height,
+                fingerprint=fingerprint,
+            )
+
+        output = NSMutableData.data()
+        destination = Quartz.CGImageDestinationCreateWithData(output, "public.jpeg" if jpeg else "public.png", 1, None)
+        properties = {Quartz.kCGImageDestinationLossyCompressionQuality: options.jpeg_quality} if jpeg else None
+        Quartz.CGImageDestinationAddImage(destination, image, properties)
+        if not Quartz.CGImageDestinationFinalize(destination):
+            return PreparedCapture(
+                image_bytes=png_bytes,
+                media_type=passthrough.media_type,
+                original_bytes=len(png_bytes),
+                fingerprint=fingerprint,
+            )
+        encoded = bytes(output)
+        return PreparedCapture(
+            image_bytes=encoded,
+            media_type="image/jpeg" if jpeg else "image/png",
+            original_bytes=len(png_bytes),
+            width=width,
+            height=height,
+            fingerprint=fingerprint,
+            cropped=cropped,
+        )
+    except Exception:
+        logger.debug("Screenshot preprocessing failed; sending the original capture", exc_info=True)
+        return passthrough
+
+
+def scaled_size(width: int, height: int, max_dimension: int) -> tuple[int, int]:
+    """Return ``(width, height)`` shrunk so the longest edge is at most ``max_dimension``."""
+    longest = max(width, height)
+    if max_dimension <= 0 or longest <= max_dimension:
+        return width, height
+    scale = max_dimension / longest
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def difference_hash(pixels: bytes | list[int], *, width: int, height: int) -> int:
+    """Horizontal difference hash of a ``width`` x ``height`` grayscale thumbnail.
+
+    Each bit records whether a pixel is brighter than its right neighbour,
+    giving ``(width - 1) * height`` bits that survive scaling and compression
+    noise but flip when the visible content changes.
+    """
+    value = 0
+    for y in range(height):
+        row = y * width
+        for x in range(width - 1):
+            value = (value << 1) | (1 if pixels[row + x] > pixels[row + x + 1] else 0)
+    return value
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+class ScreenChangeDetector:
+    """Remember the fingerprint and time of the last analyzed capture per app."""
+
+    def __init__(self) -> None:
+        self._fingerprints: dict[str, tuple[int, float]] = {}
+
+    def unchanged(
+        self,
+        key: str,
+        fingerprint: int | None,
+        *,
+        threshold: int,
+        max_age_seconds: float = 0.0,
+        now: float | None = None,
+    ) -> bool:
+        if fingerprint is None or threshold < 0:
+            return False
+        previous = self._fingerprints.get(key)
+        if previous is None:
+            return False
+        previous_fingerprint, recorded_at = previous
+        if max_age_seconds > 0 and (time.monotonic() if now is None else now) - recorded_at >= max_age_seconds:
+            return False
+        return hamming_distance(previous_fingerprint, fingerprint) <= threshold
+
+    def record(self, key: str, fingerprint: int | None, *, now: float | None = None) -> None:
+        if fingerprint is not None:
+            self._fingerprints[key] = (fingerprint, time.monotonic() if now is None else now)
+
+    def reset(self) -> None:
+        self._fingerprints.clear()
+
+
+def image_media_type(data: bytes) -> str:
+    if data.startswith(_JPEG_SIGNATURE):
+        return "image/jpeg"
+    return "image/png"
+
+
+def image_file_suffix(data: bytes) -> str:
+    return ".jpg" if image_media_type(data) == "image/jpeg" else ".png"
+
+
+def _resize(Quartz, image, width: int, height: int):
+    context = Quartz.CGBitmapContextCreate(
+        None,
+        width,
+        height,
+        8,
+        0,
+        Quartz.CGColorSpaceCreateDeviceRGB(),
+        Quartz.kCGImageAlphaNoneSkipLast,
+    )
+    if context is None:
+        return None
+    Quartz.CGContextSetInterpolationQuality(context, Quartz.kCGInterpolationHigh)
+    Quartz.CGContextDrawImage(context, Quartz.CGRectMake(0, 0, width, height), image)
+    return Quartz.CGBitmapContextCreateImage(context)
+
+
+def _render_grayscale(Quartz, image, width: int, height: int) -> list[int] | None:
+    context = Quartz.CGBitmapContextCreate(
+        None,
+        width,
+        height,
+        8,
+        0,
+        Quartz.CGColorSpaceCreateDeviceGray(),
+        Quartz.kCGImageAlphaNone,
+    )
+    if context is None:
+        return None
+    Quartz.CGContextSetInterpolationQuality(context, Quartz.kCGInterpolationMedium)
+    Quartz.CGContextDrawImage(context, Quartz.CGRectMake(0, 0, width, height), image)
+    thumbnail = Quartz.CGBitmapContextCreateImage(context)
+    if thumbnail is None:
+        return None
+    raw = bytes(Quartz.CGDataProviderCopyData(Quartz.CGImageGetDataProvider(thumbnail)))
+    stride = Quartz.CGImageGetBytesPerRow(thumbnail)
+    return [raw[y * stride + x] for y in range(height) for x in range(width)]
+
+
+def _crop_to_frontmost_window(Quartz, image, app_name: str | None):
+    """Crop to the frontmost on-screen window of ``app_name`` on the main display."""
+    windows = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+        Quartz.kCGNullWindowID,
+    )
+    bounds = None
+    for info in windows or []:
+        # Windows are listed front to back; layer 0 is the normal application layer.
+        if info.get(Quartz.kCGWindowLayer, 0) != 0:
+            continue
+        if app_name and info.get(Quartz.kCGWindowOwnerName) != app_name:
+            continue
+        bounds = info.get(Quartz.kCGWindowBounds)
+        break
+    if not bounds:
+        return None
+
+    display = Quartz.CGDisplayBounds(Quartz.CGMainDisplayID())
+    if display.size.width <= 0:
+        return None
+    scale = Quartz.CGImageGetWidth(image) / display.size.width
+    left = max(0.0, float(bounds["X"]) * scale)
+    top = max(0.0, float(bounds["Y"]) * scale)
+    right = min(float(Quartz.CGImageGetWidth(image)), (float(bounds["X"]) + float(bounds["Width"])) * scale)
+    bottom = min(float(Quartz.CGImageGetHeight(image)), (float(bounds["Y"]) + float(bounds["Height"])) * scale)
+    if right - left < 100 or bottom - top < 100:
+        return None
+    return Quartz.CGImageCreateWithImageInRect(image, Quartz.CGRectMake(left, top, right - left, bottom - top))
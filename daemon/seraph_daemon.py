@@ -30,8 +30,14 @@ import time
 
 import httpx
 
+from ocr.preprocess import PreparedCapture, PreprocessOptions, ScreenChangeDetector, image_file_suffix, prepare_capture
+
 logger = logging.getLogger("seraph_daemon")
 
+# Set from the --capture-* flags in main(); shared by the switch and periodic loops.
+_capture_options = PreprocessOptions()
+_screen_changes = ScreenChangeDetector()
+
 
 def _slug(value: str) -> str:
     slug = re.sub(r"[^a-zA-Z0-9_-]+", "-", value.strip().lower()).strip("-")
@@ -60,7 +66,7 @@ def _archive_provider_capture(
         png_bytes + provider_name.encode("utf-8") + analysis_json.encode("utf-8")
     ).hexdigest()[:16]
     stem = f"{now.strftime('%H%M%S')}-{_slug(app_name)}-{digest}"
-    image_path = day_dir / f"{stem}.png"
+    image_path = day_dir / f"{stem}{image_file_suffix(png_bytes)}"
     provider_output_path = day_dir / f"{stem}.{_slug(provider_name)}.json"
     analysis_path = day_dir / f"{stem}.analysis.json"
     provider_payload = {
@@ -83,13 +89,27 @@ def _archive_provider_capture(
     }
 
 
-def _analysis_usage(provider_name: str, *, duration_ms: int | None, success: bool) -> dict[str, object]:
-    return {
+def _analysis_usage(
+    provider_name: str,
+    *,
+    duration_ms: int | None,
+    success: bool,
+    prepared: PreparedCapture | None = None,
+) -> dict[str, object]:
+    usage: dict[str, object] = {
         "provider": provider_name,
         "duration_ms": duration_ms,
         "success": success,
         "cost_posture": "local_no_api_price" if provider_name == "codex-local" else "provider_api_usage",
     }
+    if prepared is not None:
+        usage["image_bytes"] = len(prepared.image_bytes)
+        usage["original_image_bytes"] = prepared.original_bytes
+    return usage
+
+
+async def _prepare_capture(png_bytes: bytes, app_name: str) -> PreparedCapture:
+    return await asyncio.to_thread(prepare_capture, png_bytes, options=_capture_options, app_name=app_name)
 
 
 def _write_private_bytes(path: Path, content: bytes) -> None:
@@ -698,60 +718,74 @@ async def poll_loop(
                                         last_error_kind="screen_capture_permission",
                                     )
                                 if png_bytes:
-                                    result = await screen_runtime.provider.analyze_screen(png_bytes, app_name)
-                                    if result.success:
-                                        screen_runtime.record_capture(now=time.time())
-                                        analysis = {
-                                            **result.data,
-                                            "analysis_usage": _analysis_usage(
-                                                screen_runtime.provider.name,
-                                                duration_ms=result.duration_ms,
-                                                success=True,
-                                            ),
-                                        }
-                                        observation.update(analysis)
-                                        if screen_runtime.preserve_captures and "capture_artifacts" not in observation:
-                                            observation["capture_artifacts"] = _archive_provider_capture(
-                                                archive_dir=screen_runtime.archive_dir,
-                                                png_bytes=png_bytes,
-                                                app_name=app_name,
-                                                provider_name=screen_runtime.provider.name,
-                                                analysis=analysis,
-                                            )
+                                    prepared = await _prepare_capture(png_bytes, app_name)
+                                    if _screen_changes.unchanged(
+                                        app_name,
+                                        prepared.fingerprint,
+                                        threshold=_capture_options.change_threshold,
+                                        max_age_seconds=_capture_options.change_max_age_seconds,
+                                    ):
+                                        observation["capture_skipped"] = True
+                                        observation["capture_skip_reason"] = "screen_unchanged"
                                         if verbose:
-                                            ts = time.strftime("%H:%M:%S")
-                                            logger.info(
-                                                "[%s] analyzed (%dms): %s",
-                                                ts,
-                                                result.duration_ms,
-                                                result.data.get("summary", "")[:80],
-                                            )
-                                        _write_daemon_status(
-                                            state="running",
-                                            screen_analysis="active",
-                                            provider=screen_runtime.provider.name,
-                                            capture_ready=True,
-                                            active_window=active_window,
-                                            frontmost_app=app_name,
-                                            window_title=window_title,
-                                            last_capture_at=datetime.now(timezone.utc).isoformat(),
-                                            last_poll_at=poll_at,
-                                            last_error=None,
-                                            last_error_kind=None,
-                                            capture_budget=screen_runtime.budget_status(),
-                                        )
+                                            logger.info("Screen unchanged since the last %s analysis — skipping", app_name)
                                     else:
-                                        logger.debug("Screen analysis failed: %s", result.error)
-                                        observation["capture_error"] = result.error or "Screen analysis failed."
-                                        observation["capture_error_kind"] = "analysis_error"
-                                        _write_daemon_status(
-                                            state="running",
-                                            screen_analysis="analysis_error",
-                                            provider=screen_runtime.provider.name,
-                                            capture_ready=False,
-                                            last_error=observation["capture_error"],
-                                            last_error_kind="analysis_error",
-                                        )
+                                        result = await screen_runtime.provider.analyze_screen(prepared.image_bytes, app_name)
+                                        if result.success:
+                                            screen_runtime.record_capture(now=time.time())
+                                            _screen_changes.record(app_name, prepared.fingerprint)
+                                            analysis = {
+                                                **result.data,
+                                                "analysis_usage": _analysis_usage(
+                                                    screen_runtime.provider.name,
+                                                    duration_ms=result.duration_ms,
+                                                    success=True,
+                                                    prepared=prepared,
+                                                ),
+                                            }
+                                            observation.update(analysis)
+                                            if screen_runtime.preserve_captures and "capture_artifacts" not in observation:
+                                                observation["capture_artifacts"] = _archive_provider_capture(
+                                                    archive_dir=screen_runtime.archive_dir,
+                                                    png_bytes=prepared.image_bytes,
+                                                    app_name=app_name,
+                                                    provider_name=screen_runtime.provider.name,
+                                                    analysis=analysis,
+                                                )
+                                            if verbose:
+                                                ts = time.strftime("%H:%M:%S")
+                                                logger.info(
+                                                    "[%s] analyzed (%dms): %s",
+                                                    ts,
+                                                    result.duration_ms,
+                                                    result.data.get("summary", "")[:80],
+                                                )
+                                            _write_daemon_status(
+                                                state="running",
+                                                screen_analysis="active",
+                                                provider=screen_runtime.provider.name,
+                                                capture_ready=True,
+                                                active_window=active_window,
+                                                frontmost_app=app_name,
+                                                window_title=window_title,
+                                                last_capture_at=datetime.now(timezone.utc).isoformat(),
+                                                last_poll_at=poll_at,
+                                                last_error=None,
+                                                last_error_kind=None,
+                                                capture_budget=screen_runtime.budget_status(),
+                                            )
+                                        else:
+                                            logger.debug("Screen analysis failed: %s", result.error)
+                                            observation["capture_error"] = result.error or "Screen analysis failed."
+                                            observation["capture_error_kind"] = "analysis_error"
+                                            _write_daemon_status(
+                                                state="running",
+                                                screen_analysis="analysis_error",
+                                                provider=screen_runtime.provider.name,
+                                                capture_ready=False,
+                                                last_error=observation["capture_error"],
+                                                last_error_kind="analysis_error",
+                                            )
                             except Exception:
                                 logger.debug("Screenshot/analysis error", exc_info=True)
                                 observation["capture_error"] = "Screenshot or screen analysis failed unexpectedly."
@@ -964,60 +998,74 @@ async def periodic_capture_loop(
                             last_error_kind="screen_capture_permission",
                         )
                     if png_bytes:
-                        result = await screen_runtime.provider.analyze_screen(png_bytes, app_name)
-                        if result.success:
-                            screen_runtime.record_capture(now=now)
-                            analysis = {
-                                **result.data,
-                                "analysis_usage": _analysis_usage(
-                                    screen_runtime.provider.name,
-                                    duration_ms=result.duration_ms,
-                                    success=True,
-                                ),
-                            }
-                            observation.update(analysis)
-                            if screen_runtime.preserve_captures and "capture_artifacts" not in observation:
-                                observation["capture_artifacts"] = _archive_provider_capture(
-                                    archive_dir=screen_runtime.archive_dir,
-                                    png_bytes=png_bytes,
-                                    app_name=app_name,
-                                    provider_name=screen_runtime.provider.name,
-                                    analysis=analysis,
-                                )
+                        prepared = await _prepare_capture(png_bytes, app_name)
+                        if _screen_changes.unchanged(
+                            app_name,
+                            prepared.fingerprint,
+                            threshold=_capture_options.change_threshold,
+                            max_age_seconds=_capture_options.change_max_age_seconds,
+                        ):
+                            observation["capture_skipped"] = True
+                            observation["capture_skip_reason"] = "screen_unchanged"
                             if verbose:
-                                ts = time.strftime("%H:%M:%S")
-                                logger.info(
-                                    "[%s] periodic (%s, %ds): %s",
-                                    ts,
-                                    capture_mode,
-                                    period,
-                                    result.data.get("summary", "")[:80],
-                                )
-                            _write_daemon_status(
-                                state="running",
-                                screen_analysis="active",
-                                provider=screen_runtime.provider.name,
-                                capture_ready=True,
-                                active_window=active_window,
-                                frontmost_app=app_name,
-                                window_title=window_title,
-                                last_capture_at=datetime.now(timezone.utc).isoformat(),
-                                last_poll_at=poll_at,
-                                last_error=None,
-                                last_error_kind=None,
-                                capture_budget=screen_runtime.budget_status(),
-                            )
+                                logger.info("Screen unchanged since the last %s analysis — skipping", app_name)
                         else:
-                            logger.debug("Periodic analysis failed: %s", result.error)
-                            observation["capture_error"] = result.error or "Periodic screen analysis failed."
-                            _write_daemon_status(
-                                state="running",
-                                screen_analysis="analysis_error",
-                                provider=screen_runtime.provider.name,
-                                capture_ready=False,
-                                last_error=observation["capture_error"],
-                                last_error_kind="analysis_error",
-                            )
+                            result = await screen_runtime.provider.analyze_screen(prepared.image_bytes, app_name)
+                            if result.success:
+                                screen_runtime.record_capture(now=now)
+                                _screen_changes.record(app_name, prepared.fingerprint)
+                                analysis = {
+                                    **result.data,
+                                    "analysis_usage": _analysis_usage(
+                                        screen_runtime.provider.name,
+                                        duration_ms=result.duration_ms,
+                                        success=True,
+                                        prepared=prepared,
+                                    ),
+                                }
+                                observation.update(analysis)
+                                if screen_runtime.preserve_captures and "capture_artifacts" not in observation:
+                                    observation["capture_artifacts"] = _archive_provider_capture(
+                                        archive_dir=screen_runtime.archive_dir,
+                                        png_bytes=prepared.image_bytes,
+                                        app_name=app_name,
+                                        provider_name=screen_runtime.provider.name,
+                                        analysis=analysis,
+                                    )
+                                if verbose:
+                                    ts = time.strftime("%H:%M:%S")
+                                    logger.info(
+                                        "[%s] periodic (%s, %ds): %s",
+                                        ts,
+                                        capture_mode,
+                                        period,
+                                        result.data.get("summary", "")[:80],
+                                    )
+                                _write_daemon_status(
+                                    state="running",
+                                    screen_analysis="active",
+                                    provider=screen_runtime.provider.name,
+                                    capture_ready=True,
+                                    active_window=active_window,
+                                    frontmost_app=app_name,
+                                    window_title=window_title,
+                                    last_capture_at=datetime.now(timezone.utc).isoformat(),
+                                    last_poll_at=poll_at,
+                                    last_error=None,
+                                    last_error_kind=None,
+                                    capture_budget=screen_runtime.budget_status(),
+                                )
+                            else:
+                                logger.debug("Periodic analysis failed: %s", result.error)
+                                observation["capture_error"] = result.error or "Periodic screen analysis failed."
+                                _write_daemon_status(
+                                    state="running",
+                                    screen_analysis="analysis_error",
+                                    provider=screen_runtime.provider.name,
+                                    capture_ready=False,
+                                    last_error=observation["capture_error"],
+                                    last_error_kind="analysis_error",
+                                )
                 except Exception:
                     logger.debug("Periodic screenshot/analysis error", exc_info=True)
                     observation["capture_error"] = "Periodic screenshot or screen analysis failed unexpectedly."
@@ -1143,8 +1191,62 @@ async def main() -> None:
         help="Path to JSON blocklist config (default: use built-in defaults only)",
     )
 
+    # Capture preprocessing options
+    parser.add_argument(
+        "--capture-max-dimension",
+        type=int,
+        default=1568,
+        help="Downscale captures so the longest edge is at most this many pixels before analysis (0 = full resolution)",
+    )
+    parser.add_argument(
+        "--capture-format",
+        choices=["jpeg", "png"],
+        default="jpeg",
+        help="Image format sent to the analysis provider (default: jpeg)",
+    )
+    parser.add_argument(
+        "--capture-jpeg-quality",
+        type=float,
+        default=0.7,
+        help="JPEG quality between 0 and 1 (default: 0.7)",
+    )
+    parser.add_argument(
+        "--capture-crop-window",
+        action="store_true",
+        default=False,
+        help="Crop captures to the frontmost window before analysis",
+    )
+    parser.add_argument(
+        "--capture-change-threshold",
+        type=int,
+        default=6,
+        help=(
+            "Skip analysis when a capture differs from the last analyzed capture of the same app by at most "
+            "this many of 256 perceptual-hash bits (default: 6, -1 = always analyze)"
+        ),
+    )
+    parser.add_argument(
+        "--capture-max-skip-seconds",
+        type=float,
+        default=300.0,
+        help=(
+            "Re-analyze an app whose captures look unchanged once its last analysis is this many seconds old "
+            "(default: 300, 0 = no limit)"
+        ),
+    )
+
     args = parser.parse_args()
 
+    global _capture_options
+    _capture_options = PreprocessOptions(
+        max_dimension=max(0, args.capture_max_dimension),
+        output_format=args.capture_format,
+        jpeg_quality=min(1.0, max(0.1, args.capture_jpeg_quality)),
+        crop_to_frontmost_window=args.capture_crop_window,
+        change_threshold=args.capture_change_threshold,
+        change_max_age_seconds=max(0.0, args.capture_max_skip_seconds),
+    )
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(message)s",
@@ -0,0 +1,75 @@
+"""Tests for screenshot preprocessing and change detection."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ocr.preprocess import (
+    PreprocessOptions,
+    ScreenChangeDetector,
+    difference_hash,
+    hamming_distance,
+    image_file_suffix,
+    image_media_type,
+    prepare_capture,
+    scaled_size,
+)
+
+
+def test_scaled_size_caps_longest_edge_and_keeps_aspect_ratio():
+    assert scaled_size(5120, 2880, 1568) == (1568, 882)
+    assert scaled_size(2880, 5120, 1568) == (882, 1568)
+    assert scaled_size(1280, 800, 1568) == (1280, 800)
+    assert scaled_size(5120, 2880, 0) == (5120, 2880)
+
+
+def test_difference_hash_tracks_brightness_gradients():
+    rising = [x for _ in range(2) for x in range(3)]
+    falling = [2 - x for _ in range(2) for x in range(3)]
+
+    assert difference_hash(rising, width=3, height=2) == 0
+    assert difference_hash(falling, width=3, height=2) == 0b1111
+    assert hamming_distance(0b1111, 0b0101) == 2
+
+
+def test_change_detector_only_skips_near_identical_captures_of_the_same_app():
+    detector = ScreenChangeDetector()
+
+    assert detector.unchanged("Code", 0b1010, threshold=1) is False
+    detector.record("Code", 0b1010)
+    assert detector.unchanged("Code", 0b1011, threshold=1) is True
+    assert detector.unchanged("Code", 0b0101, threshold=1) is False
+    assert detector.unchanged("Safari", 0b1010, threshold=1) is False
+    assert detector.unchanged("Code", 0b1010, threshold=-1) is False
+    assert detector.unchanged("Code", None, threshold=1) is False
+
+
+def test_change_detector_forces_reanalysis_once_the_last_analysis_is_too_old():
+    detector = ScreenChangeDetector()
+    detector.record("Code", 0b1010, now=100.0)
+
+    assert detector.unchanged("Code", 0b1010, threshold=1, max_age_seconds=60, now=159.0) is True
+    assert detector.unchanged("Code", 0b1010, threshold=1, max_age_seconds=60, now=160.0) is False
+    assert detector.unchanged("Code", 0b1010, threshold=1, max_age_seconds=0, now=10_000.0) is True
+
+    detector.record("Code", 0b1010, now=160.0)
+    assert detector.unchanged("Code", 0b1010, threshold=1, max_age_seconds=60, now=200.0) is True
+
+
+def test_prepare_capture_passes_through_undecodable_bytes():
+    prepared = prepare_capture(b"png bytes", options=PreprocessOptions(), app_name="Code")
+
+    assert prepared.image_bytes == b"png bytes"
+    assert prepared.media_type == "image/png"
+    assert prepared.original_bytes == len(b"png bytes")
+    assert prepared.fingerprint is None
+
+
+def test_image_media_type_sniffs_jpeg():
+    assert image_media_type(b"\xff\xd8\xff\xe0rest") == "image/jpeg"
+    assert image_file_suffix(b"\xff\xd8\xff\xe0rest") == ".jpg"
+    assert image_media_type(b"\x89PNG\r\n\x1a\nrest") == "image/png"
+    assert image_file_suffix(b"\x89PNG\r\n\x1a\nrest") == ".png"
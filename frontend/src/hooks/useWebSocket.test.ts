@@ -9,7 +9,12 @@ import { describe, it, expect, vi } from "vitest";
 // We test the constants and behavior rather than the hook directly
 // since hooks require a React rendering context.
 import { WS_RECONNECT_DELAY_MS } from "../config/constants";
-import { WS_RESPONSE_TIMEOUT_MS, buildClarificationMessage, resolveClarificationSessionId } from "./useWebSocket";
+import {
+  WS_RESPONSE_TIMEOUT_MS,
+  buildClarificationMessage,
+  buildWebSocketUrl,
+  resolveClarificationSessionId,
+} from "./useWebSocket";
 
 describe("WS reconnection constants", () => {
   it("has a sensible initial reconnect delay", () => {
@@ -23,6 +28,21 @@ describe("WS reconnection constants", () => {
   });
 });
 
+describe("broadcast replay on reconnect", () => {
+  it("connects without a replay cursor before any broadcast was seen", () => {
+    expect(buildWebSocketUrl("ws://localhost:8004/ws/chat", null)).toBe("ws://localhost:8004/ws/chat");
+  });
+
+  it("passes the last seen broadcast seq so missed frames are replayed", () => {
+    expect(buildWebSocketUrl("ws://localhost:8004/ws/chat", 42)).toBe(
+      "ws://localhost:8004/ws/chat?last_broadcast_seq=42",
+    );
+    expect(buildWebSocketUrl("wss://seraph.test/ws/chat?token=abc", 0)).toBe(
+      "wss://seraph.test/ws/chat?token=abc&last_broadcast_seq=0",
+    );
+  });
+});
+
 describe("exponential backoff logic", () => {
   const WS_BACKOFF_MAX_MS = 30_000;
 
@@ -44,6 +44,12 @@ export function buildClarificationMessage(
   };
 }
 
+export function buildWebSocketUrl(baseUrl: string, lastBroadcastSeq: number | null): string {
+  if (lastBroadcastSeq === null) return baseUrl;
+  const separator = baseUrl.includes("?") ? "&" : "?";
+  return `${baseUrl}${separator}last_broadcast_seq=${lastBroadcastSeq}`;
+}
+
 export function useWebSocket() {
   const wsRef = useRef<WebSocket | null>(null);
   const pingRef = useRef<ReturnType<typeof setInterval> | null>(null);
@@ -52,6 +58,10 @@ export function useWebSocket() {
   const responseTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const backoffRef = useRef(WS_RECONNECT_DELAY_MS);
   const pendingResumeRef = useRef<{ sessionId: string | null; message: string } | null>(null);
+  // Agent message being filled in by final_delta chunks until the final frame arrives.
+  const streamingAnswerRef = useRef<{ id: string; content: string } | null>(null);
+  // Last broadcast frame seen, sent on reconnect so the server replays what was missed.
+  const lastBroadcastSeqRef = useRef<number | null>(null);
 
   const addMessage = useCallback((message: ChatMessage) => {
     useChatStore.getState().addMessage(message);
@@ -268,7 +278,7 @@ export function useWebSocket() {
     if (wsRef.current?.readyState === WebSocket.OPEN) return;
 
     setConnectionStatus("connecting");
-    const ws = new WebSocket(WS_URL);
+    const ws = new WebSocket(buildWebSocketUrl(WS_URL, lastBroadcastSeqRef.current));
     wsRef.current = ws;
     if (connectTimeoutRef.current) {
       clearTimeout(connectTimeoutRef.current);
@@ -316,6 +326,9 @@ export function useWebSocket() {
         const data: WSResponse = JSON.parse(event.data);
 
         if (data.type === "pong") return;
+        if (typeof data.broadcast_seq === "number") {
+          lastBroadcastSeqRef.current = data.broadcast_seq;
+        }
 
         if (data.session_id) {
           const current = useChatStore.getState().sessionId;
@@ -344,19 +357,47 @@ export function useWebSocket() {
             toolUsed: tool ?? undefined,
           };
           addMessage(stepMsg);
+        } else if (data.type === "final_delta") {
+          const streaming = streamingAnswerRef.current;
+          if (data.reason === "restart") {
+            if (streaming) {
+              streaming.content = "";
+              useChatStore.getState().updateMessage(streaming.id, { content: "" });
+            }
+          } else if (streaming) {
+            streaming.content += data.content;
+            useChatStore.getState().updateMessage(streaming.id, { content: streaming.content });
+          } else if (data.content) {
+            const id = makeId();
+            streamingAnswerRef.current = { id, content: data.content };
+            addMessage({
+              id,
+              role: "agent",
+              content: data.content,
+              timestamp: Date.now(),
+              sessionId: data.session_id,
+            });
+          }
         } else if (data.type === "final") {
           clearResponseTimeout();
           setAgentBusy(false);
           onFinalAnswerRef.current(data.content);
 
-          const agentMsg: ChatMessage = {
-            id: makeId(),
-            role: "agent",
-            content: data.content,
-            timestamp: Date.now(),
-            sessionId: data.session_id,
-          };
-          addMessage(agentMsg);
+          // The final frame carries the complete, redacted answer; it replaces any streamed text.
+          const streaming = streamingAnswerRef.current;
+          streamingAnswerRef.current = null;
+          if (streaming) {
+            useChatStore.getState().updateMessage(streaming.id, { content: data.content });
+          } else {
+            const agentMsg: ChatMessage = {
+              id: makeId(),
+              role: "agent",
+              content: data.content,
+              timestamp: Date.now(),
+              sessionId: data.session_id,
+            };
+            addMessage(agentMsg);
+          }
 
           // Refresh session list and profile after a conversation turn
           useChatStore.getState().fetchProfile();
@@ -373,6 +414,7 @@ export function useWebSocket() {
         } else if (data.type === "error") {
           clearResponseTimeout();
           setAgentBusy(false);
+          streamingAnswerRef.current = null;
 
           const errorMsg: ChatMessage = {
             id: makeId(),
@@ -385,6 +427,7 @@ export function useWebSocket() {
         } else if (data.type === "approval_required") {
           clearResponseTimeout();
           setAgentBusy(false);
+          streamingAnswerRef.current = null;
 
           const approvalMsg: ChatMessage = {
             id: makeId(),
@@ -401,6 +444,7 @@ export function useWebSocket() {
         } else if (data.type === "clarification_required") {
           clearResponseTimeout();
           setAgentBusy(false);
+          streamingAnswerRef.current = null;
 
           addMessage(buildClarificationMessage(data, data.session_id));
         } else if (data.type === "proactive") {
@@ -53,6 +53,13 @@ describe("chatStore sync actions", () => {
     expect(useChatStore.getState().messages[0].content).toBe("hi");
   });
 
+  it("updateMessage patches only the matching message", () => {
+    useChatStore.getState().addMessage({ id: "1", role: "agent" as const, content: "Hel", timestamp: 1 });
+    useChatStore.getState().addMessage({ id: "2", role: "user" as const, content: "hi", timestamp: 2 });
+    useChatStore.getState().updateMessage("1", { content: "Hello" });
+    expect(useChatStore.getState().messages.map((m) => m.content)).toEqual(["Hello", "hi"]);
+  });
+
   it("setSessionId writes to localStorage", () => {
     useChatStore.getState().setSessionId("abc123");
     expect(useChatStore.getState().sessionId).toBe("abc123");
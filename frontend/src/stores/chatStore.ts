@@ -32,6 +32,7 @@ interface ChatStore {
   toolRegistry: ToolMeta[];
 
   addMessage: (message: ChatMessage) => void;
+  updateMessage: (id: string, patch: Partial<ChatMessage>) => void;
   setMessages: (messages: ChatMessage[]) => void;
   setSessionId: (id: string) => void;
   setSessions: (sessions: SessionInfo[]) => void;
@@ -175,6 +176,11 @@ export const useChatStore = create<ChatStore>((set, get) => ({
       return { messages: updated.length > MAX_MESSAGES ? updated.slice(-MAX_MESSAGES) : updated };
     }),
 
+  updateMessage: (id, patch) =>
+    set((state) => ({
+      messages: state.messages.map((message) => (message.id === id ? { ...message, ...patch } : message)),
+    })),
+
   setMessages: (messages) =>
     set({ messages: messages.length > MAX_MESSAGES ? messages.slice(-MAX_MESSAGES) : messages }),
 
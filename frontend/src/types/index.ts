@@ -26,11 +26,12 @@ export interface WSMessage {
 }
 
 export interface WSResponse {
-  type: "step" | "final" | "error" | "pong" | "proactive" | "ambient" | "approval_required" | "clarification_required";
+  type: "step" | "final_delta" | "final" | "error" | "pong" | "proactive" | "ambient" | "approval_required" | "clarification_required";
   content: string;
   session_id: string;
   step: number | null;
   seq: number | null;
+  broadcast_seq?: number | null;
   intervention_id?: string;
   approval_id?: string;
   tool_name?: string;